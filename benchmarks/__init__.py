@@ -0,0 +1 @@
+"""Hot-path benchmarks for the core command/query/event path."""
@@ -0,0 +1,186 @@
+"""Event path: dispatcher fan-out, hooks, metrics, aggregates, enrichment,
+hydration."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from cqrs_ddd_core.cqrs.event_dispatcher import EventDispatcher
+from cqrs_ddd_core.domain.aggregate import AggregateRoot
+from cqrs_ddd_core.domain.event_registry import EventTypeRegistry
+from cqrs_ddd_core.domain.events import (
+    DomainEvent,
+    enrich_event_metadata,
+    enrich_events_metadata,
+)
+from cqrs_ddd_core.instrumentation import HookRegistry, MetricsAggregatorHook
+
+from .harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+FAN_OUT = (1, 10)
+HOOK_COUNTS = (0, 1, 5)
+EVENTS_PER_BATCH = 50
+
+
+class ItemAdded(DomainEvent):
+    sku: str = ""
+    quantity: int = 0
+
+
+class Basket(AggregateRoot[str]):
+    owner: str = ""
+    items: dict[str, int] = {}
+
+
+class CountingHandler:
+    def __init__(self) -> None:
+        self.seen = 0
+
+    async def handle(self, _event: Any) -> None:
+        self.seen += 1
+
+
+class PassThroughHook:
+    async def __call__(
+        self,
+        operation: str,  # noqa: ARG002
+        attributes: dict[str, Any],  # noqa: ARG002
+        next_handler: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        return await next_handler()
+
+
+def _events(count: int) -> list[DomainEvent]:
+    return [
+        ItemAdded(aggregate_id=f"b-{i % 5}", sku=f"sku-{i}", quantity=i)
+        for i in range(count)
+    ]
+
+
+def _register_fan_out(n_handlers: int) -> None:
+    @benchmark(f"event_dispatcher.dispatch[{n_handlers} handlers]")
+    async def bench_dispatch(loops: int) -> float:
+        dispatcher: EventDispatcher[DomainEvent] = EventDispatcher()
+        for _ in range(n_handlers):
+            dispatcher.register(ItemAdded, CountingHandler())
+        events = _events(1)
+        start = time.perf_counter()
+        for _ in range(loops):
+            await dispatcher.dispatch(events)
+        return time.perf_counter() - start
+
+    @benchmark(
+        f"event_dispatcher.dispatch_batch[{EVENTS_PER_BATCH} events, "
+        f"{n_handlers} handlers]"
+    )
+    async def bench_dispatch_batch(loops: int) -> float:
+        dispatcher: EventDispatcher[DomainEvent] = EventDispatcher()
+        for _ in range(n_handlers):
+            dispatcher.register(ItemAdded, CountingHandler())
+        events = _events(EVENTS_PER_BATCH)
+        start = time.perf_counter()
+        for _ in range(loops):
+            await dispatcher.dispatch_batch(events)
+        return time.perf_counter() - start
+
+
+async def _noop() -> None:
+    return None
+
+
+def _cache_attributes() -> dict[str, Any]:
+    return {"cache.key": "k", "correlation_id": None}
+
+
+def _register_hooks(n_hooks: int) -> None:
+    @benchmark(f"hook_registry.execute_all[{n_hooks} hooks]")
+    async def bench_execute_all(loops: int) -> float:
+        registry = HookRegistry()
+        for priority in range(n_hooks):
+            registry.register(PassThroughHook(), priority=priority)
+
+        start = time.perf_counter()
+        for _ in range(loops):
+            await registry.execute_all("redis.cache.get", _cache_attributes, _noop)
+        return time.perf_counter() - start
+
+
+@benchmark("hook_registry.execute_all[5 non-matching hooks]")
+async def bench_execute_all_non_matching(loops: int) -> float:
+    registry = HookRegistry()
+    for priority in range(5):
+        registry.register(PassThroughHook(), priority=priority, operations=["event.*"])
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        await registry.execute_all("redis.cache.get", _cache_attributes, _noop)
+    return time.perf_counter() - start
+
+
+for _count in FAN_OUT:
+    _register_fan_out(_count)
+for _count in HOOK_COUNTS:
+    _register_hooks(_count)
+
+
+class NullExporter:
+    async def export(self, metrics: Any) -> None:  # noqa: ARG002
+        return None
+
+
+@benchmark("metrics_aggregator.record")
+async def bench_metrics_record(loops: int) -> float:
+    aggregator = MetricsAggregatorHook(NullExporter())
+    operations = [f"redis.cache.op{i}" for i in range(8)]
+    start = time.perf_counter()
+    for i in range(loops):
+        aggregator._record(operations[i & 7], 0.42, False)
+    return time.perf_counter() - start
+
+
+@benchmark("aggregate.create+add_event")
+async def bench_aggregate_create(loops: int) -> float:
+    start = time.perf_counter()
+    for i in range(loops):
+        basket = Basket(id="b-1", owner="alice")
+        basket.add_event(ItemAdded(aggregate_id="b-1", sku="sku", quantity=i))
+        basket.collect_events()
+    return time.perf_counter() - start
+
+
+@benchmark(f"events.enrich_event_metadata[{EVENTS_PER_BATCH} events]")
+async def bench_enrich_per_event(loops: int) -> float:
+    batches = [_events(EVENTS_PER_BATCH) for _ in range(min(loops, 64))]
+    start = time.perf_counter()
+    for i in range(loops):
+        for event in batches[i % len(batches)]:
+            enrich_event_metadata(event, correlation_id="cid", causation_id="cmd")
+    return time.perf_counter() - start
+
+
+@benchmark(f"events.enrich_events_metadata[{EVENTS_PER_BATCH} events]")
+async def bench_enrich_batch(loops: int) -> float:
+    batches = [_events(EVENTS_PER_BATCH) for _ in range(min(loops, 64))]
+    start = time.perf_counter()
+    for i in range(loops):
+        enrich_events_metadata(
+            batches[i % len(batches)], correlation_id="cid", causation_id="cmd"
+        )
+    return time.perf_counter() - start
+
+
+@benchmark("event_type_registry.hydrate")
+async def bench_hydrate(loops: int) -> float:
+    registry = EventTypeRegistry()
+    registry.register("ItemAdded", ItemAdded)
+    payload = ItemAdded(aggregate_id="b-1", sku="sku", quantity=3).model_dump(
+        mode="json"
+    )
+    start = time.perf_counter()
+    for _ in range(loops):
+        registry.hydrate("ItemAdded", payload)
+    return time.perf_counter() - start
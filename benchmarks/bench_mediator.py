@@ -0,0 +1,97 @@
+"""Mediator.send / Mediator.query through pipelines of 0-10 middlewares."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from cqrs_ddd_core.adapters.memory import InMemoryUnitOfWork
+from cqrs_ddd_core.cqrs.command import Command
+from cqrs_ddd_core.cqrs.mediator import Mediator
+from cqrs_ddd_core.cqrs.query import Query
+from cqrs_ddd_core.cqrs.registry import HandlerRegistry
+from cqrs_ddd_core.cqrs.response import CommandResponse, QueryResponse
+from cqrs_ddd_core.domain.events import DomainEvent
+from cqrs_ddd_core.middleware.registry import MiddlewareRegistry
+
+from .harness import benchmark
+
+MIDDLEWARE_COUNTS = (0, 1, 5, 10)
+
+
+class PlaceOrder(Command[str]):
+    order_id: str
+
+
+class GetOrder(Query[str]):
+    order_id: str
+
+
+class OrderPlaced(DomainEvent):
+    order_id: str = ""
+
+
+class PlaceOrderHandler:
+    async def handle(self, command: PlaceOrder) -> CommandResponse[str]:
+        return CommandResponse(
+            result=command.order_id,
+            events=[OrderPlaced(aggregate_id=command.order_id)],
+        )
+
+
+class GetOrderHandler:
+    async def handle(self, query: GetOrder) -> QueryResponse[str]:
+        return QueryResponse(result=query.order_id)
+
+
+class PassThroughMiddleware:
+    async def __call__(self, message: Any, next_handler: Any) -> Any:
+        return await next_handler(message)
+
+
+def build_mediator(n_middlewares: int) -> Mediator:
+    registry = HandlerRegistry()
+    registry.register_command_handler(PlaceOrder, PlaceOrderHandler)
+    registry.register_query_handler(GetOrder, GetOrderHandler)
+    middleware_registry = MiddlewareRegistry()
+    for priority in range(n_middlewares):
+        middleware_registry.register(PassThroughMiddleware, priority=priority)
+    return Mediator(
+        registry=registry,
+        uow_factory=InMemoryUnitOfWork,
+        middleware_registry=middleware_registry,
+    )
+
+
+def _register(n_middlewares: int) -> None:
+    @benchmark(f"mediator.send[{n_middlewares} middlewares]")
+    async def bench_send(loops: int) -> float:
+        mediator = build_mediator(n_middlewares)
+        command = PlaceOrder(order_id="o-1")
+        start = time.perf_counter()
+        for _ in range(loops):
+            await mediator.send(command)
+        return time.perf_counter() - start
+
+    @benchmark(f"mediator.query[{n_middlewares} middlewares]")
+    async def bench_query(loops: int) -> float:
+        mediator = build_mediator(n_middlewares)
+        query = GetOrder(order_id="o-1")
+        start = time.perf_counter()
+        for _ in range(loops):
+            await mediator.query(query)
+        return time.perf_counter() - start
+
+
+for _count in MIDDLEWARE_COUNTS:
+    _register(_count)
+
+
+@benchmark("mediator.send_many[100 commands]")
+async def bench_send_many(loops: int) -> float:
+    mediator = build_mediator(1)
+    commands = [PlaceOrder(order_id=f"o-{i}") for i in range(100)]
+    start = time.perf_counter()
+    for _ in range(loops):
+        await mediator.send_many(commands)
+    return time.perf_counter() - start
@@ -0,0 +1,82 @@
+"""In-memory adapters: repository, event store, outbox storage."""
+
+from __future__ import annotations
+
+import time
+
+from cqrs_ddd_core.adapters.memory import (
+    InMemoryEventStore,
+    InMemoryOutboxStorage,
+    InMemoryRepository,
+)
+from cqrs_ddd_core.domain.aggregate import AggregateRoot
+from cqrs_ddd_core.ports.event_store import StoredEvent
+from cqrs_ddd_core.ports.outbox import OutboxMessage
+
+from .harness import benchmark
+
+BATCH = 100
+
+
+class Product(AggregateRoot[str]):
+    name: str = ""
+
+
+def _stored_events(count: int, offset: int = 0) -> list[StoredEvent]:
+    return [
+        StoredEvent(
+            event_type="ProductRenamed",
+            aggregate_id=f"p-{(offset + i) % 10}",
+            aggregate_type="Product",
+            version=offset + i + 1,
+            payload={"name": f"name-{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+@benchmark("memory.repository.add+get")
+async def bench_repository(loops: int) -> float:
+    repository: InMemoryRepository[str] = InMemoryRepository()
+    products = [Product(id=f"p-{i}", name="widget") for i in range(256)]
+    start = time.perf_counter()
+    for i in range(loops):
+        product = products[i & 255]
+        await repository.add(product)
+        await repository.get(product.id)
+    return time.perf_counter() - start
+
+
+@benchmark(f"memory.event_store.append_batch[{BATCH}]")
+async def bench_event_store_append(loops: int) -> float:
+    store = InMemoryEventStore()
+    batches = [_stored_events(BATCH, offset=i * BATCH) for i in range(loops)]
+    start = time.perf_counter()
+    for batch in batches:
+        await store.append_batch(batch)
+    return time.perf_counter() - start
+
+
+@benchmark("memory.event_store.get_events[1000 stored]")
+async def bench_event_store_read(loops: int) -> float:
+    store = InMemoryEventStore()
+    await store.append_batch(_stored_events(1000))
+    start = time.perf_counter()
+    for i in range(loops):
+        await store.get_events(f"p-{i % 10}")
+    return time.perf_counter() - start
+
+
+@benchmark(f"memory.outbox.save+get_pending+mark_published[{BATCH}]")
+async def bench_outbox(loops: int) -> float:
+    batches = [
+        [OutboxMessage(event_type="ProductRenamed") for _ in range(BATCH)]
+        for _ in range(loops)
+    ]
+    start = time.perf_counter()
+    for batch in batches:
+        storage = InMemoryOutboxStorage()
+        await storage.save_messages(batch)
+        pending = await storage.get_pending(limit=BATCH)
+        await storage.mark_published([m.message_id for m in pending])
+    return time.perf_counter() - start
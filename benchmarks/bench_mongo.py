@@ -0,0 +1,73 @@
+"""MongoDB event store: append throughput by batch size, with and without leasing.
+
+These benchmarks measure round-trips, so they need a real MongoDB server.
+Set ``BENCH_MONGO_URL`` (e.g. ``mongodb://localhost:27017``) to enable them;
+without it this module registers nothing.  Timings are per ``append_batch``
+call; divide by the batch size for the per-event cost.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from cqrs_ddd_core.ports.event_store import StoredEvent
+
+from .harness import benchmark
+
+if TYPE_CHECKING:
+    from cqrs_ddd_persistence_mongo import MongoEventStore
+
+BATCH_SIZES = (1, 10, 100, 1000)
+LEASE_SIZE = 1000
+DATABASE = "cqrs_ddd_benchmarks"
+MONGO_URL = os.environ.get("BENCH_MONGO_URL")
+
+
+def _stored_events(count: int, offset: int) -> list[StoredEvent]:
+    return [
+        StoredEvent(
+            event_type="ProductRenamed",
+            aggregate_id=f"p-{(offset + i) % 10}",
+            aggregate_type="Product",
+            version=offset + i + 1,
+            payload={"name": f"name-{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+async def _fresh_store(url: str, lease_size: int) -> MongoEventStore:
+    from cqrs_ddd_persistence_mongo import MongoConnectionManager, MongoEventStore
+
+    connection = MongoConnectionManager(url)
+    await connection.connect()
+    store = MongoEventStore(connection, DATABASE, position_lease_size=lease_size)
+    await store._events_collection().drop()
+    await store._counters_collection().drop()
+    return store
+
+
+def _register(url: str, batch_size: int, lease_size: int) -> None:
+    suffix = f", lease={lease_size}" if lease_size else ""
+
+    @benchmark(f"mongo.event_store.append_batch[{batch_size}{suffix}]")
+    async def bench_append_batch(loops: int) -> float:
+        store = await _fresh_store(url, lease_size)
+        batches = [
+            _stored_events(batch_size, offset=i * batch_size) for i in range(loops)
+        ]
+        start = time.perf_counter()
+        for batch in batches:
+            await store.append_batch(batch)
+        elapsed = time.perf_counter() - start
+        store._connection.close()
+        return elapsed
+
+
+if MONGO_URL:
+    for _size in BATCH_SIZES:
+        _register(MONGO_URL, _size, 0)
+    for _size in BATCH_SIZES[:2]:
+        _register(MONGO_URL, _size, LEASE_SIZE)
@@ -0,0 +1,96 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Benchmarks are compared on their median; a benchmark whose median grew by
+more than ``--threshold`` percent is a regression and makes the command exit
+with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _load(path: Path) -> dict[str, Any]:
+    document: dict[str, Any] = json.loads(path.read_text())
+    return document
+
+
+def compare(
+    base: dict[str, Any], head: dict[str, Any], *, threshold: float
+) -> tuple[list[tuple[str, float | None, float | None, float | None]], list[str]]:
+    """Return ``(rows, regressions)`` for two result documents.
+
+    Each row is ``(name, base_median_us, head_median_us, change_percent)``;
+    medians are ``None`` for benchmarks present on one side only.
+    """
+    base_benchmarks = base.get("benchmarks", {})
+    head_benchmarks = head.get("benchmarks", {})
+    names = list(base_benchmarks) + [
+        n for n in head_benchmarks if n not in base_benchmarks
+    ]
+
+    rows: list[tuple[str, float | None, float | None, float | None]] = []
+    regressions: list[str] = []
+    for name in names:
+        before = base_benchmarks.get(name, {}).get("median_us")
+        after = head_benchmarks.get(name, {}).get("median_us")
+        change = None
+        if before and after is not None:
+            change = (after - before) / before * 100
+            if change > threshold:
+                regressions.append(name)
+        rows.append((name, before, after, change))
+    return rows, regressions
+
+
+def _fmt(value: float | None, suffix: str = "") -> str:
+    return "-" if value is None else f"{value:.3f}{suffix}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percent slowdown of the median that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    base, head = _load(args.base), _load(args.head)
+    rows, regressions = compare(base, head, threshold=args.threshold)
+
+    print(  # noqa: T201
+        f"{'benchmark':<70} {'base us':>12} {'head us':>12} {'change':>9}"
+    )
+    for name, before, after, change in rows:
+        marker = "  <-- regression" if name in regressions else ""
+        print(  # noqa: T201
+            f"{name:<70} {_fmt(before):>12} {_fmt(after):>12} "
+            f"{_fmt(change, '%'):>9}{marker}"
+        )
+
+    base_commit = base.get("metadata", {}).get("commit")
+    head_commit = head.get("metadata", {}).get("commit")
+    print(f"\nbase={base_commit} head={head_commit}")  # noqa: T201
+    if regressions:
+        print(  # noqa: T201
+            f"{len(regressions)} regression(s) above {args.threshold:g}%",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Minimal pyperf-style timing harness for the benchmark suite.
+
+A benchmark is an async *time function*: it receives a loop count, runs the
+measured operation that many times and returns the elapsed seconds, so
+per-benchmark setup stays outside the timed region::
+
+    @benchmark("mediator.send[0 middlewares]")
+    async def bench_send(loops: int) -> float:
+        mediator = build_mediator()
+        start = time.perf_counter()
+        for _ in range(loops):
+            await mediator.send(command)
+        return time.perf_counter() - start
+
+The runner calibrates the loop count so one sample takes at least
+``min_time`` seconds, discards a warm-up sample and reports per-operation
+statistics in microseconds.
+"""
+
+from __future__ import annotations
+
+import statistics
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    TimeFunc = Callable[[int], Awaitable[float]]
+
+_REGISTRY: dict[str, TimeFunc] = {}
+
+_MAX_LOOPS = 1 << 22
+
+
+def benchmark(name: str) -> Callable[[TimeFunc], TimeFunc]:
+    """Register an async time function under *name*."""
+
+    def decorator(func: TimeFunc) -> TimeFunc:
+        if name in _REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        _REGISTRY[name] = func
+        return func
+
+    return decorator
+
+
+def registered() -> dict[str, TimeFunc]:
+    """Return the registered benchmarks by name, in registration order."""
+    return dict(_REGISTRY)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Per-operation timing statistics (microseconds) for one benchmark."""
+
+    name: str
+    loops: int
+    samples_us: list[float]
+
+    @property
+    def median_us(self) -> float:
+        return statistics.median(self.samples_us)
+
+    @property
+    def mean_us(self) -> float:
+        return statistics.fmean(self.samples_us)
+
+    @property
+    def min_us(self) -> float:
+        return min(self.samples_us)
+
+    @property
+    def stdev_us(self) -> float:
+        if len(self.samples_us) < 2:
+            return 0.0
+        return statistics.stdev(self.samples_us)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(
+            median_us=self.median_us,
+            mean_us=self.mean_us,
+            min_us=self.min_us,
+            stdev_us=self.stdev_us,
+        )
+        return data
+
+
+async def _calibrate(func: TimeFunc, min_time: float) -> int:
+    loops = 1
+    while loops < _MAX_LOOPS:
+        if await func(loops) >= min_time:
+            break
+        loops *= 2
+    return loops
+
+
+async def run_benchmark(
+    name: str,
+    func: TimeFunc,
+    *,
+    samples: int = 10,
+    min_time: float = 0.02,
+) -> BenchmarkResult:
+    """Calibrate, warm up and sample *func*; return per-operation timings."""
+    loops = await _calibrate(func, min_time)
+    await func(loops)  # warm-up sample, discarded
+    timings = [await func(loops) / loops * 1e6 for _ in range(samples)]
+    return BenchmarkResult(name=name, loops=loops, samples_us=timings)
@@ -0,0 +1,106 @@
+"""Run the benchmark suite and write JSON results.
+
+Usage::
+
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.run -k mediator --samples 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .harness import BenchmarkResult, registered, run_benchmark
+
+MODULES = (
+    "benchmarks.bench_mediator",
+    "benchmarks.bench_events",
+    "benchmarks.bench_memory",
+    "benchmarks.bench_mongo",
+)
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _metadata() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": _git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def _run(
+    selected: list[str], *, samples: int, min_time: float
+) -> list[BenchmarkResult]:
+    benchmarks = registered()
+    results = []
+    for name in selected:
+        result = await run_benchmark(
+            name, benchmarks[name], samples=samples, min_time=min_time
+        )
+        print(  # noqa: T201
+            f"{name:<70} {result.median_us:>12.3f} us  "
+            f"(+- {result.stdev_us:.3f}, loops={result.loops})"
+        )
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, help="write JSON results here")
+    parser.add_argument(
+        "-k", "--filter", default="", help="only run benchmarks containing this"
+    )
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.02,
+        help="minimum seconds per sample (loop count is calibrated)",
+    )
+    args = parser.parse_args(argv)
+
+    for module in MODULES:
+        importlib.import_module(module)
+    selected = [name for name in registered() if args.filter in name]
+    if not selected:
+        print(f"No benchmarks match {args.filter!r}", file=sys.stderr)  # noqa: T201
+        return 1
+
+    results = asyncio.run(_run(selected, samples=args.samples, min_time=args.min_time))
+    if args.output is not None:
+        document = {
+            "metadata": _metadata(),
+            "benchmarks": {r.name: r.to_dict() for r in results},
+        }
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
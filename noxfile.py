@@ -46,6 +46,13 @@ def tests(session: nox.Session) -> None:
     session.run("pytest", *session.posargs)
 
 
+@nox.session(python=["3.12", "3.13"])
+def benchmarks(session: nox.Session) -> None:
+    """Run the hot-path benchmark suite (pass ``-o results.json`` to save)."""
+    session.install("-e", "./packages/core")
+    session.run("python", "-m", "benchmarks.run", *session.posargs)
+
+
 @nox.session(python=["3.12", "3.13"])
 def autoformat(session: nox.Session) -> None:
     """Fix linting issues and format code."""
@@ -37,14 +37,16 @@ class MockEventStore(IEventStore):
             }
         )
 
-    async def append_batch(self, events: list[Any]) -> None:
+    async def append_batch(self, events: list[Any]) -> list[int]:
         """Store multiple events."""
+        start = len(self.events)
         self.events.extend(
             [
                 {"event_type": e.event_type, "aggregate_id": e.aggregate_id}
                 for e in events
             ]
         )
+        return list(range(start, len(self.events)))
 
     async def get_events(
         self,
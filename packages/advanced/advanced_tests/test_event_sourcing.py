@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -250,6 +251,52 @@ class TestEventSourcedLoader:
         assert snap["version"] == 1
         assert snap["snapshot_data"]["amount"] == 100.0
 
+    async def test_load_many_batches_snapshots_and_events(
+        self,
+        event_store: InMemoryEventStore,
+        event_registry: EventTypeRegistry,
+        snapshot_store: InMemorySnapshotStore,
+    ) -> None:
+        """load_many() matches load() per id using one query per store."""
+        await snapshot_store.save_snapshot(
+            "Order",
+            "order-1",
+            {"id": "order-1", "status": "created", "amount": 50.0, "currency": "EUR"},
+            version=1,
+        )
+        await event_store.append_batch(
+            [
+                StoredEvent(
+                    event_type="OrderPaid",
+                    aggregate_id=order_id,
+                    aggregate_type="Order",
+                    version=version,
+                    payload={
+                        "aggregate_id": order_id,
+                        "order_id": order_id,
+                        "transaction_id": "tx",
+                    },
+                )
+                for order_id, version in (("order-1", 2), ("order-2", 1))
+            ]
+        )
+        loader = EventSourcedLoader(
+            Order, event_store, event_registry, snapshot_store=snapshot_store
+        )
+        event_store.get_events = AsyncMock()  # type: ignore[method-assign]
+        snapshot_store.get_latest_snapshot = AsyncMock()  # type: ignore[method-assign]
+
+        loaded = await loader.load_many(["order-2", "missing", "order-1", "order-2"])
+
+        assert [agg.id for agg in loaded] == ["order-2", "order-1"]
+        assert loaded[0].status == "paid"
+        assert loaded[0].version == 1
+        assert loaded[1].amount == 50.0
+        assert loaded[1].version == 2
+        event_store.get_events.assert_not_awaited()
+        snapshot_store.get_latest_snapshot.assert_not_awaited()
+        assert await loader.load_many([]) == []
+
 
 class TestDefaultEventApplicator:
     """Test DefaultEventApplicator dispatch (sync, no asyncio)."""
@@ -344,6 +391,14 @@ class TestInMemorySnapshotStore:
         await store.delete_snapshot("Order", "o1")
         assert await store.get_latest_snapshot("Order", "o1") is None
 
+    async def test_get_latest_snapshots(self) -> None:
+        store = InMemorySnapshotStore()
+        await store.save_snapshot("Order", "o1", {"amount": 10}, version=1)
+        await store.save_snapshot("Order", 2, {"amount": 20}, version=3)
+        snaps = await store.get_latest_snapshots("Order", ["o1", 2, "o3"])
+        assert set(snaps) == {"o1", "2"}
+        assert snaps["2"]["version"] == 3
+
 
 @pytest.mark.asyncio
 class TestEventSourcedRepository:
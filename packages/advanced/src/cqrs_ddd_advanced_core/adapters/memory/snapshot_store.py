@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from cqrs_ddd_advanced_core.ports.snapshots import ISnapshotStore
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from cqrs_ddd_core.domain.specification import ISpecification
 
 
@@ -46,6 +48,19 @@ class InMemorySnapshotStore(ISnapshotStore):
         key = (aggregate_type, str(aggregate_id))
         return self._store.get(key)
 
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: Sequence[Any],
+        *,
+        specification: ISpecification[Any] | None = None,  # noqa: ARG002
+    ) -> dict[str, dict[str, Any]]:
+        found = (
+            (str(aid), self._store.get((aggregate_type, str(aid))))
+            for aid in aggregate_ids
+        )
+        return {aid: snapshot for aid, snapshot in found if snapshot is not None}
+
     async def delete_snapshot(
         self,
         aggregate_type: str,
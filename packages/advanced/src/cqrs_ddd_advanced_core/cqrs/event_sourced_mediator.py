@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from cqrs_ddd_core.correlation import get_correlation_id
+from cqrs_ddd_core.cqrs.handler import HandlerLifetime
 from cqrs_ddd_core.instrumentation import get_hook_registry
 
 if TYPE_CHECKING:
@@ -96,6 +97,8 @@ class EventSourcedMediator(CoreMediator):
         event_persistence_orchestrator: EventSourcedPersistenceOrchestrator
         | None = None,
         handler_factory: Callable[[type[Any]], Any] | None = None,
+        default_handler_lifetime: HandlerLifetime = HandlerLifetime.TRANSIENT,
+        handler_lifetimes: dict[type[Any], HandlerLifetime] | None = None,
     ) -> None:
         """Initialize EventSourcedMediator.
 
@@ -109,6 +112,9 @@ class EventSourcedMediator(CoreMediator):
                 for mandatory event persistence. If provided, events from
                 event-sourced aggregates are persisted within UoW transaction.
             handler_factory: Optional callable for creating handler instances.
+            default_handler_lifetime: HandlerLifetime for handlers that do
+                not declare one. Defaults to TRANSIENT.
+            handler_lifetimes: Optional per-handler-class lifetime overrides.
         """
         # Initialize core Mediator with all parameters except orchestrator
         # (we'll add persistence orchestration in _dispatch_command override)
@@ -118,6 +124,8 @@ class EventSourcedMediator(CoreMediator):
             event_dispatcher=event_dispatcher,
             middleware_registry=middleware_registry,
             handler_factory=handler_factory,
+            default_handler_lifetime=default_handler_lifetime,
+            handler_lifetimes=handler_lifetimes,
         )
 
         self._event_persistence_orchestrator = event_persistence_orchestrator
@@ -125,6 +133,8 @@ class EventSourcedMediator(CoreMediator):
     async def _dispatch_command(
         self,
         command: Any,
+        *,
+        dispatch_events: bool = True,
     ) -> Any:
         """Override core _dispatch_command to add event persistence.
 
@@ -142,11 +152,17 @@ class EventSourcedMediator(CoreMediator):
                 "correlation_id": get_correlation_id()
                 or getattr(command, "correlation_id", None),
             },
-            lambda: self._dispatch_command_internal(command),
+            lambda: self._dispatch_command_internal(
+                command, dispatch_events=dispatch_events
+            ),
         )
 
-    async def _dispatch_command_internal(self, command: Any) -> Any:
-        result = await super()._dispatch_command(command)
+    async def _dispatch_command_internal(
+        self, command: Any, *, dispatch_events: bool = True
+    ) -> Any:
+        result = await super()._dispatch_command(
+            command, dispatch_events=dispatch_events
+        )
         if self._event_persistence_orchestrator and result.events:
             await self._event_persistence_orchestrator.persist_events(
                 result.events, result
@@ -10,12 +10,12 @@ from cqrs_ddd_core.domain.event_registry import EventTypeRegistry
 from cqrs_ddd_core.instrumentation import fire_and_forget_hook, get_hook_registry
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from cqrs_ddd_core.domain.event_registry import EventTypeRegistry
     from cqrs_ddd_core.domain.events import DomainEvent
     from cqrs_ddd_core.domain.specification import ISpecification
-    from cqrs_ddd_core.ports.event_store import IEventStore
+    from cqrs_ddd_core.ports.event_store import IEventStore, StoredEvent
 
     from ..domain.event_validation import EventValidator
     from ..ports.event_applicator import IEventApplicator
@@ -137,6 +137,7 @@ class EventSourcedLoader(Generic[T]):
 
     **Flow:** get_latest_snapshot → restore or create fresh → get_events(after_version)
     → upcast each payload → hydrate to DomainEvent → apply to aggregate.
+    :meth:`load_many` runs the same flow for many ids with batched queries.
     """
 
     def __init__(
@@ -189,28 +190,16 @@ class EventSourcedLoader(Generic[T]):
             specification: Optional specification for tenant filtering,
                 forwarded to event_store and snapshot_store.
         """
-        after_version = 0
-        aggregate: T | None = None
-
+        snapshot = None
         if self._snapshot_store:
             snapshot = await self._snapshot_store.get_latest_snapshot(
                 self._aggregate_type_name,
                 aggregate_id,
                 specification=specification,
             )
-            if snapshot:
-                snapshot_data = snapshot.get("snapshot_data") or snapshot
-                version = snapshot.get("version", 0)
-                aggregate = self._aggregate_type.model_validate(snapshot_data)
-                object.__setattr__(aggregate, "_version", version)
-                after_version = version
-
+        aggregate, after_version = self._restore(aggregate_id, snapshot)
         if aggregate is None:
-            try:
-                aggregate = self._create_aggregate(aggregate_id)
-            except Exception:  # noqa: BLE001
-                return None
-            object.__setattr__(aggregate, "_version", 0)
+            return None
 
         raw_events = await self._event_store.get_events(
             aggregate_id,
@@ -220,7 +209,82 @@ class EventSourcedLoader(Generic[T]):
         if not raw_events and after_version == 0:
             # No snapshot and no events: aggregate never existed
             return None
+        return self._apply_events(aggregate, raw_events)
+
+    async def load_many(
+        self,
+        aggregate_ids: Sequence[str],
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> list[T]:
+        """Reconstitute several aggregates with one snapshot and one event query.
+
+        Same result as calling :meth:`load` for each id, but snapshots come
+        from ``snapshot_store.get_latest_snapshots()`` and events from
+        ``event_store.get_events_for_aggregates()``, so loading N aggregates
+        costs two round-trips instead of 2N.
+
+        Args:
+            aggregate_ids: The aggregate identifiers (duplicates are loaded once).
+            specification: Optional specification for tenant filtering,
+                forwarded to event_store and snapshot_store.
+
+        Returns:
+            The aggregates that exist, in the order of ``aggregate_ids``.
+        """
+        ids = list(dict.fromkeys(aggregate_ids))
+        if not ids:
+            return []
 
+        snapshots: dict[str, dict[str, Any]] = {}
+        if self._snapshot_store:
+            snapshots = await self._snapshot_store.get_latest_snapshots(
+                self._aggregate_type_name, ids, specification=specification
+            )
+
+        restored: dict[str, tuple[T, int]] = {}
+        for aggregate_id in ids:
+            aggregate, after_version = self._restore(
+                aggregate_id, snapshots.get(aggregate_id)
+            )
+            if aggregate is not None:
+                restored[aggregate_id] = (aggregate, after_version)
+        if not restored:
+            return []
+
+        events = await self._event_store.get_events_for_aggregates(
+            list(restored),
+            {aid: after_version for aid, (_, after_version) in restored.items()},
+            specification=specification,
+        )
+        result: list[T] = []
+        for aggregate_id, (aggregate, after_version) in restored.items():
+            raw_events = events.get(aggregate_id, [])
+            if not raw_events and after_version == 0:
+                continue
+            result.append(self._apply_events(aggregate, raw_events))
+        return result
+
+    def _restore(
+        self, aggregate_id: str, snapshot: dict[str, Any] | None
+    ) -> tuple[T | None, int]:
+        """Restore from *snapshot* or create fresh; returns the replay-from version."""
+        if snapshot:
+            snapshot_data = snapshot.get("snapshot_data") or snapshot
+            version = snapshot.get("version", 0)
+            aggregate = self._aggregate_type.model_validate(snapshot_data)
+            object.__setattr__(aggregate, "_version", version)
+            return aggregate, version
+
+        try:
+            aggregate = self._create_aggregate(aggregate_id)
+        except Exception:  # noqa: BLE001
+            return None, 0
+        object.__setattr__(aggregate, "_version", 0)
+        return aggregate, 0
+
+    def _apply_events(self, aggregate: T, raw_events: list[StoredEvent]) -> T:
+        """Upcast, hydrate and apply stored events in order."""
         for stored_event in raw_events:
             payload = dict(stored_event.payload)
             schema_ver = getattr(stored_event, "schema_version", 1)
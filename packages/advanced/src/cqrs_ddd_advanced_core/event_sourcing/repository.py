@@ -32,7 +32,8 @@ class EventSourcedRepository(
 ):
     """Repository for event-sourced aggregates.
 
-    - **Retrieve:** loads via EventSourcedLoader (snapshot + events + upcasting).
+    - **Retrieve:** loads via EventSourcedLoader.load_many (snapshot + events +
+      upcasting, batched across the requested ids).
     - **Persist:** appends the entity's events to the event store and optionally
       saves a snapshot if the strategy says so.
 
@@ -107,12 +108,9 @@ class EventSourcedRepository(
         specification: ISpecification[Any] | None = None,
     ) -> list[T]:
         loader = self._loader(uow)
-        result: list[T] = []
-        for id_val in ids:
-            agg = await loader.load(str(id_val), specification=specification)
-            if agg is not None:
-                result.append(agg)
-        return result
+        return await loader.load_many(
+            [str(id_val) for id_val in ids], specification=specification
+        )
 
     async def persist(
         self,
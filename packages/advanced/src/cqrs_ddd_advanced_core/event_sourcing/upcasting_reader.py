@@ -41,7 +41,7 @@ class UpcastingEventReader:
             "list[StoredEvent]",
             await registry.execute_all(
                 "upcast.apply.get_events",
-                {
+                lambda: {
                     "aggregate.id": aggregate_id,
                     "after_version": after_version,
                     "correlation_id": get_correlation_id(),
@@ -71,7 +71,7 @@ class UpcastingEventReader:
             "list[StoredEvent]",
             await registry.execute_all(
                 "upcast.apply.get_by_aggregate",
-                {
+                lambda: {
                     "aggregate.id": aggregate_id,
                     "aggregate.type": aggregate_type,
                     "correlation_id": get_correlation_id(),
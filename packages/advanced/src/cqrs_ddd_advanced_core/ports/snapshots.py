@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from cqrs_ddd_core.domain.aggregate import AggregateRoot
     from cqrs_ddd_core.domain.specification import ISpecification
 
@@ -66,6 +68,28 @@ class ISnapshotStore(Protocol):
         """
         ...
 
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: Sequence[Any],
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve the most recent snapshots of several aggregates at once.
+
+        Batch form of :meth:`get_latest_snapshot` (one query for all ids).
+
+        Args:
+            aggregate_type: Type name of the aggregates.
+            aggregate_ids: The aggregates' IDs.
+            specification: Optional specification for tenant filtering.
+
+        Returns:
+            Dict keyed by ``str(aggregate_id)`` with the same values as
+            :meth:`get_latest_snapshot`; ids without a snapshot are absent.
+        """
+        ...
+
     async def delete_snapshot(
         self,
         aggregate_type: str,
@@ -0,0 +1,158 @@
+"""Tests for CoalescingLockStrategy."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cqrs_ddd_core.adapters.decorators.coalescing_lock import CoalescingLockStrategy
+from cqrs_ddd_core.adapters.memory.locking import InMemoryLockStrategy
+from cqrs_ddd_core.ports.locking import ILockStrategy
+from cqrs_ddd_core.primitives.exceptions import LockAcquisitionError
+from cqrs_ddd_core.primitives.locking import ResourceIdentifier
+
+RESOURCE = ResourceIdentifier("Account", "1")
+
+
+@pytest.fixture
+def inner() -> InMemoryLockStrategy:
+    return InMemoryLockStrategy()
+
+
+@pytest.fixture
+def strategy(inner: InMemoryLockStrategy) -> CoalescingLockStrategy:
+    return CoalescingLockStrategy(inner)
+
+
+@pytest.mark.asyncio
+class TestCoalescingLockStrategy:
+    async def test_burst_uses_one_inner_acquire(
+        self, strategy: CoalescingLockStrategy, inner: InMemoryLockStrategy
+    ) -> None:
+        order: list[int] = []
+        held = 0
+
+        async def _command(n: int) -> None:
+            nonlocal held
+            token = await strategy.acquire(RESOURCE, timeout=1.0)
+            held += 1
+            assert held == 1
+            await asyncio.sleep(0)
+            order.append(n)
+            held -= 1
+            await strategy.release(RESOURCE, token)
+
+        await asyncio.gather(*(_command(n) for n in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+        assert strategy.inner_acquisitions == 1
+        assert strategy.local_handoffs == 4
+        assert inner.get_stats().acquisitions == 1
+        assert await inner.get_active_locks() == []
+        assert strategy._slots == {}
+
+    async def test_inner_lock_released_between_bursts(
+        self, strategy: CoalescingLockStrategy, inner: InMemoryLockStrategy
+    ) -> None:
+        for _ in range(2):
+            token = await strategy.acquire(RESOURCE)
+            assert len(await inner.get_active_locks()) == 1
+            await strategy.release(RESOURCE, token)
+            assert await inner.get_active_locks() == []
+
+        assert strategy.inner_acquisitions == 2
+
+    async def test_reentrant_for_same_session(
+        self, strategy: CoalescingLockStrategy
+    ) -> None:
+        token = await strategy.acquire(RESOURCE, session_id="s1")
+        assert await strategy.acquire(RESOURCE, session_id="s1") == token
+
+        await strategy.release(RESOURCE, token)
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(RESOURCE, timeout=0.01)
+        await strategy.release(RESOURCE, token)
+
+        assert strategy._slots == {}
+
+    async def test_local_timeout_leaves_holder_intact(
+        self, strategy: CoalescingLockStrategy, inner: InMemoryLockStrategy
+    ) -> None:
+        token = await strategy.acquire(RESOURCE)
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(RESOURCE, timeout=0.01)
+
+        assert await strategy.extend(RESOURCE, token, ttl=60.0)
+        await strategy.release(RESOURCE, token)
+        assert strategy._slots == {}
+        assert await inner.get_active_locks() == []
+
+    async def test_inner_failure_is_propagated(
+        self, inner: InMemoryLockStrategy
+    ) -> None:
+        other = await inner.acquire(RESOURCE)
+        strategy = CoalescingLockStrategy(inner)
+
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(RESOURCE, timeout=0.01)
+
+        assert strategy._slots == {}
+        await inner.release(RESOURCE, other)
+
+    async def test_max_handoffs_reacquires_inner_lock(
+        self, inner: InMemoryLockStrategy
+    ) -> None:
+        strategy = CoalescingLockStrategy(inner, max_handoffs=1)
+
+        async def _command() -> None:
+            token = await strategy.acquire(RESOURCE, timeout=1.0)
+            await asyncio.sleep(0)
+            await strategy.release(RESOURCE, token)
+
+        await asyncio.gather(*(_command() for _ in range(4)))
+
+        assert strategy.inner_acquisitions == 2
+
+    async def test_heartbeat_extends_while_held(self) -> None:
+        inner = AsyncMock(spec=ILockStrategy)
+        inner.acquire.return_value = "remote"
+        inner.extend.return_value = True
+        strategy = CoalescingLockStrategy(inner, extend_interval=0.01)
+
+        token = await strategy.acquire(RESOURCE, ttl=5.0)
+        await asyncio.sleep(0.05)
+        await strategy.release(RESOURCE, token)
+
+        assert inner.extend.await_count >= 2
+        inner.extend.assert_awaited_with(RESOURCE, "remote", 5.0)
+        inner.release.assert_awaited_once_with(RESOURCE, "remote")
+
+    async def test_lost_inner_lock_is_reacquired_on_handoff(self) -> None:
+        inner = AsyncMock(spec=ILockStrategy)
+        inner.acquire.side_effect = ["remote-1", "remote-2"]
+        inner.extend.return_value = False
+        strategy = CoalescingLockStrategy(inner, extend_interval=0.01)
+
+        first = await strategy.acquire(RESOURCE)
+        waiter = asyncio.create_task(strategy.acquire(RESOURCE, timeout=1.0))
+        await asyncio.sleep(0.03)
+        await strategy.release(RESOURCE, first)
+        second = await waiter
+        await strategy.release(RESOURCE, second)
+
+        assert inner.acquire.await_count == 2
+        inner.release.assert_awaited_once_with(RESOURCE, "remote-2")
+
+    async def test_read_locks_pass_through(
+        self, strategy: CoalescingLockStrategy, inner: InMemoryLockStrategy
+    ) -> None:
+        read = ResourceIdentifier("Account", "1", lock_mode="read")
+        t1 = await strategy.acquire(read)
+        t2 = await strategy.acquire(read)
+
+        assert len(await inner.get_active_locks()) == 2
+        assert strategy._slots == {}
+        await strategy.release(read, t1)
+        await strategy.release(read, t2)
@@ -132,3 +132,69 @@ def test_value_object_immutability() -> None:
     m = Money(amount=10.0, currency="USD")
     with pytest.raises(Exception, match="is immutable|cannot set attribute|validation"):
         m.amount = 20.0
+
+
+def test_enrich_events_metadata_copies_and_keeps_existing_ids() -> None:
+    from cqrs_ddd_core.domain.events import enrich_events_metadata
+
+    fresh = SomethingHappened(message="a")
+    traced = SomethingHappened(message="b", correlation_id="own", causation_id="own")
+
+    enriched = enrich_events_metadata(
+        [fresh, traced], correlation_id="cid", causation_id="cmd"
+    )
+
+    assert (enriched[0].correlation_id, enriched[0].causation_id) == ("cid", "cmd")
+    assert enriched[0].event_id == fresh.event_id
+    assert fresh.correlation_id is None
+    assert enriched[1] is traced
+
+
+def test_enrich_events_metadata_without_ids_returns_input() -> None:
+    from cqrs_ddd_core.domain.events import enrich_events_metadata
+
+    events = [SomethingHappened(message="a")]
+    assert enrich_events_metadata(events) is events
+    assert enrich_events_metadata(events, correlation_id="") is events
+
+
+class SomethingElseHappened(DomainEvent):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_enrich_events_metadata_fires_hook_per_event_type() -> None:
+    import asyncio
+
+    from cqrs_ddd_core.domain.events import enrich_events_metadata
+    from cqrs_ddd_core.instrumentation import (
+        HookRegistry,
+        get_hook_registry,
+        set_hook_registry,
+    )
+
+    seen: list[dict[str, object]] = []
+
+    async def _hook(operation, attributes, next_handler):
+        seen.append(attributes)
+        return await next_handler()
+
+    registry = HookRegistry()
+    registry.register(_hook, message_types=[SomethingHappened])
+    original = get_hook_registry()
+    set_hook_registry(registry)
+    try:
+        events = [
+            SomethingHappened(message="a"),
+            SomethingElseHappened(),
+            SomethingHappened(message="b"),
+        ]
+        enriched = enrich_events_metadata(events, correlation_id="cid")
+        await asyncio.sleep(0)
+    finally:
+        set_hook_registry(original)
+
+    assert len(seen) == 1
+    assert seen[0]["message_type"] is SomethingHappened
+    assert seen[0]["event.ids"] == [events[0].event_id, events[2].event_id]
+    assert {e.correlation_id for e in enriched} == {"cid"}
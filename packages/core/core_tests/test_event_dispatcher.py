@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from cqrs_ddd_core.cqrs.event_dispatcher import EventDispatcher
+from cqrs_ddd_core.domain.events import DomainEvent
+from cqrs_ddd_core.instrumentation import (
+    HookRegistry,
+    get_hook_registry,
+    set_hook_registry,
+)
+
+
+class ItemImported(DomainEvent):
+    seq: int = 0
+
+
+class ItemPriced(DomainEvent):
+    seq: int = 0
+
+
+class RecordingHandler:
+    def __init__(self, log: list[tuple[str | None, int]], delay: float = 0) -> None:
+        self.log = log
+        self.delay = delay
+
+    async def handle(self, event: Any) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.log.append((event.aggregate_id, event.seq))
+
+
+class RecordingHook:
+    def __init__(self) -> None:
+        self.operations: list[str] = []
+        self.attributes: list[dict[str, Any]] = []
+
+    async def __call__(self, operation: str, attributes: dict[str, Any], next_handler):
+        self.operations.append(operation)
+        self.attributes.append(attributes)
+        return await next_handler()
+
+
+@pytest.fixture
+def hook():
+    original = get_hook_registry()
+    recording = RecordingHook()
+    registry = HookRegistry()
+    registry.register(recording, operations=["event.*"])
+    set_hook_registry(registry)
+    yield recording
+    set_hook_registry(original)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_preserves_order_and_emits_one_hook(hook) -> None:
+    log: list[tuple[str | None, int]] = []
+    dispatcher = EventDispatcher()
+    dispatcher.register(ItemImported, RecordingHandler(log))
+
+    events = [ItemImported(aggregate_id="a", seq=i) for i in range(5)]
+    events.append(ItemPriced(aggregate_id="a", seq=99))  # no handler
+    await dispatcher.dispatch_batch(events)
+
+    assert log == [("a", i) for i in range(5)]
+    assert hook.operations == ["event.dispatch.batch"]
+    assert hook.attributes[0]["event.count"] == 6
+    assert hook.attributes[0]["event.types"] == ["ItemImported", "ItemPriced"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_concurrent_keeps_per_aggregate_order(hook) -> None:
+    log: list[tuple[str | None, int]] = []
+    dispatcher = EventDispatcher(max_concurrency=4)
+    dispatcher.register(ItemImported, RecordingHandler(log, delay=0.001))
+
+    events = [ItemImported(aggregate_id=agg, seq=i) for i in range(3) for agg in "abc"]
+    await dispatcher.dispatch_batch(events, concurrent=True)
+
+    assert len(log) == 9
+    for agg in "abc":
+        assert [seq for a, seq in log if a == agg] == [0, 1, 2]
+    assert hook.attributes[0]["event.partitions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_dispatch_switches_to_batch_mode_at_threshold(hook) -> None:
+    log: list[tuple[str | None, int]] = []
+    dispatcher = EventDispatcher(batch_threshold=3)
+    dispatcher.register(ItemImported, RecordingHandler(log))
+
+    await dispatcher.dispatch([ItemImported(seq=1)])
+    assert hook.operations == [
+        "event.dispatch.ItemImported",
+        "event.handler.ItemImported.RecordingHandler",
+    ]
+
+    hook.operations.clear()
+    await dispatcher.dispatch([ItemImported(seq=i) for i in range(3)])
+    assert hook.operations == ["event.dispatch.batch"]
+    assert [seq for _, seq in log] == [1, 0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_propagates_handler_errors() -> None:
+    class FailingHandler:
+        async def handle(self, event: Any) -> None:
+            raise RuntimeError("boom")
+
+    dispatcher = EventDispatcher()
+    dispatcher.register(ItemImported, FailingHandler())
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await dispatcher.dispatch_batch([ItemImported(aggregate_id="a")])
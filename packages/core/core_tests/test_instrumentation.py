@@ -129,3 +129,320 @@ async def test_set_instrumentation_hook_backward_compatibility() -> None:
         assert order[0] == "before:single"
     finally:
         set_hook_registry(original)
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_lazy_attributes_not_built_without_match() -> None:
+    order: list[str] = []
+    built: list[int] = []
+    registry = HookRegistry()
+    registry.register(RecordingHook("cache", order), operations=["cache.*"])
+
+    def _attributes() -> dict[str, Any]:
+        built.append(1)
+        return {"cache.key": "k"}
+
+    async def _handler() -> str:
+        return "ok"
+
+    assert await registry.execute_all("event.dispatch.X", _attributes, _handler) == "ok"
+    assert built == []
+
+    assert await registry.execute_all("cache.get", _attributes, _handler) == "ok"
+    assert built == [1]
+    assert order == ["before:cache", "after:cache"]
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_lazy_attributes_with_message_type() -> None:
+    order: list[str] = []
+    registry = HookRegistry()
+    registry.register(RecordingHook("typed", order), message_types=[MsgType])
+
+    async def _handler() -> None:
+        return None
+
+    # Explicit message_type resolves filtering without building attributes
+    await registry.execute_all(
+        "op", lambda: pytest.fail("built"), _handler, message_type=str
+    )
+    assert order == []
+
+    # Without it, the lazy attributes are consulted for message_type
+    await registry.execute_all("op", lambda: {"message_type": MsgType}, _handler)
+    assert order == ["before:typed", "after:typed"]
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_compiled_matches_invalidated_on_register() -> None:
+    order: list[str] = []
+    registry = HookRegistry()
+
+    async def _handler() -> None:
+        order.append("handler")
+
+    await registry.execute_all("event.dispatch.Sample", {}, _handler)
+    registry.register(RecordingHook("late", order), operations=["event.*"])
+    await registry.execute_all("event.dispatch.Sample", {}, _handler)
+
+    assert order == ["handler", "before:late", "handler", "after:late"]
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_matching_compiled_once_per_operation(
+    monkeypatch,
+) -> None:
+    from cqrs_ddd_core.instrumentation import HookRegistration
+
+    checks: list[str] = []
+    original = HookRegistration._matches_operation
+
+    def _counting(self: HookRegistration, operation: str) -> bool:
+        checks.append(operation)
+        return original(self, operation)
+
+    monkeypatch.setattr(HookRegistration, "_matches_operation", _counting)
+    order: list[str] = []
+    registry = HookRegistry()
+    for i in range(5):
+        registry.register(RecordingHook(f"h{i}", order), operations=["event.*"])
+
+    async def _handler() -> None:
+        return None
+
+    for _ in range(100):
+        await registry.execute_all("cache.get", lambda: pytest.fail("built"), _handler)
+    assert checks == ["cache.get"] * 5
+    assert order == []
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_predicate_evaluated_per_call() -> None:
+    order: list[str] = []
+    registry = HookRegistry()
+    registry.register(
+        RecordingHook("pred", order),
+        predicate=lambda _op, attrs: attrs.get("sample") is True,
+    )
+
+    async def _handler() -> None:
+        return None
+
+    await registry.execute_all("op", {"sample": False}, _handler)
+    assert order == []
+    await registry.execute_all("op", {"sample": True}, _handler)
+    assert order == ["before:pred", "after:pred"]
+
+
+class AttributeHook:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def __call__(self, operation: str, attributes: dict[str, Any], next_handler):
+        self.calls.append((operation, attributes))
+        return await next_handler()
+
+
+async def _noop() -> str:
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_sample_rate_zero_skips_attribute_building() -> None:
+    hook = AttributeHook()
+    registry = HookRegistry()
+    registry.register(hook, sample_rate=0.0)
+    built = 0
+
+    def attrs() -> dict[str, Any]:
+        nonlocal built
+        built += 1
+        return {}
+
+    for _ in range(10):
+        assert await registry.execute_all("cache.get", attrs, _noop) == "ok"
+    assert hook.calls == []
+    assert built == 0
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_rate_limit_is_per_operation(monkeypatch) -> None:
+    from cqrs_ddd_core import instrumentation
+
+    now = [100.0]
+    monkeypatch.setattr(instrumentation.time, "monotonic", lambda: now[0])
+    hook = AttributeHook()
+    registry = HookRegistry()
+    registry.register(hook, rate_limit=2)
+
+    for _ in range(5):
+        await registry.execute_all("cache.get", {}, _noop)
+        await registry.execute_all("cache.set", {}, _noop)
+    assert [op for op, _ in hook.calls].count("cache.get") == 2
+    assert [op for op, _ in hook.calls].count("cache.set") == 2
+
+    now[0] += 0.5  # refills one token
+    await registry.execute_all("cache.get", {}, _noop)
+    await registry.execute_all("cache.get", {}, _noop)
+    assert [op for op, _ in hook.calls].count("cache.get") == 3
+
+
+def test_hook_registry_rejects_invalid_sampling_options() -> None:
+    registry = HookRegistry()
+    with pytest.raises(ValueError, match="sample_rate"):
+        registry.register(AttributeHook(), sample_rate=1.5)
+    with pytest.raises(ValueError, match="rate_limit"):
+        registry.register(AttributeHook(), rate_limit=0)
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_tail_records_only_slow_operations(monkeypatch) -> None:
+    from cqrs_ddd_core import instrumentation
+
+    durations = iter([0.0, 0.001, 1.0, 1.050])  # 1 ms, then 50 ms
+    monkeypatch.setattr(instrumentation.time, "perf_counter", lambda: next(durations))
+    order: list[str] = []
+    hook = AttributeHook()
+    registry = HookRegistry()
+    registry.register(hook, tail_min_duration_ms=10)
+    registry.register(RecordingHook("head", order), priority=-1)
+
+    assert await registry.execute_all("op.fast", {"k": 1}, _noop) == "ok"
+    assert await registry.execute_all("op.slow", {"k": 2}, _noop) == "ok"
+
+    assert [op for op, _ in hook.calls] == ["op.slow"]
+    assert hook.calls[0][1]["k"] == 2
+    assert hook.calls[0][1]["duration_ms"] == pytest.approx(50)
+    assert order == ["before:head", "after:head"] * 2
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_tail_errors_replays_exception() -> None:
+    seen: list[str] = []
+
+    class ErrorHook:
+        async def __call__(self, operation, attributes, next_handler):
+            try:
+                return await next_handler()
+            except RuntimeError as exc:
+                seen.append(f"{operation}:{exc}")
+                raise
+
+    registry = HookRegistry()
+    registry.register(ErrorHook(), tail_errors=True)
+
+    async def _failing() -> None:
+        raise RuntimeError("boom")
+
+    await registry.execute_all("op.ok", {}, _noop)
+    with pytest.raises(RuntimeError, match="boom"):
+        await registry.execute_all("op.fail", {}, _failing)
+    assert seen == ["op.fail:boom"]
+
+
+class CollectingExporter:
+    def __init__(self) -> None:
+        self.exports: list[dict[str, Any]] = []
+
+    async def export(self, metrics):
+        self.exports.append(dict(metrics))
+
+
+@pytest.mark.asyncio
+async def test_metrics_aggregator_counts_errors_and_latency() -> None:
+    from cqrs_ddd_core.instrumentation import MetricsAggregatorHook
+
+    exporter = CollectingExporter()
+    aggregator = MetricsAggregatorHook(exporter, buckets_ms=(1.0, 10.0, 100.0))
+    registry = HookRegistry()
+    registry.register(aggregator, operations=["*"])
+
+    async def _failing() -> None:
+        raise RuntimeError("boom")
+
+    for _ in range(3):
+        await registry.execute_all("cache.get", {}, _noop)
+    with pytest.raises(RuntimeError):
+        await registry.execute_all("cache.set", {}, _failing)
+    aggregator._record("cache.get", 50.0, False)
+
+    await aggregator.flush()
+
+    stats = exporter.exports[0]
+    assert stats["cache.get"].count == 4
+    assert stats["cache.get"].errors == 0
+    assert stats["cache.get"].buckets == [3, 0, 1, 0]
+    assert stats["cache.get"].percentile(50) <= 1.0
+    assert stats["cache.get"].percentile(99) == 50.0
+    assert stats["cache.set"].errors == 1
+
+    # Flushing drains the buffers; nothing new means nothing exported
+    await aggregator.flush()
+    assert len(exporter.exports) == 1
+
+
+def test_metrics_aggregator_collect_counts_every_record() -> None:
+    from cqrs_ddd_core.instrumentation import MetricsAggregatorHook
+
+    aggregator = MetricsAggregatorHook(CollectingExporter())
+    operations = [f"redis.cache.op{i}" for i in range(8)]
+    for i in range(1000):
+        aggregator._record(operations[i & 7], 0.42, False)
+
+    stats = aggregator.collect()
+    assert sorted(stats) == sorted(operations)
+    assert {s.count for s in stats.values()} == {125}
+
+
+@pytest.mark.asyncio
+async def test_metrics_aggregator_merges_thread_buffers() -> None:
+    import threading
+
+    from cqrs_ddd_core.instrumentation import MetricsAggregatorHook
+
+    aggregator = MetricsAggregatorHook(CollectingExporter())
+    aggregator._record("op", 0.2, False)
+    worker = threading.Thread(target=aggregator._record, args=("op", 3.0, True))
+    worker.start()
+    worker.join()
+
+    merged = aggregator.collect()
+
+    assert merged["op"].count == 2
+    assert merged["op"].errors == 1
+    assert merged["op"].max_ms == 3.0
+    assert len(aggregator._buffers) == 1  # exited thread's buffer dropped
+
+
+@pytest.mark.asyncio
+async def test_metrics_aggregator_periodic_flush_and_stop() -> None:
+    import asyncio
+
+    from cqrs_ddd_core.instrumentation import MetricsAggregatorHook
+
+    exporter = CollectingExporter()
+    aggregator = MetricsAggregatorHook(exporter, flush_interval=0.01)
+    aggregator.start()
+    aggregator._record("op", 1.0, False)
+    await asyncio.sleep(0.05)
+    aggregator._record("op", 1.0, False)
+    await aggregator.stop()
+
+    assert sum(e["op"].count for e in exporter.exports) == 2
+
+
+@pytest.mark.asyncio
+async def test_logging_metrics_exporter_writes_summary(caplog) -> None:
+    import logging
+
+    from cqrs_ddd_core.instrumentation import LoggingMetricsExporter, OperationStats
+
+    stats = OperationStats(bounds=(1.0,))
+    stats.merge(
+        OperationStats(bounds=(1.0,), count=2, total_ms=1.0, max_ms=0.6, buckets=[2, 0])
+    )
+    caplog.set_level(logging.INFO, logger="cqrs_ddd.instrumentation")
+
+    await LoggingMetricsExporter().export({"uow.commit": stats})
+
+    assert "uow.commit count=2 errors=0" in caplog.text
@@ -19,6 +19,8 @@ from cqrs_ddd_core.primitives import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from cqrs_ddd_core.ports.locking import ILockStrategy
 
 
@@ -172,6 +174,130 @@ class TestInMemoryLockStrategy:
         assert len(locks) == 0
 
 
+class TestInMemoryLockStrategyModes:
+    """Reader/writer modes, state cleanup and contention stats."""
+
+    async def test_readers_share_writers_exclude(self) -> None:
+        strategy = InMemoryLockStrategy()
+        read = ResourceIdentifier("Account", "1", lock_mode="read")
+        write = ResourceIdentifier("Account", "1")
+
+        t1 = await strategy.acquire(read, timeout=0.1)
+        t2 = await strategy.acquire(read, timeout=0.1)
+        assert t1 != t2
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(write, timeout=0.05)
+
+        await strategy.release(read, t1)
+        await strategy.release(read, t2)
+        tw = await strategy.acquire(write, timeout=0.1)
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(read, timeout=0.05)
+        await strategy.release(write, tw)
+
+    async def test_queued_writer_blocks_later_readers(self) -> None:
+        strategy = InMemoryLockStrategy()
+        read = ResourceIdentifier("Account", "1", lock_mode="read")
+        write = ResourceIdentifier("Account", "1")
+        order: list[str] = []
+
+        first = await strategy.acquire(read, timeout=0.1)
+
+        async def _take(resource: ResourceIdentifier, name: str) -> None:
+            token = await strategy.acquire(resource, timeout=1.0)
+            order.append(name)
+            await strategy.release(resource, token)
+
+        writer = asyncio.create_task(_take(write, "writer"))
+        await asyncio.sleep(0)
+        reader = asyncio.create_task(_take(read, "reader"))
+        await asyncio.sleep(0)
+        assert order == []
+
+        await strategy.release(read, first)
+        await asyncio.gather(writer, reader)
+        assert order == ["writer", "reader"]
+
+    async def test_idle_state_is_dropped(self) -> None:
+        strategy = InMemoryLockStrategy()
+        resource = ResourceIdentifier("Account", "1")
+
+        token = await strategy.acquire(resource, timeout=0.1)
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(resource, timeout=0.01)
+        await strategy.release(resource, token)
+
+        assert strategy._locks == {}
+        assert strategy.get_stats().active_resources == 0
+
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        strategy = InMemoryLockStrategy()
+        resource = ResourceIdentifier("Account", "1")
+        token = await strategy.acquire(resource, timeout=0.1)
+
+        waiter = asyncio.create_task(strategy.acquire(resource, timeout=5.0))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await strategy.release(resource, token)
+
+        assert strategy._locks == {}
+
+    async def test_read_lock_upgrades_for_same_session(self) -> None:
+        strategy = InMemoryLockStrategy()
+        read = ResourceIdentifier("Account", "1", lock_mode="read")
+        write = ResourceIdentifier("Account", "1")
+
+        token = await strategy.acquire(read, session_id="s1")
+        assert await strategy.acquire(write, session_id="s1") == token
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(read, timeout=0.01)
+
+        await strategy.release(write, token)
+        await strategy.release(read, token)
+        assert await strategy.get_active_locks() == []
+
+    async def test_queue_full_applies_backpressure(self) -> None:
+        strategy = InMemoryLockStrategy(max_queue_size=1)
+        resource = ResourceIdentifier("Account", "1")
+        token = await strategy.acquire(resource)
+        waiter = asyncio.create_task(strategy.acquire(resource, timeout=1.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LockAcquisitionError, match="queue full"):
+            await strategy.acquire(resource, timeout=1.0)
+
+        await strategy.release(resource, token)
+        await strategy.release(resource, await waiter)
+
+    async def test_contention_stats(self) -> None:
+        strategy = InMemoryLockStrategy()
+        resource = ResourceIdentifier("Account", "1")
+        token = await strategy.acquire(resource)
+
+        waiter = asyncio.create_task(strategy.acquire(resource, timeout=1.0))
+        await asyncio.sleep(0.02)
+        assert strategy.get_stats().waiting == 1
+        await strategy.release(resource, token)
+        await strategy.release(resource, await waiter)
+        held = await strategy.acquire(resource)
+        with pytest.raises(LockAcquisitionError):
+            await strategy.acquire(resource, timeout=0.01)
+        await strategy.release(resource, held)
+
+        stats = strategy.get_stats()
+        assert stats.acquisitions == 3
+        assert stats.contended == 1
+        assert stats.timeouts == 1
+        assert stats.max_queue_depth == 1
+        assert stats.max_wait_seconds >= 0.01
+        assert stats.mean_wait_seconds == stats.total_wait_seconds
+
+        strategy.reset_stats()
+        assert strategy.get_stats().acquisitions == 0
+
+
 class TestCriticalSection:
     """Test CriticalSection multi-resource locking."""
 
@@ -227,6 +353,77 @@ class TestCriticalSection:
             pass  # Success means they were sorted
 
 
+class MultiLockStrategy(InMemoryLockStrategy):
+    """In-memory strategy that records all-or-nothing calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    async def acquire_many(
+        self,
+        resources: Sequence[ResourceIdentifier],
+        *,
+        timeout: float = 10.0,
+        ttl: float = 30.0,
+        session_id: str | None = None,
+    ) -> list[str]:
+        self.calls.append("acquire_many")
+        acquired: list[tuple[ResourceIdentifier, str]] = []
+        try:
+            for resource in resources:
+                token = await self.acquire(
+                    resource, timeout=timeout, ttl=ttl, session_id=session_id
+                )
+                acquired.append((resource, token))
+        except ConcurrencyError:
+            for resource, token in acquired:
+                await self.release(resource, token)
+            raise
+        return [token for _, token in acquired]
+
+    async def release_many(
+        self, locks: Sequence[tuple[ResourceIdentifier, str]]
+    ) -> None:
+        self.calls.append("release_many")
+        for resource, token in locks:
+            await self.release(resource, token)
+
+
+class TestCriticalSectionAcquireMany:
+    """CriticalSection delegates to acquire_many/release_many when available."""
+
+    async def test_uses_single_calls(self) -> None:
+        strategy = MultiLockStrategy()
+        resources = [
+            ResourceIdentifier("Account", "456"),
+            ResourceIdentifier("Account", "123"),
+        ]
+
+        async with CriticalSection(resources, strategy, timeout=1.0):
+            with pytest.raises(ConcurrencyError):
+                await strategy.acquire(resources[0], timeout=0.1)
+
+        assert strategy.calls == ["acquire_many", "release_many"]
+        assert await strategy.get_active_locks() == []
+
+    async def test_failure_holds_nothing(self) -> None:
+        strategy = MultiLockStrategy()
+        r1 = ResourceIdentifier("Account", "123")
+        r2 = ResourceIdentifier("Account", "456")
+        token = await strategy.acquire(r2, timeout=1.0)
+
+        with pytest.raises(LockAcquisitionError):
+            async with CriticalSection([r1, r2], strategy, timeout=0.1):
+                pass
+
+        # Nothing was acquired, so there is nothing to release
+        assert strategy.calls == ["acquire_many"]
+        token1 = await strategy.acquire(r1, timeout=0.1)
+        await strategy.release(r1, token1)
+        await strategy.release(r2, token)
+
+
 class TestConcurrencyGuardMiddleware:
     """Test automatic locking middleware."""
 
@@ -86,3 +86,328 @@ async def test_mediator_query_calls_handler() -> None:
     actual_qry = handler.handle.call_args[0][0]
     assert actual_qry.id == qry.id
     assert actual_qry.correlation_id is not None
+
+
+class _RecordingMiddleware:
+    calls: list[str] = []
+
+    def __init__(self, name: str = "mw") -> None:
+        self.name = name
+
+    async def __call__(self, message, next_handler):
+        _RecordingMiddleware.calls.append(f"{self.name}:{type(message).__name__}")
+        return await next_handler(message)
+
+
+def _mediator_with_middleware(middleware_registry):
+    registry = HandlerRegistry()
+
+    class MyCommandHandler:
+        async def handle(self, command):
+            return CommandResponse(result=command.name)
+
+    class MyQueryHandler:
+        async def handle(self, query):
+            return QueryResponse(result=query.id)
+
+    registry.register_command_handler(MyCommand, MyCommandHandler)
+    registry.register_query_handler(MyQuery, MyQueryHandler)
+
+    uow = AsyncMock(spec=UnitOfWork)
+    uow.__aenter__.return_value = uow
+    return Mediator(
+        registry=registry,
+        uow_factory=MagicMock(return_value=uow),
+        middleware_registry=middleware_registry,
+    )
+
+
+@pytest.mark.asyncio
+async def test_mediator_caches_compiled_pipeline_per_message_type() -> None:
+    from cqrs_ddd_core.middleware.registry import MiddlewareRegistry
+
+    _RecordingMiddleware.calls = []
+    middleware_registry = MiddlewareRegistry()
+    middleware_registry.register(_RecordingMiddleware, name="all")
+    mediator = _mediator_with_middleware(middleware_registry)
+
+    await mediator.send(MyCommand(name="a"))
+    pipeline = mediator._pipeline_cache[(MyCommand, middleware_registry.generation)]
+    await mediator.send(MyCommand(name="b"))
+
+    assert len(mediator._pipeline_cache) == 1
+    assert (
+        mediator._pipeline_cache[(MyCommand, middleware_registry.generation)]
+        is pipeline
+    )
+    assert _RecordingMiddleware.calls == ["all:MyCommand", "all:MyCommand"]
+
+
+@pytest.mark.asyncio
+async def test_mediator_recompiles_pipeline_after_registration() -> None:
+    from cqrs_ddd_core.middleware.registry import MiddlewareRegistry
+
+    _RecordingMiddleware.calls = []
+    middleware_registry = MiddlewareRegistry()
+    mediator = _mediator_with_middleware(middleware_registry)
+
+    await mediator.query(MyQuery(id="1"))
+    middleware_registry.register(_RecordingMiddleware, name="late")
+    result = await mediator.query(MyQuery(id="2"))
+
+    assert result.result == "2"
+    assert _RecordingMiddleware.calls == ["late:MyQuery"]
+    assert list(mediator._pipeline_cache) == [(MyQuery, middleware_registry.generation)]
+
+
+@pytest.mark.asyncio
+async def test_mediator_skips_middleware_not_applicable_to_message_type() -> None:
+    from cqrs_ddd_core.middleware.registry import MiddlewareRegistry
+
+    _RecordingMiddleware.calls = []
+    middleware_registry = MiddlewareRegistry()
+    middleware_registry.register(
+        _RecordingMiddleware, name="commands", message_types=[Command]
+    )
+    mediator = _mediator_with_middleware(middleware_registry)
+
+    await mediator.send(MyCommand(name="a"))
+    await mediator.query(MyQuery(id="1"))
+
+    assert _RecordingMiddleware.calls == ["commands:MyCommand"]
+
+
+@pytest.mark.asyncio
+async def test_mediator_enriches_copies_of_raised_events() -> None:
+    from cqrs_ddd_core.domain.events import DomainEvent
+
+    class Happened(DomainEvent):
+        pass
+
+    raised = [Happened(), Happened()]
+    registry = HandlerRegistry()
+
+    class RaisingHandler:
+        async def handle(self, command):
+            return CommandResponse(result="ok", events=raised)
+
+    registry.register_command_handler(MyCommand, RaisingHandler)
+    uow = AsyncMock(spec=UnitOfWork)
+    uow.__aenter__.return_value = uow
+    mediator = Mediator(registry=registry, uow_factory=MagicMock(return_value=uow))
+
+    cmd = MyCommand(name="x")
+    result = await mediator.send(cmd)
+
+    assert [e.event_id for e in result.events] == [e.event_id for e in raised]
+    assert {e.correlation_id for e in raised} == {None}
+    assert {e.correlation_id for e in result.events} == {result.correlation_id}
+    assert {e.causation_id for e in result.events} == {cmd.command_id}
+
+
+class _CountingFactory:
+    def __init__(self) -> None:
+        self.built: list[type] = []
+
+    def __call__(self, cls):
+        self.built.append(cls)
+        return cls()
+
+
+def _lifetime_mediator(handler_cls, query_handler_cls=None, **kwargs):
+    registry = HandlerRegistry()
+    registry.register_command_handler(MyCommand, handler_cls)
+    if query_handler_cls is not None:
+        registry.register_query_handler(MyQuery, query_handler_cls)
+    uow = AsyncMock(spec=UnitOfWork)
+    uow.__aenter__.return_value = uow
+    factory = _CountingFactory()
+    mediator = Mediator(
+        registry=registry,
+        uow_factory=MagicMock(return_value=uow),
+        handler_factory=factory,
+        **kwargs,
+    )
+    return mediator, factory
+
+
+@pytest.mark.asyncio
+async def test_mediator_transient_handlers_built_per_message() -> None:
+    class Handler:
+        async def handle(self, command):
+            return CommandResponse(result="ok")
+
+    mediator, factory = _lifetime_mediator(Handler)
+    await mediator.send(MyCommand(name="a"))
+    await mediator.send(MyCommand(name="b"))
+
+    assert factory.built == [Handler, Handler]
+
+
+@pytest.mark.asyncio
+async def test_mediator_singleton_handler_from_class_attribute() -> None:
+    from cqrs_ddd_core.cqrs.handler import HandlerLifetime
+
+    class Handler:
+        handler_lifetime = HandlerLifetime.SINGLETON
+
+        async def handle(self, command):
+            return CommandResponse(result="ok")
+
+    class QHandler:
+        async def handle(self, query):
+            return QueryResponse(result=query.id)
+
+    mediator, factory = _lifetime_mediator(
+        Handler,
+        QHandler,
+        handler_lifetimes={QHandler: HandlerLifetime.SINGLETON},
+    )
+    for i in range(3):
+        await mediator.send(MyCommand(name=str(i)))
+        await mediator.query(MyQuery(id=str(i)))
+
+    assert factory.built == [Handler, QHandler]
+
+
+@pytest.mark.asyncio
+async def test_mediator_scoped_handler_shared_within_root_uow() -> None:
+    from cqrs_ddd_core.cqrs.handler import HandlerLifetime
+
+    class NestedCommand(Command[str]):
+        pass
+
+    seen: list[int] = []
+
+    class NestedHandler:
+        async def handle(self, command):
+            seen.append(id(self))
+            return CommandResponse(result="nested")
+
+    class Handler:
+        async def handle(self, command):
+            await mediator.send(NestedCommand())
+            await mediator.send(NestedCommand())
+            return CommandResponse(result="ok")
+
+    mediator, factory = _lifetime_mediator(
+        Handler, default_handler_lifetime=HandlerLifetime.SCOPED
+    )
+    mediator._registry.register_command_handler(NestedCommand, NestedHandler)
+
+    await mediator.send(MyCommand(name="a"))
+    await mediator.send(MyCommand(name="b"))
+
+    assert factory.built == [Handler, NestedHandler, Handler, NestedHandler]
+    assert seen[0] == seen[1]
+
+
+class _CountingUoW(UnitOfWork):
+    instances: list["_CountingUoW"] = []
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.commits = 0
+        self.rollbacks = 0
+        _CountingUoW.instances.append(self)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _batch_mediator(fail_on: str | None = None):
+    from cqrs_ddd_core.cqrs.event_dispatcher import EventDispatcher
+    from cqrs_ddd_core.cqrs.mediator import get_current_uow
+    from cqrs_ddd_core.domain.events import DomainEvent
+
+    class Imported(DomainEvent):
+        name: str = ""
+
+    class ImportHandler:
+        async def handle(self, command):
+            if command.name == fail_on:
+                raise RuntimeError(f"cannot import {command.name}")
+            get_current_uow().on_commit(AsyncMock())
+            return CommandResponse(
+                result=command.name, events=[Imported(name=command.name)]
+            )
+
+    registry = HandlerRegistry()
+    registry.register_command_handler(MyCommand, ImportHandler)
+    dispatcher = EventDispatcher()
+    dispatcher.dispatch_batch = AsyncMock()  # type: ignore[method-assign]
+    dispatcher.dispatch = AsyncMock()  # type: ignore[method-assign]
+    _CountingUoW.instances = []
+    mediator = Mediator(
+        registry=registry, uow_factory=_CountingUoW, event_dispatcher=dispatcher
+    )
+    return mediator, dispatcher
+
+
+@pytest.mark.asyncio
+async def test_send_many_atomic_uses_one_uow_and_one_event_batch() -> None:
+    mediator, dispatcher = _batch_mediator()
+
+    commands = [MyCommand(name=str(i)) for i in range(5)]
+    responses = await mediator.send_many(commands)
+
+    assert [r.result for r in responses] == [str(i) for i in range(5)]
+    assert [u.commits for u in _CountingUoW.instances] == [1]
+    dispatcher.dispatch.assert_not_awaited()
+    dispatcher.dispatch_batch.assert_awaited_once()
+    events = dispatcher.dispatch_batch.await_args.args[0]
+    assert [e.name for e in events] == [str(i) for i in range(5)]
+    assert len({r.correlation_id for r in responses}) == 1
+    assert [e.causation_id for e in events] == [c.command_id for c in commands]
+
+
+@pytest.mark.asyncio
+async def test_send_many_chunks_commit_per_chunk() -> None:
+    mediator, dispatcher = _batch_mediator()
+
+    await mediator.send_many(
+        [MyCommand(name=str(i)) for i in range(5)], atomic=False, chunk_size=2
+    )
+
+    assert [u.commits for u in _CountingUoW.instances] == [1, 1, 1]
+    assert dispatcher.dispatch_batch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_send_many_failure_rolls_back_only_current_chunk() -> None:
+    mediator, _ = _batch_mediator(fail_on="3")
+
+    with pytest.raises(RuntimeError, match="cannot import 3"):
+        await mediator.send_many(
+            [MyCommand(name=str(i)) for i in range(5)], atomic=False, chunk_size=2
+        )
+
+    assert [(u.commits, u.rollbacks) for u in _CountingUoW.instances] == [
+        (1, 0),
+        (0, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_many_atomic_failure_rolls_back_everything() -> None:
+    mediator, dispatcher = _batch_mediator(fail_on="4")
+
+    with pytest.raises(RuntimeError):
+        await mediator.send_many([MyCommand(name=str(i)) for i in range(5)])
+
+    assert [(u.commits, u.rollbacks) for u in _CountingUoW.instances] == [(0, 1)]
+    dispatcher.dispatch_batch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_send_many_validates_arguments() -> None:
+    mediator, _ = _batch_mediator()
+
+    assert await mediator.send_many([]) == []
+    with pytest.raises(ValueError, match="atomic=False"):
+        await mediator.send_many([MyCommand(name="a")], chunk_size=10)
+    with pytest.raises(ValueError, match="positive"):
+        await mediator.send_many([MyCommand(name="a")], atomic=False, chunk_size=0)
@@ -6,6 +6,7 @@ import pytest
 
 from cqrs_ddd_core.adapters.memory.event_store import InMemoryEventStore
 from cqrs_ddd_core.domain.events import DomainEvent
+from cqrs_ddd_core.ports.event_store import EventCursor, StoredEvent
 
 
 class OrderCreated(DomainEvent):
@@ -211,3 +212,67 @@ class TestInMemoryEventStore:
         assert len(events_456) == 1
         assert events_123[0].aggregate_id == "order-123"
         assert events_456[0].aggregate_id == "order-456"
+
+    async def test_stream_batches_carries_resume_cursor(
+        self, store: InMemoryEventStore
+    ) -> None:
+        """stream_batches() pages by (position, event_id) and resumes exactly."""
+        await store.append_batch(
+            [
+                StoredEvent(event_id=event_id, aggregate_id="a", position=position)
+                for event_id, position in [("e5", 5), ("e2b", 2), ("e2a", 2)]
+            ]
+        )
+        store._events.append(StoredEvent(event_id="unpositioned"))
+
+        batches = [b async for b in store.stream_batches(batch_size=2)]
+
+        assert [[e.event_id for e in b.events] for b in batches] == [
+            ["e2a", "e2b"],
+            ["e5"],
+        ]
+        assert batches[0].cursor == EventCursor(2, "e2b")
+        resumed = [b async for b in store.stream_batches(EventCursor(2, "e2a"))]
+        assert [e.event_id for e in resumed[0].events] == ["e2b", "e5"]
+        from_checkpoint = [b async for b in store.stream_batches(EventCursor(2))]
+        assert [e.event_id for e in from_checkpoint[0].events] == ["e5"]
+
+    async def test_get_all_streaming_uses_positions(
+        self, store: InMemoryEventStore
+    ) -> None:
+        """get_all_streaming() pages by position, not by a running offset."""
+        await store.append_batch(
+            [StoredEvent(aggregate_id="a", position=p) for p in (10, 20, 30)]
+        )
+
+        batches = [b async for b in store.get_all_streaming(batch_size=2)]
+
+        assert [[e.position for e in b] for b in batches] == [[10, 20], [30]]
+
+    async def test_append_batch_returns_positions(
+        self, store: InMemoryEventStore
+    ) -> None:
+        """append_batch() returns assigned or preserved positions, in order."""
+        assert await store.append_batch([]) == []
+        assert await store.append_batch([StoredEvent(), StoredEvent()]) == [0, 1]
+        assert await store.append_batch([StoredEvent(position=10), StoredEvent()]) == [
+            10,
+            3,
+        ]
+
+    async def test_get_events_for_aggregates(self, store: InMemoryEventStore) -> None:
+        """get_events_for_aggregates() applies each aggregate's after_version."""
+        await store.append_batch(
+            [
+                StoredEvent(aggregate_id=aggregate_id, version=version)
+                for version in (1, 2, 3)
+                for aggregate_id in ("a", "b", "c")
+            ]
+        )
+
+        events = await store.get_events_for_aggregates(["a", "b", "x"], {"b": 2})
+
+        assert [e.version for e in events["a"]] == [1, 2, 3]
+        assert [e.version for e in events["b"]] == [3]
+        assert events["x"] == []
+        assert "c" not in events
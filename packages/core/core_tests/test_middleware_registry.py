@@ -65,3 +65,44 @@ def test_middleware_registry_clear() -> None:
     registry.register(Middleware1)
     registry.clear()
     assert len(registry.get_ordered_middlewares()) == 0
+
+
+class _BaseMessage:
+    pass
+
+
+class _OtherMessage:
+    pass
+
+
+def test_middleware_registry_message_types_filter() -> None:
+    registry = MiddlewareRegistry()
+    registry.register(Middleware1, priority=0)
+    registry.register(Middleware2, priority=10, message_types=[_BaseMessage])
+
+    class DerivedMessage(_BaseMessage):
+        pass
+
+    derived = registry.get_middlewares_for(DerivedMessage)
+    other = registry.get_middlewares_for(_OtherMessage)
+
+    assert [type(m) for m in derived] == [Middleware1, Middleware2]
+    assert [type(m) for m in other] == [Middleware1]
+    # Cached per type until the next registration
+    assert registry.get_middlewares_for(_OtherMessage) is other
+
+
+def test_middleware_registry_generation_bumps_on_change() -> None:
+    registry = MiddlewareRegistry()
+    gen0 = registry.generation
+    before = registry.get_middlewares_for(_OtherMessage)
+
+    registry.register(Middleware1)
+    assert registry.generation == gen0 + 1
+    after = registry.get_middlewares_for(_OtherMessage)
+    assert before == ()
+    assert len(after) == 1
+
+    registry.clear()
+    assert registry.generation == gen0 + 2
+    assert registry.get_middlewares_for(_OtherMessage) == ()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -12,9 +13,17 @@ from cqrs_ddd_core.adapters.memory.locking import InMemoryLockStrategy
 from cqrs_ddd_core.adapters.memory.outbox import InMemoryOutboxStorage
 from cqrs_ddd_core.cqrs import BufferedOutbox as OutboxPublisher
 from cqrs_ddd_core.cqrs import BufferedOutbox as OutboxWorker
-from cqrs_ddd_core.cqrs import OutboxService
-from cqrs_ddd_core.ports.outbox import OutboxMessage
-from cqrs_ddd_core.primitives.exceptions import ConcurrencyError, OutboxError
+from cqrs_ddd_core.cqrs import (
+    OutboxPurgeWorker,
+    OutboxService,
+    TopicRoutingPublisher,
+)
+from cqrs_ddd_core.ports.outbox import OutboxMessage, OutboxStats
+from cqrs_ddd_core.primitives.exceptions import (
+    BatchPublishError,
+    ConcurrencyError,
+    OutboxError,
+)
 
 # ═══════════════════════════════════════════════════════════════════════
 # Helpers
@@ -134,6 +143,34 @@ class TestOutboxService:
         assert len(pending) == 1
         assert pending[0].event_type == "EventB"
 
+    @pytest.mark.asyncio
+    async def test_structural_storage_without_mark_failed_batch(self) -> None:
+        """Storages that only match IOutboxStorage structurally still work."""
+
+        class StructuralStorage:
+            def __init__(self) -> None:
+                self.inner = InMemoryOutboxStorage()
+                self.save_messages = self.inner.save_messages
+                self.get_pending = self.inner.get_pending
+                self.mark_published = self.inner.mark_published
+                self.mark_failed = self.inner.mark_failed
+
+        storage = StructuralStorage()
+        publisher = _make_publisher()
+        ok, bad = _make_message(event_type="Ok"), _make_message(event_type="Bad")
+
+        async def _fail_bad(topic: str, message: Any, **kwargs: Any) -> None:
+            if topic == "Bad":
+                raise RuntimeError("rejected")
+
+        publisher.publish.side_effect = _fail_bad
+        await storage.save_messages([ok, bad])
+        service = OutboxService(storage, publisher, InMemoryLockStrategy())  # type: ignore[arg-type]
+
+        assert await service.process_batch() == 1
+        pending = await storage.get_pending()
+        assert [(m.event_type, m.error) for m in pending] == [("Bad", "rejected")]
+
     @pytest.mark.asyncio
     async def test_retry_failed(self) -> None:
         storage = InMemoryOutboxStorage()
@@ -248,6 +285,232 @@ class TestOutboxService:
         publisher.publish.assert_not_called()
 
 
+class TestOutboxServiceClaimMode:
+    @pytest.mark.asyncio
+    async def test_workers_receive_disjoint_batches(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+        await storage.save_messages([_make_message() for _ in range(5)])
+
+        # Claims that are never released simulate a worker still publishing.
+        first = await storage.claim_pending(3, worker_id="w1")
+        service = OutboxService(storage, publisher, worker_id="w2")
+
+        count = await service.process_batch(batch_size=10)
+
+        assert count == 2
+        claimed_by_first = {m.message_id for m in first}
+        published = {m.message_id for m in storage._messages if m.published_at}
+        assert published.isdisjoint(claimed_by_first)
+
+    @pytest.mark.asyncio
+    async def test_failure_clears_claim(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+        publisher.publish.side_effect = RuntimeError("broker down")
+        service = OutboxService(storage, publisher)
+        await storage.save_messages([_make_message()])
+
+        assert await service.process_batch() == 0
+
+        publisher.publish.side_effect = None
+        assert await service.retry_failed() == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_claims_only_retryable_messages(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+        service = OutboxService(storage, publisher, max_retries=3)
+        await storage.save_messages(
+            [_make_message(), _make_message(error="boom", retry_count=3)]
+        )
+        failed = _make_message(error="boom", retry_count=1)
+        await storage.save_messages([failed])
+
+        # The older fresh and exhausted messages don't use up the batch
+        assert await service.retry_failed(batch_size=1) == 1
+        publisher.publish.assert_awaited_once()
+        assert failed.message_id not in {
+            m.message_id for m in await storage.get_pending()
+        }
+        assert storage._claims == {}
+        assert await service.process_batch() == 2
+
+    def test_requires_claiming_storage(self) -> None:
+        storage = AsyncMock(spec=["save_messages", "get_pending"])
+        with pytest.raises(OutboxError, match="IClaimingOutboxStorage"):
+            OutboxService(storage, _make_publisher())
+
+    @pytest.mark.asyncio
+    async def test_buffered_outbox_without_lock_strategy(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+        outbox = OutboxWorker(storage=storage, broker=publisher)
+        await storage.save_messages([_make_message()])
+
+        assert await outbox._service.process_batch() == 1
+
+
+class TestOutboxServiceConcurrentPublish:
+    @staticmethod
+    def _keyed(key: str, seq: int) -> OutboxMessage:
+        msg = _make_message(event_type=f"{key}-{seq}")
+        msg.metadata["aggregate_id"] = key
+        return msg
+
+    @pytest.mark.asyncio
+    async def test_parallel_across_keys_ordered_within_key(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+        in_flight = 0
+        peak = 0
+        order: list[str] = []
+
+        async def _slow_publish(topic: str, message: Any, **kwargs: Any) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            order.append(topic)
+            in_flight -= 1
+
+        publisher.publish.side_effect = _slow_publish
+        service = OutboxService(storage, publisher, max_concurrency=2)
+        await storage.save_messages(
+            [self._keyed(key, seq) for seq in range(3) for key in ("a", "b", "c")]
+        )
+
+        count = await service.process_batch()
+
+        assert count == 9
+        assert peak == 2
+        for key in ("a", "b", "c"):
+            assert [t for t in order if t.startswith(key)] == [
+                f"{key}-0",
+                f"{key}-1",
+                f"{key}-2",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_failure_holds_back_rest_of_partition(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _make_publisher()
+
+        async def _fail_a1(topic: str, message: Any, **kwargs: Any) -> None:
+            if topic == "a-1":
+                raise RuntimeError("broker down")
+
+        publisher.publish.side_effect = _fail_a1
+        storage.mark_failed_batch = AsyncMock(  # type: ignore[method-assign]
+            wraps=storage.mark_failed_batch
+        )
+        service = OutboxService(storage, publisher, max_concurrency=4)
+        await storage.save_messages(
+            [self._keyed(key, seq) for key in ("a", "b") for seq in range(3)]
+        )
+
+        count = await service.process_batch()
+
+        assert count == 4
+        published_topics = [c.kwargs["topic"] for c in publisher.publish.call_args_list]
+        assert "a-2" not in published_topics
+        storage.mark_failed_batch.assert_awaited_once()
+        pending = {m.event_type: m for m in await storage.get_pending()}
+        assert set(pending) == {"a-1", "a-2"}
+        assert pending["a-1"].error == "broker down"
+        assert pending["a-2"].error is None
+        # Both are claimable again and go out in order once the broker recovers
+        publisher.publish.reset_mock(side_effect=True)
+        assert await service.process_batch() == 2
+        assert [c.kwargs["topic"] for c in publisher.publish.call_args_list] == [
+            "a-1",
+            "a-2",
+        ]
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            OutboxService(InMemoryOutboxStorage(), _make_publisher(), max_concurrency=0)
+
+
+class _BatchPublisher:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.batches: list[list[tuple[str, Any, dict[str, Any]]]] = []
+        self.publish = AsyncMock()
+
+    async def publish_batch(
+        self, messages: list[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        self.batches.append(list(messages))
+        if self.error is not None:
+            raise self.error
+
+
+class TestOutboxServiceBatchPublish:
+    @pytest.mark.asyncio
+    async def test_uses_publish_batch_when_available(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _BatchPublisher()
+        service = OutboxService(storage, publisher)
+        await storage.save_messages(
+            [_make_message(event_type=f"E{i}") for i in range(3)]
+        )
+
+        count = await service.process_batch()
+
+        assert count == 3
+        publisher.publish.assert_not_called()
+        assert [topic for topic, _, _ in publisher.batches[0]] == ["E0", "E1", "E2"]
+        assert publisher.batches[0][0][2] == {"correlation_id": "test-correlation-id"}
+        assert await storage.get_pending() == []
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_marks_every_message_failed(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _BatchPublisher(error=RuntimeError("broker down"))
+        service = OutboxService(storage, publisher)
+        await storage.save_messages([_make_message(), _make_message()])
+
+        count = await service.process_batch()
+
+        assert count == 0
+        pending = await storage.get_pending()
+        assert [m.error for m in pending] == ["broker down", "broker down"]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_failure_marks_only_failed_messages(self) -> None:
+        storage = InMemoryOutboxStorage()
+        publisher = _BatchPublisher(error=BatchPublishError({1: "rejected"}, [2]))
+        service = OutboxService(storage, publisher)
+        messages = [_make_message(event_type=f"E{i}") for i in range(4)]
+        await storage.save_messages(messages)
+
+        count = await service.process_batch()
+
+        assert count == 2
+        pending = {m.event_type: m for m in await storage.get_pending()}
+        assert set(pending) == {"E1", "E2"}
+        assert (pending["E1"].error, pending["E1"].retry_count) == ("rejected", 1)
+        assert (pending["E2"].error, pending["E2"].retry_count) == (None, 0)
+
+    @pytest.mark.asyncio
+    async def test_router_over_plain_publisher_publishes_per_message(self) -> None:
+        storage = InMemoryOutboxStorage()
+        plain = _make_publisher()
+        plain.publish.side_effect = [None, RuntimeError("nack"), None]
+        service = OutboxService(storage, TopicRoutingPublisher(default=plain))
+        await storage.save_messages(
+            [_make_message(event_type=f"E{i}") for i in range(3)]
+        )
+
+        count = await service.process_batch()
+
+        assert count == 2
+        assert plain.publish.await_count == 3
+        pending = await storage.get_pending()
+        assert [(m.event_type, m.retry_count) for m in pending] == [("E1", 1)]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # OutboxPublisher tests
 # ═══════════════════════════════════════════════════════════════════════
@@ -518,3 +781,93 @@ class TestOutboxWorker:
         import asyncio
 
         assert asyncio.iscoroutinefunction(on_commit_callback[0])
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Retention
+# ═══════════════════════════════════════════════════════════════════════
+
+
+async def _published_storage(count: int, age: timedelta) -> InMemoryOutboxStorage:
+    storage = InMemoryOutboxStorage()
+    created_at = datetime.now(timezone.utc) - age
+    messages = [_make_message() for _ in range(count)]
+    for msg in messages:
+        msg.created_at = created_at
+    await storage.save_messages(messages)
+    await storage.mark_published([m.message_id for m in messages])
+    return storage
+
+
+class TestOutboxRetention:
+    @pytest.mark.asyncio
+    async def test_purge_worker_removes_expired_in_chunks(self) -> None:
+        storage = await _published_storage(5, age=timedelta(days=10))
+        fresh = _make_message()
+        await storage.save_messages([fresh])
+        await storage.mark_published([fresh.message_id])
+        worker = OutboxPurgeWorker(storage, retention=timedelta(days=7), chunk_size=2)
+
+        with patch.object(
+            storage, "purge_published", wraps=storage.purge_published
+        ) as purge:
+            assert await worker.run_once() == 5
+
+        assert purge.await_count == 3
+        assert len(storage) == 1
+
+    @pytest.mark.asyncio
+    async def test_purge_worker_archives_and_uses_uow(self) -> None:
+        storage = await _published_storage(3, age=timedelta(days=40))
+        uows: list[Any] = []
+
+        class _UoW:
+            async def __aenter__(self) -> _UoW:
+                uows.append(self)
+                return self
+
+            async def __aexit__(self, *exc: object) -> None:
+                return None
+
+        worker = OutboxPurgeWorker(
+            storage, chunk_size=10, archive=True, uow_factory=_UoW
+        )
+
+        assert await worker.run_once() == 3
+        assert len(uows) == 1
+        assert sum(len(msgs) for msgs in storage.archived.values()) == 3
+
+    @pytest.mark.asyncio
+    async def test_purge_worker_start_and_stop(self) -> None:
+        storage = await _published_storage(2, age=timedelta(days=10))
+        worker = OutboxPurgeWorker(storage, interval=0.01)
+
+        await worker.start()
+        await asyncio.sleep(0.03)
+        await worker.stop()
+
+        assert len(storage) == 0
+        assert worker._task is None
+
+    def test_purge_worker_rejects_empty_chunks(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            OutboxPurgeWorker(InMemoryOutboxStorage(), chunk_size=0)
+
+    @pytest.mark.asyncio
+    async def test_stats(self) -> None:
+        storage = await _published_storage(2, age=timedelta(days=1))
+        oldest = _make_message()
+        oldest.created_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        failed = _make_message(error="boom", retry_count=1)
+        await storage.save_messages([oldest, _make_message(), failed])
+
+        stats = await storage.get_stats()
+
+        assert (stats.pending, stats.failed, stats.published) == (2, 1, 2)
+        assert stats.oldest_pending_at == oldest.created_at
+        age = stats.oldest_pending_age()
+        assert age is not None
+        assert 299 < age < 310
+
+    def test_stats_without_pending(self) -> None:
+        assert OutboxStats().oldest_pending_age() is None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -12,8 +12,14 @@ from cqrs_ddd_core.cqrs import (
     route_to,
 )
 from cqrs_ddd_core.domain.events import DomainEvent
-from cqrs_ddd_core.ports.messaging import IMessagePublisher
-from cqrs_ddd_core.primitives.exceptions import PublisherNotFoundError
+from cqrs_ddd_core.ports.messaging import IMessagePublisher, supports_publish_batch
+from cqrs_ddd_core.primitives.exceptions import (
+    BatchPublishError,
+    PublisherNotFoundError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 # ============================================================================
 # Test Events
@@ -55,6 +61,35 @@ class DummyPublisher(IMessagePublisher):
         self.published.append((topic, message))
 
 
+class BatchingPublisher(DummyPublisher):
+    """Mock publisher with a native batch API."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.error = error
+        self.batches: list[list[tuple[str, Any, dict[str, Any]]]] = []
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        self.batches.append(list(messages))
+        if self.error is not None:
+            raise self.error
+
+
+class FlakyPublisher(DummyPublisher):
+    """Publisher that rejects messages whose ``message`` field is listed."""
+
+    def __init__(self, fail_on: set[str]) -> None:
+        super().__init__()
+        self.fail_on = fail_on
+
+    async def publish(self, topic: str, message: Any, **kwargs: Any) -> None:
+        if message.message in self.fail_on:
+            raise RuntimeError(f"rejected {message.message}")
+        await super().publish(topic, message, **kwargs)
+
+
 class FailingPublisher(IMessagePublisher):
     """Publisher that always fails."""
 
@@ -177,3 +212,105 @@ class TestTopicRoutingPublisher:
         await router.publish("DummyEvent", DummyEvent())
 
         assert len(pub.published) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_groups_by_resolved_publisher(self) -> None:
+        """publish_batch() should use each target's batch API when present."""
+        batching = BatchingPublisher()
+        plain = DummyPublisher()
+        router = TopicRoutingPublisher(destinations={"fast": batching}, default=plain)
+        first, second = FastEvent(data="1"), FastEvent(data="2")
+        dummy = DummyEvent()
+
+        await router.publish_batch(
+            [
+                ("FastEvent", first, {"correlation_id": "c1"}),
+                ("DummyEvent", dummy, {}),
+                ("FastEvent", second, {}),
+            ]
+        )
+
+        assert batching.batches == [
+            [("FastEvent", first, {"correlation_id": "c1"}), ("FastEvent", second, {})]
+        ]
+        assert plain.published == [("DummyEvent", dummy)]
+
+    def test_supports_batch_only_when_every_target_does(self) -> None:
+        """The router should advertise batching only for batch-capable targets."""
+        batching = BatchingPublisher()
+        mixed = TopicRoutingPublisher(
+            destinations={"fast": batching}, default=DummyPublisher()
+        )
+        uniform = TopicRoutingPublisher(
+            destinations={"fast": batching}, default=batching
+        )
+
+        assert not supports_publish_batch(mixed)
+        assert supports_publish_batch(uniform)
+        assert not supports_publish_batch(TopicRoutingPublisher())
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_reports_per_message_failures(self) -> None:
+        """A failing plain publish should fail only that message and hold back
+        the rest of its group."""
+        flaky = FlakyPublisher(fail_on={"2"})
+        batching = BatchingPublisher()
+        router = TopicRoutingPublisher(destinations={"fast": batching}, default=flaky)
+        messages = [
+            ("DummyEvent", DummyEvent(message="1"), {}),
+            ("DummyEvent", DummyEvent(message="2"), {}),
+            ("FastEvent", FastEvent(), {}),
+            ("DummyEvent", DummyEvent(message="3"), {}),
+        ]
+
+        with pytest.raises(BatchPublishError) as exc_info:
+            await router.publish_batch(messages)
+
+        assert exc_info.value.failed == {1: "rejected 2"}
+        assert exc_info.value.unsent == [3]
+        assert [m.message for _, m in flaky.published] == ["1"]
+        assert len(batching.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_maps_target_partial_failures(self) -> None:
+        """Indices from a target's BatchPublishError should map to the batch."""
+        batching = BatchingPublisher(error=BatchPublishError({1: "too big"}))
+        router = TopicRoutingPublisher(
+            destinations={"fast": batching}, default=batching
+        )
+        router.register_route("DummyEvent", BatchingPublisher())
+        messages = [
+            ("DummyEvent", DummyEvent(), {}),
+            ("FastEvent", FastEvent(data="a"), {}),
+            ("FastEvent", FastEvent(data="b"), {}),
+        ]
+
+        with pytest.raises(BatchPublishError) as exc_info:
+            await router.publish_batch(messages)
+
+        assert exc_info.value.failed == {2: "too big"}
+        assert exc_info.value.unsent == []
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_unroutable_fails_only_those_messages(self) -> None:
+        """Unroutable topics should fail individually; the rest still publish."""
+        pub = DummyPublisher()
+        batching = BatchingPublisher()
+        router = TopicRoutingPublisher(
+            routes={"DummyEvent": pub}, destinations={"fast": batching}
+        )
+        messages = [
+            ("DummyEvent", DummyEvent(message="1"), {}),
+            ("Other", DummyEvent(message="2"), {}),
+            ("FastEvent", FastEvent(), {}),
+            ("Unknown", DummyEvent(message="3"), {}),
+        ]
+
+        with pytest.raises(BatchPublishError) as exc_info:
+            await router.publish_batch(messages)
+
+        assert set(exc_info.value.failed) == {1, 3}
+        assert "Other" in exc_info.value.failed[1]
+        assert exc_info.value.unsent == []
+        assert [m.message for _, m in pub.published] == ["1"]
+        assert [len(batch) for batch in batching.batches] == [1]
@@ -0,0 +1,392 @@
+"""Tests for QueryCachingMiddleware."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from cqrs_ddd_core.cqrs.command import Command
+from cqrs_ddd_core.cqrs.mediator import _current_uow
+from cqrs_ddd_core.cqrs.query import Query
+from cqrs_ddd_core.cqrs.response import CommandResponse, QueryResponse
+from cqrs_ddd_core.domain.events import DomainEvent
+from cqrs_ddd_core.middleware import (
+    QueryCachingMiddleware,
+    cached_query,
+    query_cache_key,
+)
+
+
+class OrderDTO(BaseModel):
+    order_id: str
+    total: int = 0
+
+
+class OrderPlaced(DomainEvent):
+    pass
+
+
+class OrderShipped(DomainEvent):
+    pass
+
+
+@cached_query(ttl=30, invalidated_by=[OrderPlaced])
+class GetOrder(Query[OrderDTO]):
+    order_id: str
+    include_lines: bool = False
+
+
+class ListOrders(Query[list[str]]):
+    __cache_ttl__ = 5
+    __cache_invalidated_by__ = (OrderPlaced, OrderShipped)
+
+    customer: str
+
+
+class Uncached(Query[str]):
+    pass
+
+
+class SearchOrders(Query[list[OrderDTO]]):
+    __cache_ttl__ = 10
+
+
+class OrdersByCustomer(Query[dict[str, OrderDTO]]):
+    __cache_ttl__ = 10
+
+
+class LastOrderedAt(Query[datetime]):
+    __cache_ttl__ = 10
+
+
+class UntypedQuery(Query[Any]):
+    __cache_ttl__ = 10
+
+
+class PlaceOrder(Command[str]):
+    pass
+
+
+class DictCache:
+    """Minimal ICacheService keeping values in a dict."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.get_types: list[type[Any] | None] = []
+
+    async def get(self, key: str, cls: type[Any] | None = None) -> Any | None:
+        self.get_types.append(cls)
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def clear_namespace(self, prefix: str) -> None:
+        for key in [k for k in self.data if k.startswith(prefix)]:
+            del self.data[key]
+
+
+class JsonCache(DictCache):
+    """DictCache that stores JSON text, like a networked backend."""
+
+    async def get(self, key: str, cls: type[Any] | None = None) -> Any | None:
+        raw = await super().get(key, cls)
+        if raw is None:
+            return None
+        if cls is not None:
+            return cls.model_validate_json(raw)
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        if hasattr(value, "model_dump_json"):
+            raw = value.model_dump_json()
+        else:
+            raw = json.dumps(value, default=str)
+        await super().set(key, raw, ttl)
+
+
+def _ns(query_type: type[Any]) -> str:
+    return f"query:{query_type.__module__}.{query_type.__qualname__}:"
+
+
+def _handler(result: Any) -> AsyncMock:
+    return AsyncMock(side_effect=lambda q: QueryResponse(result=result))
+
+
+def test_cache_key_ignores_envelope_ids_and_field_order() -> None:
+    a = GetOrder(order_id="o1", include_lines=True, correlation_id="c1")
+    b = GetOrder(include_lines=True, order_id="o1", correlation_id="c2")
+    c = GetOrder(order_id="o2", include_lines=True)
+
+    assert query_cache_key(a) == query_cache_key(b)
+    assert query_cache_key(a) != query_cache_key(c)
+    assert query_cache_key(a).startswith(_ns(GetOrder))
+
+
+def test_cache_key_distinguishes_same_named_query_types() -> None:
+    def _define() -> type[Query[str]]:
+        class GetOrder(Query[str]):  # same name, different qualname
+            order_id: str
+
+        return GetOrder
+
+    other = _define()
+    assert other.__name__ == GetOrder.__name__
+    assert query_cache_key(other(order_id="o1")) != query_cache_key(
+        GetOrder(order_id="o1")
+    )
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit_uses_declared_ttl_and_result_type() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache)
+    dto = OrderDTO(order_id="o1", total=10)
+    handler = _handler(dto)
+
+    first = await middleware(GetOrder(order_id="o1"), handler)
+    second = await middleware(GetOrder(order_id="o1"), handler)
+
+    assert first.result == dto
+    assert second.result == dto
+    handler.assert_awaited_once()
+    key = query_cache_key(GetOrder(order_id="o1"))
+    assert cache.ttls[key] == 30
+    assert cache.get_types[0] is OrderDTO
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "result"),
+    [
+        (
+            SearchOrders(),
+            [OrderDTO(order_id="o1", total=1), OrderDTO(order_id="o2")],
+        ),
+        (OrdersByCustomer(), {"c1": OrderDTO(order_id="o1", total=5)}),
+        (LastOrderedAt(), datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)),
+    ],
+)
+async def test_hit_returns_same_types_as_miss(query: Query[Any], result: Any) -> None:
+    cache = JsonCache()
+    middleware = QueryCachingMiddleware(cache)
+    handler = _handler(result)
+
+    miss = await middleware(query, handler)
+    hit = await middleware(query.model_copy(), handler)
+
+    handler.assert_awaited_once()
+    assert hit.result == miss.result == result
+    assert type(hit.result) is type(miss.result)
+
+
+@pytest.mark.asyncio
+async def test_unknown_result_type_is_not_cached() -> None:
+    cache = JsonCache()
+    middleware = QueryCachingMiddleware(cache)
+    handler = _handler(OrderDTO(order_id="o1"))
+
+    await middleware(UntypedQuery(), handler)
+    await middleware(UntypedQuery(), handler)
+
+    assert handler.await_count == 2
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_class_attribute_ttl_and_uncached_queries() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache)
+
+    await middleware(ListOrders(customer="c"), _handler(["o1"]))
+    assert list(cache.ttls.values()) == [5]
+
+    handler = _handler("x")
+    await middleware(Uncached(), handler)
+    await middleware(Uncached(), handler)
+    assert handler.await_count == 2
+    assert len(cache.data) == 1
+
+
+@pytest.mark.asyncio
+async def test_default_ttl_caches_undeclared_queries() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache, default_ttl=60)
+    handler = _handler("x")
+
+    await middleware(Uncached(), handler)
+    await middleware(Uncached(), handler)
+
+    handler.assert_awaited_once()
+    assert list(cache.ttls.values()) == [60]
+
+
+@pytest.mark.asyncio
+async def test_none_and_failed_results_are_not_cached() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache)
+
+    await middleware(GetOrder(order_id="o1"), _handler(None))
+    failed = AsyncMock(
+        return_value=QueryResponse(result=OrderDTO(order_id="o2"), success=False)
+    )
+    await middleware(GetOrder(order_id="o2"), failed)
+
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_execution() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache)
+    calls = 0
+    release = asyncio.Event()
+
+    async def slow_handler(query: Any) -> QueryResponse[OrderDTO]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return QueryResponse(result=OrderDTO(order_id=query.order_id))
+
+    tasks = [
+        asyncio.create_task(middleware(GetOrder(order_id="o1"), slow_handler))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert {r.result.order_id for r in responses} == {"o1"}
+
+
+@pytest.mark.asyncio
+async def test_followers_receive_leader_error() -> None:
+    middleware = QueryCachingMiddleware(DictCache())
+    release = asyncio.Event()
+
+    async def failing(query: Any) -> QueryResponse[Any]:
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [
+        asyncio.create_task(middleware(GetOrder(order_id="o1"), failing))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_command_events_evict_dependent_query_types() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache, query_types=[GetOrder, ListOrders])
+    cache.data[f"{_ns(GetOrder)}abc"] = "stale"
+    cache.data[f"{_ns(ListOrders)}def"] = "stale"
+    cache.data["query:Other:ghi"] = "kept"
+
+    command_handler = AsyncMock(
+        return_value=CommandResponse(result="ok", events=[OrderShipped()])
+    )
+    await middleware(PlaceOrder(), command_handler)
+
+    assert set(cache.data) == {f"{_ns(GetOrder)}abc", "query:Other:ghi"}
+
+
+@pytest.mark.asyncio
+async def test_eviction_waits_for_unit_of_work_commit() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache, query_types=[GetOrder])
+    cache.data[f"{_ns(GetOrder)}abc"] = "stale"
+
+    class FakeUoW:
+        def __init__(self) -> None:
+            self.callbacks: list[Any] = []
+
+        def on_commit(self, callback: Any) -> None:
+            self.callbacks.append(callback)
+
+    uow = FakeUoW()
+    token = _current_uow.set(uow)
+    try:
+        await middleware(
+            PlaceOrder(),
+            AsyncMock(
+                return_value=CommandResponse(result="ok", events=[OrderPlaced()])
+            ),
+        )
+    finally:
+        _current_uow.reset(token)
+
+    assert f"{_ns(GetOrder)}abc" in cache.data
+    for callback in uow.callbacks:
+        await callback()
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_result_read_before_eviction_is_not_recached() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache, query_types=[GetOrder])
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _slow_handler(query: Any) -> QueryResponse[OrderDTO]:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        return QueryResponse(result=OrderDTO(order_id="o1", total=calls))
+
+    stale_read = asyncio.create_task(middleware(GetOrder(order_id="o1"), _slow_handler))
+    await started.wait()
+    # The command commits (eviction runs) while the query is still in flight
+    await middleware.invalidate(OrderPlaced())
+    release.set()
+    assert (await stale_read).result.total == 1
+    assert cache.data == {}
+
+    fresh = await middleware(GetOrder(order_id="o1"), _slow_handler)
+    assert fresh.result.total == 2
+    assert list(cache.data.values()) == [fresh.result]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_indexes_query_types_seen_at_runtime() -> None:
+    cache = DictCache()
+    middleware = QueryCachingMiddleware(cache)
+    await middleware(ListOrders(customer="c"), _handler(["o1"]))
+    assert cache.data
+
+    await middleware.invalidate(OrderShipped())
+
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_fall_back_to_handler() -> None:
+    cache = AsyncMock()
+    cache.get.side_effect = ConnectionError("redis down")
+    cache.set.side_effect = ConnectionError("redis down")
+    middleware = QueryCachingMiddleware(cache)
+    handler = _handler(OrderDTO(order_id="o1"))
+
+    response = await middleware(GetOrder(order_id="o1"), handler)
+
+    assert response.result.order_id == "o1"
+    handler.assert_awaited_once()
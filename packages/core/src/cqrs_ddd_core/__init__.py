@@ -34,8 +34,10 @@ from .cqrs import (
     CommandResponse,
     EventDispatcher,
     EventHandler,
+    HandlerLifetime,
     HandlerRegistry,
     Mediator,
+    OutboxPurgeWorker,
     OutboxService,
     Query,
     QueryHandler,
@@ -55,6 +57,7 @@ from .domain import (
     EventTypeRegistry,
     ValueObject,
     enrich_event_metadata,
+    enrich_events_metadata,
 )
 
 if HAS_GEO:
@@ -65,6 +68,10 @@ from .instrumentation import (
     HookRegistration,
     HookRegistry,
     InstrumentationHook,
+    LoggingMetricsExporter,
+    MetricsAggregatorHook,
+    MetricsExporter,
+    OperationStats,
     fire_and_forget_hook,
     get_hook_registry,
     set_hook_registry,
@@ -75,13 +82,19 @@ from .middleware import (
     MiddlewareDefinition,
     MiddlewareRegistry,
     OutboxMiddleware,
+    QueryCachingMiddleware,
     ValidatorMiddleware,
     build_pipeline,
+    cached_query,
 )
 
 # ── Ports ────────────────────────────────────────────────────────
 from .ports import (
     DDL_LOCK_TTL_SECONDS,
+    EventBatch,
+    EventCursor,
+    IBatchMessagePublisher,
+    IClaimingOutboxStorage,
     ICommandBus,
     IEventDispatcher,
     IEventStore,
@@ -89,16 +102,20 @@ from .ports import (
     IMessageConsumer,
     IMessagePublisher,
     IMiddleware,
+    IMultiLockStrategy,
+    IOutboxRetentionStorage,
     IOutboxStorage,
     IQueryBus,
     IRepository,
     IValidator,
     OutboxMessage,
+    OutboxStats,
     StoredEvent,
 )
 
 # ── Primitives ──────────────────────────────────────────────────
 from .primitives import (
+    BatchPublishError,
     ConcurrencyError,
     CQRSDDDError,
     DomainConcurrencyError,
@@ -130,12 +147,14 @@ __all__: list[str] = [
     "HAS_GEO",
     "ValueObject",
     "enrich_event_metadata",
+    "enrich_events_metadata",
     # CQRS
     "Command",
     "CommandHandler",
     "CommandResponse",
     "EventDispatcher",
     "EventHandler",
+    "HandlerLifetime",
     "HandlerRegistry",
     "ICommandBus",
     "IQueryBus",
@@ -156,15 +175,21 @@ __all__: list[str] = [
     "set_context_vars",
     "with_correlation_context",
     # Ports
+    "EventBatch",
+    "EventCursor",
+    "IBatchMessagePublisher",
+    "IClaimingOutboxStorage",
     "IEventDispatcher",
     "IEventStore",
     "IMessageConsumer",
     "IMessagePublisher",
     "IMiddleware",
+    "IOutboxRetentionStorage",
     "IOutboxStorage",
     "IRepository",
     "IValidator",
     "OutboxMessage",
+    "OutboxStats",
     "StoredEvent",
     # Middleware
     "EventStorePersistenceMiddleware",
@@ -172,11 +197,17 @@ __all__: list[str] = [
     "MiddlewareDefinition",
     "MiddlewareRegistry",
     "OutboxMiddleware",
+    "QueryCachingMiddleware",
     "ValidatorMiddleware",
     "build_pipeline",
+    "cached_query",
     "InstrumentationHook",
     "HookRegistration",
     "HookRegistry",
+    "LoggingMetricsExporter",
+    "MetricsAggregatorHook",
+    "MetricsExporter",
+    "OperationStats",
     "fire_and_forget_hook",
     "get_hook_registry",
     "set_hook_registry",
@@ -199,9 +230,11 @@ __all__: list[str] = [
     "NotFoundError",
     "OutboxError",
     "PublisherNotFoundError",
+    "BatchPublishError",
     "UUID4Generator",
     "ValidationError",
     "BufferedOutbox",
+    "OutboxPurgeWorker",
     "OutboxService",
     "BaseEventConsumer",
     # Adapters
@@ -211,6 +244,7 @@ __all__: list[str] = [
     "InMemoryUnitOfWork",
     "DDL_LOCK_TTL_SECONDS",
     "ILockStrategy",
+    "IMultiLockStrategy",
     "InMemoryLockStrategy",
 ]
 if HAS_GEO:
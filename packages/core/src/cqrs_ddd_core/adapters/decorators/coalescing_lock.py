@@ -0,0 +1,227 @@
+"""CoalescingLockStrategy - Decorator sharing one distributed lock per process."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from cqrs_ddd_core.ports.locking import ILockStrategy
+from cqrs_ddd_core.primitives.exceptions import LockAcquisitionError
+
+if TYPE_CHECKING:
+    from cqrs_ddd_core.ports.locking import ActiveLock
+    from cqrs_ddd_core.primitives.locking import ResourceIdentifier
+
+logger = logging.getLogger("cqrs_ddd.locking")
+
+_Key = tuple[str, str]
+
+
+@dataclass(slots=True)
+class _Slot:
+    """Local state of one resource: who holds it here and the shared remote lock."""
+
+    resource: ResourceIdentifier
+    ttl: float
+    local: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refs: int = 0
+    remote_token: str | None = None
+    heartbeat: asyncio.Task[None] | None = None
+    holder: str | None = None
+    session_id: str | None = None
+    depth: int = 0
+    handoffs: int = 0
+
+
+class CoalescingLockStrategy(ILockStrategy):
+    """
+    Decorator that coalesces same-process contenders for a distributed lock.
+
+    Pattern:
+    - acquire: Queue on a local asyncio.Lock -> first holder of a burst
+      acquires the inner (e.g. Redis) lock -> later holders inherit it
+    - release: Hand the local lock to the next waiter, keeping the inner lock;
+      release the inner lock only when nobody in this process wants it
+    - While the inner lock is held it is extended every ``extend_interval``
+      seconds (default ``ttl / 3``), so a long burst never lets it expire
+
+    A hot aggregate therefore costs one inner acquire per burst instead of
+    one per command.  To keep other processes from starving, the inner lock
+    is released and re-acquired after ``max_handoffs`` consecutive local
+    handoffs.
+
+    Read locks are passed straight to the inner strategy, which can already
+    share them.  Reentrancy (same ``session_id`` as the current holder) is
+    handled locally.
+    """
+
+    def __init__(
+        self,
+        inner: ILockStrategy,
+        *,
+        extend_interval: float | None = None,
+        max_handoffs: int | None = 100,
+    ) -> None:
+        self._inner = inner
+        self.extend_interval = extend_interval
+        self.max_handoffs = max_handoffs
+        self._slots: dict[_Key, _Slot] = {}
+        self.inner_acquisitions = 0
+        self.local_handoffs = 0
+
+    async def acquire(
+        self,
+        resource: ResourceIdentifier,
+        *,
+        timeout: float = 10.0,
+        ttl: float = 30.0,
+        session_id: str | None = None,
+    ) -> str:
+        if resource.lock_mode == "read":
+            return await self._inner.acquire(
+                resource, timeout=timeout, ttl=ttl, session_id=session_id
+            )
+
+        key = (resource.resource_type, resource.resource_id)
+        slot = self._slots.get(key)
+        if (
+            slot is not None
+            and session_id is not None
+            and slot.holder is not None
+            and slot.session_id == session_id
+        ):
+            slot.depth += 1
+            logger.debug("Reentrant lock acquired: %s (depth=%d)", key, slot.depth)
+            return slot.holder
+
+        if slot is None:
+            slot = self._slots[key] = _Slot(resource, ttl)
+        slot.refs += 1
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            await asyncio.wait_for(slot.local.acquire(), timeout=timeout)
+        except asyncio.TimeoutError as exc:
+            self._drop_ref(key, slot)
+            raise LockAcquisitionError(resource, timeout) from exc
+        except BaseException:
+            self._drop_ref(key, slot)
+            raise
+
+        try:
+            slot.ttl = ttl
+            if slot.remote_token is None:
+                remaining = max(deadline - loop.time(), 0.0)
+                slot.remote_token = await self._inner.acquire(
+                    slot.resource, timeout=remaining, ttl=ttl
+                )
+                slot.handoffs = 0
+                self.inner_acquisitions += 1
+                slot.heartbeat = asyncio.create_task(self._heartbeat(slot))
+            else:
+                slot.handoffs += 1
+                self.local_handoffs += 1
+        except BaseException:
+            self._drop_ref(key, slot)
+            slot.local.release()
+            raise
+
+        token = uuid4().hex
+        slot.holder = token
+        slot.session_id = session_id
+        slot.depth = 1
+        logger.debug("Lock acquired: %s", resource)
+        return token
+
+    async def extend(
+        self,
+        resource: ResourceIdentifier,
+        token: str,
+        ttl: float,
+    ) -> bool:
+        if resource.lock_mode == "read":
+            return await self._inner.extend(resource, token, ttl)
+        slot = self._slots.get((resource.resource_type, resource.resource_id))
+        if slot is None or slot.holder != token or slot.remote_token is None:
+            return False
+        slot.ttl = ttl
+        return await self._inner.extend(slot.resource, slot.remote_token, ttl)
+
+    async def release(
+        self,
+        resource: ResourceIdentifier,
+        token: str,
+    ) -> None:
+        if resource.lock_mode == "read":
+            await self._inner.release(resource, token)
+            return
+
+        key = (resource.resource_type, resource.resource_id)
+        slot = self._slots.get(key)
+        if slot is None or slot.holder != token:
+            logger.warning("Attempted to release invalid or expired lock: %s", key)
+            return
+
+        slot.depth -= 1
+        if slot.depth > 0:
+            return
+
+        slot.holder = None
+        slot.session_id = None
+        slot.refs -= 1
+        try:
+            if slot.refs == 0:
+                # Nobody else here wants it; new arrivals start a fresh slot
+                del self._slots[key]
+                await self._release_remote(slot)
+            elif self.max_handoffs is not None and slot.handoffs >= self.max_handoffs:
+                # Give other processes a turn; the next local holder re-acquires
+                await self._release_remote(slot)
+        finally:
+            slot.local.release()
+
+    async def health_check(self) -> bool:
+        return await self._inner.health_check()
+
+    async def get_active_locks(self) -> list[ActiveLock]:
+        """Active locks of the inner strategy (one per coalesced resource)."""
+        return await self._inner.get_active_locks()
+
+    # ── Internals ────────────────────────────────────────────────
+
+    def _drop_ref(self, key: _Key, slot: _Slot) -> None:
+        slot.refs -= 1
+        if slot.refs == 0 and self._slots.get(key) is slot:
+            del self._slots[key]
+
+    async def _release_remote(self, slot: _Slot) -> None:
+        if slot.heartbeat is not None:
+            slot.heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await slot.heartbeat
+            slot.heartbeat = None
+        token, slot.remote_token = slot.remote_token, None
+        if token is not None:
+            await self._inner.release(slot.resource, token)
+
+    async def _heartbeat(self, slot: _Slot) -> None:
+        while slot.remote_token is not None:
+            await asyncio.sleep(self.extend_interval or slot.ttl / 3)
+            token = slot.remote_token
+            if token is None:
+                return
+            try:
+                extended = await self._inner.extend(slot.resource, token, slot.ttl)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Lock extend failed for %s: %s", slot.resource, exc)
+                continue
+            if not extended:
+                # Lost (expired or stolen): the next holder must re-acquire
+                logger.error("Coalesced lock lost for %s", slot.resource)
+                slot.remote_token = None
+                return
@@ -1,5 +1,5 @@
 from .event_store import InMemoryEventStore
-from .locking import InMemoryLockStrategy
+from .locking import InMemoryLockStrategy, LockContentionStats
 from .outbox import InMemoryOutboxStorage
 from .repository import InMemoryRepository
 from .unit_of_work import InMemoryUnitOfWork
@@ -10,4 +10,5 @@ __all__ = [
     "InMemoryOutboxStorage",
     "InMemoryRepository",
     "InMemoryUnitOfWork",
+    "LockContentionStats",
 ]
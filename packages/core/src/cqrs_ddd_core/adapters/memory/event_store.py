@@ -7,10 +7,15 @@ from typing import TYPE_CHECKING, Any, cast
 
 from cqrs_ddd_core.correlation import get_correlation_id
 from cqrs_ddd_core.instrumentation import get_hook_registry
-from cqrs_ddd_core.ports.event_store import IEventStore, StoredEvent
+from cqrs_ddd_core.ports.event_store import (
+    EventBatch,
+    EventCursor,
+    IEventStore,
+    StoredEvent,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
 
     from cqrs_ddd_core.domain.specification import ISpecification
 
@@ -44,15 +49,15 @@ class InMemoryEventStore(IEventStore):
             lambda: self._append_internal(stored_event),
         )
 
-    async def append_batch(self, events: list[StoredEvent]) -> None:
+    async def append_batch(self, events: list[StoredEvent]) -> list[int]:
         if not events:
-            return
+            return []
         registry = get_hook_registry()
         first = events[0]
         first_aggregate_type = getattr(first, "aggregate_type", None)
         first_aggregate_id = getattr(first, "aggregate_id", None)
         first_correlation_id = getattr(first, "correlation_id", None)
-        await registry.execute_all(
+        positions = await registry.execute_all(
             f"event_store.append.{first_aggregate_type or 'unknown'}",
             {
                 "aggregate.type": first_aggregate_type,
@@ -62,6 +67,7 @@ class InMemoryEventStore(IEventStore):
             },
             lambda: self._append_batch_internal(events),
         )
+        return cast("list[int]", positions)
 
     async def _append_internal(self, stored_event: StoredEvent) -> None:
         position = len(self._events)
@@ -75,14 +81,18 @@ class InMemoryEventStore(IEventStore):
             event_with_position = stored_event
         self._events.append(event_with_position)
 
-    async def _append_batch_internal(self, events: list[StoredEvent]) -> None:
+    async def _append_batch_internal(self, events: list[StoredEvent]) -> list[int]:
         start = len(self._events)
+        positions: list[int] = []
         for i, e in enumerate(events):
+            existing = getattr(e, "position", None)
+            pos = start + i if existing is None else existing
             if isinstance(e, StoredEvent):
-                pos = start + i if getattr(e, "position", None) is None else e.position
                 self._events.append(dataclasses.replace(e, position=pos))
             else:
                 self._events.append(e)
+            positions.append(pos)
+        return positions
 
     def _apply_specification(
         self,
@@ -167,17 +177,32 @@ class InMemoryEventStore(IEventStore):
         """Stream all events in batches."""
 
         async def _stream() -> AsyncIterator[list[StoredEvent]]:
-            pos = -1
-            while True:
-                batch = await self.get_events_after(
-                    pos, batch_size, specification=specification
-                )
-                if not batch:
-                    break
-                yield batch
-                last = batch[-1]
-                p = getattr(last, "position", None)
-                pos = pos + len(batch) if p is None else p
+            async for batch in self.stream_batches(
+                batch_size=batch_size, specification=specification
+            ):
+                yield batch.events
+
+        return _stream()
+
+    def stream_batches(
+        self,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: ISpecification[Any] | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
+        """Stream events after *after* in ``(position, event_id)`` order."""
+        cursor = after or EventCursor()
+
+        async def _stream() -> AsyncGenerator[EventBatch, None]:
+            pending = sorted(
+                (e for e in self._events if cursor.admits(e)),
+                key=lambda e: (e.position or 0, e.event_id),
+            )
+            pending = self._apply_specification(pending, specification)
+            for start in range(0, len(pending), batch_size):
+                events = pending[start : start + batch_size]
+                yield EventBatch(events, EventCursor.after(events[-1]))
 
         return _stream()
 
@@ -195,6 +220,23 @@ class InMemoryEventStore(IEventStore):
         ]
         return self._apply_specification(results, specification)
 
+    async def get_events_for_aggregates(
+        self,
+        aggregate_ids: Sequence[str],
+        after_versions: Mapping[str, int] | None = None,
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, list[StoredEvent]]:
+        after = after_versions or {}
+        results: dict[str, list[StoredEvent]] = {aid: [] for aid in aggregate_ids}
+        for e in self._apply_specification(self._events, specification):
+            events = results.get(e.aggregate_id)
+            if events is not None and e.version > after.get(e.aggregate_id, 0):
+                events.append(e)
+        for events in results.values():
+            events.sort(key=lambda e: e.version)
+        return results
+
     async def get_by_aggregate(
         self,
         aggregate_id: str,
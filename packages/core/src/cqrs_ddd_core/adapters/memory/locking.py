@@ -4,98 +4,80 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from ...ports.locking import ActiveLock, ILockStrategy
-from ...primitives.exceptions import ConcurrencyError
+from ...primitives.exceptions import ConcurrencyError, LockAcquisitionError
 
 if TYPE_CHECKING:
     from ...primitives.locking import ResourceIdentifier
 
 logger = logging.getLogger("cqrs_ddd.locking")
 
+_Key = tuple[str, str]
 
-@dataclass
-class _FIFOLock:
-    """
-    FIFO lock that ensures waiters are served in order.
 
-    Prevents starvation by maintaining a strict queue of waiters.
-    Queue size is bounded to prevent unbounded memory growth.
-    """
+@dataclass(slots=True)
+class _Hold:
+    """One granted lock (shared by re-entrant acquisitions of a session)."""
 
-    _locked: bool = False
-    _waiters: asyncio.Queue[asyncio.Event] = field(default_factory=asyncio.Queue)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-    max_queue_size: int = 100  # Prevent unbounded growth
-
-    async def acquire(self, timeout: float = 10.0) -> None:
-        """Acquire lock - waits in FIFO order if already locked."""
-        async with self._lock:
-            if not self._locked:
-                # Lock is free - take it immediately
-                self._locked = True
-                logger.debug("Lock acquired immediately (no queue)")
-                return
-
-        # Lock is busy - check if queue has space
-        queue_size = self._waiters.qsize()
-        if queue_size >= self.max_queue_size:
-            raise ConcurrencyError(
-                f"Lock queue full ({queue_size}/{self.max_queue_size}). "
-                "Too many concurrent requests - apply backpressure."
-            )
+    mode: str
+    session_id: str | None
+    ttl: float
+    acquired_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    ref_count: int = 1
 
-        # Get in line
-        event = asyncio.Event()
-        await self._waiters.put(event)
-        position = self._waiters.qsize()
-        logger.debug(
-            "Waiting in queue at position %d/%d", position, self.max_queue_size
-        )
 
-        try:
-            # Wait for our turn with timeout
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-
-            async with self._lock:
-                self._locked = True
-                logger.debug("Lock acquired from queue")
-        except asyncio.TimeoutError as err:
-            # Remove ourselves from queue if we timed out
-            # (best effort - may have already been removed)
-            logger.warning("Lock acquisition timed out after %.1fs", timeout)
-            raise ConcurrencyError(
-                f"Lock acquisition timeout after {timeout}s"
-            ) from err
-
-    def release(self) -> None:
-        """Release lock and wake up next waiter in FIFO order."""
-        if not self._waiters.empty():
-            # Wake up next waiter
-            try:
-                event = self._waiters.get_nowait()
-                event.set()
-                logger.debug(
-                    "Woke up next waiter (queue size: %d)", self._waiters.qsize()
-                )
-            except asyncio.QueueEmpty:
-                self._locked = False
-        else:
-            self._locked = False
-            logger.debug("Lock released (no waiters)")
-
-
-@dataclass
-class _LockState:
-    """State for a single resource lock."""
-
-    fifo_lock: _FIFOLock
-    token: str
+@dataclass(slots=True)
+class _Waiter:
+    """A queued acquisition; the releaser grants it by resolving ``future``."""
+
+    mode: str
     session_id: str | None
-    ref_count: int = 0
+    ttl: float
+    token: str
+    future: asyncio.Future[None]
+
+
+@dataclass(slots=True)
+class _ResourceState:
+    """Holders and FIFO wait queue of one resource, dropped once idle."""
+
+    holds: dict[str, _Hold] = field(default_factory=dict)
+    waiters: deque[_Waiter] = field(default_factory=deque)
+
+    def compatible(self, mode: str) -> bool:
+        if not self.holds:
+            return True
+        return mode == "read" and all(h.mode == "read" for h in self.holds.values())
+
+    @property
+    def idle(self) -> bool:
+        return not self.holds and not self.waiters
+
+
+@dataclass(frozen=True)
+class LockContentionStats:
+    """Counters for tuning lock usage; see ``InMemoryLockStrategy.get_stats``."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    max_queue_depth: int = 0
+    active_resources: int = 0
+    waiting: int = 0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average wait of the acquisitions that had to queue."""
+        return self.total_wait_seconds / self.contended if self.contended else 0.0
 
 
 class InMemoryLockStrategy(ILockStrategy):
@@ -103,55 +85,108 @@ class InMemoryLockStrategy(ILockStrategy):
     In-memory implementation of ILockStrategy with FIFO queuing.
 
     Features:
-    - FIFO lock ordering (prevents starvation)
+    - FIFO lock ordering (prevents starvation); a queued writer blocks
+      readers that arrive after it
+    - Reader/writer modes from ``ResourceIdentifier.lock_mode``: any number
+      of ``read`` holders, or a single ``write`` holder
     - Reentrancy support via session_id
+    - State per resource is created on first use and dropped as soon as
+      the resource has no holders and no waiters, so memory tracks the
+      number of *contended* resources, not every resource ever locked
+    - Contention statistics via :meth:`get_stats`
     - Useful for testing and single-process applications
+
+    All bookkeeping runs between awaits on one event loop, so no internal
+    lock is needed.
     """
 
-    def __init__(self) -> None:
-        self._locks: dict[tuple[str, str], _LockState] = {}
-        self._global_lock = asyncio.Lock()
+    def __init__(self, *, max_queue_size: int = 100) -> None:
+        """
+        Args:
+            max_queue_size: Waiters allowed per resource before new requests
+                fail immediately (backpressure).
+        """
+        self.max_queue_size = max_queue_size
+        self._locks: dict[_Key, _ResourceState] = {}
+        self._acquisitions = 0
+        self._contended = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._max_queue_depth = 0
 
     async def acquire(
         self,
         resource: ResourceIdentifier,
         *,
         timeout: float = 10.0,
-        ttl: float = 30.0,  # noqa: ARG002
+        ttl: float = 30.0,
         session_id: str | None = None,
     ) -> str:
         key = (resource.resource_type, resource.resource_id)
+        mode = resource.lock_mode
+        state = self._locks.get(key)
+        if state is None:
+            state = self._locks[key] = _ResourceState()
+
+        if session_id is not None:
+            token = self._reenter(state, key, mode, session_id)
+            if token is not None:
+                return token
+
+        token = uuid4().hex
+        if not state.waiters and state.compatible(mode):
+            state.holds[token] = _Hold(mode, session_id, ttl)
+            self._acquisitions += 1
+            logger.debug("Lock acquired: %s", resource)
+            return token
+
+        if len(state.waiters) >= self.max_queue_size:
+            self._discard_if_idle(key, state)
+            raise LockAcquisitionError(
+                resource,
+                timeout,
+                reason=(
+                    f"Lock queue full ({len(state.waiters)}/{self.max_queue_size}). "
+                    "Too many concurrent requests - apply backpressure."
+                ),
+            )
 
-        async with self._global_lock:
-            state = self._locks.get(key)
-            if state is None:
-                # Create new lock for this resource
-                state = _LockState(
-                    fifo_lock=_FIFOLock(),
-                    token=str(uuid4()),
-                    session_id=None,
-                )
-                self._locks[key] = state
-
-            # Reentrancy check
-            if session_id is not None and state.session_id == session_id:
-                state.ref_count += 1
-                logger.debug(
-                    "Reentrant lock acquired: %s (count=%d)", key, state.ref_count
-                )
-                return state.token
-
-        # Acquire FIFO lock (waits in queue if necessary)
-        await state.fifo_lock.acquire(timeout=timeout)
-
-        # Update state after acquiring
-        async with self._global_lock:
-            if state.session_id is None:
-                state.session_id = session_id
-            state.ref_count = 1
-
-        logger.debug("Lock acquired: %s", resource)
-        return state.token
+        waiter = _Waiter(
+            mode, session_id, ttl, token, asyncio.get_running_loop().create_future()
+        )
+        state.waiters.append(waiter)
+        self._max_queue_depth = max(self._max_queue_depth, len(state.waiters))
+        logger.debug("Waiting in queue at position %d", len(state.waiters))
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if not waiter.future.done():
+                waiter.future.cancel()
+                state.waiters.remove(waiter)
+                # A writer leaving the head may let readers behind it in
+                self._grant_waiters(state)
+                self._discard_if_idle(key, state)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                self._timeouts += 1
+                logger.warning("Lock acquisition timed out after %.1fs", timeout)
+                raise LockAcquisitionError(resource, timeout) from exc
+            if isinstance(exc, asyncio.CancelledError):
+                # Granted just as we were cancelled: hand it on
+                self._release_hold(key, state, token)
+                raise
+            # Granted at the deadline: keep it
+
+        waited = time.monotonic() - started
+        self._acquisitions += 1
+        self._contended += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        logger.debug("Lock acquired from queue after %.3fs: %s", waited, resource)
+        return token
 
     async def extend(
         self,
@@ -165,16 +200,14 @@ class InMemoryLockStrategy(ILockStrategy):
         For in-memory implementation, just verify the lock is still held.
         Real implementations (Redis) would update the TTL.
         """
-        key = (resource.resource_type, resource.resource_id)
-
-        async with self._global_lock:
-            state = self._locks.get(key)
-            if state is None or state.token != token:
-                return False
-
-            # In-memory: TTL not tracked, just verify ownership
-            logger.debug("Lock extended: %s (ttl=%.1fs)", key, ttl)
-            return True
+        state = self._locks.get((resource.resource_type, resource.resource_id))
+        hold = state.holds.get(token) if state is not None else None
+        if hold is None:
+            return False
+        # In-memory: TTL is not enforced, only reported
+        hold.ttl = ttl
+        logger.debug("Lock extended: %s (ttl=%.1fs)", resource, ttl)
+        return True
 
     async def release(
         self,
@@ -182,20 +215,15 @@ class InMemoryLockStrategy(ILockStrategy):
         token: str,
     ) -> None:
         key = (resource.resource_type, resource.resource_id)
+        state = self._locks.get(key)
+        hold = state.holds.get(token) if state is not None else None
+        if state is None or hold is None:
+            logger.warning("Attempted to release invalid or expired lock: %s", key)
+            return
 
-        async with self._global_lock:
-            state = self._locks.get(key)
-            if state is None or state.token != token:
-                logger.warning("Attempted to release invalid or expired lock: %s", key)
-                return
-
-            state.ref_count -= 1
-            if state.ref_count <= 0:
-                state.session_id = None
-                state.fifo_lock.release()
-                # Clean up to prevent memory leaks
-                self._locks.pop(key)
-                logger.debug("Lock cleaned up: %s", key)
+        hold.ref_count -= 1
+        if hold.ref_count <= 0:
+            self._release_hold(key, state, token)
 
     async def health_check(self) -> bool:
         """
@@ -211,19 +239,74 @@ class InMemoryLockStrategy(ILockStrategy):
 
     async def get_active_locks(self) -> list[ActiveLock]:
         """Get all currently active locks."""
-        from datetime import datetime, timezone
-
-        async with self._global_lock:
-            locks = []
-            for (resource_type, resource_id), state in self._locks.items():
-                locks.append(
-                    ActiveLock(
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        token=state.token,
-                        acquired_at=datetime.now(timezone.utc),  # Approximate
-                        ttl_seconds=30.0,  # Default TTL
-                        session_id=state.session_id,
+        return [
+            ActiveLock(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                token=token,
+                acquired_at=hold.acquired_at,
+                ttl_seconds=hold.ttl,
+                session_id=hold.session_id,
+            )
+            for (resource_type, resource_id), state in self._locks.items()
+            for token, hold in state.holds.items()
+        ]
+
+    def get_stats(self) -> LockContentionStats:
+        """Snapshot of contention counters since creation or :meth:`reset_stats`."""
+        return LockContentionStats(
+            acquisitions=self._acquisitions,
+            contended=self._contended,
+            timeouts=self._timeouts,
+            total_wait_seconds=self._total_wait,
+            max_wait_seconds=self._max_wait,
+            max_queue_depth=self._max_queue_depth,
+            active_resources=len(self._locks),
+            waiting=sum(len(s.waiters) for s in self._locks.values()),
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the cumulative counters (current gauges are unaffected)."""
+        self._acquisitions = self._contended = self._timeouts = 0
+        self._total_wait = self._max_wait = 0.0
+        self._max_queue_depth = 0
+
+    # ── Internals ────────────────────────────────────────────────
+
+    def _reenter(
+        self, state: _ResourceState, key: _Key, mode: str, session_id: str
+    ) -> str | None:
+        for token, hold in state.holds.items():
+            if hold.session_id != session_id:
+                continue
+            if mode == "write" and hold.mode == "read":
+                if len(state.holds) > 1:
+                    raise ConcurrencyError(
+                        f"Cannot upgrade read lock on {key} to write while "
+                        "other readers hold it"
                     )
-                )
-            return locks
+                hold.mode = "write"
+            hold.ref_count += 1
+            logger.debug("Reentrant lock acquired: %s (count=%d)", key, hold.ref_count)
+            return token
+        return None
+
+    def _release_hold(self, key: _Key, state: _ResourceState, token: str) -> None:
+        state.holds.pop(token, None)
+        self._grant_waiters(state)
+        self._discard_if_idle(key, state)
+        logger.debug("Lock released: %s", key)
+
+    @staticmethod
+    def _grant_waiters(state: _ResourceState) -> None:
+        """Grant queued requests from the head while they are compatible."""
+        while state.waiters and state.compatible(state.waiters[0].mode):
+            waiter = state.waiters.popleft()
+            state.holds[waiter.token] = _Hold(
+                waiter.mode, waiter.session_id, waiter.ttl
+            )
+            waiter.future.set_result(None)
+
+    def _discard_if_idle(self, key: _Key, state: _ResourceState) -> None:
+        if state.idle and self._locks.get(key) is state:
+            del self._locks[key]
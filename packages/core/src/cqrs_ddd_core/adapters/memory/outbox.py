@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
-from cqrs_ddd_core.ports.outbox import IOutboxStorage, OutboxMessage
+from cqrs_ddd_core.ports.outbox import (
+    IClaimingOutboxStorage,
+    IOutboxRetentionStorage,
+    OutboxMessage,
+    OutboxStats,
+)
 
 if TYPE_CHECKING:
     from cqrs_ddd_core.domain.specification import ISpecification
 
 
-class InMemoryOutboxStorage(IOutboxStorage):
+class InMemoryOutboxStorage(IClaimingOutboxStorage, IOutboxRetentionStorage):
     """In-memory implementation of ``IOutboxStorage``.
 
-    Stores outbox messages in a flat list.
+    Stores outbox messages in a flat list.  Claims are kept in a side map of
+    ``message_id -> (worker_id, claimed_until)``.  Purged messages archived
+    with ``archive=True`` are kept in ``archived``, keyed by ``YYYY_MM`` of
+    their creation time.
     """
 
     def __init__(self) -> None:
         self._messages: list[OutboxMessage] = []
+        self._claims: dict[str, tuple[str, datetime]] = {}
+        self.archived: dict[str, list[OutboxMessage]] = {}
 
     async def save_messages(
         self,
@@ -49,6 +59,7 @@ class InMemoryOutboxStorage(IOutboxStorage):
         for msg in self._messages:
             if msg.message_id in message_ids:
                 msg.published_at = now
+                self._claims.pop(msg.message_id, None)
 
     async def mark_failed(
         self,
@@ -60,12 +71,91 @@ class InMemoryOutboxStorage(IOutboxStorage):
             if msg.message_id == message_id:
                 msg.error = error
                 msg.retry_count += 1
+                self._claims.pop(message_id, None)
                 break
 
+    async def claim_pending(
+        self,
+        limit: int = 100,
+        uow: Any | None = None,
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: ISpecification[Any] | None = None,
+        max_retries: int | None = None,
+    ) -> list[OutboxMessage]:
+        now = datetime.now(timezone.utc)
+        pending = await self.get_pending(
+            len(self._messages), uow, specification=specification
+        )
+        if max_retries is not None:
+            pending = [
+                m
+                for m in pending
+                if m.error is not None and m.retry_count < max_retries
+            ]
+        claimable = [
+            m
+            for m in pending
+            if m.message_id not in self._claims or self._claims[m.message_id][1] <= now
+        ][:limit]
+        until = now + timedelta(seconds=lease_seconds)
+        for msg in claimable:
+            self._claims[msg.message_id] = (worker_id, until)
+        return claimable
+
+    async def release_claims(
+        self,
+        message_ids: list[str],
+        uow: Any | None = None,  # noqa: ARG002
+        *,
+        worker_id: str,
+    ) -> None:
+        for message_id in message_ids:
+            claim = self._claims.get(message_id)
+            if claim is not None and claim[0] == worker_id:
+                del self._claims[message_id]
+
+    async def purge_published(
+        self,
+        older_than: datetime,
+        limit: int = 1000,
+        uow: Any | None = None,  # noqa: ARG002
+        *,
+        archive: bool = False,
+    ) -> int:
+        purged = [
+            m
+            for m in self._messages
+            if m.published_at is not None and m.created_at < older_than
+        ][:limit]
+        if archive:
+            for msg in purged:
+                key = f"{msg.created_at:%Y_%m}"
+                self.archived.setdefault(key, []).append(msg)
+        purged_ids = {m.message_id for m in purged}
+        self._messages = [m for m in self._messages if m.message_id not in purged_ids]
+        return len(purged)
+
+    async def get_stats(
+        self,
+        uow: Any | None = None,  # noqa: ARG002
+    ) -> OutboxStats:
+        unpublished = [m for m in self._messages if m.published_at is None]
+        pending = [m for m in unpublished if m.error is None]
+        return OutboxStats(
+            pending=len(pending),
+            failed=len(unpublished) - len(pending),
+            published=len(self._messages) - len(unpublished),
+            oldest_pending_at=min((m.created_at for m in pending), default=None),
+        )
+
     # ── Test helpers ─────────────────────────────────────────────
 
     def clear(self) -> None:
         self._messages.clear()
+        self._claims.clear()
+        self.archived.clear()
 
     def __len__(self) -> int:
         return len(self._messages)
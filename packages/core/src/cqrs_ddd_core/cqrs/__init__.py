@@ -6,9 +6,9 @@ from ..ports.unit_of_work import UnitOfWork
 from .command import Command
 from .consumers import BaseEventConsumer
 from .event_dispatcher import EventDispatcher
-from .handler import CommandHandler, EventHandler, QueryHandler
+from .handler import CommandHandler, EventHandler, HandlerLifetime, QueryHandler
 from .mediator import Mediator, get_current_uow
-from .outbox import BufferedOutbox, OutboxService
+from .outbox import BufferedOutbox, OutboxPurgeWorker, OutboxService
 from .publishers import PublishingEventHandler, TopicRoutingPublisher, route_to
 from .query import Query
 from .registry import HandlerRegistry
@@ -20,6 +20,7 @@ __all__ = [
     "CommandResponse",
     "EventHandler",
     "EventDispatcher",
+    "HandlerLifetime",
     "Mediator",
     "Query",
     "QueryHandler",
@@ -28,6 +29,7 @@ __all__ = [
     "UnitOfWork",
     "get_current_uow",
     "BufferedOutbox",
+    "OutboxPurgeWorker",
     "OutboxService",
     "BaseEventConsumer",
     "TopicRoutingPublisher",
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from ..correlation import get_correlation_id
 from ..instrumentation import get_hook_registry
+from ..ports.locking import IMultiLockStrategy, supports_acquire_many
 
 if TYPE_CHECKING:
     from ..ports.locking import ILockStrategy
@@ -26,6 +27,8 @@ class CriticalSection:
     - Supports reentrancy via session_id
     - Auto-releases on exit
     - Rolls back partial locks on failure
+    - One all-or-nothing call when the strategy implements
+      ``IMultiLockStrategy`` (e.g. a single Redis script)
 
     Usage:
         ```python
@@ -97,7 +100,9 @@ class CriticalSection:
 
         try:
             registry = get_hook_registry()
-            for resource in self._resources:
+            if supports_acquire_many(self._lock_strategy):
+                await self._acquire_all(registry)
+            for resource in self._resources[len(self._acquired) :]:
 
                 async def _acquire_single(res: ResourceIdentifier = resource) -> None:
                     token = await self._lock_strategy.acquire(
@@ -153,6 +158,30 @@ class CriticalSection:
                 reason=f"Rolled back {len(self._acquired)} locks. {exc}",
             ) from exc
 
+    async def _acquire_all(self, registry: Any) -> None:
+        strategy = cast("IMultiLockStrategy", self._lock_strategy)
+
+        async def _acquire_many() -> None:
+            tokens = await strategy.acquire_many(
+                self._resources,
+                timeout=self._timeout,
+                ttl=self._ttl,
+                session_id=self._session_id,
+            )
+            self._acquired.extend(zip(self._resources, tokens, strict=True))
+
+        await registry.execute_all(
+            "lock.acquire_many",
+            {
+                "resources": [str(r) for r in self._resources],
+                "resource_count": len(self._resources),
+                "timeout": self._timeout,
+                "ttl": self._ttl,
+                "correlation_id": get_correlation_id(),
+            },
+            _acquire_many,
+        )
+
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -171,6 +200,15 @@ class CriticalSection:
         errors: list[Exception] = []
         attempted = len(self._acquired)
 
+        if attempted and supports_acquire_many(self._lock_strategy):
+            strategy = cast("IMultiLockStrategy", self._lock_strategy)
+            try:
+                await strategy.release_many(list(reversed(self._acquired)))
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Failed to release %d locks: %s", attempted, exc)
+                errors.append(exc)
+            self._acquired.clear()
+
         for resource, token in reversed(self._acquired):
             try:
                 await self._lock_strategy.release(resource, token)
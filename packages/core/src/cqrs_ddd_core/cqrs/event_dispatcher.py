@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import partial
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
@@ -40,9 +41,24 @@ class EventDispatcher(Generic[E]):
       receiving them from a message broker.
     """
 
-    def __init__(self, max_concurrency: int = 10) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        *,
+        batch_threshold: int | None = None,
+        concurrent_batches: bool = False,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Maximum number of handlers running at once.
+            batch_threshold: When set, :meth:`dispatch` switches to
+                :meth:`dispatch_batch` for lists of at least this many events.
+            concurrent_batches: Default for ``dispatch_batch(concurrent=...)``.
+        """
         self._handlers: dict[type[E], list[EventHandler[E]]] = {}
         self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._batch_threshold = batch_threshold
+        self._concurrent_batches = concurrent_batches
 
     # ── Registration ─────────────────────────────────────────────
 
@@ -62,6 +78,9 @@ class EventDispatcher(Generic[E]):
         """Dispatch events to all registered handlers concurrently."""
         if not events:
             return
+        if self._batch_threshold is not None and len(events) >= self._batch_threshold:
+            await self.dispatch_batch(events)
+            return
 
         registry = get_hook_registry()
         for event in events:
@@ -71,30 +90,16 @@ class EventDispatcher(Generic[E]):
                 continue
 
             event_name = event_type.__name__
-            correlation_id = get_correlation_id() or getattr(
-                event, "correlation_id", None
-            )
-            attributes: dict[str, object] = {
-                "event.type": event_name,
-                "event.id": str(event.event_id),
-                "message_type": type(event),
-                "correlation_id": correlation_id,
-            }
 
             async def _dispatch_handlers(
                 current_handlers: list[EventHandler[E]] = handlers,
                 current_event_name: str = event_name,
-                base_attributes: dict[str, object] = attributes,
                 current_event: DomainEvent = event,
             ) -> None:
                 tasks = []
                 for handler in current_handlers:
                     handler_name = type(handler).__name__
                     operation = f"event.handler.{current_event_name}.{handler_name}"
-                    handler_attrs = {
-                        "handler.type": handler_name,
-                        **base_attributes,
-                    }
 
                     async def _invoke_handler(
                         h: EventHandler[E] = handler,
@@ -104,18 +109,108 @@ class EventDispatcher(Generic[E]):
                     tasks.append(
                         registry.execute_all(
                             operation,
-                            handler_attrs,
+                            partial(
+                                self._event_attributes,
+                                current_event,
+                                handler_name=handler_name,
+                            ),
                             _invoke_handler,
+                            message_type=type(current_event),
                         )
                     )
                 await asyncio.gather(*tasks)
 
             await registry.execute_all(
                 f"event.dispatch.{event_name}",
-                attributes,
+                partial(self._event_attributes, event),
                 _dispatch_handlers,
+                message_type=event_type,
             )
 
+    async def dispatch_batch(
+        self,
+        events: list[DomainEvent],
+        *,
+        concurrent: bool | None = None,
+    ) -> None:
+        """Dispatch *events* as a single batch.
+
+        Handler lists are resolved once per event type and the whole batch
+        runs inside one ``event.dispatch.batch`` hook instead of per-event and
+        per-handler hooks.  Events are processed in order; with *concurrent*,
+        events of different aggregates run in parallel (bounded by the
+        dispatcher semaphore) while each aggregate's events stay ordered.
+        Events without an ``aggregate_id`` share one ordered partition.
+        """
+        if not events:
+            return
+        if concurrent is None:
+            concurrent = self._concurrent_batches
+
+        resolved: dict[type[E], list[EventHandler[E]]] = {}
+        partitions: dict[
+            str | None, list[tuple[DomainEvent, list[EventHandler[E]]]]
+        ] = {}
+        for event in events:
+            event_type = cast("type[E]", type(event))
+            handlers = resolved.get(event_type)
+            if handlers is None:
+                handlers = resolved[event_type] = self._handlers.get(event_type, [])
+            if handlers:
+                key = event.aggregate_id if concurrent else None
+                partitions.setdefault(key, []).append((event, handlers))
+
+        if not partitions:
+            return
+
+        registry = get_hook_registry()
+        await registry.execute_all(
+            "event.dispatch.batch",
+            lambda: {
+                "event.count": len(events),
+                "event.types": sorted({type(e).__name__ for e in events}),
+                "event.partitions": len(partitions),
+                "correlation_id": get_correlation_id(),
+            },
+            partial(self._dispatch_partitions, list(partitions.values())),
+        )
+
+    async def _dispatch_partitions(
+        self,
+        partitions: list[list[tuple[DomainEvent, list[EventHandler[E]]]]],
+    ) -> None:
+        if len(partitions) == 1:
+            await self._dispatch_sequence(partitions[0])
+            return
+        await asyncio.gather(*(self._dispatch_sequence(p) for p in partitions))
+
+    async def _dispatch_sequence(
+        self,
+        items: list[tuple[DomainEvent, list[EventHandler[E]]]],
+    ) -> None:
+        """Run each event's handlers, one event after another."""
+        for event, handlers in items:
+            if len(handlers) == 1:
+                await self._invoke(handlers[0], event)
+            else:
+                await asyncio.gather(*(self._invoke(h, event) for h in handlers))
+
+    @staticmethod
+    def _event_attributes(
+        event: DomainEvent, handler_name: str | None = None
+    ) -> dict[str, object]:
+        """Build hook attributes for *event* (only called when a hook matches)."""
+        attributes: dict[str, object] = {
+            "event.type": type(event).__name__,
+            "event.id": str(event.event_id),
+            "message_type": type(event),
+            "correlation_id": get_correlation_id()
+            or getattr(event, "correlation_id", None),
+        }
+        if handler_name is not None:
+            attributes = {"handler.type": handler_name, **attributes}
+        return attributes
+
     async def _invoke(self, handler: EventHandler[E], event: DomainEvent) -> None:
         """Invoke a single handler within the concurrency limit."""
         async with self._semaphore:
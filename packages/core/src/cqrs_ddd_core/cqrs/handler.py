@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
@@ -14,6 +15,23 @@ TResult = TypeVar("TResult")  # Result type
 E = TypeVar("E")  # Event type
 
 
+class HandlerLifetime(str, Enum):
+    """How long the ``Mediator`` keeps a handler instance.
+
+    - ``TRANSIENT``: a new instance per message (default).
+    - ``SCOPED``: one instance per root Unit-of-Work scope; nested commands
+      reuse it.  Outside a UoW scope it behaves like ``TRANSIENT``.
+    - ``SINGLETON``: one instance per mediator, built on first use.
+
+    Set it per handler class with a ``handler_lifetime`` class attribute or
+    per mediator via ``Mediator(handler_lifetimes=...)``.
+    """
+
+    TRANSIENT = "transient"
+    SCOPED = "scoped"
+    SINGLETON = "singleton"
+
+
 class CommandHandler(ABC, Generic[TResult]):
     """Base class for command handlers.
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from contextvars import ContextVar
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ..correlation import (
@@ -12,9 +13,10 @@ from ..correlation import (
     set_correlation_id,
 )
 from ..ports.bus import ICommandBus, IQueryBus
+from .handler import HandlerLifetime
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping, Sequence
 
     from ..domain.events import DomainEvent
     from ..middleware.registry import MiddlewareRegistry
@@ -34,6 +36,11 @@ TResult = TypeVar("TResult")
 #: any command scope yet (root command will create a new one).
 _current_uow: ContextVar[Any] = ContextVar("current_uow", default=None)
 
+#: ContextVar holding ``SCOPED`` handler instances for the current root UoW.
+_handler_scope: ContextVar[dict[type[Any], Any] | None] = ContextVar(
+    "handler_scope", default=None
+)
+
 
 def get_current_uow() -> Any:
     """Return the active UoW (or *None* if outside a command scope)."""
@@ -63,6 +70,12 @@ class Mediator(ICommandBus, IQueryBus):
     handler_factory:
         Optional callable ``(handler_cls) -> handler_instance``.
         Defaults to simple ``handler_cls()`` construction.
+    default_handler_lifetime:
+        :class:`~cqrs_ddd_core.cqrs.handler.HandlerLifetime` used for
+        handlers that do not declare one.  Defaults to ``TRANSIENT``.
+    handler_lifetimes:
+        Optional per-class overrides; take precedence over a handler's
+        ``handler_lifetime`` class attribute.
     """
 
     def __init__(
@@ -73,6 +86,8 @@ class Mediator(ICommandBus, IQueryBus):
         middleware_registry: MiddlewareRegistry | None = None,
         event_dispatcher: EventDispatcher[DomainEvent] | None = None,
         handler_factory: Callable[[type[Any]], Any] | None = None,
+        default_handler_lifetime: HandlerLifetime = HandlerLifetime.TRANSIENT,
+        handler_lifetimes: Mapping[type[Any], HandlerLifetime] | None = None,
     ) -> None:
         self._registry = registry
         self._uow_factory = uow_factory
@@ -85,6 +100,14 @@ class Mediator(ICommandBus, IQueryBus):
         self._handler_factory: Callable[[type[Any]], Any] = handler_factory or (
             lambda cls: cls()
         )
+        # Compiled middleware chains keyed by (message type, registry
+        # generation); rebuilt lazily after new middleware is registered.
+        self._pipeline_cache: dict[tuple[type[Any], int], Callable[[Any], Any]] = {}
+        self._default_handler_lifetime = default_handler_lifetime
+        self._handler_lifetimes: dict[type[Any], HandlerLifetime] = dict(
+            handler_lifetimes or {}
+        )
+        self._singleton_handlers: dict[type[Any], Any] = {}
 
         # Auto-Ignition: Bind synchronous event handlers from the registry
         self.autoload_event_handlers()
@@ -115,16 +138,95 @@ class Mediator(ICommandBus, IQueryBus):
 
         async with self._uow_factory() as uow:
             token = _current_uow.set(uow)
+            scope_token = _handler_scope.set({})
             try:
                 result = await self._dispatch_command(command)
                 # Success -> Root command scope handles commit and hooks
                 # in its __aexit__. The UnitOfWork will trigger hooks
                 # after commit.
             finally:
+                _handler_scope.reset(scope_token)
                 _current_uow.reset(token)
 
         return result
 
+    async def send_many(
+        self,
+        commands: Sequence[Command[Any]],
+        *,
+        atomic: bool = True,
+        chunk_size: int | None = None,
+    ) -> list[CommandResponse[Any]]:
+        """Dispatch many *commands* with one commit per batch.
+
+        Each command runs through the same middleware pipeline as
+        :meth:`send`, but instead of opening a UoW per command the batch
+        shares one: events produced by all commands of a UoW are dispatched
+        together via
+        :meth:`~cqrs_ddd_core.cqrs.event_dispatcher.EventDispatcher.dispatch_batch`
+        just before it commits, and post-commit hooks fire once per UoW.
+
+        Parameters
+        ----------
+        commands:
+            Commands to dispatch, in order.
+        atomic:
+            ``True`` (default) runs every command in a single UoW — any
+            failure rolls back the whole batch.  ``False`` opens one UoW per
+            chunk of ``chunk_size`` commands; a failure rolls back only the
+            current chunk (earlier chunks stay committed) and is re-raised.
+        chunk_size:
+            Commands per UoW when ``atomic=False``.  Defaults to the whole
+            batch.
+
+        Returns
+        -------
+        list[CommandResponse]
+            One response per command, in input order.
+
+        Raises
+        ------
+        ValueError
+            If ``chunk_size`` is given with ``atomic=True`` or is not
+            positive.
+        """
+        if chunk_size is not None:
+            if atomic:
+                raise ValueError("chunk_size requires atomic=False")
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be a positive integer")
+
+        commands = list(commands)
+        if not commands:
+            return []
+
+        if _current_uow.get() is not None:
+            # Nested batch — everything joins the parent UoW
+            return await self._dispatch_commands(commands)
+
+        # One correlation id ties the batch together unless commands
+        # already carry their own.
+        cid = get_correlation_id() or generate_correlation_id()
+        set_correlation_id(cid)
+        commands = [
+            c if c.correlation_id else c.model_copy(update={"correlation_id": cid})
+            for c in commands
+        ]
+
+        size = len(commands) if chunk_size is None else chunk_size
+        responses: list[CommandResponse[Any]] = []
+        for start in range(0, len(commands), size):
+            chunk = commands[start : start + size]
+            async with self._uow_factory() as uow:
+                token = _current_uow.set(uow)
+                scope_token = _handler_scope.set({})
+                try:
+                    responses.extend(await self._dispatch_commands(chunk))
+                finally:
+                    _handler_scope.reset(scope_token)
+                    _current_uow.reset(token)
+        return responses
+
     def autoload_event_handlers(self) -> None:
         """Instantiate and bind synchronous event handlers from the registry.
 
@@ -156,22 +258,10 @@ class Mediator(ICommandBus, IQueryBus):
             query = query.model_copy(update={"correlation_id": cid})
         set_correlation_id(cid)
 
-        handler_cls = self._registry.get_query_handler(type(query))
-        if handler_cls is None:
+        if self._registry.get_query_handler(type(query)) is None:
             raise ValueError(f"No handler registered for query {type(query).__name__}")
-        handler = cast("QueryHandler[TResult]", self._handler_factory(handler_cls))
-
-        async def _innermost(q: Query[TResult]) -> QueryResponse[TResult]:
-            return await handler.handle(q)
-
-        if self._middleware_registry is not None:
-            from ..middleware.pipeline import build_pipeline
-
-            middlewares = self._middleware_registry.get_ordered_middlewares()
-            pipeline = build_pipeline(middlewares, _innermost)
-        else:
-            pipeline = _innermost
 
+        pipeline = self._get_pipeline(type(query), self._handle_query)
         result = await pipeline(query)
 
         propagated = self._propagate_ids(query, result)
@@ -180,29 +270,19 @@ class Mediator(ICommandBus, IQueryBus):
     # ── Internals ────────────────────────────────────────────────
 
     async def _dispatch_command(
-        self, command: Command[TResult]
+        self, command: Command[TResult], *, dispatch_events: bool = True
     ) -> CommandResponse[TResult]:
-        """Build the middleware chain and invoke the handler."""
-        handler_cls = self._registry.get_command_handler(type(command))
-        if handler_cls is None:
+        """Run the compiled middleware chain and invoke the handler.
+
+        With ``dispatch_events=False`` the response's events are enriched but
+        left for the caller to dispatch (see :meth:`_dispatch_commands`).
+        """
+        if self._registry.get_command_handler(type(command)) is None:
             raise ValueError(
                 f"No handler registered for command {type(command).__name__}"
             )
 
-        handler = cast("CommandHandler[TResult]", self._handler_factory(handler_cls))
-
-        async def _innermost(cmd: Command[TResult]) -> CommandResponse[TResult]:
-            return await handler.handle(cmd)
-
-        # Build middleware pipeline using the pipeline builder
-        if self._middleware_registry is not None:
-            from ..middleware.pipeline import build_pipeline
-
-            middlewares = self._middleware_registry.get_ordered_middlewares()
-            pipeline = build_pipeline(middlewares, _innermost)
-        else:
-            pipeline = _innermost
-
+        pipeline = self._get_pipeline(type(command), self._handle_command)
         result = await pipeline(command)
 
         # Propagate IDs to response
@@ -211,31 +291,108 @@ class Mediator(ICommandBus, IQueryBus):
 
         # In-transaction event dispatch (local handlers)
         if self._event_dispatcher:
-            from ..domain.events import enrich_event_metadata
+            from ..domain.events import enrich_events_metadata
 
             # Enrich events with correlation and causation info
-            enriched_events = [
-                enrich_event_metadata(
-                    e,
-                    correlation_id=result.correlation_id,
-                    causation_id=result.causation_id,
-                )
-                for e in result.events
-            ]
-
-            # Update result with enriched events
-            result = result.__class__(
-                result=result.result,
-                events=enriched_events,
-                success=result.success,
+            events = enrich_events_metadata(
+                result.events,
                 correlation_id=result.correlation_id,
                 causation_id=result.causation_id,
             )
+            if events is not result.events:
+                result = replace(result, events=events)
 
-            await self._event_dispatcher.dispatch(result.events)
+            if dispatch_events:
+                await self._event_dispatcher.dispatch(result.events)
 
         return result
 
+    async def _dispatch_commands(
+        self, commands: Sequence[Command[Any]]
+    ) -> list[CommandResponse[Any]]:
+        """Run *commands* in the current UoW, then dispatch all events once."""
+        responses = [
+            await self._dispatch_command(command, dispatch_events=False)
+            for command in commands
+        ]
+        if self._event_dispatcher:
+            events = [event for response in responses for event in response.events]
+            if events:
+                await self._event_dispatcher.dispatch_batch(events)
+        return responses
+
+    def _get_pipeline(
+        self,
+        message_type: type[Any],
+        terminal: Callable[[Any], Any],
+    ) -> Callable[[Any], Any]:
+        """Return the compiled middleware chain for *message_type*.
+
+        Chains only contain the middlewares that apply to the message type
+        and are cached until the middleware registry's generation changes.
+        """
+        if self._middleware_registry is None:
+            return terminal
+
+        key = (message_type, self._middleware_registry.generation)
+        pipeline = self._pipeline_cache.get(key)
+        if pipeline is None:
+            from ..middleware.pipeline import build_pipeline
+
+            # Drop chains compiled against an older registry generation
+            stale = [k for k in self._pipeline_cache if k[1] != key[1]]
+            for k in stale:
+                del self._pipeline_cache[k]
+
+            middlewares = self._middleware_registry.get_middlewares_for(message_type)
+            pipeline = build_pipeline(middlewares, terminal)
+            self._pipeline_cache[key] = pipeline
+        return pipeline
+
+    async def _handle_command(
+        self, command: Command[TResult]
+    ) -> CommandResponse[TResult]:
+        """Pipeline terminal: resolve the command handler and invoke it."""
+        handler_cls = cast(
+            "type[Any]", self._registry.get_command_handler(type(command))
+        )
+        handler = cast("CommandHandler[TResult]", self._get_handler(handler_cls))
+        return await handler.handle(command)
+
+    async def _handle_query(self, query: Query[TResult]) -> QueryResponse[TResult]:
+        """Pipeline terminal: resolve the query handler and invoke it."""
+        handler_cls = cast("type[Any]", self._registry.get_query_handler(type(query)))
+        handler = cast("QueryHandler[TResult]", self._get_handler(handler_cls))
+        return await handler.handle(query)
+
+    def _get_handler(self, handler_cls: type[Any]) -> Any:
+        """Return a handler instance honouring its configured lifetime."""
+        lifetime = self._handler_lifetimes.get(handler_cls)
+        if lifetime is None:
+            declared = getattr(handler_cls, "handler_lifetime", None)
+            lifetime = (
+                HandlerLifetime(declared)
+                if isinstance(declared, str)
+                else self._default_handler_lifetime
+            )
+            self._handler_lifetimes[handler_cls] = lifetime
+
+        if lifetime is HandlerLifetime.TRANSIENT:
+            return self._handler_factory(handler_cls)
+        cache = (
+            self._singleton_handlers
+            if lifetime is HandlerLifetime.SINGLETON
+            else _handler_scope.get()
+        )
+        if cache is None:
+            # SCOPED outside a UoW scope (e.g. a standalone query)
+            return self._handler_factory(handler_cls)
+
+        handler = cache.get(handler_cls)
+        if handler is None:
+            handler = cache[handler_cls] = self._handler_factory(handler_cls)
+        return handler
+
     def _propagate_ids(self, message: Any, response: Any) -> Any:
         """Propagate correlation ID and causation ID from command/query to response."""
         correlation_id = getattr(response, "correlation_id", None) or getattr(
@@ -249,8 +406,6 @@ class Mediator(ICommandBus, IQueryBus):
             )
 
         # CommandResponse and QueryResponse are frozen dataclasses, use replace
-        from dataclasses import replace
-
         return replace(
             response, correlation_id=correlation_id, causation_id=causation_id
         )
@@ -1,4 +1,5 @@
 from .buffered import BufferedOutbox
+from .purge import OutboxPurgeWorker
 from .service import OutboxService
 
-__all__ = ["BufferedOutbox", "OutboxService"]
+__all__ = ["BufferedOutbox", "OutboxPurgeWorker", "OutboxService"]
@@ -41,6 +41,9 @@ class BufferedOutbox(IMessagePublisher, IBackgroundWorker):
 
         # In your application
         await outbox.publish("order.created", {"id": 1})
+
+    ``lock_strategy`` may be omitted when *storage* implements
+    ``IClaimingOutboxStorage``; batches are then claimed by the storage.
     """
 
     # Explicitly implement the protocol for structural type checking
@@ -64,10 +67,9 @@ class BufferedOutbox(IMessagePublisher, IBackgroundWorker):
             self._storage = service.storage
             self._broker = service.publisher
         else:
-            if storage is None or broker is None or lock_strategy is None:
+            if storage is None or broker is None:
                 raise OutboxError(
-                    "Either 'service' or ('storage', 'broker', "
-                    "'lock_strategy') must be provided."
+                    "Either 'service' or ('storage', 'broker') must be provided."
                 )
             self._storage = storage
             self._broker = broker
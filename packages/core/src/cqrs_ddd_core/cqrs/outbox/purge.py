@@ -0,0 +1,148 @@
+"""OutboxPurgeWorker — background retention for published outbox messages."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, cast
+
+from ...correlation import get_correlation_id
+from ...instrumentation import get_hook_registry
+from ...ports.background_worker import IBackgroundWorker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ...ports.outbox import IOutboxRetentionStorage
+    from ...ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger("cqrs_ddd.outbox")
+
+
+class OutboxPurgeWorker(IBackgroundWorker):
+    """
+    Periodically deletes (or archives) published outbox messages.
+
+    Published messages created more than ``retention`` ago are removed in
+    chunks of at most ``chunk_size`` rows, yielding to the event loop between
+    chunks so a large backlog never holds one long transaction or starves
+    other tasks.  With ``archive=True`` the storage copies each chunk into
+    time-partitioned archive tables/collections before deleting it.
+
+    Retention is measured from ``created_at``, not from publication: a
+    message that stayed pending longer than ``retention`` is eligible as
+    soon as it is published, so choose a retention comfortably above the
+    longest expected publish delay.
+
+    When ``uow_factory`` is given every chunk runs in its own unit of work,
+    so each one is committed independently.  Storages backed by a shared
+    transactional session need it (``SQLAlchemyOutboxStorage`` refuses to
+    purge without a unit of work); in-memory and MongoDB storages apply
+    each chunk directly.
+
+    Usage::
+
+        purger = OutboxPurgeWorker(
+            storage,
+            retention=timedelta(days=3),
+            uow_factory=lambda: SQLAlchemyUnitOfWork(session_factory=factory),
+        )
+        await purger.start()
+    """
+
+    def __init__(
+        self,
+        storage: IOutboxRetentionStorage,
+        *,
+        retention: timedelta = timedelta(days=7),
+        chunk_size: int = 1000,
+        interval: float = 300.0,
+        archive: bool = False,
+        uow_factory: Callable[..., UnitOfWork] | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._storage = storage
+        self.retention = retention
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.archive = archive
+        self._uow_factory = uow_factory
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the periodic purge loop."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(
+            "OutboxPurgeWorker started (retention=%s, interval=%.1fs)",
+            self.retention,
+            self.interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the loop, letting the current chunk finish or be cancelled."""
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("OutboxPurgeWorker stopped")
+
+    async def run_once(self) -> int:
+        """
+        Purge everything currently past retention, one chunk at a time.
+
+        Returns:
+            Total number of messages removed.
+        """
+        registry = get_hook_registry()
+        return cast(
+            "int",
+            await registry.execute_all(
+                "outbox.purge",
+                lambda: {
+                    "outbox.retention_seconds": self.retention.total_seconds(),
+                    "outbox.archive": self.archive,
+                    "correlation_id": get_correlation_id(),
+                },
+                self._purge,
+            ),
+        )
+
+    async def _run_loop(self) -> None:
+        while self._running:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("OutboxPurgeWorker error")
+            await asyncio.sleep(self.interval)
+
+    async def _purge(self) -> int:
+        cutoff = datetime.now(timezone.utc) - self.retention
+        total = 0
+        while True:
+            purged = await self._purge_chunk(cutoff)
+            total += purged
+            if purged < self.chunk_size:
+                break
+            await asyncio.sleep(0)
+        if total:
+            logger.info("OutboxPurgeWorker removed %d published messages", total)
+        return total
+
+    async def _purge_chunk(self, cutoff: datetime) -> int:
+        if self._uow_factory is None:
+            return await self._storage.purge_published(
+                cutoff, self.chunk_size, archive=self.archive
+            )
+        async with self._uow_factory() as uow:
+            return await self._storage.purge_published(
+                cutoff, self.chunk_size, uow, archive=self.archive
+            )
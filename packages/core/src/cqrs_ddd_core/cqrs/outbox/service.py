@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, cast
+import os
+import socket
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
 
 from ...correlation import get_correlation_id
 from ...instrumentation import get_hook_registry
-from ...primitives.exceptions import ConcurrencyError
+from ...ports.messaging import IBatchMessagePublisher, supports_publish_batch
+from ...ports.outbox import IClaimingOutboxStorage
+from ...primitives.exceptions import (
+    BatchPublishError,
+    ConcurrencyError,
+    OutboxError,
+)
 from ...primitives.locking import ResourceIdentifier
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ...ports.locking import ILockStrategy
     from ...ports.messaging import IMessagePublisher
     from ...ports.outbox import IOutboxStorage, OutboxMessage
@@ -30,33 +42,69 @@ class OutboxService:
 
     Lock strategy prevents race conditions when multiple workers process
     the same outbox concurrently.
+
+    **Claim mode:** when no ``lock_strategy`` is given, the storage must
+    implement ``IClaimingOutboxStorage``.  Steps 1 and 2 collapse into a
+    single ``claim_pending`` call that leases a disjoint batch to this
+    worker (e.g. ``SELECT ... FOR UPDATE SKIP LOCKED``), so no per-message
+    lock round-trips are needed.
+
+    **Concurrent publishing:** with ``max_concurrency > 1`` the batch is
+    split by ``partition_key`` (default: ``aggregate_id`` metadata, then
+    correlation id).  Messages sharing a key are published in order, one
+    at a time; different keys are published in parallel.  After a failure
+    the remaining messages of that key are left pending so they cannot
+    overtake it.
+
+    **Batch publishing:** when the publisher implements ``publish_batch``
+    (see ``IBatchMessagePublisher``) the whole batch is handed to it in one
+    call, in order, and ``max_concurrency`` is not used.  A
+    ``BatchPublishError`` records only the messages it names as failed and
+    leaves the unsent ones pending; any other exception records every
+    message of the batch as failed.
     """
 
     def __init__(
         self,
         storage: IOutboxStorage,
         publisher: IMessagePublisher,
-        lock_strategy: ILockStrategy,
+        lock_strategy: ILockStrategy | None = None,
         *,
         max_retries: int = 5,
+        worker_id: str | None = None,
+        claim_ttl: float = 30.0,
+        max_concurrency: int = 1,
+        partition_key: Callable[[OutboxMessage], str] | None = None,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if lock_strategy is None and not isinstance(storage, IClaimingOutboxStorage):
+            raise OutboxError(
+                "OutboxService without a 'lock_strategy' requires a storage "
+                "implementing IClaimingOutboxStorage."
+            )
         self.storage = storage
         self.publisher = publisher
         self.lock_strategy = lock_strategy
         self.max_retries = max_retries
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        )
+        self.claim_ttl = claim_ttl
+        self.max_concurrency = max_concurrency
+        self.partition_key = partition_key or _default_partition_key
 
     async def process_batch(self, batch_size: int = 50) -> int:
         """Process pending messages with instrumentation."""
         registry = get_hook_registry()
-        attributes = {
-            "outbox.batch_size": batch_size,
-            "correlation_id": get_correlation_id(),
-        }
         return cast(
             "int",
             await registry.execute_all(
                 "outbox.process_batch",
-                attributes,
+                lambda: {
+                    "outbox.batch_size": batch_size,
+                    "correlation_id": get_correlation_id(),
+                },
                 lambda: self._process_batch_internal(batch_size),
             ),
         )
@@ -72,6 +120,14 @@ class OutboxService:
 
         Returns the number of messages successfully published.
         """
+        if self.lock_strategy is None:
+            claimed = await self._claim(batch_size)
+            if not claimed:
+                return 0
+            return await self._publish_messages(
+                claimed, "Failed to publish outbox message %s: %s"
+            )
+
         messages: list[OutboxMessage] = await self.storage.get_pending(batch_size)
         if not messages:
             return 0
@@ -104,30 +160,10 @@ class OutboxService:
 
         # Phase 2: Process batch with held locks
         try:
-            published_ids: list[str] = []
-            for msg, _, _ in acquired:
-                try:
-                    await self.publisher.publish(
-                        topic=msg.event_type,
-                        message=msg.payload,
-                        correlation_id=msg.metadata.get("correlation_id")
-                        or msg.correlation_id
-                        or None,
-                    )
-                    published_ids.append(msg.message_id)
-                except Exception as exc:  # noqa: BLE001
-                    logger.error(
-                        "Failed to publish outbox message %s: %s",
-                        msg.message_id,
-                        exc,
-                    )
-                    await self.storage.mark_failed(msg.message_id, str(exc))
-
-            # Batch DB update!
-            if published_ids:
-                await self.storage.mark_published(published_ids)
-
-            return len(published_ids)
+            return await self._publish_messages(
+                [msg for msg, _, _ in acquired],
+                "Failed to publish outbox message %s: %s",
+            )
 
         finally:
             # Always release all locks (even if processing failed)
@@ -144,15 +180,14 @@ class OutboxService:
     async def retry_failed(self, batch_size: int = 50) -> int:
         """Retry pending failed messages with instrumentation."""
         registry = get_hook_registry()
-        attributes = {
-            "outbox.retry.batch_size": batch_size,
-            "correlation_id": get_correlation_id(),
-        }
         return cast(
             "int",
             await registry.execute_all(
                 "outbox.retry_failed",
-                attributes,
+                lambda: {
+                    "outbox.retry.batch_size": batch_size,
+                    "correlation_id": get_correlation_id(),
+                },
                 lambda: self._retry_failed_internal(batch_size),
             ),
         )
@@ -166,13 +201,19 @@ class OutboxService:
 
         Returns the number of messages successfully retried.
         """
+        if self.lock_strategy is None:
+            # Claim only retryable messages so fresh ones stay free for
+            # process_batch on other workers.
+            retryable = await self._claim(batch_size, max_retries=self.max_retries)
+            if not retryable:
+                return 0
+            return await self._publish_messages(
+                retryable, "Retry failed for outbox message %s: %s"
+            )
+
         pending = await self.storage.get_pending(batch_size)
         # Filter to only previously-failed messages eligible for retry.
-        retryable = [
-            m
-            for m in pending
-            if m.error is not None and m.retry_count < self.max_retries
-        ]
+        retryable = [m for m in pending if self._is_retryable(m)]
         if not retryable:
             return 0
 
@@ -196,29 +237,10 @@ class OutboxService:
 
         # Phase 2: Process with held locks
         try:
-            published_ids: list[str] = []
-            for msg, _, _ in acquired:
-                try:
-                    await self.publisher.publish(
-                        topic=msg.event_type,
-                        message=msg.payload,
-                        correlation_id=msg.metadata.get("correlation_id")
-                        or msg.correlation_id
-                        or None,
-                    )
-                    published_ids.append(msg.message_id)
-                except Exception as exc:  # noqa: BLE001
-                    logger.error(
-                        "Retry failed for outbox message %s: %s",
-                        msg.message_id,
-                        exc,
-                    )
-                    await self.storage.mark_failed(msg.message_id, str(exc))
-
-            if published_ids:
-                await self.storage.mark_published(published_ids)
-
-            return len(published_ids)
+            return await self._publish_messages(
+                [msg for msg, _, _ in acquired],
+                "Retry failed for outbox message %s: %s",
+            )
 
         finally:
             # Release all locks
@@ -231,3 +253,153 @@ class OutboxService:
                         resource,
                         exc,
                     )
+
+    def _is_retryable(self, msg: OutboxMessage) -> bool:
+        return msg.error is not None and msg.retry_count < self.max_retries
+
+    async def _claim(
+        self, batch_size: int, *, max_retries: int | None = None
+    ) -> list[OutboxMessage]:
+        storage = cast("IClaimingOutboxStorage", self.storage)
+        claimed = await storage.claim_pending(
+            batch_size,
+            worker_id=self.worker_id,
+            lease_seconds=self.claim_ttl,
+            max_retries=max_retries,
+        )
+        if claimed:
+            logger.debug("Worker %s claimed %d messages", self.worker_id, len(claimed))
+        return claimed
+
+    async def _publish_messages(
+        self, messages: list[OutboxMessage], failure_log: str
+    ) -> int:
+        """Publish *messages*, then record failures and successes in batch."""
+        published_ids: list[str] = []
+        failures: dict[str, str] = {}
+        skipped: list[str] = []
+        if supports_publish_batch(self.publisher):
+            skipped = await self._publish_batch(
+                messages, published_ids, failures, failure_log
+            )
+        elif self.max_concurrency == 1:
+            for msg in messages:
+                await self._publish_one(msg, published_ids, failures, failure_log)
+        else:
+            skipped = await self._publish_partitioned(
+                messages, published_ids, failures, failure_log
+            )
+
+        if failures:
+            await self._record_failures(failures)
+        # Batch DB update!
+        if published_ids:
+            await self.storage.mark_published(published_ids)
+        if skipped and self.lock_strategy is None:
+            await cast("IClaimingOutboxStorage", self.storage).release_claims(
+                skipped, worker_id=self.worker_id
+            )
+
+        return len(published_ids)
+
+    async def _publish_batch(
+        self,
+        messages: list[OutboxMessage],
+        published_ids: list[str],
+        failures: dict[str, str],
+        failure_log: str,
+    ) -> list[str]:
+        """Publish *messages* in one call; return IDs the publisher did not send."""
+        publisher = cast("IBatchMessagePublisher", self.publisher)
+        try:
+            await publisher.publish_batch(
+                [
+                    (msg.event_type, msg.payload, self._publish_kwargs(msg))
+                    for msg in messages
+                ]
+            )
+        except BatchPublishError as exc:
+            for index, error in exc.failed.items():
+                logger.error(failure_log, messages[index].message_id, error)
+                failures[messages[index].message_id] = error
+            undelivered = set(exc.failed).union(exc.unsent)
+            published_ids.extend(
+                msg.message_id
+                for index, msg in enumerate(messages)
+                if index not in undelivered
+            )
+            return [messages[index].message_id for index in exc.unsent]
+        except Exception as exc:  # noqa: BLE001
+            for msg in messages:
+                logger.error(failure_log, msg.message_id, exc)
+                failures[msg.message_id] = str(exc)
+            return []
+        published_ids.extend(msg.message_id for msg in messages)
+        return []
+
+    async def _publish_partitioned(
+        self,
+        messages: list[OutboxMessage],
+        published_ids: list[str],
+        failures: dict[str, str],
+        failure_log: str,
+    ) -> list[str]:
+        """Publish partitions in parallel; return IDs held back by a failure."""
+        partitions: dict[str, list[OutboxMessage]] = {}
+        for msg in messages:
+            partitions.setdefault(self.partition_key(msg), []).append(msg)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        skipped: list[str] = []
+
+        async def _publish_partition(partition: list[OutboxMessage]) -> None:
+            async with semaphore:
+                for index, msg in enumerate(partition):
+                    if not await self._publish_one(
+                        msg, published_ids, failures, failure_log
+                    ):
+                        skipped.extend(m.message_id for m in partition[index + 1 :])
+                        return
+
+        await asyncio.gather(*(_publish_partition(p) for p in partitions.values()))
+        return skipped
+
+    async def _publish_one(
+        self,
+        msg: OutboxMessage,
+        published_ids: list[str],
+        failures: dict[str, str],
+        failure_log: str,
+    ) -> bool:
+        try:
+            await self.publisher.publish(
+                topic=msg.event_type,
+                message=msg.payload,
+                **self._publish_kwargs(msg),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.error(failure_log, msg.message_id, exc)
+            failures[msg.message_id] = str(exc)
+            return False
+        published_ids.append(msg.message_id)
+        return True
+
+    @staticmethod
+    def _publish_kwargs(msg: OutboxMessage) -> dict[str, Any]:
+        return {
+            "correlation_id": msg.metadata.get("correlation_id")
+            or msg.correlation_id
+            or None
+        }
+
+    async def _record_failures(self, failures: dict[str, str]) -> None:
+        # Structural IOutboxStorage implementers don't inherit the default
+        mark_failed_batch = getattr(self.storage, "mark_failed_batch", None)
+        if mark_failed_batch is not None:
+            await mark_failed_batch(failures)
+            return
+        for message_id, error in failures.items():
+            await self.storage.mark_failed(message_id, error)
+
+
+def _default_partition_key(msg: OutboxMessage) -> str:
+    return str(msg.metadata.get("aggregate_id") or msg.correlation_id or msg.message_id)
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
 from ...correlation import get_correlation_id
 from ...instrumentation import get_hook_registry
-from ...ports.messaging import IMessagePublisher
+from ...ports.messaging import (
+    IBatchMessagePublisher,
+    IMessagePublisher,
+    supports_publish_batch,
+)
+from ...primitives.exceptions import BatchPublishError, PublisherNotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 logger = logging.getLogger("cqrs_ddd.publishers")
 
@@ -20,6 +28,15 @@ class TopicRoutingPublisher(IMessagePublisher):
     2. Check if topic/event name is in explicit ``routes`` dict.
     3. Fall back to ``default`` publisher.
 
+    ``publish_batch`` groups messages by resolved publisher (keeping their
+    relative order) and uses each publisher's own ``publish_batch`` when
+    it has one, falling back to one ``publish`` call per message.  Those
+    fallbacks stop at the first failure of their group, and partial
+    outcomes are reported as a single ``BatchPublishError``.  The router
+    only advertises batching (``supports_batch``) when every publisher it
+    routes to supports it, so callers such as ``OutboxService`` otherwise
+    keep their own concurrent per-message publishing.
+
     Usage::
 
         router = TopicRoutingPublisher(
@@ -43,6 +60,14 @@ class TopicRoutingPublisher(IMessagePublisher):
         self._destinations = destinations or {}
         self._default = default
 
+    @property
+    def supports_batch(self) -> bool:
+        """True when every target publisher implements ``publish_batch``."""
+        targets = [*self._routes.values(), *self._destinations.values()]
+        if self._default is not None:
+            targets.append(self._default)
+        return bool(targets) and all(supports_publish_batch(p) for p in targets)
+
     def register_route(self, topic: str, publisher: IMessagePublisher) -> None:
         """Register a specific publisher for a topic (event class name)."""
         self._routes[topic] = publisher
@@ -58,42 +83,7 @@ class TopicRoutingPublisher(IMessagePublisher):
         }
 
         async def _publish() -> None:
-            publisher: IMessagePublisher | None = None
-
-            # 1. Check for destination key on the message/event class
-            # (Usually set via @route_to decorator)
-            dest_key = getattr(message, "__route_to__", None)
-            if not dest_key and hasattr(message, "__class__"):
-                dest_key = getattr(message.__class__, "__route_to__", None)
-
-            if dest_key:
-                publisher = self._destinations.get(dest_key)
-                if publisher:
-                    logger.debug(
-                        "Resolved auto-route: %s -> %s -> %s",
-                        topic,
-                        dest_key,
-                        type(publisher).__name__,
-                    )
-
-            # 2. Check explicit topic route (overrides auto-route)
-            if topic in self._routes:
-                publisher = self._routes[topic]
-
-            # 3. Fall back to default
-            if not publisher:
-                publisher = self._default
-
-            if not publisher:
-                msg = (
-                    f"No publisher configured for topic '{topic}' "
-                    "and no default provided."
-                )
-                logger.error(msg)
-                from ...primitives.exceptions import PublisherNotFoundError
-
-                raise PublisherNotFoundError(msg)
-
+            publisher = self._resolve(topic, message)
             await publisher.publish(topic, message, **kwargs)
 
         await registry.execute_all(
@@ -101,3 +91,124 @@ class TopicRoutingPublisher(IMessagePublisher):
             attributes,
             _publish,
         )
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        """Route a batch of ``(topic, message, kwargs)`` triples.
+
+        Raises:
+            BatchPublishError: If some messages failed or were not sent;
+                indices refer to positions in *messages*.
+        """
+        if not messages:
+            return
+        registry = get_hook_registry()
+
+        async def _publish() -> None:
+            groups: dict[int, tuple[IMessagePublisher, list[int]]] = {}
+            failed: dict[int, str] = {}
+            unsent: list[int] = []
+            for index, (topic, message, _) in enumerate(messages):
+                try:
+                    publisher = self._resolve(topic, message)
+                except PublisherNotFoundError as exc:
+                    failed[index] = str(exc)
+                    continue
+                groups.setdefault(id(publisher), (publisher, []))[1].append(index)
+
+            for publisher, indices in groups.values():
+                if supports_publish_batch(publisher):
+                    await self._publish_group_batch(
+                        publisher, messages, indices, failed, unsent
+                    )
+                else:
+                    await self._publish_group_each(
+                        publisher, messages, indices, failed, unsent
+                    )
+            if failed or unsent:
+                raise BatchPublishError(failed, unsent)
+
+        await registry.execute_all(
+            "publisher.publish_batch",
+            lambda: {
+                "publisher.batch_size": len(messages),
+                "correlation_id": get_correlation_id(),
+            },
+            _publish,
+        )
+
+    @staticmethod
+    async def _publish_group_batch(
+        publisher: IMessagePublisher,
+        messages: Sequence[tuple[str, Any, dict[str, Any]]],
+        indices: list[int],
+        failed: dict[int, str],
+        unsent: list[int],
+    ) -> None:
+        batch = [messages[i] for i in indices]
+        try:
+            await cast("IBatchMessagePublisher", publisher).publish_batch(batch)
+        except BatchPublishError as exc:
+            failed.update({indices[i]: error for i, error in exc.failed.items()})
+            unsent.extend(indices[i] for i in exc.unsent)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Batch publish via %s failed: %s", type(publisher).__name__, exc
+            )
+            failed.update(dict.fromkeys(indices, str(exc)))
+
+    @staticmethod
+    async def _publish_group_each(
+        publisher: IMessagePublisher,
+        messages: Sequence[tuple[str, Any, dict[str, Any]]],
+        indices: list[int],
+        failed: dict[int, str],
+        unsent: list[int],
+    ) -> None:
+        for position, index in enumerate(indices):
+            topic, message, kwargs = messages[index]
+            try:
+                await publisher.publish(topic, message, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Publish to %s failed: %s", topic, exc)
+                failed[index] = str(exc)
+                # Later messages of this group must not overtake the failure
+                unsent.extend(indices[position + 1 :])
+                return
+
+    def _resolve(self, topic: str, message: Any) -> IMessagePublisher:
+        publisher: IMessagePublisher | None = None
+
+        # 1. Check for destination key on the message/event class
+        # (Usually set via @route_to decorator)
+        dest_key = getattr(message, "__route_to__", None)
+        if not dest_key and hasattr(message, "__class__"):
+            dest_key = getattr(message.__class__, "__route_to__", None)
+
+        if dest_key:
+            publisher = self._destinations.get(dest_key)
+            if publisher:
+                logger.debug(
+                    "Resolved auto-route: %s -> %s -> %s",
+                    topic,
+                    dest_key,
+                    type(publisher).__name__,
+                )
+
+        # 2. Check explicit topic route (overrides auto-route)
+        if topic in self._routes:
+            publisher = self._routes[topic]
+
+        # 3. Fall back to default
+        if not publisher:
+            publisher = self._default
+
+        if not publisher:
+            msg = (
+                f"No publisher configured for topic '{topic}' and no default provided."
+            )
+            logger.error(msg)
+            raise PublisherNotFoundError(msg)
+
+        return publisher
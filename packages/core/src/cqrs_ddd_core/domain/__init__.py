@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from .aggregate import AggregateRoot
 from .event_registry import EventTypeRegistry
-from .events import DomainEvent, enrich_event_metadata
+from .events import DomainEvent, enrich_event_metadata, enrich_events_metadata
 from .mixins import (
     HAS_GEO,
     AggregateRootMixin,
@@ -23,6 +23,7 @@ __all__: list[str] = [
     "HAS_GEO",
     "ValueObject",
     "enrich_event_metadata",
+    "enrich_events_metadata",
 ]
 
 if HAS_GEO:
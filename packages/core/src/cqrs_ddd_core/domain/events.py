@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
+from functools import partial
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -71,3 +73,70 @@ def enrich_event_metadata(
         },
     )
     return enriched
+
+
+def enrich_events_metadata(
+    events: list[DomainEvent],
+    *,
+    correlation_id: str | None = None,
+    causation_id: str | None = None,
+) -> list[DomainEvent]:
+    """Return *events* with tracing IDs injected, as copies.
+
+    Batch counterpart of :func:`enrich_event_metadata`: events that already
+    carry the requested IDs are passed through, the rest are copied.  One
+    ``event.enrich_metadata`` hook fires per distinct event type (with that
+    type as ``message_type``) instead of one per event.
+
+    Returns *events* itself when nothing needed enriching.
+    """
+    if not correlation_id and not causation_id:
+        return events
+
+    enriched: list[DomainEvent] = []
+    copied: dict[type[DomainEvent], list[str]] = {}
+    for event in events:
+        updates: dict[str, str] = {}
+        if correlation_id and not event.correlation_id:
+            updates["correlation_id"] = correlation_id
+        if causation_id and not event.causation_id:
+            updates["causation_id"] = causation_id
+        if updates:
+            event = event.model_copy(update=updates)
+            copied.setdefault(type(event), []).append(str(event.event_id))
+        enriched.append(event)
+
+    if not copied:
+        return events
+
+    registry = get_hook_registry()
+    for event_type, event_ids in copied.items():
+        fire_and_forget_hook(
+            registry,
+            "event.enrich_metadata",
+            partial(
+                _enrich_hook_attributes,
+                event_type,
+                event_ids,
+                correlation_id,
+                causation_id,
+            ),
+            message_type=event_type,
+        )
+    return enriched
+
+
+def _enrich_hook_attributes(
+    event_type: type[DomainEvent],
+    event_ids: list[str],
+    correlation_id: str | None,
+    causation_id: str | None,
+) -> dict[str, Any]:
+    return {
+        "event.type": event_type.__name__,
+        "event.ids": event_ids,
+        "event.count": len(event_ids),
+        "correlation_id": correlation_id,
+        "causation_id": causation_id,
+        "message_type": event_type,
+    }
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import fnmatch
 import logging
+import random
+import threading
+import time
+from bisect import bisect_right
 from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
 
 logger = logging.getLogger("cqrs_ddd.instrumentation")
 
@@ -31,7 +38,16 @@ class InstrumentationHook(Protocol):
 
 
 class HookRegistration:
-    """A registered hook with filtering and priority."""
+    """A registered hook with filtering, sampling and priority.
+
+    Head sampling (``sample_rate``, ``rate_limit``) decides *before* the
+    operation runs whether the hook wraps it.  Tail sampling
+    (``tail_min_duration_ms``, ``tail_errors``) runs the operation first and
+    only then invokes the hook — with a ``next_handler`` that replays the
+    recorded result or exception and a ``duration_ms`` attribute holding
+    the measured latency — if it was slow enough or failed.  Tail-sampled
+    hooks therefore cannot parent spans opened during the operation.
+    """
 
     def __init__(
         self,
@@ -42,14 +58,38 @@ class HookRegistration:
         operations: list[str] | None = None,
         message_types: list[type[Any]] | None = None,
         enabled: bool = True,
+        sample_rate: float = 1.0,
+        rate_limit: float | None = None,
+        tail_min_duration_ms: float | None = None,
+        tail_errors: bool = False,
     ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
         self.hook = hook
         self.priority = priority
         self.predicate = predicate
         self.operations = operations or []
         self.message_types = message_types or []
         self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit
+        self.tail_min_duration_ms = tail_min_duration_ms
+        self.tail_errors = tail_errors
         self._match_cache: dict[str, bool] = {}
+        # operation -> [tokens, last refill (monotonic seconds)]
+        self._buckets: dict[str, list[float]] = {}
+
+    @property
+    def head_sampled(self) -> bool:
+        """Whether a per-call head sampling decision is needed."""
+        return self.sample_rate < 1.0 or self.rate_limit is not None
+
+    @property
+    def tail_sampled(self) -> bool:
+        """Whether the hook only records slow or failed operations."""
+        return self.tail_min_duration_ms is not None or self.tail_errors
 
     def matches(self, operation: str, attributes: dict[str, Any]) -> bool:
         """Check if this registration applies to the operation."""
@@ -83,23 +123,64 @@ class HookRegistration:
         return matched
 
     def _matches_message_type(self, attributes: dict[str, Any]) -> bool:
-        if not self.message_types:
-            return True
-        msg_type = attributes.get("message_type")
-        if msg_type is None:
+        return self._matches_message_type_value(attributes.get("message_type"))
+
+    def _matches_message_type_value(self, msg_type: type[Any] | None) -> bool:
+        if not self.message_types or msg_type is None:
             return True
         return msg_type in self.message_types
 
+    def _sample(self, operation: str) -> bool:
+        """Head sampling: probabilistic, then per-operation token bucket."""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:  # noqa: S311
+            return False
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        bucket = self._buckets.get(operation)
+        if bucket is None:
+            if len(self._buckets) >= _MATCH_CACHE_MAX_SIZE:
+                self._buckets.clear()
+            bucket = self._buckets[operation] = [max(1.0, self.rate_limit), now]
+        else:
+            bucket[0] = min(
+                max(1.0, self.rate_limit),
+                bucket[0] + (now - bucket[1]) * self.rate_limit,
+            )
+            bucket[1] = now
+        if bucket[0] < 1.0:
+            return False
+        bucket[0] -= 1.0
+        return True
+
+    def _tail_records(self, duration_ms: float, *, errored: bool) -> bool:
+        if errored and self.tail_errors:
+            return True
+        return (
+            self.tail_min_duration_ms is not None
+            and duration_ms >= self.tail_min_duration_ms
+        )
+
     def clear_cache(self) -> None:
         """Clear the match cache."""
         self._match_cache.clear()
 
 
 class HookRegistry:
-    """Registry for multiple instrumentation hooks with filtering."""
+    """Registry for multiple instrumentation hooks with filtering.
+
+    Matching is compiled per ``(operation, message_type)``: the tuple of
+    registrations whose operation globs and message types match is computed
+    once and cached until the next :meth:`register`.  Only ``enabled`` and
+    ``predicate`` are evaluated per call, so operations without matching
+    hooks cost a single dict lookup.
+    """
 
     def __init__(self) -> None:
         self._registrations: list[HookRegistration] = []
+        self._compiled: dict[
+            tuple[str, type[Any] | None], tuple[HookRegistration, ...]
+        ] = {}
 
     def register(
         self,
@@ -110,8 +191,27 @@ class HookRegistry:
         operations: list[str] | None = None,
         message_types: list[type[Any]] | None = None,
         enabled: bool = True,
+        sample_rate: float = 1.0,
+        rate_limit: float | None = None,
+        tail_min_duration_ms: float | None = None,
+        tail_errors: bool = False,
     ) -> HookRegistration:
-        """Register a hook with optional filtering."""
+        """Register a hook with optional filtering and sampling.
+
+        Args:
+            hook: The hook to register.
+            priority: Lower values wrap outermost.
+            predicate: Per-call filter on ``(operation, attributes)``.
+            operations: Operation glob patterns; empty matches everything.
+            message_types: Message types the hook applies to.
+            enabled: Whether the hook starts enabled.
+            sample_rate: Probability (``0.0``-``1.0``) that a matching call
+                is recorded.
+            rate_limit: Maximum recorded calls per second, per operation.
+            tail_min_duration_ms: Only record calls at least this slow.
+            tail_errors: Only record calls that raised (combined with
+                ``tail_min_duration_ms``: slow *or* failed).
+        """
         registration = HookRegistration(
             hook=hook,
             priority=priority,
@@ -119,44 +219,170 @@ class HookRegistry:
             operations=operations,
             message_types=message_types,
             enabled=enabled,
+            sample_rate=sample_rate,
+            rate_limit=rate_limit,
+            tail_min_duration_ms=tail_min_duration_ms,
+            tail_errors=tail_errors,
         )
         self._registrations.append(registration)
         self._registrations.sort(key=lambda r: r.priority)
+        self._compiled.clear()
         return registration
 
     async def execute_all(
         self,
         operation: str,
-        attributes: dict[str, Any],
+        attributes: dict[str, Any] | Callable[[], dict[str, Any]],
         next_handler: Callable[[], Awaitable[Any]],
+        *,
+        message_type: type[Any] | None = None,
     ) -> Any:
-        """Execute all matching hooks in priority order."""
-        matching = [r for r in self._registrations if r.matches(operation, attributes)]
+        """Execute all matching hooks in priority order.
+
+        *attributes* may be a dict or a zero-argument callable returning
+        one; a callable is only invoked when at least one hook matches.
+        Pass *message_type* explicitly alongside lazy attributes so
+        message-type filters can be resolved without building them.
+        """
+        if not self._registrations:
+            return await next_handler()
+
+        matching, attrs = self._resolve(operation, attributes, message_type)
         if not matching:
             return await next_handler()
 
-        async def pipeline(index: int = 0) -> Any:
-            if index >= len(matching):
-                return await next_handler()
-            registration = matching[index]
-            return await registration.hook(
-                operation,
-                attributes,
-                lambda: pipeline(index + 1),
+        call: Callable[[], Awaitable[Any]] = next_handler
+        tail = [r for r in matching if r.tail_sampled]
+        if tail:
+            matching = [r for r in matching if not r.tail_sampled]
+            call = partial(self._run_tail_sampled, operation, attrs, tail, next_handler)
+
+        # Build the chain inside-out instead of recursing per call
+        for registration in reversed(matching):
+            call = partial(registration.hook, operation, attrs, call)
+        return await call()
+
+    async def _run_tail_sampled(
+        self,
+        operation: str,
+        attrs: dict[str, Any],
+        tail: list[HookRegistration],
+        next_handler: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run the operation, then replay it through slow/failed tail hooks."""
+        start = time.perf_counter()
+        try:
+            result = await next_handler()
+        except Exception as exc:
+            duration_ms = (time.perf_counter() - start) * 1000
+            recorded = [r for r in tail if r._tail_records(duration_ms, errored=True)]
+            if recorded:
+                try:
+                    await self._replay(
+                        operation, attrs, recorded, duration_ms, error=exc
+                    )
+                except Exception as replay_exc:  # noqa: BLE001
+                    if replay_exc is not exc:
+                        logger.warning(
+                            "Tail-sampled hook failed for %s: %s", operation, replay_exc
+                        )
+            raise
+        duration_ms = (time.perf_counter() - start) * 1000
+        recorded = [r for r in tail if r._tail_records(duration_ms, errored=False)]
+        if recorded:
+            return await self._replay(
+                operation, attrs, recorded, duration_ms, result=result
             )
+        return result
 
-        return await pipeline()
+    @staticmethod
+    async def _replay(
+        operation: str,
+        attrs: dict[str, Any],
+        recorded: list[HookRegistration],
+        duration_ms: float,
+        *,
+        result: Any = None,
+        error: Exception | None = None,
+    ) -> Any:
+        async def replay() -> Any:
+            if error is not None:
+                raise error
+            return result
+
+        tail_attrs = {**attrs, "duration_ms": duration_ms}
+        call: Callable[[], Awaitable[Any]] = replay
+        for registration in reversed(recorded):
+            call = partial(registration.hook, operation, tail_attrs, call)
+        return await call()
+
+    def _resolve(
+        self,
+        operation: str,
+        attributes: dict[str, Any] | Callable[[], dict[str, Any]],
+        message_type: type[Any] | None,
+    ) -> tuple[list[HookRegistration], dict[str, Any]]:
+        """Return the matching registrations and the materialised attributes."""
+        attrs = attributes if isinstance(attributes, dict) else None
+        if message_type is None and attrs is not None:
+            message_type = attrs.get("message_type")
+
+        candidates = self._candidates(operation, message_type)
+        if (
+            attrs is None
+            and message_type is None
+            and any(r.message_types for r in candidates)
+        ):
+            # Message-type filters need the lazy attributes after all
+            attrs = cast("Callable[[], dict[str, Any]]", attributes)()
+            candidates = self._candidates(operation, attrs.get("message_type"))
+
+        # Head sampling runs before attributes are built, except for
+        # predicated hooks whose rate limit must only count matching calls.
+        enabled = [
+            r
+            for r in candidates
+            if r.enabled
+            and (r.predicate is not None or not r.head_sampled or r._sample(operation))
+        ]
+        if not enabled:
+            return [], {}
+        if attrs is None:
+            attrs = cast("Callable[[], dict[str, Any]]", attributes)()
+        return [
+            r
+            for r in enabled
+            if r._matches_predicate(operation, attrs)
+            and (r.predicate is None or not r.head_sampled or r._sample(operation))
+        ], attrs
+
+    def _candidates(
+        self, operation: str, message_type: type[Any] | None
+    ) -> tuple[HookRegistration, ...]:
+        key = (operation, message_type)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = tuple(
+                r
+                for r in self._registrations
+                if r._matches_operation(operation)
+                and r._matches_message_type_value(message_type)
+            )
+            if len(self._compiled) >= _MATCH_CACHE_MAX_SIZE:
+                self._compiled.clear()
+            self._compiled[key] = compiled
+        return compiled
 
     def clear(self) -> None:
         """Remove all registrations and clear caches."""
-        for registration in self._registrations:
-            registration.clear_cache()
+        self.clear_caches()
         self._registrations.clear()
 
     def clear_caches(self) -> None:
         """Clear all match caches without removing registrations."""
         for registration in self._registrations:
             registration.clear_cache()
+        self._compiled.clear()
 
 
 _hook_registry_var: ContextVar[HookRegistry | None] = ContextVar(
@@ -223,13 +449,16 @@ def _on_fire_and_forget_done(task: asyncio.Task[Any]) -> None:
 def fire_and_forget_hook(
     registry: HookRegistry,
     operation: str,
-    attributes: dict[str, Any],
+    attributes: dict[str, Any] | Callable[[], dict[str, Any]],
+    *,
+    message_type: type[Any] | None = None,
 ) -> None:
     """Schedule a no-op hook execution as a fire-and-forget task.
 
     Safe to call from synchronous code inside a running event loop.
     Logs errors instead of swallowing them silently.
     Does nothing if there is no running event loop.
+    *message_type* is forwarded to :meth:`HookRegistry.execute_all`.
     """
     if not registry._registrations:
         return
@@ -241,5 +470,249 @@ def fire_and_forget_hook(
     async def _no_op() -> None:
         return None
 
-    task = loop.create_task(registry.execute_all(operation, attributes, _no_op))
+    task = loop.create_task(
+        registry.execute_all(operation, attributes, _no_op, message_type=message_type)
+    )
     task.add_done_callback(_on_fire_and_forget_done)
+
+
+# ── In-process metrics aggregation ───────────────────────────────
+
+#: Default latency histogram upper bounds, in milliseconds.
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Aggregated count, errors and latency histogram for one operation.
+
+    ``buckets[i]`` counts observations below ``bounds[i]`` (and at or above
+    the previous bound); the extra final bucket counts everything beyond
+    the last bound.
+    """
+
+    bounds: tuple[float, ...]
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.buckets:
+            self.buckets = [0] * (len(self.bounds) + 1)
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean latency in milliseconds (``0.0`` when empty)."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Approximate the *q*-th percentile (``0``-``100``) in milliseconds.
+
+        Returns the upper bound of the bucket holding the target rank, or
+        ``max_ms`` when it falls in the overflow bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max_ms)
+                break
+        return self.max_ms
+
+    def merge(self, other: OperationStats) -> None:
+        """Add *other* (recorded with the same bounds) into this instance."""
+        self.count += other.count
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for index, bucket in enumerate(other.buckets):
+            self.buckets[index] += bucket
+
+
+@runtime_checkable
+class MetricsExporter(Protocol):
+    """Receives aggregated per-operation metrics on every flush."""
+
+    async def export(self, metrics: Mapping[str, OperationStats]) -> None:
+        """Export metrics accumulated since the previous flush."""
+        ...
+
+
+class LoggingMetricsExporter:
+    """Logs one summary line per operation (count, errors, p50/p99)."""
+
+    def __init__(
+        self, log: logging.Logger | None = None, level: int = logging.INFO
+    ) -> None:
+        self._log = log or logger
+        self._level = level
+
+    async def export(self, metrics: Mapping[str, OperationStats]) -> None:
+        for operation, stats in sorted(metrics.items()):
+            self._log.log(
+                self._level,
+                "%s count=%d errors=%d mean=%.3fms p50=%.3fms p99=%.3fms max=%.3fms",
+                operation,
+                stats.count,
+                stats.errors,
+                stats.mean_ms,
+                stats.percentile(50),
+                stats.percentile(99),
+                stats.max_ms,
+            )
+
+
+class _ThreadBuffer:
+    __slots__ = ("stats", "thread")
+
+    def __init__(self) -> None:
+        self.stats: dict[str, OperationStats] = {}
+        self.thread = threading.current_thread()
+
+
+class MetricsAggregatorHook:
+    """Instrumentation hook aggregating per-operation metrics in process.
+
+    Each call records its latency into a histogram keyed by operation name
+    — no spans, labels or allocations beyond the first call per operation.
+    Buffers are per thread, so recording takes no lock: tasks sharing an
+    event loop never interleave inside :meth:`_record`.  :meth:`flush`
+    drains every buffer, merges them and hands the result to the exporter;
+    :meth:`start` does so periodically.
+
+    Usage::
+
+        aggregator = MetricsAggregatorHook(LoggingMetricsExporter())
+        get_hook_registry().register(aggregator, operations=["*"])
+        aggregator.start()
+
+    Parameters
+    ----------
+    exporter:
+        Destination for flushed metrics (Prometheus, OpenTelemetry, logs).
+    flush_interval:
+        Seconds between periodic flushes started by :meth:`start`.
+    buckets_ms:
+        Ascending histogram upper bounds in milliseconds.
+    """
+
+    def __init__(
+        self,
+        exporter: MetricsExporter,
+        *,
+        flush_interval: float = 10.0,
+        buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> None:
+        self._exporter = exporter
+        self._flush_interval = flush_interval
+        self._bounds = tuple(buckets_ms)
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def __call__(
+        self,
+        operation: str,
+        attributes: dict[str, Any],  # noqa: ARG002
+        next_handler: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            result = await next_handler()
+        except Exception:
+            self._record(operation, (time.perf_counter() - start) * 1000.0, True)
+            raise
+        self._record(operation, (time.perf_counter() - start) * 1000.0, False)
+        return result
+
+    def _record(self, operation: str, duration_ms: float, error: bool) -> None:
+        try:
+            buffer: _ThreadBuffer = self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+        stats = buffer.stats.get(operation)
+        if stats is None:
+            stats = buffer.stats[operation] = OperationStats(self._bounds)
+        stats.count += 1
+        if error:
+            stats.errors += 1
+        stats.total_ms += duration_ms
+        if duration_ms > stats.max_ms:
+            stats.max_ms = duration_ms
+        stats.buckets[bisect_right(self._bounds, duration_ms)] += 1
+
+    def collect(self) -> dict[str, OperationStats]:
+        """Drain all buffers and return the merged per-operation stats."""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        merged: dict[str, OperationStats] = {}
+        for buffer in buffers:
+            drained, buffer.stats = buffer.stats, {}
+            for operation, stats in drained.items():
+                total = merged.get(operation)
+                if total is None:
+                    merged[operation] = stats
+                else:
+                    total.merge(stats)
+        with self._buffers_lock:
+            # Forget buffers of threads that have exited
+            self._buffers = [b for b in self._buffers if b.thread.is_alive()]
+        return merged
+
+    async def flush(self) -> None:
+        """Export everything recorded since the previous flush."""
+        metrics = self.collect()
+        if not metrics:
+            return
+        try:
+            await self._exporter.export(metrics)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Metrics export failed: %s", exc, exc_info=True)
+
+    def start(self) -> None:
+        """Start periodic flushing on the running event loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_loop()
+            )
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and export any remaining metrics."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
@@ -6,6 +6,7 @@ from .logging import LoggingMiddleware
 from .outbox import OutboxMiddleware
 from .persistence import EventStorePersistenceMiddleware
 from .pipeline import build_pipeline
+from .query_caching import QueryCachingMiddleware, cached_query, query_cache_key
 from .registry import MiddlewareRegistry
 from .validation import ValidatorMiddleware
 
@@ -16,6 +17,9 @@ __all__ = [
     "MiddlewareDefinition",
     "MiddlewareRegistry",
     "OutboxMiddleware",
+    "QueryCachingMiddleware",
     "ValidatorMiddleware",
     "build_pipeline",
+    "cached_query",
+    "query_cache_key",
 ]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..utils import default_dict_factory
 
@@ -19,12 +19,22 @@ class MiddlewareDefinition:
 
     Supports **deferred instantiation**: supply *middleware_cls* and
     optional *factory* for lazy construction.
+
+    *message_types* restricts the middleware to messages that are instances
+    of (subclasses of) the given types.  ``None`` means it applies to all.
     """
 
     middleware_cls: type[IMiddleware]
     priority: int = 0
     factory: Callable[..., IMiddleware] | None = None
     kwargs: dict[str, object] = field(default_factory=default_dict_factory)
+    message_types: tuple[type[Any], ...] | None = None
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        """Return ``True`` if this middleware should wrap *message_type*."""
+        if self.message_types is None:
+            return True
+        return issubclass(message_type, self.message_types)
 
     def build(self) -> IMiddleware:
         """Construct the middleware instance."""
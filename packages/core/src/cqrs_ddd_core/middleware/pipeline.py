@@ -5,13 +5,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from ..ports.middleware import IMiddleware
 
 
 def build_pipeline(
-    middlewares: list[IMiddleware],
+    middlewares: Sequence[IMiddleware],
     handler_fn: Callable[[Any], Any],
 ) -> Callable[[Any], Any]:
     """Build a LIFO middleware chain ending at *handler_fn*.
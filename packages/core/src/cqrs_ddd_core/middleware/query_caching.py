@@ -0,0 +1,387 @@
+"""QueryCachingMiddleware — caches query results in an ``ICacheService``."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from ..cqrs.query import Query
+from ..cqrs.response import CommandResponse, QueryResponse
+from ..ports.middleware import IMiddleware
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+    from ..domain.events import DomainEvent
+    from ..ports.cache import ICacheService
+
+logger = logging.getLogger("cqrs_ddd.caching")
+
+T = TypeVar("T")
+
+#: Envelope fields that identify a *request*, not the data being asked for.
+_NON_KEY_FIELDS = frozenset({"query_id", "correlation_id"})
+
+
+def cached_query(
+    *,
+    ttl: int | None = None,
+    invalidated_by: Iterable[type[Any]] = (),
+    result_type: Any = None,
+) -> Callable[[type[T]], type[T]]:
+    """Class decorator opting a query type into result caching.
+
+    Sets ``__cache_ttl__``, ``__cache_invalidated_by__`` and (optionally)
+    ``__cache_result_type__`` on the class; the attributes may also be
+    declared directly in the class body.
+
+    Args:
+        ttl: Time-to-live in seconds (``None`` = no expiry).
+        invalidated_by: Domain event types whose occurrence evicts every
+            cached result of this query type.
+        result_type: Type the cached result is rebuilt as on a hit.
+            Defaults to the type argument of ``Query[...]``.
+
+    Usage::
+
+        @cached_query(ttl=30, invalidated_by=[OrderPlaced, OrderCancelled])
+        class GetOrder(Query[OrderDTO]):
+            order_id: str
+    """
+
+    def decorator(cls: type[T]) -> type[T]:
+        cls.__cache_ttl__ = ttl  # type: ignore[attr-defined]
+        cls.__cache_invalidated_by__ = tuple(invalidated_by)  # type: ignore[attr-defined]
+        if result_type is not None:
+            cls.__cache_result_type__ = result_type  # type: ignore[attr-defined]
+        return cls
+
+    return decorator
+
+
+def query_cache_key(query: Any, *, prefix: str = "query") -> str:
+    """Return the stable cache key for *query*.
+
+    The key is ``{prefix}:{module.QualName}:{digest}`` where ``digest`` is a
+    SHA-256 of the canonical JSON of the query fields, excluding
+    ``query_id`` and ``correlation_id`` — two requests for the same data
+    share a key regardless of field order or envelope identifiers.
+    """
+    payload = query.model_dump(mode="json", exclude=_NON_KEY_FIELDS)
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"{prefix}:{_type_name(type(query))}:{digest}"
+
+
+class QueryCachingMiddleware(IMiddleware):
+    """Serves query results from an :class:`ICacheService`.
+
+    Only query types that declare a TTL (via :func:`cached_query` or a
+    ``__cache_ttl__`` class attribute) are cached, unless ``default_ttl``
+    is given, in which case every query is.  Results of ``None`` and
+    unsuccessful responses are never stored.
+
+    A hit returns the same types as a miss.  Pydantic model results are
+    rebuilt by the cache (``ICacheService.get(key, Model)``); any other
+    declared result type (``list[Model]``, ``dict[str, Model]``,
+    ``datetime`` ...) is stored in JSON mode and validated back through a
+    ``pydantic.TypeAdapter``.  Query types whose result type is unknown
+    (plain ``Query``, ``Query[Any]``) or has no pydantic schema are not
+    cached.
+
+    Concurrent identical queries in this process are coalesced: the first
+    caller runs the handler and the others await its response (single
+    flight), so a cold key costs one handler execution, not one per caller.
+
+    Commands flowing through the same middleware evict cached results of
+    every query type that lists one of the produced event types in
+    ``invalidated_by``.  Eviction is deferred to the Unit of Work's
+    ``on_commit`` hook when a command scope is active.  Each eviction bumps
+    an invalidation generation for the query type; a handler that started
+    before the eviction (and may have read pre-commit state) does not
+    store its result, so stale data is not re-cached.  This covers
+    evictions seen by this middleware instance; entries written by other
+    processes expire by TTL.  Events raised elsewhere can be
+    fed to :meth:`invalidate` (e.g. by registering it on an
+    ``EventDispatcher``).
+
+    Cache failures are logged and treated as misses; they never fail the
+    query.
+
+    Usage::
+
+        registry.register(
+            QueryCachingMiddleware,
+            cache=redis_cache,
+            query_types=[GetOrder, ListOrders],
+        )
+
+    Parameters
+    ----------
+    cache:
+        The cache backend.
+    default_ttl:
+        TTL for query types that do not declare one.  ``None`` (default)
+        means such queries bypass the cache.
+    query_types:
+        Query types to index for invalidation up front.  Types seen at
+        runtime are indexed automatically; pass the full set so commands
+        can evict entries written by other processes before this one has
+        served a given query type.
+    key_prefix:
+        Namespace prepended to every cache key.
+    """
+
+    def __init__(
+        self,
+        cache: ICacheService,
+        *,
+        default_ttl: int | None = None,
+        query_types: Iterable[type[Any]] = (),
+        key_prefix: str = "query",
+    ) -> None:
+        self._cache = cache
+        self._default_ttl = default_ttl
+        self._key_prefix = key_prefix
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._generations: dict[type[Any], int] = {}
+        self._policies: dict[type[Any], _CachePolicy] = {}
+        self._invalidation_index: dict[type[Any], set[type[Any]]] = {}
+        for query_type in query_types:
+            self._policy(query_type)
+
+    async def __call__(
+        self,
+        message: Any,
+        next_handler: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """Serve queries from cache; evict on command events."""
+        if isinstance(message, Query):
+            return await self._query(message, next_handler)
+
+        result = await next_handler(message)
+        if isinstance(result, CommandResponse) and result.events:
+            await self._schedule_invalidation(result.events)
+        return result
+
+    # ── Invalidation ─────────────────────────────────────────────
+
+    async def invalidate(self, event: DomainEvent) -> None:
+        """Evict cached results of query types invalidated by *event*."""
+        await self._invalidate_types(self._invalidated_query_types([event]))
+
+    async def invalidate_query_type(self, query_type: type[Any]) -> None:
+        """Evict every cached result of *query_type*."""
+        await self._invalidate_types({query_type})
+
+    async def _schedule_invalidation(self, events: Sequence[DomainEvent]) -> None:
+        query_types = self._invalidated_query_types(events)
+        if not query_types:
+            return
+
+        from ..cqrs.mediator import get_current_uow
+
+        async def _evict() -> None:
+            await self._invalidate_types(query_types)
+
+        uow = get_current_uow()
+        if uow is not None and hasattr(uow, "on_commit"):
+            uow.on_commit(_evict)
+        else:
+            # No transactional scope — the events are already durable.
+            await _evict()
+
+    def _invalidated_query_types(self, events: Iterable[DomainEvent]) -> set[type[Any]]:
+        query_types: set[type[Any]] = set()
+        for event_type in {type(e) for e in events}:
+            for indexed_type, dependents in self._invalidation_index.items():
+                if issubclass(event_type, indexed_type):
+                    query_types.update(dependents)
+        return query_types
+
+    async def _invalidate_types(self, query_types: Iterable[type[Any]]) -> None:
+        for query_type in query_types:
+            self._generations[query_type] = self._generations.get(query_type, 0) + 1
+            namespace = f"{self._key_prefix}:{_type_name(query_type)}:"
+            # New callers must not join a handler that may read stale state
+            for key in [k for k in self._inflight if k.startswith(namespace)]:
+                del self._inflight[key]
+            try:
+                await self._cache.clear_namespace(namespace)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Cache invalidation failed for %s: %s", namespace, e)
+
+    # ── Query path ───────────────────────────────────────────────
+
+    async def _query(
+        self,
+        query: Query[Any],
+        next_handler: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        policy = self._policy(type(query))
+        if not policy.cacheable:
+            return await next_handler(query)
+
+        key = query_cache_key(query, prefix=self._key_prefix)
+
+        leader = self._inflight.get(key)
+        if leader is None:
+            cached = await self._lookup(key, policy)
+            if cached is not None:
+                return QueryResponse(result=cached)
+            # Another caller may have started the handler while we awaited.
+            leader = self._inflight.get(key)
+
+        if leader is not None:
+            return await self._follow(leader, query, next_handler)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_result)
+        self._inflight[key] = future
+        generation = self._generations.get(type(query), 0)
+        try:
+            try:
+                response = await next_handler(query)
+            except Exception as exc:
+                future.set_exception(exc)
+                raise
+            future.set_result(response)
+            # Keep the in-flight entry until the value is stored so late
+            # arrivals reuse this response instead of missing the cache.
+            # Skip the store if an eviction ran while the handler did.
+            if self._generations.get(type(query), 0) == generation:
+                await self._store(key, response, policy)
+        finally:
+            if not future.done():
+                # Leader cancelled — followers fall back to the handler.
+                future.cancel()
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        return response
+
+    async def _lookup(self, key: str, policy: _CachePolicy) -> Any | None:
+        try:
+            cached = await self._cache.get(key, policy.model)
+            if cached is not None and policy.adapter is not None:
+                cached = policy.adapter.validate_python(cached)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Cache get failed for %s: %s", key, e)
+            return None
+        return cached
+
+    async def _follow(
+        self,
+        leader: asyncio.Future[Any],
+        query: Query[Any],
+        next_handler: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        try:
+            response = await asyncio.shield(leader)
+        except asyncio.CancelledError:
+            if not leader.cancelled():
+                raise  # this caller was cancelled, not the leader
+            return await next_handler(query)
+        if isinstance(response, QueryResponse):
+            # Fresh envelope so the Mediator stamps this caller's ids.
+            return QueryResponse(result=response.result, success=response.success)
+        return response
+
+    async def _store(self, key: str, response: Any, policy: _CachePolicy) -> None:
+        if not isinstance(response, QueryResponse):
+            return
+        if not response.success or response.result is None:
+            return
+        try:
+            value = response.result
+            if policy.adapter is not None:
+                value = policy.adapter.dump_python(value, mode="json")
+            await self._cache.set(key, value, ttl=policy.ttl)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Cache set failed for %s: %s", key, e)
+
+    def _policy(self, query_type: type[Any]) -> _CachePolicy:
+        """Resolve the caching policy for a query type, once."""
+        policy = self._policies.get(query_type)
+        if policy is not None:
+            return policy
+
+        if hasattr(query_type, "__cache_ttl__"):
+            policy = _build_policy(query_type, query_type.__cache_ttl__)
+        elif self._default_ttl is not None:
+            policy = _build_policy(query_type, self._default_ttl)
+        else:
+            policy = _NOT_CACHED
+        self._policies[query_type] = policy
+
+        for event_type in getattr(query_type, "__cache_invalidated_by__", ()):
+            self._invalidation_index.setdefault(event_type, set()).add(query_type)
+        return policy
+
+
+@dataclass(frozen=True)
+class _CachePolicy:
+    """How results of one query type are cached.
+
+    ``model`` is handed to ``ICacheService.get`` for pydantic model
+    results; ``adapter`` round-trips every other result type.
+    """
+
+    cacheable: bool
+    ttl: int | None = None
+    model: type[Any] | None = None
+    adapter: TypeAdapter[Any] | None = None
+
+
+_NOT_CACHED = _CachePolicy(cacheable=False)
+
+
+def _build_policy(query_type: type[Any], ttl: int | None) -> _CachePolicy:
+    result_type = _result_type(query_type)
+    if result_type is None or result_type is Any or isinstance(result_type, TypeVar):
+        logger.warning(
+            "Not caching %s: declare Query[ResultType] or result_type=",
+            query_type.__name__,
+        )
+        return _NOT_CACHED
+    if isinstance(result_type, type) and hasattr(result_type, "model_validate_json"):
+        return _CachePolicy(cacheable=True, ttl=ttl, model=result_type)
+    try:
+        adapter: TypeAdapter[Any] = TypeAdapter(result_type)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "Not caching %s: result type %r cannot be serialized: %s",
+            query_type.__name__,
+            result_type,
+            e,
+        )
+        return _NOT_CACHED
+    return _CachePolicy(cacheable=True, ttl=ttl, adapter=adapter)
+
+
+def _result_type(query_type: type[Any]) -> Any:
+    """Explicit ``__cache_result_type__`` or the argument of ``Query[...]``."""
+    declared = getattr(query_type, "__cache_result_type__", None)
+    if declared is not None:
+        return declared
+    for klass in query_type.__mro__:
+        metadata = getattr(klass, "__pydantic_generic_metadata__", None)
+        if metadata and metadata.get("origin") is Query and metadata.get("args"):
+            return metadata["args"][0]
+    return None
+
+
+def _type_name(query_type: type[Any]) -> str:
+    """Module-qualified name, so same-named query classes don't collide."""
+    return f"{query_type.__module__}.{query_type.__qualname__}"
+
+
+def _consume_result(future: asyncio.Future[Any]) -> None:
+    """Mark a future's outcome as retrieved so unobserved errors stay quiet."""
+    if not future.cancelled():
+        future.exception()
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 from .definition import MiddlewareDefinition
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from ..ports.middleware import IMiddleware
 
@@ -20,11 +20,18 @@ class MiddlewareRegistry:
 
     Middleware is registered with a ``priority`` — lower values execute
     first (outermost in the LIFO chain).
+
+    Every registration bumps :attr:`generation`, which consumers (such as
+    the :class:`~cqrs_ddd_core.cqrs.mediator.Mediator` pipeline cache) use
+    to detect that previously compiled chains are stale.
     """
 
     def __init__(self) -> None:
         self._definitions: list[MiddlewareDefinition] = []
-        self._instances: list[IMiddleware] | None = None  # cache
+        # cache of (definition, instance) pairs in priority order
+        self._instances: list[tuple[MiddlewareDefinition, IMiddleware]] | None = None
+        self._by_type: dict[type[Any], tuple[IMiddleware, ...]] = {}
+        self._generation = 0
 
     # ── Registration ─────────────────────────────────────────────
 
@@ -34,6 +41,7 @@ class MiddlewareRegistry:
         *,
         priority: int = 0,
         factory: Callable[..., IMiddleware] | None = None,
+        message_types: Iterable[type[Any]] | None = None,
         **kwargs: object,
     ) -> None:
         """Register a middleware class.
@@ -46,6 +54,9 @@ class MiddlewareRegistry:
             Lower = outermost in pipe.  Default ``0``.
         factory:
             Optional custom constructor.
+        message_types:
+            Optional message types this middleware applies to.  Messages of
+            any other type skip it entirely (it is left out of their chain).
         **kwargs:
             Passed to the constructor or factory.
         """
@@ -54,9 +65,10 @@ class MiddlewareRegistry:
             priority=priority,
             factory=factory,
             kwargs=kwargs,
+            message_types=tuple(message_types) if message_types is not None else None,
         )
         self._definitions.append(defn)
-        self._instances = None  # invalidate cache
+        self._invalidate()
         logger.debug(
             "Registered middleware %s (priority=%d)", middleware_cls.__name__, priority
         )
@@ -67,6 +79,7 @@ class MiddlewareRegistry:
         *,
         priority: int = 0,
         factory: Callable[..., IMiddleware] | None = None,
+        message_types: Iterable[type[Any]] | None = None,
         **kwargs: object,
     ) -> Any:
         """Decorator-style registration.
@@ -82,27 +95,65 @@ class MiddlewareRegistry:
         if middleware_cls is None:
             # Called as @registry.add(priority=...)
             def wrapper(cls: type[Any]) -> type[Any]:
-                self.register(cls, priority=priority, factory=factory, **kwargs)
+                self.register(
+                    cls,
+                    priority=priority,
+                    factory=factory,
+                    message_types=message_types,
+                    **kwargs,
+                )
                 return cls
 
             return wrapper
 
         # Called as @registry.add
-        self.register(middleware_cls, priority=priority, factory=factory, **kwargs)
+        self.register(
+            middleware_cls,
+            priority=priority,
+            factory=factory,
+            message_types=message_types,
+            **kwargs,
+        )
         return middleware_cls
 
     # ── Retrieval ────────────────────────────────────────────────
 
+    @property
+    def generation(self) -> int:
+        """Monotonic counter bumped on every registration change."""
+        return self._generation
+
     def get_ordered_middlewares(self) -> list[IMiddleware]:
         """Return middleware instances sorted by priority (ascending)."""
+        return [mw for _, mw in self._ordered()]
+
+    def get_middlewares_for(self, message_type: type[Any]) -> tuple[IMiddleware, ...]:
+        """Return the ordered middlewares that apply to *message_type*.
+
+        The result is cached per message type until the next registration.
+        """
+        cached = self._by_type.get(message_type)
+        if cached is None:
+            cached = tuple(
+                mw for defn, mw in self._ordered() if defn.applies_to(message_type)
+            )
+            self._by_type[message_type] = cached
+        return cached
+
+    def _ordered(self) -> list[tuple[MiddlewareDefinition, IMiddleware]]:
         if self._instances is None:
             sorted_defs = sorted(self._definitions, key=lambda d: d.priority)
-            self._instances = [d.build() for d in sorted_defs]
-        return list(self._instances)
+            self._instances = [(d, d.build()) for d in sorted_defs]
+        return self._instances
+
+    def _invalidate(self) -> None:
+        self._instances = None
+        self._by_type.clear()
+        self._generation += 1
 
     # ── Cleanup ──────────────────────────────────────────────────
 
     def clear(self) -> None:
         """Remove all registrations (testing utility)."""
         self._definitions.clear()
-        self._instances = None
+        self._invalidate()
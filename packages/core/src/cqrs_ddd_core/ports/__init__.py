@@ -1,11 +1,27 @@
 from .background_worker import IBackgroundWorker
 from .bus import ICommandBus, IQueryBus
 from .event_dispatcher import IEventDispatcher
-from .event_store import IEventStore, StoredEvent
-from .locking import DDL_LOCK_TTL_SECONDS, ILockStrategy
-from .messaging import IMessageConsumer, IMessagePublisher
+from .event_store import EventBatch, EventCursor, IEventStore, StoredEvent
+from .locking import (
+    DDL_LOCK_TTL_SECONDS,
+    ILockStrategy,
+    IMultiLockStrategy,
+    supports_acquire_many,
+)
+from .messaging import (
+    IBatchMessagePublisher,
+    IMessageConsumer,
+    IMessagePublisher,
+    supports_publish_batch,
+)
 from .middleware import IMiddleware
-from .outbox import IOutboxStorage, OutboxMessage
+from .outbox import (
+    IClaimingOutboxStorage,
+    IOutboxRetentionStorage,
+    IOutboxStorage,
+    OutboxMessage,
+    OutboxStats,
+)
 from .repository import IRepository
 from .search_result import SearchResult
 from .unit_of_work import UnitOfWork
@@ -14,13 +30,19 @@ from .validation import IValidator
 __all__ = [
     "DDL_LOCK_TTL_SECONDS",
     "IBackgroundWorker",
+    "IBatchMessagePublisher",
     "ICommandBus",
+    "EventBatch",
+    "EventCursor",
     "IEventDispatcher",
     "IEventStore",
+    "IClaimingOutboxStorage",
     "ILockStrategy",
+    "IMultiLockStrategy",
     "IMessageConsumer",
     "IMessagePublisher",
     "IMiddleware",
+    "IOutboxRetentionStorage",
     "IOutboxStorage",
     "IQueryBus",
     "IRepository",
@@ -28,5 +50,8 @@ __all__ = [
     "UnitOfWork",
     "IValidator",
     "OutboxMessage",
+    "OutboxStats",
     "StoredEvent",
+    "supports_acquire_many",
+    "supports_publish_batch",
 ]
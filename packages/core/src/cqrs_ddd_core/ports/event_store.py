@@ -10,7 +10,7 @@ from uuid import uuid4
 from ..utils import default_dict_factory
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
 
     from ..domain.specification import ISpecification
 
@@ -40,6 +40,51 @@ class StoredEvent:
     tenant_id: str | None = None
 
 
+@dataclass(frozen=True)
+class EventCursor:
+    """Keyset cursor into the global event stream.
+
+    Identifies the last event delivered by its ``position`` plus
+    ``event_id`` as a tiebreaker, so reading resumes *after* exactly that
+    event even when positions have gaps or (in legacy data) repeat.
+    ``EventCursor()`` is the start of the stream.
+
+    Persist ``position`` (e.g. in a checkpoint store) to resume later.
+    """
+
+    position: int | None = None
+    event_id: str | None = None
+
+    @classmethod
+    def after(cls, event: StoredEvent) -> EventCursor:
+        """Cursor that resumes right after *event*."""
+        return cls(event.position, event.event_id)
+
+    def admits(self, event: StoredEvent) -> bool:
+        """Whether *event* comes after this cursor in ``(position, event_id)`` order."""
+        if event.position is None:
+            return False
+        if self.position is None or event.position > self.position:
+            return True
+        return (
+            event.position == self.position
+            and self.event_id is not None
+            and event.event_id > self.event_id
+        )
+
+
+@dataclass(frozen=True)
+class EventBatch:
+    """One batch from :meth:`IEventStore.stream_batches`.
+
+    ``cursor`` points after the batch's last event; pass it back to
+    ``stream_batches`` (or save ``cursor.position``) to resume.
+    """
+
+    events: list[StoredEvent]
+    cursor: EventCursor
+
+
 @runtime_checkable
 class IEventStore(Protocol):
     """Protocol for persisting domain events.
@@ -57,8 +102,12 @@ class IEventStore(Protocol):
         """Append a single stored event."""
         ...
 
-    async def append_batch(self, events: list[StoredEvent]) -> None:
-        """Append multiple stored events atomically."""
+    async def append_batch(self, events: list[StoredEvent]) -> list[int]:
+        """Append multiple stored events atomically.
+
+        Returns:
+            The global positions assigned to *events*, in order.
+        """
         ...
 
     async def get_events(
@@ -78,6 +127,31 @@ class IEventStore(Protocol):
         """
         ...
 
+    async def get_events_for_aggregates(
+        self,
+        aggregate_ids: Sequence[str],
+        after_versions: Mapping[str, int] | None = None,
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, list[StoredEvent]]:
+        """Return the events of several aggregates in one query.
+
+        Batch form of :meth:`get_events`, for loading many aggregates
+        without one round-trip each.
+
+        Args:
+            aggregate_ids: The aggregate identifiers.
+            after_versions: Per-aggregate ``after_version`` (e.g. snapshot
+                versions); missing ids default to ``0``.
+            specification: Optional specification evaluated at the
+                persistence level (e.g. tenant filter).
+
+        Returns:
+            A dict with every requested id as key, mapping to its events
+            in version order (an empty list when it has none).
+        """
+        ...
+
     async def get_by_aggregate(
         self,
         aggregate_id: str,
@@ -191,3 +265,28 @@ class IEventStore(Protocol):
             Lists of stored events in position order.
         """
         ...
+
+    def stream_batches(
+        self,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: ISpecification[Any] | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
+        """Stream events after a cursor in ``(position, event_id)`` order.
+
+        Keyset pagination: every batch carries the cursor to resume from,
+        so a replay interrupted at any point continues without skipping or
+        repeating events and without rescanning what was already read.
+        Events without a position are not returned.
+
+        Args:
+            after: Cursor to start after; ``None`` starts at the beginning.
+            batch_size: Number of events per batch.
+            specification: Optional specification evaluated at the
+                persistence level (e.g. tenant filter).
+
+        Yields:
+            :class:`EventBatch` objects, each with its resume cursor.
+        """
+        ...
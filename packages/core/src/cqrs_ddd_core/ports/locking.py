@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 DDL_LOCK_TTL_SECONDS: float = 300.0  # 5 minutes
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
     from ..primitives.locking import ResourceIdentifier
@@ -175,3 +176,61 @@ class ILockStrategy(Protocol):
             Use sparingly and consider caching the results.
         """
         ...
+
+
+@runtime_checkable
+class IMultiLockStrategy(ILockStrategy, Protocol):
+    """
+    Lock strategy that can take several locks in one all-or-nothing step.
+
+    ``CriticalSection`` uses ``acquire_many`` / ``release_many`` when the
+    strategy provides them (see ``supports_acquire_many``), so a section
+    over N resources costs one round-trip instead of N.
+    """
+
+    async def acquire_many(
+        self,
+        resources: Sequence[ResourceIdentifier],
+        *,
+        timeout: float = 10.0,
+        ttl: float = 30.0,
+        session_id: str | None = None,
+    ) -> list[str]:
+        """
+        Acquire locks on all *resources* or on none of them.
+
+        Args:
+            resources: Resources to lock, already deduplicated and sorted.
+            timeout: Maximum time to wait until every lock is free.
+            ttl: Time-to-live for each lock (seconds).
+            session_id: Optional session ID for reentrancy support.
+
+        Returns:
+            One token per resource, in the order of *resources*.
+
+        Raises:
+            ConcurrencyError: If the locks cannot be acquired within the timeout.
+                No lock is held in that case.
+        """
+        ...
+
+    async def release_many(
+        self,
+        locks: Sequence[tuple[ResourceIdentifier, str]],
+    ) -> None:
+        """
+        Release ``(resource, token)`` pairs returned by :meth:`acquire_many`.
+
+        Args:
+            locks: The resources and their tokens.
+        """
+        ...
+
+
+def supports_acquire_many(strategy: object) -> bool:
+    """Return True when *strategy*'s class implements ``acquire_many``.
+
+    Checks the class rather than the instance so that mocks and dynamic
+    proxies are not mistaken for multi-lock strategies.
+    """
+    return callable(getattr(type(strategy), "acquire_many", None))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Callable, Coroutine, Sequence
 
 
 @runtime_checkable
@@ -27,6 +27,48 @@ class IMessagePublisher(Protocol):
         ...
 
 
+@runtime_checkable
+class IBatchMessagePublisher(IMessagePublisher, Protocol):
+    """
+    Publisher that can hand several messages to the transport at once.
+
+    Adapters implement this when the broker has a native batch API
+    (Kafka linger/flush, RabbitMQ batched confirms, SQS
+    ``SendMessageBatch``).  Use ``supports_publish_batch`` to detect it.
+    Wrappers whose batch support depends on what they wrap expose a
+    ``supports_batch`` attribute; when it is false callers should fall
+    back to ``publish``.
+    """
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        """
+        Publish ``(topic, message, kwargs)`` triples, preserving their order.
+
+        Raises ``BatchPublishError`` naming the messages that failed or were
+        not sent when delivery is partial.  Any other exception means the
+        outcome is unknown and callers treat the whole batch as failed.
+
+        Args:
+            messages: Triples with the same meaning as the ``publish``
+                arguments.
+        """
+        ...
+
+
+def supports_publish_batch(publisher: object) -> bool:
+    """Return True when *publisher* can publish batches natively.
+
+    Checks that the class rather than the instance implements
+    ``publish_batch``, so that mocks and dynamic proxies are not mistaken
+    for batch-capable publishers, and honours a false ``supports_batch``.
+    """
+    if not callable(getattr(type(publisher), "publish_batch", None)):
+        return False
+    return getattr(publisher, "supports_batch", True) is not False
+
+
 @runtime_checkable
 class IMessageConsumer(Protocol):
     """
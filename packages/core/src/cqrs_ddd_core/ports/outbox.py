@@ -93,3 +93,124 @@ class IOutboxStorage(Protocol):
             uow: Optional UnitOfWork for transactional consistency
         """
         ...
+
+    async def mark_failed_batch(
+        self, failures: dict[str, str], uow: UnitOfWork | None = None
+    ) -> None:
+        """
+        Record several publication failures at once.
+
+        The default records them one by one through ``mark_failed``;
+        storages override it to write all failures in a single statement.
+
+        Args:
+            failures: Mapping of message ID to error description
+            uow: Optional UnitOfWork for transactional consistency
+        """
+        for message_id, error in failures.items():
+            await self.mark_failed(message_id, error, uow)
+
+
+@runtime_checkable
+class IClaimingOutboxStorage(IOutboxStorage, Protocol):
+    """Outbox storage that can hand out disjoint batches to concurrent workers.
+
+    ``claim_pending`` marks the returned messages as leased by *worker_id*
+    in a single round-trip, so several workers can drain the same outbox
+    without an external lock service.  A claim expires after
+    *lease_seconds*; ``mark_published`` and ``mark_failed`` clear it.
+    """
+
+    async def claim_pending(
+        self,
+        limit: int = 100,
+        uow: UnitOfWork | None = None,
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: ISpecification[Any] | None = None,
+        max_retries: int | None = None,
+    ) -> list[OutboxMessage]:
+        """Claim up to *limit* unclaimed pending messages for *worker_id*.
+
+        Messages whose previous claim has expired are eligible again.
+
+        Args:
+            limit: Maximum number of messages to claim.
+            uow: Optional UnitOfWork for transactional consistency.
+            worker_id: Identifier of the claiming worker.
+            lease_seconds: How long the claim is held before it expires.
+            specification: Optional specification for additional filtering.
+            max_retries: When given, only claim previously failed messages
+                whose ``retry_count`` is below it (for retry passes).
+        """
+        ...
+
+    async def release_claims(
+        self,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,
+        *,
+        worker_id: str,
+    ) -> None:
+        """
+        Give back claims held by *worker_id* without changing message status.
+
+        Args:
+            message_ids: IDs of claimed messages to release
+            uow: Optional UnitOfWork for transactional consistency
+            worker_id: Identifier of the worker that holds the claims
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class OutboxStats:
+    """Point-in-time outbox depth, e.g. for autoscaling publishers."""
+
+    pending: int = 0
+    failed: int = 0
+    published: int = 0
+    oldest_pending_at: datetime | None = None
+
+    def oldest_pending_age(self, now: datetime | None = None) -> float | None:
+        """Seconds since the oldest pending message was created."""
+        if self.oldest_pending_at is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        oldest = self.oldest_pending_at
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        return max((now - oldest).total_seconds(), 0.0)
+
+
+@runtime_checkable
+class IOutboxRetentionStorage(IOutboxStorage, Protocol):
+    """Outbox storage that can report its depth and drop published messages."""
+
+    async def purge_published(
+        self,
+        older_than: datetime,
+        limit: int = 1000,
+        uow: UnitOfWork | None = None,
+        *,
+        archive: bool = False,
+    ) -> int:
+        """
+        Delete up to *limit* published messages created before *older_than*.
+
+        Args:
+            older_than: Only messages created before this instant are purged.
+            limit: Maximum number of messages removed by this call.
+            uow: Optional UnitOfWork for transactional consistency.
+            archive: Copy the messages into time-partitioned archive
+                storage (one table/collection per month) before deleting.
+
+        Returns:
+            The number of messages removed.
+        """
+        ...
+
+    async def get_stats(self, uow: UnitOfWork | None = None) -> OutboxStats:
+        """Return message counts per status and the oldest pending message."""
+        ...
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from .exceptions import (
+    BatchPublishError,
     ConcurrencyError,
     CQRSDDDError,
     DomainConcurrencyError,
@@ -25,6 +26,7 @@ from .id_generator import IIDGenerator, UUID4Generator
 from .locking import ResourceIdentifier
 
 __all__ = [
+    "BatchPublishError",
     "ConcurrencyError",
     "CQRSDDDError",
     "DomainConcurrencyError",
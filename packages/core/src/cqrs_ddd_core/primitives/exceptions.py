@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .locking import ResourceIdentifier
 
 
@@ -95,6 +97,27 @@ class InfrastructureError(CQRSDDDError):
     """Base class for all infrastructure-related errors."""
 
 
+class BatchPublishError(InfrastructureError):
+    """Raised by ``publish_batch`` when only part of a batch was delivered.
+
+    Indices refer to positions in the batch passed to ``publish_batch``.
+    ``failed`` maps each rejected message to its error text; ``unsent``
+    lists messages that were never handed to the transport.  Every other
+    message was delivered.
+    """
+
+    def __init__(
+        self,
+        failed: dict[int, str],
+        unsent: Sequence[int] = (),
+    ) -> None:
+        self.failed = dict(failed)
+        self.unsent = list(unsent)
+        super().__init__(
+            f"{len(self.failed)} batch message(s) failed, {len(self.unsent)} not sent"
+        )
+
+
 class PersistenceError(InfrastructureError):
     """Base class for all persistence-related errors."""
 
@@ -0,0 +1,110 @@
+"""Tests for ReplayEngine."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cqrs_ddd_core.adapters.memory.event_store import InMemoryEventStore
+from cqrs_ddd_core.domain.events import DomainEvent
+from cqrs_ddd_core.ports.event_store import StoredEvent
+from cqrs_ddd_projections.checkpoint import InMemoryCheckpointStore
+from cqrs_ddd_projections.registry import ProjectionRegistry
+from cqrs_ddd_projections.replay import ReplayEngine
+
+
+class E1(DomainEvent):
+    value: int = 0
+
+
+class RecordingHandler:
+    handles = {E1}
+
+    def __init__(self) -> None:
+        self.seen: list[int] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        assert isinstance(event, E1)
+        self.seen.append(event.value)
+
+
+@pytest.fixture
+async def store() -> InMemoryEventStore:
+    store = InMemoryEventStore()
+    # Positions with gaps, as left by rolled-back appends or sequence caching
+    await store.append_batch(
+        [
+            StoredEvent(
+                event_type="E1",
+                aggregate_id="a1",
+                payload={"value": i},
+                position=position,
+            )
+            for i, position in enumerate([5, 6, 20, 21, 22])
+        ]
+    )
+    return store
+
+
+def _engine(
+    store: InMemoryEventStore,
+    handler: RecordingHandler,
+    checkpoint: InMemoryCheckpointStore,
+) -> ReplayEngine:
+    reg = ProjectionRegistry()
+    reg.register(handler)
+    event_registry = MagicMock()
+    event_registry.hydrate = MagicMock(
+        side_effect=lambda _type, payload: E1(value=payload["value"])
+    )
+    return ReplayEngine(
+        store, reg, checkpoint, event_registry=event_registry, batch_size=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_checkpoints_last_event_position(
+    store: InMemoryEventStore,
+) -> None:
+    handler = RecordingHandler()
+    checkpoint = InMemoryCheckpointStore()
+    saved: list[int] = []
+    save_position = checkpoint.save_position
+
+    async def _record(name: str, position: int) -> None:
+        saved.append(position)
+        await save_position(name, position)
+
+    checkpoint.save_position = _record  # type: ignore[method-assign]
+
+    await _engine(store, handler, checkpoint).replay("test")
+
+    assert handler.seen == [0, 1, 2, 3, 4]
+    assert saved == [0, 6, 21, 22]
+    assert await checkpoint.get_position("test") == 22
+
+
+@pytest.mark.asyncio
+async def test_replay_honours_from_position(store: InMemoryEventStore) -> None:
+    handler = RecordingHandler()
+    checkpoint = InMemoryCheckpointStore()
+
+    await _engine(store, handler, checkpoint).replay("test", from_position=6)
+
+    assert handler.seen == [2, 3, 4]
+    assert await checkpoint.get_position("test") == 22
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_events_without_position() -> None:
+    store = InMemoryEventStore()
+    store._events.append(StoredEvent(event_type="E1", payload={"value": 9}))
+    await store.append(StoredEvent(event_type="E1", payload={"value": 1}, position=3))
+    handler = RecordingHandler()
+    checkpoint = InMemoryCheckpointStore()
+
+    await _engine(store, handler, checkpoint).replay("test")
+
+    assert handler.seen == [1]
+    assert await checkpoint.get_position("test") == 3
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from cqrs_ddd_core.adapters.memory.event_store import InMemoryEventStore
+from cqrs_ddd_core.domain.events import DomainEvent
 from cqrs_ddd_core.ports.event_store import StoredEvent
 from cqrs_ddd_projections.checkpoint import InMemoryCheckpointStore
 from cqrs_ddd_projections.registry import ProjectionRegistry
@@ -18,9 +21,53 @@ def in_memory_event_store() -> MagicMock:
     store = MagicMock()
     store.get_all = AsyncMock(return_value=[])
     store.get_events_after = AsyncMock(return_value=[])
+    store.stream_batches = InMemoryEventStore().stream_batches
     return store
 
 
+class E1(DomainEvent):
+    value: int = 0
+
+
+class RecordingHandler:
+    handles = {E1}
+
+    def __init__(self) -> None:
+        self.seen: list[int] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        assert isinstance(event, E1)
+        self.seen.append(event.value)
+
+
+def _event(value: int, aggregate_id: str = "a1") -> StoredEvent:
+    return StoredEvent(
+        event_type="E1", aggregate_id=aggregate_id, payload={"value": value}
+    )
+
+
+def _worker(
+    store: InMemoryEventStore,
+    handler: RecordingHandler,
+    checkpoint: InMemoryCheckpointStore,
+) -> ProjectionWorker:
+    reg = ProjectionRegistry()
+    reg.register(handler)
+    event_registry = MagicMock()
+    event_registry.hydrate = MagicMock(
+        side_effect=lambda _type, payload: E1(value=payload["value"])
+    )
+    return ProjectionWorker(
+        store,
+        reg,
+        checkpoint,
+        projection_name="test",
+        event_registry=event_registry,
+        batch_size=2,
+        poll_interval_seconds=0.01,
+    )
+
+
 @pytest.mark.asyncio
 async def test_worker_start_stop(in_memory_event_store: MagicMock) -> None:
     """Test that worker can be started and stopped cleanly."""
@@ -40,53 +87,86 @@ async def test_worker_start_stop(in_memory_event_store: MagicMock) -> None:
 
 
 @pytest.mark.asyncio
-async def test_worker_processes_events_and_checkpoints(
-    in_memory_event_store: MagicMock,
-) -> None:
+async def test_worker_processes_events_and_checkpoints() -> None:
     """Test that worker processes events and updates checkpoint."""
-    from cqrs_ddd_core.domain.events import DomainEvent
-
-    class E1(DomainEvent):
-        value: int = 0
+    store = InMemoryEventStore()
+    await store.append(_event(42))
+    handler = RecordingHandler()
+    checkpoint = InMemoryCheckpointStore()
 
-    class H1:
-        handles = {E1}
+    worker = _worker(store, handler, checkpoint)
+    await worker.start()
+    # Let worker process events
+    await asyncio.sleep(0.05)
+    await worker.stop()
+    pos = await checkpoint.get_position("test")
+    # Worker should have processed 1 event and checkpointed at its actual position
+    assert handler.seen == [42]
+    assert pos == 0  # Event had position=0, so checkpoint should be 0
 
-        async def handle(self, event: DomainEvent) -> None:
-            pass
 
-    stored = StoredEvent(
-        event_type="E1",
-        aggregate_id="a1",
-        payload={"value": 42},
-        position=0,
+@pytest.mark.asyncio
+async def test_worker_resumes_after_checkpoint_with_position_gaps() -> None:
+    store = InMemoryEventStore()
+    await store.append_batch(
+        [
+            dataclasses.replace(_event(i), position=position)
+            for i, position in enumerate([3, 10, 11, 40, 41])
+        ]
     )
+    handler = RecordingHandler()
+    checkpoint = InMemoryCheckpointStore()
+    await checkpoint.save_position("test", 10)
 
-    reg = ProjectionRegistry()
-    reg.register(H1())
+    worker = _worker(store, handler, checkpoint)
+    await worker.start()
+    await asyncio.sleep(0.05)
+    await worker.stop()
+
+    assert handler.seen == [2, 3, 4]
+    assert await checkpoint.get_position("test") == 41
+
+
+@pytest.mark.asyncio
+async def test_filtered_events_advance_checkpoint() -> None:
+    store = InMemoryEventStore()
+    await store.append_batch([_event(i, aggregate_id="other") for i in range(4)])
+    handler = RecordingHandler()
     checkpoint = InMemoryCheckpointStore()
-    # Set initial checkpoint to 0
-    await checkpoint.save_position("test", 0)
-    # First call returns event, subsequent calls return empty
-    in_memory_event_store.get_events_after = AsyncMock(
-        side_effect=[[stored], [], [], []]
-    )
-    event_registry = MagicMock()
-    event_registry.hydrate = MagicMock(return_value=E1(value=42))
+    worker = _worker(store, handler, checkpoint)
+    worker._partition_filter = lambda stored: stored.aggregate_id == "a1"
+    stream_batches = MagicMock(wraps=store.stream_batches)
+    store.stream_batches = stream_batches  # type: ignore[method-assign]
 
-    worker = ProjectionWorker(
-        in_memory_event_store,
-        reg,
-        checkpoint,
-        projection_name="test",
-        event_registry=event_registry,
-        batch_size=10,
-        poll_interval_seconds=0.01,
-    )
     await worker.start()
-    # Let worker process events
     await asyncio.sleep(0.05)
     await worker.stop()
-    pos = await checkpoint.get_position("test")
-    # Worker should have processed 1 event and checkpointed at its actual position
-    assert pos == 0  # Event had position=0, so checkpoint should be 0
+
+    assert handler.seen == []
+    assert await checkpoint.get_position("test") == 3
+    # Later polls start after the filtered events instead of rescanning them
+    assert stream_batches.call_args.args[0].position == 3
+
+
+@pytest.mark.asyncio
+async def test_stopping_mid_stream_closes_batch_stream() -> None:
+    store = InMemoryEventStore()
+    await store.append_batch([_event(i) for i in range(6)])
+    handler = RecordingHandler()
+    worker = _worker(store, handler, InMemoryCheckpointStore())
+    stream_batches = store.stream_batches
+    closed: list[bool] = []
+
+    async def _tracked(*args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+        try:
+            async for batch in stream_batches(*args, **kwargs):  # type: ignore[arg-type]
+                worker._running = False
+                yield batch
+        finally:
+            closed.append(True)
+
+    store.stream_batches = _tracked  # type: ignore[method-assign]
+    worker._running = True
+    await worker._run()
+
+    assert closed == [True]
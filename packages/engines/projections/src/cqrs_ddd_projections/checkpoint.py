@@ -21,7 +21,7 @@ class InMemoryCheckpointStore(ICheckpointStore):
         registry = get_hook_registry()
         await registry.execute_all(
             f"checkpoint.save.{projection_name}",
-            {
+            lambda: {
                 "projection.name": projection_name,
                 "projection.position": position,
                 "correlation_id": get_correlation_id(),
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from cqrs_ddd_core.correlation import get_correlation_id
 from cqrs_ddd_core.instrumentation import get_hook_registry
+from cqrs_ddd_core.ports.event_store import EventCursor
 
 from .error_handling import ProjectionErrorPolicy
 
@@ -51,7 +52,11 @@ class ReplayEngine:
         progress_callback: Callable[[int, int, float], Any] | None = None,
     ) -> None:
         """Replay projection from position using streaming API.
-        Optionally call on_drop() to clear read model first."""
+        Optionally call on_drop() to clear read model first.
+
+        Events with a position greater than ``from_position`` are replayed;
+        ``0`` (the default) replays the full history.  The checkpoint is
+        saved after each batch as the position of its last event."""
         registry = get_hook_registry()
         await registry.execute_all(
             f"replay.start.{projection_name}",
@@ -79,19 +84,21 @@ class ReplayEngine:
         await self._execute_on_drop(on_drop)
         await self._checkpoint_store.save_position(projection_name, from_position)
 
-        position = from_position
+        cursor = EventCursor(from_position) if from_position else EventCursor()
         processed = 0
-        async for batch in self._event_store.get_all_streaming(
-            batch_size=self._batch_size
+        async for batch in self._event_store.stream_batches(
+            cursor, batch_size=self._batch_size
         ):
-            for stored in batch:
+            for stored in batch.events:
                 domain_event = self._hydrate_event(stored)
                 if domain_event is not None:
                     await self._dispatch_to_handlers(stored, domain_event)
                 processed += 1
                 await self._report_progress(progress_callback, processed)
-            position += len(batch)
-            await self._checkpoint_store.save_position(projection_name, position)
+            if batch.cursor.position is not None:
+                await self._checkpoint_store.save_position(
+                    projection_name, batch.cursor.position
+                )
 
     async def _execute_on_drop(self, on_drop: Callable[[], Any] | None) -> None:
         """Execute on_drop callback if provided, handling both sync and async."""
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 from cqrs_ddd_core.correlation import get_correlation_id
 from cqrs_ddd_core.instrumentation import get_hook_registry
 from cqrs_ddd_core.ports.background_worker import IBackgroundWorker
+from cqrs_ddd_core.ports.event_store import EventCursor
 
 from .error_handling import ProjectionErrorPolicy
 
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from cqrs_ddd_core.domain.event_registry import EventTypeRegistry
-    from cqrs_ddd_core.ports.event_store import IEventStore, StoredEvent
+    from cqrs_ddd_core.ports.event_store import EventBatch, IEventStore, StoredEvent
 
     from .ports import ICheckpointStore, IProjectionRegistry
 
@@ -66,31 +67,47 @@ class ProjectionWorker(IBackgroundWorker):
             self._task = None
 
     async def _run(self) -> None:
-        """Main worker loop using cursor-based event streaming."""
+        """Main worker loop using cursor-based event streaming.
+
+        The cursor is loaded from the checkpoint once and then kept in
+        memory; each poll streams every batch after it.  Events skipped by
+        the partition filter still advance the cursor, so they are never
+        read again.
+        """
+        cursor: EventCursor | None = None
         while self._running:
             try:
-                position = await self._get_checkpoint_position()
-                batch = await self._event_store.get_events_after(
-                    position, self._batch_size
-                )
-
-                if not batch:
+                if cursor is None:
+                    cursor = await self._load_cursor()
+                read_any = False
+                # Close the stream (and its DB cursor/session) on early exit
+                async with contextlib.aclosing(
+                    self._event_store.stream_batches(
+                        cursor, batch_size=self._batch_size
+                    )
+                ) as batches:
+                    async for batch in batches:
+                        read_any = True
+                        cursor = await self._process_event_batch(cursor, batch)
+                        if not self._running:
+                            break
+
+                if not read_any:
                     await self._handle_empty_batch()
-                    continue
-
-                await self._process_event_batch(position, batch)
 
             except asyncio.CancelledError:
                 logger.debug("Worker cancelled, shutting down")
                 break
             except Exception as e:
                 logger.error(f"Projection worker error: {e}", exc_info=True)
+                # Resume from the last saved checkpoint
+                cursor = None
                 await asyncio.sleep(self._poll_interval)
 
-    async def _get_checkpoint_position(self) -> int:
-        """Get current checkpoint position, defaulting to 0."""
+    async def _load_cursor(self) -> EventCursor:
+        """Cursor after the checkpointed position (start if none saved)."""
         position = await self._checkpoint_store.get_position(self._projection_name)
-        return position if position is not None else 0
+        return EventCursor(position)
 
     async def _handle_empty_batch(self) -> None:
         """Handle case when no new events are available."""
@@ -99,27 +116,31 @@ class ProjectionWorker(IBackgroundWorker):
         await asyncio.sleep(self._poll_interval)
 
     async def _process_event_batch(
-        self, position: int, batch: list[StoredEvent]
-    ) -> None:
-        """Process a batch of events with retry logic and checkpointing."""
-        last_position = position
-        for stored in batch:
+        self, cursor: EventCursor, batch: EventBatch
+    ) -> EventCursor:
+        """Process a batch of events with retry logic and checkpointing.
+
+        Returns the cursor after the last event handled (or filtered out).
+        """
+        for stored in batch.events:
             if not self._running:
                 break
 
-            if not self._should_process_event(stored):
-                continue
-
             # Use actual event position from event store (global sequence number)
             event_position = stored.position
             if event_position is None:
                 logger.warning(f"Event {stored.event_id} has no position, skipping")
                 continue
 
-            await self._process_event_with_retry(stored, event_position)
-            last_position = event_position
+            if self._should_process_event(stored):
+                await self._process_event_with_retry(stored, event_position)
+            cursor = EventCursor.after(stored)
 
-        await self._checkpoint_store.save_position(self._projection_name, last_position)
+        if cursor.position is not None:
+            await self._checkpoint_store.save_position(
+                self._projection_name, cursor.position
+            )
+        return cursor
 
     def _should_process_event(self, stored: StoredEvent) -> bool:
         """Check if event should be processed based on partition filter."""
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
 import pytest
 
+from cqrs_ddd_core.ports.event_store import EventBatch, EventCursor
 from cqrs_ddd_multitenancy.context import reset_tenant, set_tenant
 from cqrs_ddd_multitenancy.exceptions import TenantContextMissingError
 from cqrs_ddd_multitenancy.mixins.event_store import MultitenantEventStoreMixin
@@ -62,9 +63,11 @@ class MockEventStore:
         self.appended.append(stored_event)
         self.events.append(stored_event)
 
-    async def append_batch(self, events: list[FakeStoredEvent]) -> None:
+    async def append_batch(self, events: list[FakeStoredEvent]) -> list[int]:
+        start = len(self.events)
         self.appended.extend(events)
         self.events.extend(events)
+        return list(range(start, len(self.events)))
 
     async def get_events(
         self,
@@ -82,6 +85,22 @@ class MockEventStore:
             result = [e for e in result if specification.is_satisfied_by(e)]
         return result
 
+    async def get_events_for_aggregates(
+        self,
+        aggregate_ids: list[str],
+        after_versions: dict[str, int] | None = None,
+        *,
+        specification: Any | None = None,
+    ) -> dict[str, list[FakeStoredEvent]]:
+        return {
+            aid: await self.get_events(
+                aid,
+                after_version=(after_versions or {}).get(aid, 0),
+                specification=specification,
+            )
+            for aid in aggregate_ids
+        }
+
     async def get_by_aggregate(
         self,
         aggregate_id: str,
@@ -152,6 +171,22 @@ class MockEventStore:
 
         return _gen()
 
+    def stream_batches(
+        self,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: Any | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
+        async def _gen():
+            result = [e for e in self.events if (after or EventCursor()).admits(e)]
+            if specification is not None:
+                result = [e for e in result if specification.is_satisfied_by(e)]
+            if result:
+                yield EventBatch(result[:batch_size], EventCursor.after(result[-1]))
+
+        return _gen()
+
     async def get_latest_position(
         self, *, specification: Any | None = None
     ) -> int | None:
@@ -215,7 +250,7 @@ async def test_append_batch_injects_tenant_id(store: TestEventStore):
     token = set_tenant("tenant-A")
     try:
         events = [make_event(version=i) for i in range(3)]
-        await store.append_batch(events)
+        assert await store.append_batch(events) == [0, 1, 2]
         assert all(e.tenant_id == "tenant-A" for e in store.appended)
     finally:
         reset_tenant(token)
@@ -280,6 +315,30 @@ async def test_get_events_system_bypasses(store: TestEventStore):
     assert len(results) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_events_for_aggregates_filters_by_tenant(store: TestEventStore):
+    store.events = [
+        make_event("agg-1", "tenant-A"),
+        make_event("agg-1", "tenant-B"),
+        make_event("agg-2", "tenant-A", version=2),
+    ]
+    token = set_tenant("tenant-A")
+    try:
+        results = await store.get_events_for_aggregates(
+            ["agg-1", "agg-2"], {"agg-2": 1}
+        )
+        assert [e.tenant_id for e in results["agg-1"]] == ["tenant-A"]
+        assert [e.version for e in results["agg-2"]] == [2]
+    finally:
+        reset_tenant(token)
+
+
+@pytest.mark.asyncio
+async def test_get_events_for_aggregates_raises_when_no_tenant(store: TestEventStore):
+    with pytest.raises(TenantContextMissingError):
+        await store.get_events_for_aggregates(["agg-1"])
+
+
 # ── Tests: get_by_aggregate ────────────────────────────────────────────
 
 
@@ -524,6 +583,31 @@ async def test_get_all_streaming_system_bypasses(store: TestEventStore):
     assert len(results) == 2
 
 
+# ── Tests: stream_batches ──────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_stream_batches_filters_by_tenant(store: TestEventStore):
+    store.events = [
+        dataclasses.replace(make_event(tenant_id="tenant-A"), position=1),
+        dataclasses.replace(make_event(tenant_id="tenant-B"), position=2),
+        dataclasses.replace(make_event(tenant_id="tenant-A"), position=3),
+    ]
+    token = set_tenant("tenant-A")
+    try:
+        batches = [b async for b in store.stream_batches(EventCursor(1))]
+        assert [e.position for e in batches[0].events] == [3]
+        assert batches[0].cursor.position == 3
+    finally:
+        reset_tenant(token)
+
+
+@pytest.mark.asyncio
+async def test_stream_batches_raises_when_no_tenant(store: TestEventStore):
+    with pytest.raises(TenantContextMissingError):
+        store.stream_batches()
+
+
 # ── Tests: get_latest_position ─────────────────────────────────────────
 
 
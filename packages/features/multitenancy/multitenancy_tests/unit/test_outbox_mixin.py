@@ -48,6 +48,7 @@ class MockOutboxStorage:
         self.saved: list[FakeOutboxMessage] = []
         self.published: list[str] = []
         self.failed: list[str] = []
+        self.claims: dict[str, str] = {}
 
     async def save_messages(
         self, messages: list[FakeOutboxMessage], uow: Any = None
@@ -72,6 +73,39 @@ class MockOutboxStorage:
     async def mark_failed(self, message_id: str, error: str, uow: Any = None) -> None:
         self.failed.append(message_id)
 
+    async def mark_failed_batch(
+        self, failures: dict[str, str], uow: Any = None
+    ) -> None:
+        self.failed.extend(failures)
+
+    async def claim_pending(
+        self,
+        limit: int = 100,
+        uow: Any = None,
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: Any | None = None,
+        max_retries: int | None = None,
+    ) -> list[FakeOutboxMessage]:
+        result = [m for m in self.saved if m.message_id not in self.claims]
+        if max_retries is not None:
+            result = [
+                m for m in result if m.error is not None and m.retry_count < max_retries
+            ]
+        if specification is not None:
+            result = [m for m in result if specification.is_satisfied_by(m)]
+        for msg in result[:limit]:
+            self.claims[msg.message_id] = worker_id
+        return result[:limit]
+
+    async def release_claims(
+        self, message_ids: list[str], uow: Any = None, *, worker_id: str
+    ) -> None:
+        for msg_id in message_ids:
+            if self.claims.get(msg_id) == worker_id:
+                del self.claims[msg_id]
+
 
 class UnfilteredMockOutboxStorage(MockOutboxStorage):
     """Mock where get_pending returns ALL messages regardless of spec.
@@ -282,6 +316,104 @@ async def test_mark_failed_system_bypasses():
     assert "msg-1" in outbox.failed
 
 
+@pytest.mark.asyncio
+async def test_mark_failed_batch_raises_when_no_tenant():
+    outbox = TestOutbox()
+    with pytest.raises(TenantContextMissingError):
+        await outbox.mark_failed_batch({"msg-1": "error"})
+    assert outbox.failed == []
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_batch_with_tenant():
+    outbox = TestOutbox()
+    token = set_tenant("tenant-A")
+    try:
+        await outbox.mark_failed_batch({"msg-1": "error", "msg-2": "error"})
+        assert outbox.failed == ["msg-1", "msg-2"]
+    finally:
+        reset_tenant(token)
+
+
+# ── Tests: claim_pending / release_claims ──────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_never_claims_other_tenant():
+    outbox = TestOutbox()
+    own = make_message("tenant-A")
+    other = make_message("tenant-B")
+    outbox.saved = [other, own]
+    token = set_tenant("tenant-A")
+    try:
+        claimed = await outbox.claim_pending(worker_id="worker-A")
+        assert [m.message_id for m in claimed] == [own.message_id]
+        assert other.message_id not in outbox.claims
+    finally:
+        reset_tenant(token)
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_raises_when_no_tenant():
+    outbox = TestOutbox()
+    outbox.saved = [make_message("tenant-A")]
+    with pytest.raises(TenantContextMissingError):
+        await outbox.claim_pending(worker_id="worker-A")
+    assert outbox.claims == {}
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_system_bypasses():
+    outbox = TestOutbox()
+    outbox.saved = [make_message("tenant-A"), make_message("tenant-B")]
+
+    from cqrs_ddd_multitenancy.context import system_operation
+
+    @system_operation
+    async def do_claim():
+        return await outbox.claim_pending(worker_id="worker-sys")
+
+    assert len(await do_claim()) == 2
+
+
+@pytest.mark.asyncio
+async def test_release_claims_raises_when_no_tenant():
+    outbox = TestOutbox()
+    with pytest.raises(TenantContextMissingError):
+        await outbox.release_claims(["msg-1"], worker_id="worker-A")
+
+
+@pytest.mark.asyncio
+async def test_strict_release_claims_validates_ownership():
+    outbox = UnfilteredStrictOutbox()
+    msg = make_message("tenant-B")
+    outbox.saved.append(msg)
+    outbox.claims[msg.message_id] = "worker-A"
+
+    token = set_tenant("tenant-A")
+    try:
+        with pytest.raises(CrossTenantAccessError):
+            await outbox.release_claims([msg.message_id], worker_id="worker-A")
+        assert outbox.claims[msg.message_id] == "worker-A"
+    finally:
+        reset_tenant(token)
+
+
+@pytest.mark.asyncio
+async def test_strict_release_claims_allows_own_tenant():
+    outbox = StrictTestOutbox()
+    msg = make_message("tenant-A")
+    outbox.saved.append(msg)
+    outbox.claims[msg.message_id] = "worker-A"
+
+    token = set_tenant("tenant-A")
+    try:
+        await outbox.release_claims([msg.message_id], worker_id="worker-A")
+        assert outbox.claims == {}
+    finally:
+        reset_tenant(token)
+
+
 # ── Tests: StrictMultitenantOutboxMixin ────────────────────────────────
 
 
@@ -331,6 +463,24 @@ async def test_strict_mark_published_system_bypasses():
     assert msg.message_id in outbox.published
 
 
+@pytest.mark.asyncio
+async def test_strict_mark_failed_batch_validates_ownership():
+    outbox = UnfilteredStrictOutbox()
+    own = make_message("tenant-A")
+    other = make_message("tenant-B")
+    outbox.saved.extend([own, other])
+
+    token = set_tenant("tenant-A")
+    try:
+        with pytest.raises(CrossTenantAccessError):
+            await outbox.mark_failed_batch(
+                {own.message_id: "error", other.message_id: "error"}
+            )
+        assert outbox.failed == []
+    finally:
+        reset_tenant(token)
+
+
 # ── Tests: _inject_tenant_into_message fallback ────────────────────────
 
 
@@ -80,6 +80,21 @@ class MockSnapshotStore:
                 return None
         return result
 
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: list[Any],
+        *,
+        specification: Any | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        found = {
+            str(aid): await MockSnapshotStore.get_latest_snapshot(
+                self, aggregate_type, aid, specification=specification
+            )
+            for aid in aggregate_ids
+        }
+        return {aid: snap for aid, snap in found.items() if snap is not None}
+
     async def delete_snapshot(
         self,
         aggregate_type: str,
@@ -289,6 +304,51 @@ class TestMultitenantSnapshotMixinGet:
             reset_tenant(token)
 
 
+class TestMultitenantSnapshotMixinGetMany:
+    """Tests for get_latest_snapshots() method."""
+
+    @pytest.mark.asyncio
+    async def test_get_snapshots_excludes_cross_tenant(
+        self, snapshot_store: TestMultitenantSnapshotStore, tenant_a: str, tenant_b: str
+    ) -> None:
+        """Should only return snapshots of the current tenant."""
+        token_b = set_tenant(tenant_b)
+        await snapshot_store.save_snapshot(
+            aggregate_type="Order",
+            aggregate_id="order-2",
+            snapshot_data={"status": "active", "tenant_id": tenant_b},
+            version=2,
+        )
+        reset_tenant(token_b)
+
+        token_a = set_tenant(tenant_a)
+        try:
+            await snapshot_store.save_snapshot(
+                aggregate_type="Order",
+                aggregate_id="order-1",
+                snapshot_data={"status": "active", "tenant_id": tenant_a},
+                version=5,
+            )
+
+            result = await snapshot_store.get_latest_snapshots(
+                aggregate_type="Order",
+                aggregate_ids=["order-1", "order-2"],
+            )
+
+            assert list(result) == ["order-1"]
+            assert result["order-1"]["version"] == 5
+        finally:
+            reset_tenant(token_a)
+
+    @pytest.mark.asyncio
+    async def test_get_snapshots_requires_tenant_context(
+        self, snapshot_store: TestMultitenantSnapshotStore
+    ) -> None:
+        """Should raise when no tenant context is set."""
+        with pytest.raises(TenantContextMissingError):
+            await snapshot_store.get_latest_snapshots("Order", ["order-1"])
+
+
 class TestMultitenantSnapshotMixinDelete:
     """Tests for delete_snapshot() method."""
 
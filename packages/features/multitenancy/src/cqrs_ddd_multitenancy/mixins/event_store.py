@@ -15,9 +15,9 @@ from ..context import get_current_tenant_or_none, is_system_tenant
 from ..exceptions import TenantContextMissingError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
 
-    from cqrs_ddd_core.ports.event_store import StoredEvent
+    from cqrs_ddd_core.ports.event_store import EventBatch, EventCursor, StoredEvent
 
 __all__ = [
     "MultitenantEventStoreMixin",
@@ -188,12 +188,15 @@ class MultitenantEventStoreMixin:
 
         return await super().append(event_with_tenant)  # type: ignore[misc, no-any-return]
 
-    async def append_batch(self: Any, events: list[StoredEvent]) -> None:
+    async def append_batch(self: Any, events: list[StoredEvent]) -> list[int]:
         """Append events with tenant_id injection.
 
         Args:
             events: The events to append.
 
+        Returns:
+            The positions assigned to *events*, in order.
+
         Raises:
             TenantContextMissingError: If no tenant context.
         """
@@ -253,6 +256,44 @@ class MultitenantEventStoreMixin:
             aggregate_id, after_version=after_version, specification=combined
         )
 
+    async def get_events_for_aggregates(
+        self: Any,
+        aggregate_ids: Sequence[str],
+        after_versions: Mapping[str, int] | None = None,
+        *,
+        specification: Any | None = None,
+    ) -> dict[str, list[StoredEvent]]:
+        """Get events for several aggregates with specification-based tenant filtering.
+
+        Creates a tenant specification and passes it via the specification
+        parameter for evaluation at the database level.
+
+        Args:
+            aggregate_ids: The aggregate IDs.
+            after_versions: Per-aggregate minimum version (exclusive).
+            specification: Optional additional specification to compose with.
+
+        Returns:
+            Dict of aggregate ID to its events, filtered by tenant.
+        """
+        if is_system_tenant():
+            return await super().get_events_for_aggregates(  # type: ignore[misc, no-any-return]
+                aggregate_ids, after_versions, specification=specification
+            )
+
+        tenant_id = self._require_tenant_context()
+        tenant_spec = self._build_tenant_specification(tenant_id)
+        combined = self._compose_specs(tenant_spec, specification)
+
+        logger.debug(
+            "Getting events for aggregates with tenant specification",
+            extra={"tenant_id": tenant_id, "aggregate_count": len(aggregate_ids)},
+        )
+
+        return await super().get_events_for_aggregates(  # type: ignore[misc, no-any-return]
+            aggregate_ids, after_versions, specification=combined
+        )
+
     async def get_by_aggregate(
         self: Any,
         aggregate_id: str,
@@ -467,6 +508,44 @@ class MultitenantEventStoreMixin:
 
         return super().get_all_streaming(batch_size, specification=combined)  # type: ignore[misc, no-any-return]
 
+    def stream_batches(
+        self: Any,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: Any | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
+        """Stream events after a cursor with specification-based tenant filtering.
+
+        Creates a tenant specification and passes it via the specification
+        parameter for evaluation at the database level.
+
+        Args:
+            after: Cursor to start after; ``None`` starts at the beginning.
+            batch_size: Number of events per batch.
+            specification: Optional additional specification to compose with.
+
+        Yields:
+            EventBatch objects filtered by tenant.
+        """
+        if is_system_tenant():
+            return super().stream_batches(  # type: ignore[misc, no-any-return]
+                after, batch_size=batch_size, specification=specification
+            )
+
+        tenant_id = self._require_tenant_context()
+        tenant_spec = self._build_tenant_specification(tenant_id)
+        combined = self._compose_specs(tenant_spec, specification)
+
+        logger.debug(
+            "Streaming event batches with tenant specification",
+            extra={"tenant_id": tenant_id},
+        )
+
+        return super().stream_batches(  # type: ignore[misc, no-any-return]
+            after, batch_size=batch_size, specification=combined
+        )
+
     async def get_latest_position(
         self: Any,
         *,
@@ -43,6 +43,10 @@ class MultitenantOutboxMixin:
     - **get_pending()**: Passes tenant specification to base for DB-level filtering
     - **mark_published()**: Validates tenant ownership
     - **mark_failed()**: Validates tenant ownership
+    - **mark_failed_batch()**: Validates tenant ownership
+    - **claim_pending()**: Passes tenant specification to base so a worker
+      only ever claims its own tenant's messages
+    - **release_claims()**: Validates tenant context
 
     Note:
         The mixin uses super() to call the next class in MRO, so it must
@@ -269,34 +273,117 @@ class MultitenantOutboxMixin:
         self._require_tenant_context()
         return await super().mark_failed(message_id, error, uow)  # type: ignore[misc, no-any-return]
 
+    async def mark_failed_batch(
+        self: Any,
+        failures: dict[str, str],
+        uow: UnitOfWork | None = None,
+    ) -> None:
+        """Mark several messages as failed with tenant validation.
+
+        Args:
+            failures: Mapping of message ID to error description.
+            uow: Optional unit of work.
+        """
+        if is_system_tenant():
+            return await super().mark_failed_batch(failures, uow)  # type: ignore[misc, no-any-return]
+
+        self._require_tenant_context()
+        return await super().mark_failed_batch(failures, uow)  # type: ignore[misc, no-any-return]
+
+    async def claim_pending(
+        self: Any,
+        limit: int = 100,
+        uow: UnitOfWork | None = None,
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: Any | None = None,
+        max_retries: int | None = None,
+    ) -> list[OutboxMessage]:
+        """Claim pending messages filtered by tenant via specification.
+
+        The tenant specification is combined with any caller-supplied
+        *specification* so the claim statement itself never touches
+        another tenant's rows.
+
+        Args:
+            limit: Maximum number of messages to claim.
+            uow: Optional unit of work.
+            worker_id: Identifier of the claiming worker.
+            lease_seconds: How long the claim is held before it expires.
+            specification: Optional additional specification.
+            max_retries: Only claim failed messages retried fewer times.
+
+        Returns:
+            List of claimed messages for the current tenant.
+        """
+        if is_system_tenant():
+            return await super().claim_pending(  # type: ignore[misc, no-any-return]
+                limit,
+                uow,
+                worker_id=worker_id,
+                lease_seconds=lease_seconds,
+                specification=specification,
+                max_retries=max_retries,
+            )
+
+        tenant_id = self._require_tenant_context()
+        tenant_spec = self._build_tenant_specification(tenant_id)
+        if specification is not None:
+            tenant_spec = tenant_spec & specification
+        return await super().claim_pending(  # type: ignore[misc, no-any-return]
+            limit,
+            uow,
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+            specification=tenant_spec,
+            max_retries=max_retries,
+        )
+
+    async def release_claims(
+        self: Any,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,
+        *,
+        worker_id: str,
+    ) -> None:
+        """Release claims with tenant validation.
+
+        Args:
+            message_ids: IDs of claimed messages to release.
+            uow: Optional unit of work.
+            worker_id: Identifier of the worker that holds the claims.
+        """
+        if is_system_tenant():
+            return await super().release_claims(  # type: ignore[misc, no-any-return]
+                message_ids, uow, worker_id=worker_id
+            )
+
+        self._require_tenant_context()
+        return await super().release_claims(  # type: ignore[misc, no-any-return]
+            message_ids, uow, worker_id=worker_id
+        )
+
 
 class StrictMultitenantOutboxMixin(MultitenantOutboxMixin):
     """Strict variant that validates tenant ownership on all operations.
 
     Fetches and validates tenant ownership before allowing
-    modification operations (mark_published, mark_failed).
+    modification operations (mark_published, mark_failed_batch,
+    release_claims).
     """
 
-    async def mark_published(
+    async def _validate_ownership(
         self: Any,
+        tenant_id: str,
         message_ids: list[str],
         uow: UnitOfWork | None = None,
     ) -> None:
-        """Mark messages as published with strict tenant validation.
-
-        Args:
-            message_ids: IDs of messages to mark as published.
-            uow: Optional unit of work.
+        """Raise if any of *message_ids* belongs to a different tenant.
 
         Raises:
             CrossTenantAccessError: If any message belongs to different tenant.
         """
-        if is_system_tenant():
-            return await super().mark_published(message_ids, uow)
-
-        tenant_id = self._require_tenant_context()
-
-        # Fetch pending messages and validate ownership
         pending = await super().get_pending(limit=len(message_ids) * 2, uow=uow)
         pending_by_id = {msg.message_id: msg for msg in pending}
 
@@ -312,4 +399,68 @@ class StrictMultitenantOutboxMixin(MultitenantOutboxMixin):
                         resource_id=msg_id,
                     )
 
+    async def mark_published(
+        self: Any,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,
+    ) -> None:
+        """Mark messages as published with strict tenant validation.
+
+        Args:
+            message_ids: IDs of messages to mark as published.
+            uow: Optional unit of work.
+
+        Raises:
+            CrossTenantAccessError: If any message belongs to different tenant.
+        """
+        if is_system_tenant():
+            return await super().mark_published(message_ids, uow)
+
+        tenant_id = self._require_tenant_context()
+        await self._validate_ownership(tenant_id, message_ids, uow)
         return await super().mark_published(message_ids, uow)
+
+    async def mark_failed_batch(
+        self: Any,
+        failures: dict[str, str],
+        uow: UnitOfWork | None = None,
+    ) -> None:
+        """Mark several messages as failed with strict tenant validation.
+
+        Args:
+            failures: Mapping of message ID to error description.
+            uow: Optional unit of work.
+
+        Raises:
+            CrossTenantAccessError: If any message belongs to different tenant.
+        """
+        if is_system_tenant():
+            return await super().mark_failed_batch(failures, uow)
+
+        tenant_id = self._require_tenant_context()
+        await self._validate_ownership(tenant_id, list(failures), uow)
+        return await super().mark_failed_batch(failures, uow)
+
+    async def release_claims(
+        self: Any,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,
+        *,
+        worker_id: str,
+    ) -> None:
+        """Release claims with strict tenant validation.
+
+        Args:
+            message_ids: IDs of claimed messages to release.
+            uow: Optional unit of work.
+            worker_id: Identifier of the worker that holds the claims.
+
+        Raises:
+            CrossTenantAccessError: If any message belongs to different tenant.
+        """
+        if is_system_tenant():
+            return await super().release_claims(message_ids, uow, worker_id=worker_id)
+
+        tenant_id = self._require_tenant_context()
+        await self._validate_ownership(tenant_id, message_ids, uow)
+        return await super().release_claims(message_ids, uow, worker_id=worker_id)
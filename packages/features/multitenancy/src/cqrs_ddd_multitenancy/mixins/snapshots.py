@@ -14,11 +14,14 @@ method resolution overrides the base methods correctly.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..context import get_current_tenant_or_none, is_system_tenant
 from ..exceptions import TenantContextMissingError
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 __all__ = [
     "MultitenantSnapshotMixin",
 ]
@@ -225,6 +228,48 @@ class MultitenantSnapshotMixin:
             aggregate_type, aggregate_id, specification=combined
         )
 
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: Sequence[Any],
+        *,
+        specification: Any | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve the most recent snapshots of several aggregates with tenant filtering.
+
+        Uses specification-based filtering at the DB level.
+
+        Args:
+            aggregate_type: Type name of the aggregates.
+            aggregate_ids: The aggregates' IDs.
+            specification: Optional additional specification to compose with.
+
+        Returns:
+            Dict keyed by ``str(aggregate_id)``; ids without a snapshot for
+            this tenant are absent.
+        """
+        if is_system_tenant():
+            return await super().get_latest_snapshots(  # type: ignore[misc, no-any-return]
+                aggregate_type, aggregate_ids, specification=specification
+            )
+
+        tenant_id = self._require_tenant_context()
+        tenant_spec = self._build_tenant_specification(tenant_id)
+        combined = self._compose_specs(tenant_spec, specification)
+
+        logger.debug(
+            "Getting latest snapshots with tenant specification",
+            extra={
+                "tenant_id": tenant_id,
+                "aggregate_type": aggregate_type,
+                "aggregate_count": len(aggregate_ids),
+            },
+        )
+
+        return await super().get_latest_snapshots(  # type: ignore[misc, no-any-return]
+            aggregate_type, aggregate_ids, specification=combined
+        )
+
     async def delete_snapshot(
         self,
         aggregate_type: str,
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 from cqrs_ddd_messaging.envelope import MessageEnvelope
 from cqrs_ddd_messaging.exceptions import MessagingSerializationError
 from cqrs_ddd_messaging.kafka.publisher import KafkaPublisher
@@ -133,3 +135,102 @@ async def test_health_check_delegates_to_connection(
         result = await publisher.health_check()
     assert result is True
     mock_connection.health_check.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_sends_without_waiting_and_flushes_once(
+    mock_connection: MagicMock, mock_producer: MagicMock
+) -> None:
+    delivered = asyncio.get_running_loop().create_future()
+    delivered.set_result(None)
+    mock_producer.send = AsyncMock(return_value=delivered)
+    mock_producer.flush = AsyncMock()
+    with patch(
+        "cqrs_ddd_messaging.kafka.publisher.AIOKafkaProducer",
+        return_value=mock_producer,
+    ):
+        publisher = KafkaPublisher(connection=mock_connection)
+        await publisher.publish_batch(
+            [
+                ("orders", {"event_type": "A"}, {"partition_key": "k1"}),
+                ("orders", {"event_type": "B"}, {"partition_key": "k2"}),
+            ]
+        )
+    assert mock_producer.send.await_count == 2
+    assert [c.kwargs["key"] for c in mock_producer.send.call_args_list] == [
+        b"k1",
+        b"k2",
+    ]
+    mock_producer.flush.assert_awaited_once()
+    mock_producer.send_and_wait.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_raises_delivery_error(
+    mock_connection: MagicMock, mock_producer: MagicMock
+) -> None:
+    failed = asyncio.get_running_loop().create_future()
+    failed.set_exception(RuntimeError("leader not available"))
+    mock_producer.send = AsyncMock(return_value=failed)
+    mock_producer.flush = AsyncMock()
+    with patch(
+        "cqrs_ddd_messaging.kafka.publisher.AIOKafkaProducer",
+        return_value=mock_producer,
+    ):
+        publisher = KafkaPublisher(connection=mock_connection)
+        with pytest.raises(BatchPublishError) as exc_info:
+            await publisher.publish_batch([("orders", {"event_type": "A"}, {})])
+    assert exc_info.value.failed == {0: "leader not available"}
+    mock_producer.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_stops_enqueueing_after_send_error(
+    mock_connection: MagicMock, mock_producer: MagicMock
+) -> None:
+    delivered = asyncio.get_running_loop().create_future()
+    delivered.set_result(None)
+    mock_producer.send = AsyncMock(
+        side_effect=[delivered, RuntimeError("record too large")]
+    )
+    mock_producer.flush = AsyncMock()
+    with patch(
+        "cqrs_ddd_messaging.kafka.publisher.AIOKafkaProducer",
+        return_value=mock_producer,
+    ):
+        publisher = KafkaPublisher(connection=mock_connection)
+        with pytest.raises(BatchPublishError) as exc_info:
+            await publisher.publish_batch(
+                [("orders", {"event_type": t}, {}) for t in ("A", "B", "C")]
+            )
+    assert exc_info.value.failed == {1: "record too large"}
+    assert exc_info.value.unsent == [2]
+    assert mock_producer.send.await_count == 2
+    mock_producer.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_serialization_error_flushes_enqueued(
+    mock_connection: MagicMock, mock_producer: MagicMock
+) -> None:
+    delivered = asyncio.get_running_loop().create_future()
+    delivered.set_result(None)
+    mock_producer.send = AsyncMock(return_value=delivered)
+    mock_producer.flush = AsyncMock()
+    serializer = MagicMock(spec=EnvelopeSerializer)
+    serializer.serialize = MagicMock(
+        side_effect=[b"a", ValueError("serialize failed"), b"c"]
+    )
+    with patch(
+        "cqrs_ddd_messaging.kafka.publisher.AIOKafkaProducer",
+        return_value=mock_producer,
+    ):
+        publisher = KafkaPublisher(connection=mock_connection, serializer=serializer)
+        with pytest.raises(BatchPublishError) as exc_info:
+            await publisher.publish_batch(
+                [("orders", {"event_type": t}, {}) for t in ("A", "B", "C")]
+            )
+    assert exc_info.value.failed == {1: "serialize failed"}
+    assert exc_info.value.unsent == [2]
+    assert mock_producer.send.await_count == 1
+    mock_producer.flush.assert_awaited_once()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 from cqrs_ddd_messaging.envelope import MessageEnvelope
 from cqrs_ddd_messaging.exceptions import MessagingSerializationError
 from cqrs_ddd_messaging.rabbitmq.publisher import RabbitMQPublisher
@@ -98,3 +100,73 @@ async def test_health_check_returns_false_when_connection_unhealthy(
     mock_connection.health_check.return_value = False
     result = await publisher.health_check()
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_publishes_each_message_in_order(
+    publisher: RabbitMQPublisher, mock_connection: MagicMock
+) -> None:
+    await publisher.publish_batch(
+        [
+            ("orders.created", {"event_type": "OrderCreated"}, {}),
+            ("orders.paid", {"event_type": "OrderPaid"}, {"correlation_id": "c1"}),
+        ]
+    )
+    mock_connection.connect.assert_called_once()
+    exchange = mock_connection.channel.declare_exchange.return_value
+    calls = exchange.publish.call_args_list
+    assert [c.kwargs["routing_key"] for c in calls] == ["orders.created", "orders.paid"]
+    assert b"OrderPaid" in calls[1].args[0].body
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_reports_unconfirmed_messages(
+    publisher: RabbitMQPublisher, mock_connection: MagicMock
+) -> None:
+    exchange = mock_connection.channel.declare_exchange.return_value
+    exchange.publish.side_effect = [None, RuntimeError("nacked"), None]
+
+    with pytest.raises(BatchPublishError) as exc_info:
+        await publisher.publish_batch(
+            [("orders", {"event_type": t}, {}) for t in ("A", "B", "C")]
+        )
+
+    assert exc_info.value.failed == {1: "nacked"}
+    assert exc_info.value.unsent == [2]
+    assert exchange.publish.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_holds_back_only_the_failed_aggregate(
+    publisher: RabbitMQPublisher, mock_connection: MagicMock
+) -> None:
+    exchange = mock_connection.channel.declare_exchange.return_value
+    sent: list[bytes] = []
+
+    async def _publish(message: Any, routing_key: str) -> None:
+        if b'"A"' in message.body:
+            raise RuntimeError("nacked")
+        sent.append(message.body)
+
+    exchange.publish.side_effect = _publish
+
+    with pytest.raises(BatchPublishError) as exc_info:
+        await publisher.publish_batch(
+            [
+                ("orders", {"event_type": t, "aggregate_id": aggregate_id}, {})
+                for t, aggregate_id in (("A", "o-1"), ("B", "o-1"), ("C", "o-2"))
+            ]
+        )
+
+    assert exc_info.value.failed == {0: "nacked"}
+    assert exc_info.value.unsent == [1]
+    assert len(sent) == 1
+    assert b'"C"' in sent[0]
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_empty_is_noop(
+    publisher: RabbitMQPublisher, mock_connection: MagicMock
+) -> None:
+    await publisher.publish_batch([])
+    mock_connection.connect.assert_not_called()
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 from cqrs_ddd_messaging.envelope import MessageEnvelope
 from cqrs_ddd_messaging.exceptions import MessagingSerializationError
 from cqrs_ddd_messaging.serialization import EnvelopeSerializer
-from cqrs_ddd_messaging.sqs.publisher import SQSPublisher
+from cqrs_ddd_messaging.sqs.publisher import SQS_MAX_BATCH_BYTES, SQSPublisher
 
 
 @pytest.fixture
@@ -144,3 +146,114 @@ async def test_health_check_returns_false_when_connection_unhealthy(
     mock_connection.health_check.return_value = False
     result = await publisher.health_check()
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_sends_groups_of_ten(
+    publisher: SQSPublisher, mock_connection: MagicMock
+) -> None:
+    client = mock_connection.get_client.return_value
+    client.send_message_batch = AsyncMock(return_value={"Successful": []})
+
+    await publisher.publish_batch(
+        [("my-queue", {"event_type": "E", "n": i}, {}) for i in range(25)]
+    )
+
+    calls = client.send_message_batch.call_args_list
+    assert [len(c.kwargs["Entries"]) for c in calls] == [10, 10, 5]
+    assert [e["Id"] for e in calls[2].kwargs["Entries"]] == [
+        "20",
+        "21",
+        "22",
+        "23",
+        "24",
+    ]
+    first_of_last = json.loads(calls[2].kwargs["Entries"][0]["MessageBody"])
+    assert first_of_last["payload"]["n"] == 20
+    client.send_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_fifo_entries_and_failures(
+    publisher: SQSPublisher, mock_connection: MagicMock
+) -> None:
+    client = mock_connection.get_client.return_value
+    client.send_message_batch = AsyncMock(
+        return_value={"Failed": [{"Id": "1", "Code": "InternalError"}]}
+    )
+    fifo_url = "https://sqs.us-east-1.amazonaws.com/123/orders.fifo"
+
+    with pytest.raises(BatchPublishError) as exc_info:
+        await publisher.publish_batch(
+            [
+                ("orders", {"aggregate_id": "o-1"}, {"queue_url": fifo_url}),
+                ("orders", {"aggregate_id": "o-2"}, {"queue_url": fifo_url}),
+            ]
+        )
+
+    assert exc_info.value.failed == {1: "InternalError"}
+    assert exc_info.value.unsent == []
+    entries = client.send_message_batch.call_args.kwargs["Entries"]
+    assert [e["MessageGroupId"] for e in entries] == ["o-1", "o-2"]
+    assert all("MessageDeduplicationId" in e for e in entries)
+    mock_connection.get_queue_url.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_failed_entry_holds_back_its_message_group(
+    publisher: SQSPublisher, mock_connection: MagicMock
+) -> None:
+    client = mock_connection.get_client.return_value
+    client.send_message_batch = AsyncMock(
+        side_effect=[{"Failed": [{"Id": "0", "Code": "InternalError"}]}, {}]
+    )
+    fifo_url = "https://sqs.us-east-1.amazonaws.com/123/orders.fifo"
+    groups = ["o-1"] + ["o-2"] * 9 + ["o-1", "o-2"]
+
+    with pytest.raises(BatchPublishError) as exc_info:
+        await publisher.publish_batch(
+            [("orders", {"aggregate_id": g}, {"queue_url": fifo_url}) for g in groups]
+        )
+
+    assert exc_info.value.failed == {0: "InternalError"}
+    assert exc_info.value.unsent == [10]
+    second = client.send_message_batch.call_args_list[1].kwargs["Entries"]
+    assert [e["Id"] for e in second] == ["11"]
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_splits_by_payload_size(
+    publisher: SQSPublisher, mock_connection: MagicMock
+) -> None:
+    client = mock_connection.get_client.return_value
+    client.send_message_batch = AsyncMock(return_value={"Successful": []})
+    blob = "x" * 100_000
+
+    await publisher.publish_batch(
+        [("my-queue", {"event_type": "E", "blob": blob}, {}) for _ in range(5)]
+    )
+
+    calls = client.send_message_batch.call_args_list
+    assert [len(c.kwargs["Entries"]) for c in calls] == [2, 2, 1]
+    for call in calls:
+        size = sum(len(e["MessageBody"].encode()) for e in call.kwargs["Entries"])
+        assert size <= SQS_MAX_BATCH_BYTES
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_request_error_holds_back_rest_of_queue(
+    publisher: SQSPublisher, mock_connection: MagicMock
+) -> None:
+    client = mock_connection.get_client.return_value
+    client.send_message_batch = AsyncMock(
+        side_effect=[{"Successful": []}, RuntimeError("throttled")]
+    )
+
+    with pytest.raises(BatchPublishError) as exc_info:
+        await publisher.publish_batch(
+            [("my-queue", {"event_type": "E", "n": i}, {}) for i in range(25)]
+        )
+
+    assert exc_info.value.failed == dict.fromkeys(range(10, 20), "throttled")
+    assert exc_info.value.unsent == list(range(20, 25))
+    assert client.send_message_batch.await_count == 2
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from aiokafka import AIOKafkaProducer
 
 from cqrs_ddd_core.ports.messaging import IMessagePublisher
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 
 from ..envelope import MessageEnvelope
 from ..exceptions import MessagingSerializationError
@@ -14,6 +16,8 @@ from ..serialization import EnvelopeSerializer
 from .connection import KafkaConnectionManager
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .connection import KafkaConnectionManager
 
 
@@ -75,6 +79,50 @@ class KafkaPublisher(IMessagePublisher):
         """Publish message to Kafka topic.
         Partition key = kwargs.get('aggregate_id') or message.aggregate_id."""
         producer = await self._get_producer()
+        body, key = self._encode(topic, message, **kwargs)
+        await producer.send_and_wait(topic, value=body, key=key)
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        """Enqueue all records without waiting on each, then flush once.
+
+        If a record cannot be serialized or the producer refuses it, the
+        records after it are not enqueued; those already enqueued are
+        still flushed.
+
+        Raises:
+            BatchPublishError: If any record failed or was not sent;
+                indices refer to positions in *messages*.
+        """
+        if not messages:
+            return
+        producer = await self._get_producer()
+        deliveries = []
+        failed: dict[int, str] = {}
+        unsent: list[int] = []
+        for index, (topic, message, kwargs) in enumerate(messages):
+            try:
+                body, key = self._encode(topic, message, **kwargs)
+                deliveries.append(await producer.send(topic, value=body, key=key))
+            except Exception as exc:  # noqa: BLE001
+                failed[index] = str(exc)
+                unsent.extend(range(index + 1, len(messages)))
+                break
+        await producer.flush()
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        failed.update(
+            (index, str(result))
+            for index, result in enumerate(results)
+            if isinstance(result, BaseException)
+        )
+        if failed or unsent:
+            raise BatchPublishError(failed, unsent)
+
+    def _encode(
+        self, topic: str, message: Any, **kwargs: Any
+    ) -> tuple[bytes, bytes | None]:
+        """Serialize the envelope and resolve the partition key."""
         envelope = _message_to_envelope(message, topic, **kwargs)
         try:
             body = self._serializer.serialize(envelope)
@@ -90,7 +138,7 @@ class KafkaPublisher(IMessagePublisher):
         key = key or kwargs.get("partition_key")
         if isinstance(key, str):
             key = key.encode("utf-8")
-        await producer.send_and_wait(topic, value=body, key=key)
+        return body, key
 
     async def close(self) -> None:
         """Stop the producer."""
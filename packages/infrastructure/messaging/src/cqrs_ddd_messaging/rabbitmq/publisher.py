@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 import aio_pika
 
 from cqrs_ddd_core.ports.messaging import IMessagePublisher
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 
 from ..envelope import MessageEnvelope
 from ..exceptions import MessagingSerializationError
 from ..serialization import EnvelopeSerializer
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from aio_pika.abc import AbstractExchange
 
     from .connection import RabbitMQConnectionManager
@@ -88,20 +92,66 @@ class RabbitMQPublisher(IMessagePublisher):
         await self._connection.connect()
         exchange = await self._ensure_exchange()
         envelope = _message_to_envelope(message, topic, **kwargs)
+        await exchange.publish(self._build_message(envelope), routing_key=topic)
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        """Publish messages pipelined across ordering keys.
+
+        Messages are keyed by routing key and ``aggregate_id``.  Keys are
+        published concurrently so the broker confirms them together; within
+        a key each message waits for the previous confirm, and once one is
+        not confirmed the rest of that key is not sent.
+
+        Raises:
+            BatchPublishError: If the broker did not confirm some messages
+                or they were held back; indices refer to positions in
+                *messages*.
+        """
+        if not messages:
+            return
+        await self._connection.connect()
+        exchange = await self._ensure_exchange()
+        by_key: dict[tuple[str, str], list[tuple[int, str, aio_pika.Message]]] = {}
+        for index, (topic, message, kwargs) in enumerate(messages):
+            envelope = _message_to_envelope(message, topic, **kwargs)
+            key = (topic, str(envelope.payload.get("aggregate_id") or ""))
+            by_key.setdefault(key, []).append(
+                (index, topic, self._build_message(envelope))
+            )
+
+        failed: dict[int, str] = {}
+        unsent: list[int] = []
+
+        async def _publish_in_order(
+            items: list[tuple[int, str, aio_pika.Message]],
+        ) -> None:
+            for position, (index, topic, body) in enumerate(items):
+                try:
+                    await exchange.publish(body, routing_key=topic)
+                except Exception as exc:  # noqa: BLE001
+                    failed[index] = str(exc)
+                    unsent.extend(i for i, _, _ in items[position + 1 :])
+                    return
+
+        await asyncio.gather(*(_publish_in_order(items) for items in by_key.values()))
+        if failed or unsent:
+            raise BatchPublishError(failed, sorted(unsent))
+
+    def _build_message(self, envelope: MessageEnvelope) -> aio_pika.Message:
+        """Serialize *envelope* to an AMQP message."""
         try:
             body = self._serializer.serialize(envelope)
         except Exception as e:
             raise MessagingSerializationError(str(e)) from e
-        await exchange.publish(
-            aio_pika.Message(
-                body=body,
-                content_type="application/json",
-                headers={
-                    "event_type": envelope.event_type,
-                    **{k: (v or "") for k, v in envelope.headers.items()},
-                },
-            ),
-            routing_key=topic,
+        return aio_pika.Message(
+            body=body,
+            content_type="application/json",
+            headers={
+                "event_type": envelope.event_type,
+                **{k: (v or "") for k, v in envelope.headers.items()},
+            },
         )
 
     async def health_check(self) -> bool:
@@ -5,14 +5,22 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from cqrs_ddd_core.ports.messaging import IMessagePublisher
+from cqrs_ddd_core.primitives.exceptions import BatchPublishError
 
 from ..envelope import MessageEnvelope
 from ..exceptions import MessagingSerializationError
 from ..serialization import EnvelopeSerializer
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .connection import SQSConnectionManager
 
+#: Maximum number of entries SQS accepts in one ``SendMessageBatch`` call.
+SQS_MAX_BATCH_SIZE = 10
+#: Maximum total payload size of one ``SendMessageBatch`` call (256 KiB).
+SQS_MAX_BATCH_BYTES = 262_144
+
 
 def _message_to_envelope(message: Any, _topic: str, **kwargs: Any) -> MessageEnvelope:
     """Build MessageEnvelope from message and kwargs."""
@@ -38,6 +46,27 @@ def _message_to_envelope(message: Any, _topic: str, **kwargs: Any) -> MessageEnv
     )
 
 
+def _chunk_entries(
+    entries: list[tuple[int, dict[str, Any]]],
+) -> list[list[tuple[int, dict[str, Any]]]]:
+    """Split entries into ``SendMessageBatch`` requests within SQS limits."""
+    chunks: list[list[tuple[int, dict[str, Any]]]] = []
+    chunk: list[tuple[int, dict[str, Any]]] = []
+    size = 0
+    for item in entries:
+        entry_size = len(item[1]["MessageBody"].encode("utf-8"))
+        if chunk and (
+            len(chunk) == SQS_MAX_BATCH_SIZE or size + entry_size > SQS_MAX_BATCH_BYTES
+        ):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(item)
+        size += entry_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 class SQSPublisher(IMessagePublisher):
     """SQS adapter implementing IMessagePublisher.
 
@@ -62,25 +91,103 @@ class SQSPublisher(IMessagePublisher):
 
     async def publish(self, topic: str, message: Any, **kwargs: Any) -> None:
         """Publish message to the queue named by topic (or queue_url in kwargs)."""
+        queue_url = await self._queue_url(topic, **kwargs)
+        entry = self._build_entry(queue_url, topic, message, **kwargs)
+        client = await self._connection.get_client()
+        await client.send_message(QueueUrl=queue_url, **entry)
+
+    async def publish_batch(
+        self, messages: Sequence[tuple[str, Any, dict[str, Any]]]
+    ) -> None:
+        """Send messages with ``send_message_batch``, grouped per queue.
+
+        Each request carries at most 10 entries and 256 KiB of message
+        bodies.  Once an entry fails, individually or because its request
+        failed, the later messages of the same FIFO message group (of the
+        whole queue for standard queues) are not sent, so they cannot
+        overtake it.
+
+        Raises:
+            BatchPublishError: If any message failed or was not sent;
+                indices refer to positions in *messages*.
+        """
+        by_queue: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        for index, (topic, message, kwargs) in enumerate(messages):
+            queue_url = await self._queue_url(topic, **kwargs)
+            by_queue.setdefault(queue_url, []).append(
+                (index, self._build_entry(queue_url, topic, message, **kwargs))
+            )
+        if not by_queue:
+            return
+
+        client = await self._connection.get_client()
+        failed: dict[int, str] = {}
+        unsent: list[int] = []
+        for queue_url, entries in by_queue.items():
+            await self._send_queue(client, queue_url, entries, failed, unsent)
+        if failed or unsent:
+            raise BatchPublishError(failed, unsent)
+
+    @staticmethod
+    async def _send_queue(
+        client: Any,
+        queue_url: str,
+        entries: list[tuple[int, dict[str, Any]]],
+        failed: dict[int, str],
+        unsent: list[int],
+    ) -> None:
+        """Send one queue's *entries* in chunks, holding back failed groups."""
+        blocked: set[str | None] = set()
+        for chunk in _chunk_entries(entries):
+            groups: dict[int, str | None] = {}
+            for index, entry in chunk:
+                group = entry.get("MessageGroupId")
+                if group in blocked:
+                    unsent.append(index)
+                else:
+                    groups[index] = group
+            if not groups:
+                continue
+            try:
+                response = await client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(index), **entry}
+                        for index, entry in chunk
+                        if index in groups
+                    ],
+                )
+            except Exception as exc:  # noqa: BLE001
+                failed.update(dict.fromkeys(groups, str(exc)))
+                blocked.update(groups.values())
+                continue
+            for entry in (response or {}).get("Failed", []):
+                index = int(entry["Id"])
+                failed[index] = str(entry.get("Message") or entry.get("Code"))
+                blocked.add(groups[index])
+
+    async def _queue_url(self, topic: str, /, **kwargs: Any) -> str:
         queue_url = kwargs.get("queue_url")
         if queue_url is None:
             queue_url = await self._connection.get_queue_url(topic)
+        return str(queue_url)
+
+    def _build_entry(
+        self, queue_url: str, topic: str, message: Any, /, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Build the ``send_message`` arguments (minus ``QueueUrl``)."""
         envelope = _message_to_envelope(message, topic, **kwargs)
         try:
             body = self._serializer.serialize(envelope)
         except Exception as e:
             raise MessagingSerializationError(str(e)) from e
-        client = await self._connection.get_client()
-        send_kwargs: dict[str, Any] = {
-            "QueueUrl": queue_url,
-            "MessageBody": body.decode("utf-8"),
-        }
+        entry: dict[str, Any] = {"MessageBody": body.decode("utf-8")}
         if queue_url.endswith(".fifo"):
-            send_kwargs["MessageDeduplicationId"] = envelope.message_id
-            send_kwargs["MessageGroupId"] = str(
+            entry["MessageDeduplicationId"] = envelope.message_id
+            entry["MessageGroupId"] = str(
                 envelope.payload.get("aggregate_id") or "default"
             )
-        await client.send_message(**send_kwargs)
+        return entry
 
     async def health_check(self) -> bool:
         """Return True if SQS is reachable."""
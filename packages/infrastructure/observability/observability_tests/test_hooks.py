@@ -39,3 +39,17 @@ def test_install_framework_hooks_registers_hook() -> None:
         assert len(local._registrations) == 1  # noqa: SLF001
     finally:
         set_hook_registry(original)
+
+
+def test_install_framework_hooks_forwards_sampling_options() -> None:
+    original = get_hook_registry()
+    try:
+        local = HookRegistry()
+        set_hook_registry(local)
+        install_framework_hooks(rate_limit=50, tail_min_duration_ms=25)
+        registration = local._registrations[0]  # noqa: SLF001
+        assert registration.rate_limit == 50
+        assert registration.tail_min_duration_ms == 25
+        assert registration.tail_sampled
+    finally:
+        set_hook_registry(original)
@@ -217,3 +217,41 @@ class TestMetricsMiddleware:
 
             # Verify debug logging
             assert mock_logger.debug.called
+
+
+class TestPrometheusMetricsExporter:
+    """Tests for PrometheusMetricsExporter."""
+
+    @pytest.mark.asyncio
+    async def test_export_aggregated_stats(self):
+        from prometheus_client import CollectorRegistry
+
+        from cqrs_ddd_core.instrumentation import OperationStats
+        from cqrs_ddd_observability.metrics import PrometheusMetricsExporter
+
+        registry = CollectorRegistry()
+        exporter = PrometheusMetricsExporter(registry=registry)
+        stats = OperationStats(bounds=(1.0, 10.0))
+        stats.merge(
+            OperationStats(
+                bounds=(1.0, 10.0),
+                count=4,
+                errors=1,
+                total_ms=12.0,
+                max_ms=8.0,
+                buckets=[3, 1, 0],
+            )
+        )
+
+        await exporter.export({"redis.cache.get": stats})
+
+        labels = {"operation": "redis.cache.get"}
+        assert registry.get_sample_value("cqrs_operation_total", labels) == 4
+        assert registry.get_sample_value("cqrs_operation_errors_total", labels) == 1
+        assert (
+            registry.get_sample_value(
+                "cqrs_operation_latency_milliseconds",
+                {**labels, "quantile": "0.99"},
+            )
+            == 8.0
+        )
@@ -10,7 +10,7 @@ from .hooks import (
     ObservabilityInstrumentationHook,
     install_framework_hooks,
 )
-from .metrics import MetricsMiddleware
+from .metrics import MetricsMiddleware, PrometheusMetricsExporter
 from .payload_tracing import PayloadTracingMiddleware
 from .sentry import SentryMiddleware
 from .structured_logging import StructuredLoggingMiddleware
@@ -21,6 +21,7 @@ __all__ = [
     "DEFAULT_FRAMEWORK_TRACE_OPERATIONS",
     "ObservabilityInstrumentationHook",
     "MetricsMiddleware",
+    "PrometheusMetricsExporter",
     "PayloadTracingMiddleware",
     "ObservabilityContext",
     "ObservabilityError",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -54,7 +55,15 @@ class ObservabilityInstrumentationHook:
             )
 
             tracer = trace_api.get_tracer("cqrs-ddd-framework")
-            with tracer.start_as_current_span(operation) as span:
+            # Tail-sampled registrations replay a finished operation and pass
+            # its measured latency; backdate the span so it covers the work.
+            duration_ms = attributes.get("duration_ms")
+            start_time = (
+                time.time_ns() - int(duration_ms * 1_000_000)
+                if isinstance(duration_ms, (int, float))
+                else None
+            )
+            with tracer.start_as_current_span(operation, start_time=start_time) as span:
                 for key, value in attributes.items():
                     span.set_attribute(key, str(value))
                 try:
@@ -74,8 +83,18 @@ def install_framework_hooks(
     operations: list[str] | None = None,
     priority: int = -100,
     enabled: bool = True,
+    sample_rate: float = 1.0,
+    rate_limit: float | None = None,
+    tail_min_duration_ms: float | None = None,
+    tail_errors: bool = False,
 ) -> None:
-    """Install observability instrumentation hook into core hook registry."""
+    """Install observability instrumentation hook into core hook registry.
+
+    ``sample_rate``/``rate_limit`` (head sampling) and
+    ``tail_min_duration_ms``/``tail_errors`` (only slow or failed
+    operations) are forwarded to ``HookRegistry.register`` so tracing can
+    stay enabled in production at bounded cost.
+    """
     try:
         from cqrs_ddd_core.instrumentation import get_hook_registry
 
@@ -85,6 +104,10 @@ def install_framework_hooks(
             priority=priority,
             operations=operations or DEFAULT_FRAMEWORK_TRACE_OPERATIONS,
             enabled=enabled,
+            sample_rate=sample_rate,
+            rate_limit=rate_limit,
+            tail_min_duration_ms=tail_min_duration_ms,
+            tail_errors=tail_errors,
         )
         logger.info("Observability hooks installed")
         logger.debug("Observability registration id=%s", id(registration))
@@ -9,10 +9,15 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from cqrs_ddd_core.ports.middleware import IMiddleware
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from cqrs_ddd_core.instrumentation import OperationStats
+
 _logger = logging.getLogger(__name__)
 
 
@@ -74,3 +79,64 @@ class MetricsMiddleware(IMiddleware):
                 self._counter.labels(**labels).inc()
             except Exception:  # noqa: BLE001
                 _logger.debug("Failed to emit metrics labels", exc_info=True)
+
+
+class PrometheusMetricsExporter:
+    """Exports ``MetricsAggregatorHook`` flushes as Prometheus metrics.
+
+    Prometheus metrics:
+      - ``cqrs_operation_total{operation}``
+      - ``cqrs_operation_errors_total{operation}``
+      - ``cqrs_operation_duration_milliseconds_total{operation}``
+      - ``cqrs_operation_latency_milliseconds{operation, quantile}`` — p50/p99
+        of the last flush interval
+    """
+
+    def __init__(self, registry: Any = None) -> None:
+        self._total = None
+        self._errors = None
+        self._duration = None
+        self._latency = None
+        try:
+            from prometheus_client import Counter, Gauge
+
+            kwargs: dict[str, Any] = {} if registry is None else {"registry": registry}
+            self._total = Counter(
+                "cqrs_operation_total", "Operations", ["operation"], **kwargs
+            )
+            self._errors = Counter(
+                "cqrs_operation_errors_total",
+                "Failed operations",
+                ["operation"],
+                **kwargs,
+            )
+            self._duration = Counter(
+                "cqrs_operation_duration_milliseconds_total",
+                "Cumulative operation latency",
+                ["operation"],
+                **kwargs,
+            )
+            self._latency = Gauge(
+                "cqrs_operation_latency_milliseconds",
+                "Operation latency quantiles over the last flush interval",
+                ["operation", "quantile"],
+                **kwargs,
+            )
+        except ImportError:
+            pass
+
+    async def export(self, metrics: Mapping[str, OperationStats]) -> None:
+        if (
+            self._total is None
+            or self._errors is None
+            or self._duration is None
+            or self._latency is None
+        ):
+            return
+        for operation, stats in metrics.items():
+            self._total.labels(operation).inc(stats.count)
+            if stats.errors:
+                self._errors.labels(operation).inc(stats.errors)
+            self._duration.labels(operation).inc(stats.total_ms)
+            self._latency.labels(operation, "0.5").set(stats.percentile(50))
+            self._latency.labels(operation, "0.99").set(stats.percentile(99))
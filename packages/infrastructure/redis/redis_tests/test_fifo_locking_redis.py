@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.exceptions import NoScriptError
 
+from cqrs_ddd_core.cqrs.concurrency import CriticalSection
 from cqrs_ddd_core.primitives import LockAcquisitionError, ResourceIdentifier
 from cqrs_ddd_redis import FifoRedisLockStrategy
 from cqrs_ddd_redis.exceptions import RedisLockError
+from cqrs_ddd_redis.fifo_redis_locking import (
+    _FAIR_ACQUIRE,
+    _FAIR_ACQUIRE_MANY,
+    _RELEASE,
+    _RELEASE_MANY,
+)
+
+
+async def _blpop_timeout(keys: list[str], timeout: float) -> None:
+    """Behave like a BLPOP that is never notified."""
+    await asyncio.sleep(timeout)
 
 
 @pytest.fixture
 def mock_redis() -> MagicMock:
     redis = MagicMock()
+    redis.evalsha = AsyncMock(return_value=1)
     redis.eval = AsyncMock(return_value=1)
     redis.zrem = AsyncMock()
+    redis.blpop = AsyncMock(side_effect=_blpop_timeout)
     redis.ping = AsyncMock()
     redis.aclose = AsyncMock()
     return redis
@@ -40,18 +56,19 @@ class TestFifoRedisLockStrategy:
         token = await strategy.acquire(resource, timeout=1.0, ttl=30.0)
         assert token is not None
 
-        # Verify lua script call
-        mock_redis.eval.assert_called_once()
-        args = mock_redis.eval.call_args[0]
-        assert "ZADD" in args[0]  # Fair acquisition script
+        # Verify lua script call (by SHA, not by body)
+        mock_redis.evalsha.assert_called_once()
+        args = mock_redis.evalsha.call_args[0]
+        assert args[0] == _FAIR_ACQUIRE.sha
         assert args[4] == token  # token (ARGV[1])
+        mock_redis.eval.assert_not_called()
 
         # 2. Release
         await strategy.release(resource, token)
         # Lua script: KEYS[1]=lock, KEYS[2]=queue, ARGV[1]=token
-        assert mock_redis.eval.call_count == 2
-        release_args = mock_redis.eval.call_args[0]
-        assert "DEL" in release_args[0]
+        assert mock_redis.evalsha.call_count == 2
+        release_args = mock_redis.evalsha.call_args[0]
+        assert release_args[0] == _RELEASE.sha
         assert release_args[4] == token
 
     async def test_reentrancy_increments_ref_count(
@@ -63,7 +80,7 @@ class TestFifoRedisLockStrategy:
 
         # First acquisition
         token = await strategy.acquire(resource, session_id=session_id)
-        assert mock_redis.eval.call_count == 1
+        assert mock_redis.evalsha.call_count == 1
 
         # Second acquisition (reentrant)
         # Mock extend success
@@ -72,7 +89,7 @@ class TestFifoRedisLockStrategy:
         ) as mock_extend:
             token2 = await strategy.acquire(resource, session_id=session_id)
             assert token == token2
-            assert mock_redis.eval.call_count == 1  # Still 1 call to fair script
+            assert mock_redis.evalsha.call_count == 1  # Still 1 call to fair script
             mock_extend.assert_called_once()
 
             # Internal check
@@ -81,11 +98,11 @@ class TestFifoRedisLockStrategy:
 
         # Release 1
         await strategy.release(resource, token)
-        assert mock_redis.eval.call_count == 1  # Not called yet
+        assert mock_redis.evalsha.call_count == 1  # Not called yet
 
         # Release 2
         await strategy.release(resource, token)
-        assert mock_redis.eval.call_count == 2  # Fully released
+        assert mock_redis.evalsha.call_count == 2  # Fully released
 
     async def test_acquire_timeout_throws_error(
         self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
@@ -93,22 +110,22 @@ class TestFifoRedisLockStrategy:
         """Should throw LockAcquisitionError and cleanup queue on timeout."""
         resource = ResourceIdentifier("Account", "123")
         # Mock result as 0 (not acquired)
-        mock_redis.eval.return_value = 0
+        mock_redis.evalsha.return_value = 0
 
         # Short timeout for test
         with pytest.raises(LockAcquisitionError) as exc:
             await strategy.acquire(resource, timeout=0.2)
 
         assert "timed out" in str(exc.value)
-        # Should have called zrem to cleanup queue
-        mock_redis.zrem.assert_called_once()
+        # Should have left the queue via the release script
+        assert mock_redis.evalsha.call_args[0][0] == _RELEASE.sha
 
     async def test_technical_failure_throws_error(
         self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
     ) -> None:
         """Should wrap technical exceptions."""
         resource = ResourceIdentifier("Account", "123")
-        mock_redis.eval.side_effect = Exception("Redis crash")
+        mock_redis.evalsha.side_effect = Exception("Redis crash")
 
         with pytest.raises(RedisLockError):
             await strategy.acquire(resource)
@@ -121,7 +138,7 @@ class TestFifoRedisLockStrategy:
         token = await strategy.acquire(resource)
 
         # Mock successful PEXPIRE
-        mock_redis.eval.return_value = 1
+        mock_redis.evalsha.return_value = 1
 
         success = await strategy.extend(resource, token, ttl=60.0)
         assert success is True
@@ -152,3 +169,124 @@ class TestFifoRedisLockStrategy:
         ids = {lock.resource_id for lock in locks}
         assert "1" in ids
         assert "2" in ids
+
+    async def test_unknown_script_falls_back_to_eval(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """EVAL with the body is used (and caches it) when the SHA is unknown."""
+        mock_redis.evalsha.side_effect = NoScriptError("NOSCRIPT")
+
+        await strategy.acquire(ResourceIdentifier("Account", "1"), timeout=1.0)
+
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args[0][0] == _FAIR_ACQUIRE.source
+
+    async def test_acquire_many_takes_all_locks_in_one_call(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """All locks are taken by one script call and share one token."""
+        resources = [
+            ResourceIdentifier("Account", "1"),
+            ResourceIdentifier("Account", "2"),
+        ]
+
+        tokens = await strategy.acquire_many(resources, timeout=1.0)
+
+        assert len(set(tokens)) == 1
+        mock_redis.evalsha.assert_called_once()
+        args = mock_redis.evalsha.call_args[0]
+        assert args[0] == _FAIR_ACQUIRE_MANY.sha
+        assert args[1] == 4  # two lock keys + two queue keys
+        assert args[2:6] == (
+            strategy._lock_key(resources[0]),
+            strategy._lock_key(resources[1]),
+            strategy._queue_key(resources[0]),
+            strategy._queue_key(resources[1]),
+        )
+
+        await strategy.release_many(list(zip(resources, tokens, strict=True)))
+        assert mock_redis.evalsha.call_count == 2
+        assert mock_redis.evalsha.call_args[0][0] == _RELEASE_MANY.sha
+        assert strategy._lock_metadata == {}
+
+    async def test_acquire_many_timeout_leaves_queues(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """On timeout no lock is held and the token leaves every queue."""
+        mock_redis.evalsha.return_value = 0
+        resources = [
+            ResourceIdentifier("Account", "1"),
+            ResourceIdentifier("Account", "2"),
+        ]
+
+        with pytest.raises(LockAcquisitionError, match="timed out"):
+            await strategy.acquire_many(resources, timeout=0.2)
+
+        assert mock_redis.evalsha.call_args[0][0] == _RELEASE_MANY.sha
+        assert strategy._lock_metadata == {}
+
+    async def test_acquire_many_reuses_reentrant_locks(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """Locks already held by the session are extended, not re-acquired."""
+        held = ResourceIdentifier("Account", "1")
+        other = ResourceIdentifier("Account", "2")
+        held_token = await strategy.acquire(held, session_id="s1")
+
+        tokens = await strategy.acquire_many([held, other], session_id="s1")
+
+        assert tokens[0] == held_token
+        assert tokens[1] != held_token
+        assert mock_redis.evalsha.call_args[0][1] == 2  # only `other` is acquired
+        assert strategy._lock_metadata[strategy._lock_key(held)][4] == 2
+
+    async def test_critical_section_uses_acquire_many(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """A CriticalSection costs one script call to enter and one to exit."""
+        resources = [ResourceIdentifier("Account", str(i)) for i in range(3)]
+
+        async with CriticalSection(resources, strategy, timeout=1.0):
+            assert mock_redis.evalsha.call_count == 1
+
+        assert mock_redis.evalsha.call_count == 2
+        assert mock_redis.evalsha.call_args[0][0] == _RELEASE_MANY.sha
+
+    async def test_waiter_blocks_on_its_notify_key(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """A queued waiter BLPOPs its own key instead of polling."""
+        mock_redis.evalsha.side_effect = [0, 1]
+        mock_redis.blpop = AsyncMock(return_value=[b"lock:notify:t", b"1"])
+
+        token = await strategy.acquire(ResourceIdentifier("Account", "1"), timeout=5)
+
+        mock_redis.blpop.assert_awaited_once()
+        keys = mock_redis.blpop.call_args[0][0]
+        assert keys == [f"lock:notify:{token}"]
+        assert mock_redis.blpop.call_args.kwargs["timeout"] <= 1.0
+
+    async def test_release_notifies_next_waiter(
+        self, strategy: FifoRedisLockStrategy, mock_redis: MagicMock
+    ) -> None:
+        """The release script gets the notify prefix to wake the next token."""
+        resource = ResourceIdentifier("Account", "1")
+        token = await strategy.acquire(resource)
+
+        await strategy.release(resource, token)
+
+        args = mock_redis.evalsha.call_args[0]
+        assert args[0] == _RELEASE.sha
+        assert args[4:6] == (token, "lock:notify:")
+
+    async def test_polling_mode_does_not_block(self, mock_redis: MagicMock) -> None:
+        """With blocking_wait off, waiters sleep retry_interval between attempts."""
+        strategy = FifoRedisLockStrategy(
+            mock_redis, retry_interval=0.01, blocking_wait=False
+        )
+        mock_redis.evalsha.side_effect = [0, 0, 1]
+
+        await strategy.acquire(ResourceIdentifier("Account", "1"), timeout=1.0)
+
+        mock_redis.blpop.assert_not_called()
+        assert mock_redis.evalsha.call_count == 3
@@ -11,6 +11,7 @@ import pytest
 from cqrs_ddd_core.primitives import LockAcquisitionError, ResourceIdentifier
 from cqrs_ddd_redis import RedlockLockStrategy
 from cqrs_ddd_redis.exceptions import RedisLockError
+from cqrs_ddd_redis.redlock_locking import _EXTEND
 
 
 @pytest.fixture
@@ -38,7 +39,7 @@ async def strategy(redis_urls: list[str], mock_lock: MagicMock) -> RedlockLockSt
         # Mock the internal client instances that we zip in __init__
         mock_instances = [MagicMock() for _ in redis_urls]
         for inst in mock_instances:
-            inst.eval = AsyncMock(return_value=1)
+            inst.evalsha = AsyncMock(return_value=1)
             inst.ping = AsyncMock()
             inst.aclose = AsyncMock()
 
@@ -170,11 +171,11 @@ class TestRedlockLockStrategy:
         success = await strategy.extend(resource, token, ttl=60.0)
         assert success is True
 
-        # Verify lua script was called on clients
+        # Verify lua script was called on clients by SHA
         for client in strategy._redis_clients.values():
-            client.eval.assert_called_once()
-            args = client.eval.call_args[0]
-            assert "KEYS[1]" in args[0]  # Lua script
+            client.evalsha.assert_called_once()
+            args = client.evalsha.call_args[0]
+            assert args[0] == _EXTEND.sha
             assert args[3] == "token123"  # Redlock ID check (ARGV[1])
 
     async def test_health_check_quorum(self, strategy: RedlockLockStrategy) -> None:
@@ -335,11 +336,11 @@ class TestRedlockLockStrategy:
         clients = list(strategy._redis_clients.values())
 
         # Client 1: Success (1)
-        clients[0].eval.return_value = 1
+        clients[0].evalsha.return_value = 1
         # Client 2: Success (1)
-        clients[1].eval.return_value = 1
+        clients[1].evalsha.return_value = 1
         # Client 3: Failure (Exception)
-        clients[2].eval.side_effect = Exception("Connection lost")
+        clients[2].evalsha.side_effect = Exception("Connection lost")
 
         success = await strategy.extend(resource, token, 10.0)
 
@@ -29,7 +29,7 @@ class RedisCacheService(ICacheService):
         registry = get_hook_registry()
         return await registry.execute_all(
             "redis.cache.get",
-            {"cache.key": key, "correlation_id": get_correlation_id()},
+            lambda: {"cache.key": key, "correlation_id": get_correlation_id()},
             lambda: self._get_internal(key, cls),
         )
 
@@ -49,7 +49,7 @@ class RedisCacheService(ICacheService):
         registry = get_hook_registry()
         await registry.execute_all(
             "redis.cache.set",
-            {
+            lambda: {
                 "cache.key": key,
                 "cache.ttl": ttl,
                 "correlation_id": get_correlation_id(),
@@ -47,7 +47,7 @@ class RedisCheckpointStore:
         registry = get_hook_registry()
         await registry.execute_all(
             f"redis.checkpoint.save.{projection_name}",
-            {
+            lambda: {
                 "projection.name": projection_name,
                 "projection.position": position,
                 "correlation_id": get_correlation_id(),
@@ -16,14 +16,120 @@ from cqrs_ddd_core.primitives.exceptions import (
 )
 
 from .exceptions import RedisLockError
+from .scripts import LuaScript
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from redis.asyncio import Redis
 
     from cqrs_ddd_core.primitives.locking import ResourceIdentifier
 
 logger = logging.getLogger("cqrs_ddd.redis.fifo_locking")
 
+# KEYS: [queue_key, lock_key]  ARGV: [token, ttl_ms, now_ts]
+_FAIR_ACQUIRE = LuaScript("""
+local queue_key = KEYS[1]
+local lock_key = KEYS[2]
+local token = ARGV[1]
+local ttl_ms = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+-- Add to queue if not present
+redis.call('ZADD', queue_key, 'NX', now, token)
+
+-- Check Rank
+local rank = redis.call('ZRANK', queue_key, token)
+
+if rank == 0 then
+    -- We are at the head, try to SET lock
+    local acquired = redis.call('SET', lock_key, token, 'NX', 'PX', ttl_ms)
+    if acquired then
+        redis.call('ZREM', queue_key, token)
+        return 1
+    end
+end
+return 0
+""")
+
+# KEYS: [lock_1..lock_n, queue_1..queue_n]  ARGV: [token, ttl_ms, now_ts]
+# Joins every queue with the same score, so waiters are ordered the same
+# way in all of them and two multi-lock requests cannot wait on each other.
+_FAIR_ACQUIRE_MANY = LuaScript("""
+local n = #KEYS / 2
+local token = ARGV[1]
+local ready = true
+for i = 1, n do
+    redis.call('ZADD', KEYS[n + i], 'NX', ARGV[3], token)
+    if redis.call('ZRANK', KEYS[n + i], token) ~= 0
+        or redis.call('EXISTS', KEYS[i]) == 1 then
+        ready = false
+    end
+end
+if not ready then
+    return 0
+end
+for i = 1, n do
+    redis.call('SET', KEYS[i], token, 'PX', ARGV[2])
+    redis.call('ZREM', KEYS[n + i], token)
+end
+return 1
+""")
+
+# Wakes the waiter now at the head of a queue when its lock is free, by
+# pushing to that waiter's notify list (see ``_wait_turn``).
+_NOTIFY_NEXT = """
+local function notify_next(lock_key, queue_key, notify_prefix, notify_ttl_ms)
+    if redis.call("EXISTS", lock_key) == 0 then
+        local head = redis.call("ZRANGE", queue_key, 0, 0)
+        if head[1] then
+            local notify_key = notify_prefix .. head[1]
+            redis.call("RPUSH", notify_key, 1)
+            redis.call("PEXPIRE", notify_key, notify_ttl_ms)
+        end
+    end
+end
+"""
+
+# KEYS: [lock_key, queue_key]  ARGV: [token, notify_prefix, notify_ttl_ms]
+# Also used by waiters that give up, to leave the queue.
+_RELEASE = LuaScript(
+    _NOTIFY_NEXT
+    + """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("DEL", KEYS[1])
+end
+redis.call("ZREM", KEYS[2], ARGV[1])
+notify_next(KEYS[1], KEYS[2], ARGV[2], ARGV[3])
+return 1
+"""
+)
+
+# KEYS: [lock_1..lock_n, queue_1..queue_n]
+# ARGV: [notify_prefix, notify_ttl_ms, token_1..token_n]
+_RELEASE_MANY = LuaScript(
+    _NOTIFY_NEXT
+    + """
+local n = #KEYS / 2
+for i = 1, n do
+    if redis.call("GET", KEYS[i]) == ARGV[2 + i] then
+        redis.call("DEL", KEYS[i])
+    end
+    redis.call("ZREM", KEYS[n + i], ARGV[2 + i])
+    notify_next(KEYS[i], KEYS[n + i], ARGV[1], ARGV[2])
+end
+return 1
+"""
+)
+
+# KEYS: [lock_key]  ARGV: [token, ttl_ms]
+_EXTEND = LuaScript("""
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+""")
+
 
 class FifoRedisLockStrategy:
     """
@@ -35,7 +141,15 @@ class FifoRedisLockStrategy:
 
     Features:
     - Fair Locking: Requests are served in order of arrival via a Redis ZSET.
+    - Push handoff: a waiter blocks on its own list with ``BLPOP``; releasing
+      (or a waiter giving up) pushes to the list of the next queued token,
+      so the handoff is immediate and idle waiters send no commands.
     - Atomic Operations: Lua scripts ensure queue and lock consistency.
+      Scripts are sent once and then invoked by SHA1 (``EVALSHA``).
+    - Multi-resource acquire: ``acquire_many`` takes all locks of a
+      ``CriticalSection`` in one all-or-nothing script call per attempt.
+      In Redis Cluster all keys of one call must share a hash slot
+      (use a ``{hash-tag}`` in ``prefix``).
     - Reentrancy: Supported via session_id and local reference counting.
     - Automatic Expiration: TTL-based cleanup.
     """
@@ -45,6 +159,9 @@ class FifoRedisLockStrategy:
         redis: Redis[bytes],
         prefix: str = "lock",
         retry_interval: float = 0.1,
+        *,
+        blocking_wait: bool = True,
+        max_block: float = 1.0,
     ) -> None:
         """
         Initialize FifoRedisLockStrategy.
@@ -52,11 +169,20 @@ class FifoRedisLockStrategy:
         Args:
             redis: An initialized redis.asyncio.Redis client.
             prefix: Key prefix for Redis keys.
-            retry_interval: Delay between polling attempts while in queue.
+            retry_interval: Delay between polling attempts while in queue
+                when ``blocking_wait`` is off.
+            blocking_wait: Wait for a release notification with ``BLPOP``
+                instead of polling.  Each blocked waiter holds one pool
+                connection while it waits.
+            max_block: Longest single ``BLPOP`` before the waiter retries
+                anyway.  Covers handoffs that send no notification, such
+                as a holder that crashed and let its lock expire.
         """
         self._redis = redis
         self._prefix = prefix
         self._retry_interval = retry_interval
+        self._blocking_wait = blocking_wait
+        self._max_block = max_block
 
         # Metadata for reentrancy and monitoring
         # Key -> (acquired_at, ttl, session_id, token, ref_count)
@@ -74,6 +200,25 @@ class FifoRedisLockStrategy:
             f"{resource.resource_id}:{resource.lock_mode}"
         )
 
+    @property
+    def _notify_prefix(self) -> str:
+        return f"{self._prefix}:notify:"
+
+    def _notify_args(self) -> list[str]:
+        # Notifications outlive the longest block so a late waiter sees them
+        return [self._notify_prefix, str(int(self._max_block * 2000) + 1000)]
+
+    async def _wait_turn(self, token: str, remaining: float) -> None:
+        """Block until notified for *token* (or poll) before the next attempt."""
+        if not self._blocking_wait:
+            await asyncio.sleep(self._retry_interval)
+            return
+        block = max(min(self._max_block, remaining), 0.01)
+        # Redis >= 6 accepts fractional BLPOP timeouts; the client stubs
+        # type ``timeout`` as int and the result as sync-or-async.
+        blpop = cast("Callable[..., Awaitable[Any]]", self._redis.blpop)
+        await blpop([self._notify_prefix + token], timeout=block)
+
     def _prune_expired_metadata(self) -> None:
         """Remove naturally expired locks from local metadata."""
         now = datetime.now(timezone.utc)
@@ -145,8 +290,10 @@ class FifoRedisLockStrategy:
                 lock_key, queue_key, token, ttl_ms, timeout, ttl, session_id
             )
         except asyncio.TimeoutError:
-            # Cleanup queue if timed out
-            await self._redis.zrem(queue_key, token)
+            # Leave the queue, waking the next waiter if the lock is free
+            await _RELEASE(
+                self._redis, [lock_key, queue_key], [token, *self._notify_args()]
+            )
             raise LockAcquisitionError(
                 resource, timeout, reason="Fair lock acquisition timed out"
             ) from None
@@ -214,7 +361,9 @@ class FifoRedisLockStrategy:
                     ]
                     return token
 
-                await asyncio.sleep(self._retry_interval)
+                remaining = timeout - (asyncio.get_event_loop().time() - start_time)
+                if remaining > 0:
+                    await self._wait_turn(token, remaining)
             except Exception as exc:  # noqa: BLE001
                 logger.error("Error during fair lock acquisition: %s", exc)
                 raise RedisLockError(f"Technical failure: {exc}") from exc
@@ -228,51 +377,120 @@ class FifoRedisLockStrategy:
         token: str,
         ttl_ms: int,
     ) -> bool:
-        """Execute the Lua script for fair lock acquisition.
-
-        Lua script uses Redis EVAL with:
-        - KEYS: [queue_key, lock_key]
-        - ARGV: [token, ttl_ms, now_ts]
-        """
-        fair_acquire_script = """
-        local queue_key = KEYS[1]
-        local lock_key = KEYS[2]
-        local token = ARGV[1]
-        local ttl_ms = tonumber(ARGV[2])
-        local now = tonumber(ARGV[3])
-
-        -- Add to queue if not present
-        redis.call('ZADD', queue_key, 'NX', now, token)
-
-        -- Check Rank
-        local rank = redis.call('ZRANK', queue_key, token)
-
-        if rank == 0 then
-            -- We are at the head, try to SET lock
-            local acquired = redis.call('SET', lock_key, token, 'NX', 'PX', ttl_ms)
-            if acquired then
-                redis.call('ZREM', queue_key, token)
-                return 1
-            end
-        end
-        return 0
-        """
-
+        """Run the fair acquisition script once."""
         now_ts = datetime.now(timezone.utc).timestamp()
-        result_raw = self._redis.eval(  # type: ignore[no-untyped-call]
-            fair_acquire_script,
-            2,
-            queue_key,
-            lock_key,
-            token,
-            str(ttl_ms),
-            str(now_ts),
+        result = await _FAIR_ACQUIRE(
+            self._redis,
+            [queue_key, lock_key],
+            [token, str(ttl_ms), str(now_ts)],
         )
-        result = await result_raw if hasattr(result_raw, "__await__") else result_raw
         result = int(result) if isinstance(result, str | bytes) else result
 
         return bool(result == 1)
 
+    async def acquire_many(
+        self,
+        resources: Sequence[ResourceIdentifier],
+        *,
+        timeout: float = 10.0,
+        ttl: float = 30.0,
+        session_id: str | None = None,
+    ) -> list[str]:
+        """Acquire all *resources* atomically (one script call per attempt)."""
+        registry = get_hook_registry()
+        return cast(
+            "list[str]",
+            await registry.execute_all(
+                "redis.lock.acquire_many",
+                {
+                    "resources": [str(r) for r in resources],
+                    "resource_count": len(resources),
+                    "timeout": timeout,
+                    "ttl": ttl,
+                    "correlation_id": get_correlation_id(),
+                },
+                lambda: self._acquire_many_internal(
+                    resources, timeout=timeout, ttl=ttl, session_id=session_id
+                ),
+            ),
+        )
+
+    async def _acquire_many_internal(
+        self,
+        resources: Sequence[ResourceIdentifier],
+        *,
+        timeout: float,
+        ttl: float,
+        session_id: str | None,
+    ) -> list[str]:
+        self._prune_expired_metadata()
+
+        tokens: dict[int, str] = {}
+        reentrant: list[tuple[ResourceIdentifier, str]] = []
+        for i, resource in enumerate(resources):
+            existing = await self._try_reentrant_acquire(
+                resource, self._lock_key(resource), session_id, ttl
+            )
+            if existing:
+                tokens[i] = existing
+                reentrant.append((resource, existing))
+
+        fresh = [r for i, r in enumerate(resources) if i not in tokens]
+        if fresh:
+            token = str(uuid.uuid4())
+            lock_keys = [self._lock_key(r) for r in fresh]
+            try:
+                await self._wait_for_all(fresh, token, int(ttl * 1000), timeout)
+            except BaseException:
+                # Give back the reentrant references taken above
+                await self._release_many_internal(reentrant)
+                raise
+            now = datetime.now(timezone.utc)
+            for lock_key in lock_keys:
+                self._lock_metadata[lock_key] = [now, ttl, session_id, token, 1]
+            for i in range(len(resources)):
+                tokens.setdefault(i, token)
+
+        return [tokens[i] for i in range(len(resources))]
+
+    async def _wait_for_all(
+        self,
+        resources: list[ResourceIdentifier],
+        token: str,
+        ttl_ms: int,
+        timeout: float,
+    ) -> None:
+        keys = [self._lock_key(r) for r in resources] + [
+            self._queue_key(r) for r in resources
+        ]
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                now_ts = datetime.now(timezone.utc).timestamp()
+                result = await _FAIR_ACQUIRE_MANY(
+                    self._redis, keys, [token, str(ttl_ms), str(now_ts)]
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Error during fair multi-lock acquisition: %s", exc)
+                raise RedisLockError(f"Technical failure: {exc}") from exc
+            if int(result) == 1:
+                return
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                try:
+                    await self._wait_turn(token, remaining)
+                except Exception as exc:  # noqa: BLE001
+                    raise RedisLockError(f"Technical failure: {exc}") from exc
+
+        # Leave every queue we joined, waking whoever is now first
+        await _RELEASE_MANY(
+            self._redis, keys, [*self._notify_args(), *([token] * len(resources))]
+        )
+        raise LockAcquisitionError(
+            resources[0], timeout, reason="Fair multi-lock acquisition timed out"
+        )
+
     async def release(self, resource: ResourceIdentifier, token: str) -> None:
         """Release the lock."""
         registry = get_hook_registry()
@@ -298,23 +516,57 @@ class FifoRedisLockStrategy:
             if metadata[4] > 0:
                 return
 
-        # Lua script for safe release
-        release_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            redis.call("DEL", KEYS[1])
-        end
-        redis.call("ZREM", KEYS[2], ARGV[1])
-        return 1
-        """
-
         try:
-            result_raw = self._redis.eval(release_script, 2, lock_key, queue_key, token)  # type: ignore[no-untyped-call]
-            if hasattr(result_raw, "__await__"):
-                await result_raw
+            await _RELEASE(
+                self._redis, [lock_key, queue_key], [token, *self._notify_args()]
+            )
             self._lock_metadata.pop(lock_key, None)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to release simple lock %s: %s", lock_key, exc)
 
+    async def release_many(
+        self, locks: Sequence[tuple[ResourceIdentifier, str]]
+    ) -> None:
+        """Release several locks with a single script call."""
+        registry = get_hook_registry()
+        await registry.execute_all(
+            "redis.lock.release_many",
+            {
+                "resources": [str(r) for r, _ in locks],
+                "resource_count": len(locks),
+                "correlation_id": get_correlation_id(),
+            },
+            lambda: self._release_many_internal(locks),
+        )
+
+    async def _release_many_internal(
+        self, locks: Sequence[tuple[ResourceIdentifier, str]]
+    ) -> None:
+        lock_keys: list[str] = []
+        queue_keys: list[str] = []
+        tokens: list[str] = []
+        for resource, token in locks:
+            lock_key = self._lock_key(resource)
+            metadata = self._lock_metadata.get(lock_key)
+            if metadata and metadata[3] == token:
+                metadata[4] -= 1
+                if metadata[4] > 0:
+                    continue
+            lock_keys.append(lock_key)
+            queue_keys.append(self._queue_key(resource))
+            tokens.append(token)
+        if not lock_keys:
+            return
+
+        try:
+            await _RELEASE_MANY(
+                self._redis, lock_keys + queue_keys, [*self._notify_args(), *tokens]
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to release locks %s: %s", lock_keys, exc)
+        for lock_key in lock_keys:
+            self._lock_metadata.pop(lock_key, None)
+
     async def extend(
         self, resource: ResourceIdentifier, token: str, ttl: float
     ) -> bool:
@@ -322,19 +574,8 @@ class FifoRedisLockStrategy:
         lock_key = self._lock_key(resource)
         ttl_ms = int(ttl * 1000)
 
-        extend_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("PEXPIRE", KEYS[1], ARGV[2])
-        end
-        return 0
-        """
         try:
-            result_raw = self._redis.eval(  # type: ignore[no-untyped-call]
-                extend_script, 1, lock_key, token, str(ttl_ms)
-            )
-            result = (
-                await result_raw if hasattr(result_raw, "__await__") else result_raw
-            )
+            result = await _EXTEND(self._redis, [lock_key], [token, str(ttl_ms)])
             result = int(result) if isinstance(result, str | bytes) else result
             if result == 1:
                 if lock_key in self._lock_metadata:
@@ -18,12 +18,22 @@ from cqrs_ddd_core.primitives.exceptions import (
 )
 
 from .exceptions import RedisLockError
+from .scripts import LuaScript
 
 if TYPE_CHECKING:
     from cqrs_ddd_core.primitives.locking import ResourceIdentifier
 
 logger = logging.getLogger("cqrs_ddd.redis.locking")
 
+# KEYS: [key]  ARGV: [redlock_id, ttl_ms]
+_EXTEND = LuaScript("""
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+""")
+
 
 class RedlockLockStrategy:
     """
@@ -37,7 +47,7 @@ class RedlockLockStrategy:
 
     Hardened Reliability Features:
     - Unique tokens to prevent unauthorized releases (Redlock safety)
-    - Atomic extensions via Lua scripts
+    - Atomic extensions via Lua scripts (cached, invoked with EVALSHA)
     - Reentrancy support with Reference Counting
       (prevents early release in nested flows)
     - Proactive Memory Management (metadata pruning to prevent leaks)
@@ -371,20 +381,13 @@ class RedlockLockStrategy:
         except ValueError:
             return False
 
-        lua_extend = """
-        if redis.call("get", KEYS[1]) == ARGV[1] then
-            return redis.call("pexpire", KEYS[1], ARGV[2])
-        else
-            return 0
-        end
-        """
         ttl_ms = int(ttl * 1000)
 
         try:
             success_count = 0
             for _url, client in self._redis_clients.items():
                 try:
-                    result = await client.eval(lua_extend, 1, key, redlock_id, ttl_ms)
+                    result = await _EXTEND(client, [key], [redlock_id, ttl_ms])
                     if result:
                         success_count += 1
                 except Exception as exc:  # noqa: BLE001
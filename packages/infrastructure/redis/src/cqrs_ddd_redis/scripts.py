@@ -0,0 +1,45 @@
+"""Cached Lua scripts invoked with EVALSHA."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, cast
+
+from redis.exceptions import NoScriptError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from redis.asyncio import Redis
+
+
+class LuaScript:
+    """
+    A Lua script sent by SHA1 digest instead of by body.
+
+    Calls use ``EVALSHA``.  If the server does not know the script yet
+    (first call, restart, ``SCRIPT FLUSH``, failover) the call falls back to
+    ``EVAL`` with the full body, which also caches it server-side, so every
+    later call is a short ``EVALSHA`` again.  Unlike
+    ``Redis.register_script`` one instance can be shared by several clients,
+    as Redlock needs.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.sha = hashlib.sha1(source.encode(), usedforsecurity=False).hexdigest()
+
+    async def __call__(
+        self,
+        client: Redis[bytes],
+        keys: Sequence[str] = (),
+        args: Sequence[Any] = (),
+    ) -> Any:
+        """Run the script on *client* with *keys* and *args*."""
+        # redis-py types these as sync/async unions; the asyncio client awaits
+        evalsha = cast("Callable[..., Awaitable[Any]]", client.evalsha)
+        try:
+            return await evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            run = cast("Callable[..., Awaitable[Any]]", client.eval)
+            return await run(self.source, len(keys), *keys, *args)
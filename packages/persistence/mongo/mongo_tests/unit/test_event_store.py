@@ -2,7 +2,7 @@
 
 import pytest
 
-from cqrs_ddd_core.ports.event_store import StoredEvent
+from cqrs_ddd_core.ports.event_store import EventCursor, StoredEvent
 from cqrs_ddd_persistence_mongo import MongoEventStore
 
 
@@ -52,7 +52,7 @@ async def test_append_batch_assigns_positions(mongo_connection):
         for i in range(1, 4)
     ]
 
-    await store.append_batch(events)
+    assert await store.append_batch(events) == [1, 2, 3]
 
     stored = await store.get_events("agg1")
 
@@ -62,6 +62,72 @@ async def test_append_batch_assigns_positions(mongo_connection):
     assert stored[2].position == 3
 
 
+def _events(count, start=1, aggregate_id="agg1"):
+    return [
+        StoredEvent(
+            event_id=f"{aggregate_id}-evt{i}",
+            event_type="TestEvent",
+            aggregate_id=aggregate_id,
+            aggregate_type="TestAggregate",
+            version=i,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_append_batch_reserves_block_in_one_update(mongo_connection):
+    """A batch costs one counter update, however many events it holds."""
+    store = MongoEventStore(mongo_connection)
+    counters = store._counters_collection()
+    calls = 0
+    original = counters.find_one_and_update
+
+    async def _counting(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await original(*args, **kwargs)
+
+    counters.find_one_and_update = _counting
+    store._counters_collection = lambda: counters
+
+    await store.append(_events(1, aggregate_id="agg0")[0])
+    await store.append_batch(_events(50))
+
+    stored = await store.get_events("agg1")
+    assert calls == 2
+    assert [e.position for e in stored] == list(range(2, 52))
+    assert await store.get_latest_position() == 51
+
+
+@pytest.mark.asyncio
+async def test_position_leasing_hands_out_positions_locally(mongo_connection):
+    """With leasing, appends reuse the reserved range until it runs out."""
+    store = MongoEventStore(mongo_connection, position_lease_size=10)
+    other = MongoEventStore(mongo_connection, position_lease_size=10)
+
+    await store.append_batch(_events(3))
+    await other.append_batch(_events(2, aggregate_id="agg2"))
+    await store.append_batch(_events(4, start=4))
+    await store.append_batch(_events(5, start=8))
+
+    positions = [e.position for e in await store.get_events("agg1")]
+    assert positions == [1, 2, 3, 4, 5, 6, 7, 21, 22, 23, 24, 25]
+    assert [e.position for e in await store.get_events("agg2")] == [11, 12]
+
+
+@pytest.mark.asyncio
+async def test_position_leasing_batch_larger_than_lease(mongo_connection):
+    """A batch bigger than the lease size reserves a block of its own size."""
+    store = MongoEventStore(mongo_connection, position_lease_size=4)
+
+    await store.append_batch(_events(6))
+    await store.append(_events(1, start=7)[0])
+
+    positions = [e.position for e in await store.get_events("agg1")]
+    assert positions == [1, 2, 3, 4, 5, 6, 7]
+
+
 @pytest.mark.asyncio
 async def test_get_events_after_version(mongo_connection):
     """Test that get_events respects after_version filter."""
@@ -201,6 +267,65 @@ async def test_get_events_after_respects_limit(mongo_connection):
     assert len(events) == 5
 
 
+@pytest.mark.asyncio
+async def test_stream_batches_resumes_after_cursor(mongo_connection):
+    """Keyset cursor resumes across gaps and breaks position ties by _id."""
+    store = MongoEventStore(mongo_connection)
+    # Legacy data: a gap after 2 and two events sharing position 2
+    docs = [
+        store._stored_event_to_doc(
+            StoredEvent(
+                event_id=event_id,
+                event_type="TestEvent",
+                aggregate_id=f"agg-{event_id}",
+                aggregate_type="TestAggregate",
+                version=1,
+                position=position,
+            )
+        )
+        for event_id, position in [("e1", 1), ("e2b", 2), ("e2a", 2), ("e5", 5)]
+    ]
+    await store._events_collection().insert_many(docs)
+
+    batches = [b async for b in store.stream_batches(batch_size=2)]
+    assert [[e.event_id for e in b.events] for b in batches] == [
+        ["e1", "e2a"],
+        ["e2b", "e5"],
+    ]
+    assert batches[0].cursor == EventCursor(2, "e2a")
+
+    resumed = [b async for b in store.stream_batches(batches[0].cursor)]
+    assert [e.event_id for e in resumed[0].events] == ["e2b", "e5"]
+    assert [b async for b in store.stream_batches(batches[-1].cursor)] == []
+
+
+@pytest.mark.asyncio
+async def test_get_events_for_aggregates_applies_after_versions(mongo_connection):
+    """Batch read returns each aggregate's events after its own version."""
+    store = MongoEventStore(mongo_connection)
+    await store.append_batch(
+        [
+            StoredEvent(
+                event_type="TestEvent",
+                aggregate_id=aggregate_id,
+                aggregate_type="TestAggregate",
+                version=version,
+            )
+            for aggregate_id in ("agg1", "agg2", "agg3")
+            for version in (1, 2, 3)
+        ]
+    )
+
+    events = await store.get_events_for_aggregates(
+        ["agg1", "agg2", "missing"], {"agg2": 2}
+    )
+
+    assert [e.version for e in events["agg1"]] == [1, 2, 3]
+    assert [e.version for e in events["agg2"]] == [3]
+    assert events["missing"] == []
+    assert "agg3" not in events
+
+
 @pytest.mark.asyncio
 async def test_get_all_returns_all_events(mongo_connection):
     """Test that get_all returns all stored events."""
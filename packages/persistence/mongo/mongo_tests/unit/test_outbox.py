@@ -1,5 +1,7 @@
 """Tests for MongoOutboxStorage."""
 
+from datetime import datetime, timezone
+
 import pytest
 
 from cqrs_ddd_core.ports.outbox import OutboxMessage
@@ -162,6 +164,29 @@ async def test_mark_failed_multiple_times(mongo_connection):
     assert doc["error"] == "Error 2"
 
 
+@pytest.mark.asyncio
+async def test_mark_failed_batch(mongo_connection):
+    """Test that several failures are recorded at once."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id="msg1", event_type="TestEvent", payload={}),
+            OutboxMessage(message_id="msg2", event_type="TestEvent", payload={}),
+            OutboxMessage(message_id="msg3", event_type="TestEvent", payload={}),
+        ]
+    )
+
+    await storage.mark_failed_batch({"msg1": "Error 1", "msg3": "Error 3"})
+
+    coll = storage._collection()
+    docs = {doc["_id"]: doc async for doc in coll.find({})}
+    assert docs["msg1"]["status"] == "failed"
+    assert docs["msg1"]["error"] == "Error 1"
+    assert docs["msg3"]["error"] == "Error 3"
+    assert docs["msg3"]["retry_count"] == 1
+    assert docs["msg2"]["status"] == "pending"
+
+
 @pytest.mark.asyncio
 async def test_custom_database(mongo_connection):
     """Test that outbox storage can use a custom database."""
@@ -174,3 +199,188 @@ async def test_custom_database(mongo_connection):
     pending = await storage.get_pending(limit=10)
 
     assert len(pending) == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_gives_disjoint_batches(mongo_connection):
+    """Test that concurrent workers lease disjoint batches."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id=f"msg{i}", event_type="TestEvent", payload={})
+            for i in range(5)
+        ]
+    )
+
+    first = await storage.claim_pending(limit=3, worker_id="w1")
+    second = await storage.claim_pending(limit=3, worker_id="w2")
+
+    assert [m.message_id for m in first] == ["msg0", "msg1", "msg2"]
+    assert [m.message_id for m in second] == ["msg3", "msg4"]
+    assert await storage.claim_pending(worker_id="w3") == []
+
+    doc = await storage._collection().find_one({"_id": "msg0"})
+    assert doc["claimed_by"] == "w1"
+    assert doc["lease_until"] is not None
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_reclaims_expired_lease(mongo_connection):
+    """Test that an expired lease can be claimed by another worker."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [OutboxMessage(message_id="msg1", event_type="TestEvent", payload={})]
+    )
+
+    await storage.claim_pending(worker_id="w1", lease_seconds=-1)
+    reclaimed = await storage.claim_pending(worker_id="w2")
+
+    assert [m.message_id for m in reclaimed] == ["msg1"]
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_max_retries_claims_only_retryable(mongo_connection):
+    """Test that retry claims skip fresh and exhausted messages."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id="fresh", event_type="TestEvent", payload={}),
+            OutboxMessage(
+                message_id="exhausted",
+                event_type="TestEvent",
+                payload={},
+                error="x",
+                retry_count=3,
+            ),
+            OutboxMessage(
+                message_id="retryable",
+                event_type="TestEvent",
+                payload={},
+                error="x",
+                retry_count=1,
+            ),
+        ]
+    )
+
+    claimed = await storage.claim_pending(limit=1, worker_id="w1", max_retries=3)
+    rest = await storage.claim_pending(worker_id="w2")
+
+    assert [m.message_id for m in claimed] == ["retryable"]
+    assert [m.message_id for m in rest] == ["fresh", "exhausted"]
+
+
+@pytest.mark.asyncio
+async def test_release_and_publish_clear_claims(mongo_connection):
+    """Test that releasing or publishing clears the lease."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id="msg1", event_type="TestEvent", payload={}),
+            OutboxMessage(message_id="msg2", event_type="TestEvent", payload={}),
+        ]
+    )
+    await storage.claim_pending(worker_id="w1")
+
+    # Another worker cannot release claims it does not hold
+    await storage.release_claims(["msg1"], worker_id="w2")
+    assert await storage.claim_pending(worker_id="w2") == []
+
+    await storage.release_claims(["msg1"], worker_id="w1")
+    await storage.mark_published(["msg2"])
+
+    doc = await storage._collection().find_one({"_id": "msg2"})
+    assert doc["claimed_by"] is None
+    reclaimed = await storage.claim_pending(worker_id="w2")
+    assert [m.message_id for m in reclaimed] == ["msg1"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_creates_claim_index(mongo_connection):
+    """Test that the compound claim index is created."""
+    storage = MongoOutboxStorage(mongo_connection)
+
+    await storage.ensure_indexes()
+
+    info = await storage._collection().index_information()
+    assert info[MongoOutboxStorage.CLAIM_INDEX]["key"] == [
+        ("status", 1),
+        ("created_at", 1),
+        ("lease_until", 1),
+    ]
+    assert info[MongoOutboxStorage.PENDING_INDEX]["key"] == [("created_at", 1)]
+
+
+@pytest.mark.asyncio
+async def test_purge_published_deletes_old_published_in_chunks(mongo_connection):
+    """Test that only old published messages are purged, up to the limit."""
+    storage = MongoOutboxStorage(mongo_connection)
+    old = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id=f"old{i}", event_type="E", created_at=old)
+            for i in range(3)
+        ]
+        + [OutboxMessage(message_id="pending", event_type="E", created_at=old)]
+    )
+    await storage.mark_published(["old0", "old1", "old2"])
+    cutoff = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    assert await storage.purge_published(cutoff, limit=2) == 2
+    assert await storage.purge_published(cutoff, limit=2) == 1
+    assert await storage.purge_published(cutoff, limit=2) == 0
+
+    stats = await storage.get_stats()
+    assert (stats.pending, stats.published) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_purge_published_archives_by_month(mongo_connection):
+    """Test that archived messages land in the collection for their month."""
+    storage = MongoOutboxStorage(mongo_connection)
+    await storage.save_messages(
+        [
+            OutboxMessage(
+                message_id="jan",
+                event_type="E",
+                created_at=datetime(2024, 1, 31, tzinfo=timezone.utc),
+            ),
+            OutboxMessage(
+                message_id="feb",
+                event_type="E",
+                created_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            ),
+        ]
+    )
+    await storage.mark_published(["jan", "feb"])
+
+    purged = await storage.purge_published(
+        datetime(2024, 3, 1, tzinfo=timezone.utc), archive=True
+    )
+
+    assert purged == 2
+    db = storage._db()
+    jan = await db["outbox_messages_archive_2024_01"].find_one({"_id": "jan"})
+    feb = await db["outbox_messages_archive_2024_02"].find_one({"_id": "feb"})
+    assert jan["status"] == "published"
+    assert feb is not None
+
+
+@pytest.mark.asyncio
+async def test_get_stats(mongo_connection):
+    """Test per-status counts and the oldest pending timestamp."""
+    storage = MongoOutboxStorage(mongo_connection)
+    oldest = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    await storage.save_messages(
+        [
+            OutboxMessage(message_id="a", event_type="E", created_at=oldest),
+            OutboxMessage(message_id="b", event_type="E"),
+            OutboxMessage(message_id="c", event_type="E"),
+        ]
+    )
+    await storage.mark_published(["b"])
+    await storage.mark_failed("c", "boom")
+
+    stats = await storage.get_stats()
+
+    assert (stats.pending, stats.published, stats.failed) == (1, 1, 1)
+    assert stats.oldest_pending_at.replace(tzinfo=timezone.utc) == oldest
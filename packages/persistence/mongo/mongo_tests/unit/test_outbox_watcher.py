@@ -0,0 +1,85 @@
+"""Tests for MongoOutboxChangeStreamWatcher (fake change stream)."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from cqrs_ddd_persistence_mongo import MongoOutboxChangeStreamWatcher
+
+
+class FakeChangeStream:
+    def __init__(self):
+        self.events = asyncio.Queue()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self.events.get()
+        if isinstance(event, Exception):
+            raise event
+        return event
+
+
+class FakeCollection:
+    def __init__(self):
+        self.streams = []
+        self.pipelines = []
+
+    @contextlib.asynccontextmanager
+    async def watch(self, pipeline):
+        stream = FakeChangeStream()
+        self.pipelines.append(pipeline)
+        self.streams.append(stream)
+        yield stream
+
+
+class FakeStorage:
+    def __init__(self):
+        self.collection = FakeCollection()
+
+    def _collection(self):
+        return self.collection
+
+
+async def _until(predicate):
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_watcher_triggers_on_inserts_and_reopens():
+    """Test that inserts wake the outbox and a failed stream is reopened."""
+    storage = FakeStorage()
+    calls = []
+    watcher = MongoOutboxChangeStreamWatcher(
+        storage, lambda: calls.append(1), reconnect_delay=0
+    )
+
+    await watcher.start()
+    try:
+        coll = storage.collection
+        await _until(lambda: len(calls) == 1)  # catch-up after opening
+        assert coll.pipelines[0] == [{"$match": {"operationType": "insert"}}]
+
+        await coll.streams[0].events.put({"operationType": "insert"})
+        await _until(lambda: len(calls) == 2)
+
+        await coll.streams[0].events.put(RuntimeError("stream closed"))
+        await _until(lambda: len(coll.streams) == 2 and len(calls) == 3)
+    finally:
+        await watcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_watcher_stop_is_idempotent():
+    """Test that stopping twice (or before starting) is harmless."""
+    watcher = MongoOutboxChangeStreamWatcher(FakeStorage(), lambda: None)
+    await watcher.stop()
+    await watcher.start()
+    await watcher.stop()
+    await watcher.stop()
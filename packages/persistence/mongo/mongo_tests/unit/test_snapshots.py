@@ -0,0 +1,33 @@
+"""Tests for MongoSnapshotStore."""
+
+import pytest
+
+from cqrs_ddd_persistence_mongo.advanced.snapshots import MongoSnapshotStore
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_latest_snapshot(mongo_connection):
+    store = MongoSnapshotStore(connection=mongo_connection)
+
+    await store.save_snapshot("Order", "o1", {"total": 100}, 1)
+    await store.save_snapshot("Order", "o1", {"total": 200}, 5)
+
+    snapshot = await store.get_latest_snapshot("Order", "o1")
+    assert snapshot is not None
+    assert snapshot["version"] == 5
+    assert snapshot["snapshot_data"] == {"total": 200}
+
+
+@pytest.mark.asyncio
+async def test_get_latest_snapshots_batches_ids(mongo_connection):
+    store = MongoSnapshotStore(connection=mongo_connection)
+    await store.save_snapshot("Order", "o1", {"total": 100}, 3)
+    await store.save_snapshot("Order", "o2", {"total": 200}, 7)
+    await store.save_snapshot("Invoice", "o3", {"total": 300}, 1)
+
+    snapshots = await store.get_latest_snapshots("Order", ["o1", "o2", "o3"])
+
+    assert set(snapshots) == {"o1", "o2"}
+    assert snapshots["o1"]["version"] == 3
+    assert snapshots["o2"]["snapshot_data"] == {"total": 200}
+    assert await store.get_latest_snapshots("Order", []) == {}
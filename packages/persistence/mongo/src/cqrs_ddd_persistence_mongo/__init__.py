@@ -22,6 +22,7 @@ from .connection import MongoConnectionManager
 from .core.checkpoint_store import MongoCheckpointStore
 from .core.event_store import MongoEventStore
 from .core.outbox import MongoOutboxStorage
+from .core.outbox_watcher import MongoOutboxChangeStreamWatcher
 from .core.repository import MongoRepository
 from .core.uow import MongoUnitOfWork, MongoUnitOfWorkError
 from .exceptions import (
@@ -39,6 +40,7 @@ __all__ = [
     "MongoUnitOfWork",
     "MongoUnitOfWorkError",
     "MongoOutboxStorage",
+    "MongoOutboxChangeStreamWatcher",
     "MongoEventStore",
     "MongoCheckpointStore",
     "MongoProjectionPositionStore",
@@ -12,6 +12,8 @@ from ..query_builder import MongoQueryBuilder
 
 # Re-export type for use in signature
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from cqrs_ddd_core.domain.specification import ISpecification
 
     from ..connection import MongoConnectionManager
@@ -162,6 +164,26 @@ class MongoSnapshotStore(ISnapshotStore):
         doc = await self._coll().find_one(filter_query)
         if doc is None:
             return None
+        return self._doc_to_snapshot(doc)
+
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: Sequence[Any],
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        ids = {_doc_id(aggregate_type, aid): str(aid) for aid in aggregate_ids}
+        if not ids:
+            return {}
+        filter_query = self._merge_spec({"_id": {"$in": list(ids)}}, specification)
+        return {
+            ids[doc["_id"]]: self._doc_to_snapshot(doc)
+            async for doc in self._coll().find(filter_query)
+        }
+
+    @staticmethod
+    def _doc_to_snapshot(doc: dict[str, Any]) -> dict[str, Any]:
         return {
             "snapshot_data": doc["snapshot_data"],
             "version": doc["version"],
@@ -4,6 +4,7 @@ from .checkpoint_store import MongoCheckpointStore
 from .event_store import MongoEventStore
 from .model_mapper import MongoDBModelMapper
 from .outbox import MongoOutboxStorage
+from .outbox_watcher import MongoOutboxChangeStreamWatcher
 from .repository import MongoRepository
 from .uow import MongoUnitOfWork
 from .versioning import (
@@ -17,6 +18,7 @@ __all__ = [
     "MongoEventStore",
     "MongoDBModelMapper",
     "MongoOutboxStorage",
+    "MongoOutboxChangeStreamWatcher",
     "MongoRepository",
     "MongoUnitOfWork",
     "check_document_version",
@@ -7,16 +7,23 @@ ensuring atomicity and preventing race conditions.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, cast
 
-from cqrs_ddd_core.ports.event_store import IEventStore, StoredEvent
+from cqrs_ddd_core.ports.event_store import (
+    EventBatch,
+    EventCursor,
+    IEventStore,
+    StoredEvent,
+)
 
 from ..exceptions import MongoPersistenceError
 from ..query_builder import MongoQueryBuilder
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
 
     from cqrs_ddd_core.domain.specification import ISpecification
 
@@ -46,7 +53,17 @@ class MongoEventStore(IEventStore):
         }
 
     Positions are auto-incremented using a separate ``counters`` collection
-    with atomic ``find_one_and_update`` operations.
+    with atomic ``find_one_and_update`` operations; ``append_batch`` reserves
+    the positions for the whole batch in one update.
+
+    **Position leasing** (``position_lease_size > 1``) reserves a block of
+    positions per process and assigns them locally, so most appends skip
+    the counter round-trip and writers stop contending on the counter
+    document.  The trade-off: positions from different processes are no
+    longer in commit order and unused lease ranges leave gaps, so a
+    consumer tailing by position can miss an event committed later with a
+    lower position.  Only enable it for write-heavy ingestion whose readers
+    replay after the fact or otherwise tolerate out-of-order positions.
     """
 
     EVENTS_COLLECTION = "domain_events"
@@ -57,6 +74,8 @@ class MongoEventStore(IEventStore):
         self,
         connection: MongoConnectionManager,
         database: str | None = None,
+        *,
+        position_lease_size: int = 0,
     ) -> None:
         """
         Initialize event store.
@@ -64,9 +83,15 @@ class MongoEventStore(IEventStore):
         Args:
             connection: MongoDB connection manager.
             database: Optional database name. If None, uses client's default database.
+            position_lease_size: Positions reserved per counter update and
+                handed out locally; ``0`` (default) disables leasing.
         """
         self._connection = connection
         self._database_name = database
+        self._lease_size = position_lease_size
+        self._lease_lock = asyncio.Lock()
+        self._lease_next = 1
+        self._lease_end = 0
 
     def _db(self) -> Any:
         """Get the database instance.
@@ -98,27 +123,50 @@ class MongoEventStore(IEventStore):
         """Get the counters collection."""
         return self._db()[self.COUNTERS_COLLECTION]
 
-    async def _next_position(self) -> int:
+    async def _reserve_positions(self, count: int) -> int:
         """
-        Get the next position value atomically.
-
-        Uses ``find_one_and_update`` with upsert to ensure
-        thread-safe increment without race conditions.
+        Reserve *count* consecutive positions with one atomic ``$inc``.
 
         Returns:
-            The next position value.
+            The first reserved position; the block is
+            ``first .. first + count - 1``.
         """
         coll = self._counters_collection()
         result = await coll.find_one_and_update(
             {"_id": self.POSITION_COUNTER},
-            {"$inc": {"value": 1}},
+            {"$inc": {"value": count}},
             upsert=True,
             return_document=True,
         )
         if result is None:
             # First time: counter was created with value=0, next is 1
             return 1
-        return cast("int", result["value"])
+        return cast("int", result["value"]) - count + 1
+
+    async def _allocate_positions(self, count: int) -> int:
+        """
+        Return the first of *count* consecutive positions for one append.
+
+        Without leasing every call reserves exactly its block from the
+        counter.  With leasing, blocks of ``position_lease_size`` are
+        reserved per process and handed out locally; a request that does
+        not fit in what is left of the lease starts a new one (the rest of
+        the old lease becomes a gap).
+        """
+        if self._lease_size <= 1:
+            return await self._reserve_positions(count)
+        async with self._lease_lock:
+            if self._lease_end - self._lease_next + 1 < count:
+                block = max(count, self._lease_size)
+                first = await self._reserve_positions(block)
+                self._lease_next, self._lease_end = first, first + block - 1
+            first = self._lease_next
+            self._lease_next += count
+            return first
+
+    async def _next_position(self) -> int:
+        """Get the next position value atomically."""
+        return await self._allocate_positions(1)
 
     def _stored_event_to_doc(self, event: StoredEvent) -> dict[str, Any]:
         """Convert StoredEvent to MongoDB document."""
@@ -186,41 +234,32 @@ class MongoEventStore(IEventStore):
         coll = self._events_collection()
         await coll.insert_one(doc)
 
-    async def append_batch(self, events: list[StoredEvent]) -> None:
+    async def append_batch(self, events: list[StoredEvent]) -> list[int]:
         """
         Append multiple stored events atomically.
 
-        Each event gets the next position via counter collection.
+        The whole batch reserves its positions with a single counter
+        update and is written with one ``insert_many``, so a batch costs
+        two round-trips regardless of its size.
 
         Args:
             events: The events to persist.
+
+        Returns:
+            The positions assigned to *events*, in order.
         """
         if not events:
-            return
-
-        events_with_positions = []
-        for event in events:
-            position = await self._next_position()
-            event_with_position = StoredEvent(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                aggregate_id=event.aggregate_id,
-                aggregate_type=event.aggregate_type,
-                version=event.version,
-                schema_version=event.schema_version,
-                payload=event.payload,
-                metadata=event.metadata,
-                occurred_at=event.occurred_at,
-                correlation_id=event.correlation_id,
-                causation_id=event.causation_id,
-                position=position,
-                tenant_id=event.tenant_id,
-            )
-            events_with_positions.append(event_with_position)
-
-        docs = [self._stored_event_to_doc(event) for event in events_with_positions]
+            return []
+
+        first = await self._allocate_positions(len(events))
+        positions = [first + i for i in range(len(events))]
+        docs = [
+            self._stored_event_to_doc(replace(event, position=position))
+            for event, position in zip(events, positions, strict=True)
+        ]
         coll = self._events_collection()
         await coll.insert_many(docs)
+        return positions
 
     def _merge_spec(
         self,
@@ -269,6 +308,48 @@ class MongoEventStore(IEventStore):
 
         return events
 
+    async def get_events_for_aggregates(
+        self,
+        aggregate_ids: Sequence[str],
+        after_versions: Mapping[str, int] | None = None,
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, list[StoredEvent]]:
+        """
+        Return events for several aggregates with a single query.
+
+        Ids sharing an ``after_version`` share one ``$in`` clause.
+
+        Args:
+            aggregate_ids: The aggregate IDs.
+            after_versions: Per-aggregate ``after_version``; missing ids
+                default to 0.
+            specification: Optional specification for additional filtering.
+
+        Returns:
+            Dict of aggregate ID to its events in version order.
+        """
+        results: dict[str, list[StoredEvent]] = {aid: [] for aid in aggregate_ids}
+        if not results:
+            return results
+        by_version: dict[int, list[str]] = {}
+        for aid in results:
+            by_version.setdefault((after_versions or {}).get(aid, 0), []).append(aid)
+        clauses = [
+            {"aggregate_id": {"$in": ids}, "version": {"$gt": version}}
+            for version, ids in by_version.items()
+        ]
+        filter_query = self._merge_spec(
+            clauses[0] if len(clauses) == 1 else {"$or": clauses}, specification
+        )
+
+        coll = self._events_collection()
+        cursor = coll.find(filter_query).sort([("aggregate_id", 1), ("version", 1)])
+        async for doc in cursor:
+            event = self._doc_to_stored_event(doc)
+            results[event.aggregate_id].append(event)
+        return results
+
     async def get_by_aggregate(
         self,
         aggregate_id: str,
@@ -376,20 +457,69 @@ class MongoEventStore(IEventStore):
         """
 
         async def _stream() -> AsyncIterator[list[StoredEvent]]:
+            async for batch in self.stream_batches(
+                batch_size=batch_size, specification=specification
+            ):
+                yield batch.events
+
+        return _stream()
+
+    def stream_batches(
+        self,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: ISpecification[Any] | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
+        """
+        Stream events after *after* in ``(position, _id)`` order.
+
+        Satisfies IEventStore protocol. The cursor is applied as a keyset
+        filter, so resuming never skips or repeats events; each batch
+        carries the cursor to resume from.
+
+        Args:
+            after: Resume point; ``None`` starts from the first event.
+            batch_size: Number of events per batch.
+            specification: Optional specification for additional filtering.
+
+        Yields:
+            EventBatch instances.
+        """
+
+        async def _stream() -> AsyncGenerator[EventBatch, None]:
             coll = self._events_collection()
-            filter_query = self._merge_spec({}, specification)
-            cursor = coll.find(filter_query).sort("position", 1).batch_size(batch_size)
+            filter_query = self._merge_spec(self._after_filter(after), specification)
+            cursor = (
+                coll.find(filter_query)
+                .sort([("position", 1), ("_id", 1)])
+                .batch_size(batch_size)
+            )
             batch: list[StoredEvent] = []
             async for doc in cursor:
                 batch.append(self._doc_to_stored_event(doc))
                 if len(batch) >= batch_size:
-                    yield batch
+                    yield EventBatch(batch, EventCursor.after(batch[-1]))
                     batch = []
             if batch:
-                yield batch
+                yield EventBatch(batch, EventCursor.after(batch[-1]))
 
         return _stream()
 
+    @staticmethod
+    def _after_filter(after: EventCursor | None) -> dict[str, Any]:
+        """Keyset filter selecting the events that come after *after*."""
+        if after is None or after.position is None:
+            return {"position": {"$ne": None}}
+        if after.event_id is None:
+            return {"position": {"$gt": after.position}}
+        return {
+            "$or": [
+                {"position": {"$gt": after.position}},
+                {"position": after.position, "_id": {"$gt": after.event_id}},
+            ]
+        }
+
     async def get_events_from_position(
         self,
         position: int,
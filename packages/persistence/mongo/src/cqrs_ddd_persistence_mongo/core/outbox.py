@@ -7,10 +7,16 @@ consistency within the same transaction.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import uuid4
 
-from cqrs_ddd_core.ports.outbox import IOutboxStorage, OutboxMessage
+from cqrs_ddd_core.ports.outbox import (
+    IClaimingOutboxStorage,
+    IOutboxRetentionStorage,
+    OutboxMessage,
+    OutboxStats,
+)
 
 from ..exceptions import MongoPersistenceError
 from ..query_builder import MongoQueryBuilder
@@ -23,7 +29,7 @@ if TYPE_CHECKING:
     from ..connection import MongoConnectionManager
 
 
-class MongoOutboxStorage(IOutboxStorage):
+class MongoOutboxStorage(IClaimingOutboxStorage, IOutboxRetentionStorage):
     """
     Transactional outbox storage implementation using MongoDB.
 
@@ -39,14 +45,34 @@ class MongoOutboxStorage(IOutboxStorage):
             "retry_count": int,
             "error": str | None,
             "correlation_id": str,
-            "causation_id": str | None
+            "causation_id": str | None,
+            "claimed_by": str | None,
+            "lease_until": datetime | None,
+            "claim_token": str | None
         }
 
     The outbox can be used with a Unit of Work to ensure atomic
     message persistence within the same transaction as aggregate changes.
+
+    ``claim_pending`` leases a batch to one worker: it selects candidate
+    ids, stamps them with ``update_many`` (re-checking the lease, so two
+    workers never win the same document) and fetches back the documents
+    carrying this call's claim token.  Call ``ensure_indexes`` once to
+    create the supporting indexes.
+
+    ``purge_published`` removes old published messages in bounded chunks,
+    optionally copying them first into monthly archive collections named
+    ``outbox_messages_archive_YYYY_MM`` (by ``created_at``).
     """
 
     COLLECTION = "outbox_messages"
+    CLAIM_INDEX = "ix_outbox_claim"
+    PENDING_INDEX = "ix_outbox_pending_created"
+    _CLEARED_CLAIM: ClassVar[dict[str, Any]] = {
+        "claimed_by": None,
+        "lease_until": None,
+        "claim_token": None,
+    }
 
     def __init__(
         self,
@@ -173,25 +199,113 @@ class MongoOutboxStorage(IOutboxStorage):
                 query = {"$and": [query, spec_filter]}
 
         cursor = coll.find(query).sort("created_at", 1).limit(limit)
-        messages = []
-
-        async for doc in cursor:
-            message = OutboxMessage(
-                message_id=doc["_id"],
-                event_type=doc["event_type"],
-                payload=doc["payload"],
-                metadata=doc.get("metadata", {}),
-                created_at=doc["created_at"],
-                published_at=doc.get("published_at"),
-                error=doc.get("error"),
-                retry_count=doc.get("retry_count", 0),
-                correlation_id=doc.get("correlation_id", ""),
-                causation_id=doc.get("causation_id"),
-                tenant_id=doc.get("tenant_id"),
-            )
-            messages.append(message)
+        return [self._to_message(doc) async for doc in cursor]
 
-        return messages
+    async def ensure_indexes(self) -> None:
+        """Create the indexes used by ``claim_pending`` and ``get_stats``.
+
+        The claim index keys follow equality-sort-range order: ``status`` is
+        matched exactly, ``created_at`` drives the sort and ``lease_until``
+        is the expiry range check.  The partial index covers only pending
+        messages, so it stays small however many published messages are
+        retained.
+        """
+        coll = self._collection()
+        await coll.create_index(
+            [("status", 1), ("created_at", 1), ("lease_until", 1)],
+            name=self.CLAIM_INDEX,
+        )
+        await coll.create_index(
+            [("created_at", 1)],
+            name=self.PENDING_INDEX,
+            partialFilterExpression={"status": "pending"},
+        )
+
+    async def claim_pending(
+        self,
+        limit: int = 100,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: ISpecification[Any] | None = None,
+        max_retries: int | None = None,
+    ) -> list[OutboxMessage]:
+        """
+        Lease up to *limit* unclaimed pending messages to *worker_id*.
+
+        Messages whose lease has expired are eligible again.  Claims are
+        written outside any transaction so other workers see them at once.
+
+        Args:
+            limit: Maximum number of messages to claim.
+            uow: Optional Unit of Work (unused; claims are not transactional).
+            worker_id: Identifier of the claiming worker.
+            lease_seconds: How long the claim is held before it expires.
+            specification: Optional specification for additional filtering.
+            max_retries: When given, only claim previously failed messages
+                whose ``retry_count`` is below it.
+
+        Returns:
+            The claimed messages, ordered by creation time.
+        """
+        coll = self._collection()
+        now = datetime.now(timezone.utc)
+        claimable: dict[str, Any] = {
+            "status": "pending",
+            "$or": [{"lease_until": None}, {"lease_until": {"$lt": now}}],
+        }
+        if max_retries is not None:
+            claimable["error"] = {"$ne": None}
+            claimable["retry_count"] = {"$lt": max_retries}
+        if specification is not None:
+            builder = MongoQueryBuilder()
+            spec_filter = builder.build_match(specification)
+            if spec_filter:
+                claimable = {"$and": [claimable, spec_filter]}
+
+        cursor = coll.find(claimable, {"_id": 1}).sort("created_at", 1).limit(limit)
+        candidate_ids = [doc["_id"] async for doc in cursor]
+        if not candidate_ids:
+            return []
+
+        token = uuid4().hex
+        await coll.update_many(
+            {"$and": [{"_id": {"$in": candidate_ids}}, claimable]},
+            {
+                "$set": {
+                    "claimed_by": worker_id,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                    "claim_token": token,
+                }
+            },
+        )
+        cursor = coll.find({"_id": {"$in": candidate_ids}, "claim_token": token}).sort(
+            "created_at", 1
+        )
+        return [self._to_message(doc) async for doc in cursor]
+
+    async def release_claims(
+        self,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+        *,
+        worker_id: str,
+    ) -> None:
+        """
+        Give back claims held by *worker_id* without changing message status.
+
+        Args:
+            message_ids: IDs of claimed messages to release.
+            uow: Optional Unit of Work (unused; claims are not transactional).
+            worker_id: Identifier of the worker that holds the claims.
+        """
+        if not message_ids:
+            return
+        await self._collection().update_many(
+            {"_id": {"$in": message_ids}, "claimed_by": worker_id},
+            {"$set": dict(self._CLEARED_CLAIM)},
+        )
 
     async def mark_published(
         self,
@@ -214,6 +328,7 @@ class MongoOutboxStorage(IOutboxStorage):
             "$set": {
                 "status": "published",
                 "published_at": published_at,
+                **self._CLEARED_CLAIM,
             }
         }
         filter_query = {"_id": {"$in": message_ids}}
@@ -245,9 +360,145 @@ class MongoOutboxStorage(IOutboxStorage):
         result = coll.update_one(
             {"_id": message_id},
             {
-                "$set": {"status": "failed", "error": error},
+                "$set": {"status": "failed", "error": error, **self._CLEARED_CLAIM},
                 "$inc": {"retry_count": 1},
             },
             session=session,
         )
         await result
+
+    async def mark_failed_batch(
+        self,
+        failures: dict[str, str],
+        uow: UnitOfWork | None = None,
+    ) -> None:
+        """
+        Record several publication failures in one ``bulk_write``.
+
+        Falls back to individual updates for mongomock compatibility.
+
+        Args:
+            failures: Mapping of message ID to error description.
+            uow: Optional Unit of Work for transactional consistency.
+        """
+        if not failures:
+            return
+        coll = self._collection()
+        session = self._extract_session(uow)
+        try:
+            from pymongo import UpdateOne
+
+            await coll.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": message_id},
+                        {
+                            "$set": {
+                                "status": "failed",
+                                "error": error,
+                                **self._CLEARED_CLAIM,
+                            },
+                            "$inc": {"retry_count": 1},
+                        },
+                    )
+                    for message_id, error in failures.items()
+                ],
+                ordered=False,
+                session=session,
+            )
+        except (NotImplementedError, AttributeError, TypeError):
+            for message_id, error in failures.items():
+                await self.mark_failed(message_id, error, uow)
+
+    async def purge_published(
+        self,
+        older_than: datetime,
+        limit: int = 1000,
+        uow: UnitOfWork | None = None,
+        *,
+        archive: bool = False,
+    ) -> int:
+        """
+        Delete up to *limit* published messages created before *older_than*.
+
+        Args:
+            older_than: Only messages created before this instant are purged.
+            limit: Maximum number of messages removed by this call.
+            uow: Optional Unit of Work for transactional consistency.
+            archive: Copy the messages into monthly archive collections
+                before deleting them.
+
+        Returns:
+            The number of messages removed.
+        """
+        coll = self._collection()
+        session = self._extract_session(uow)
+        query = {"status": "published", "created_at": {"$lt": older_than}}
+        cursor = coll.find(query, session=session).sort("_id", 1).limit(limit)
+        docs = [doc async for doc in cursor]
+        if not docs:
+            return 0
+
+        if archive:
+            partitions: dict[str, list[dict[str, Any]]] = {}
+            for doc in docs:
+                name = self.archive_collection_name(doc["created_at"])
+                partitions.setdefault(name, []).append(doc)
+            db = self._db()
+            for name, chunk in partitions.items():
+                # Re-running after a partial failure must not trip on
+                # documents that were already archived.
+                await db[name].delete_many(
+                    {"_id": {"$in": [d["_id"] for d in chunk]}}, session=session
+                )
+                await db[name].insert_many(chunk, session=session)
+
+        result = await coll.delete_many(
+            {"_id": {"$in": [doc["_id"] for doc in docs]}}, session=session
+        )
+        return int(result.deleted_count)
+
+    async def get_stats(self, uow: UnitOfWork | None = None) -> OutboxStats:
+        """
+        Return message counts per status and the oldest pending message.
+
+        Args:
+            uow: Optional Unit of Work (unused for reads).
+        """
+        coll = self._collection()
+        session = self._extract_session(uow)
+        counts: dict[str, int] = {}
+        pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        async for row in coll.aggregate(pipeline, session=session):
+            counts[row["_id"]] = row["count"]
+
+        oldest = await coll.find_one(
+            {"status": "pending"}, sort=[("created_at", 1)], session=session
+        )
+        return OutboxStats(
+            pending=counts.get("pending", 0),
+            failed=counts.get("failed", 0),
+            published=counts.get("published", 0),
+            oldest_pending_at=oldest["created_at"] if oldest else None,
+        )
+
+    @classmethod
+    def archive_collection_name(cls, created_at: datetime) -> str:
+        """Name of the archive collection holding messages from *created_at*."""
+        return f"{cls.COLLECTION}_archive_{created_at:%Y_%m}"
+
+    @staticmethod
+    def _to_message(doc: dict[str, Any]) -> OutboxMessage:
+        return OutboxMessage(
+            message_id=doc["_id"],
+            event_type=doc["event_type"],
+            payload=doc["payload"],
+            metadata=doc.get("metadata", {}),
+            created_at=doc["created_at"],
+            published_at=doc.get("published_at"),
+            error=doc.get("error"),
+            retry_count=doc.get("retry_count", 0),
+            correlation_id=doc.get("correlation_id", ""),
+            causation_id=doc.get("causation_id"),
+            tenant_id=doc.get("tenant_id"),
+        )
@@ -0,0 +1,97 @@
+"""
+Change-stream wake-ups for the MongoDB transactional outbox.
+
+``MongoOutboxChangeStreamWatcher`` watches the outbox collection for
+inserts and calls ``on_change`` (typically ``BufferedOutbox.trigger``), so
+messages written by any process are published without waiting for the
+polling fallback.  Change streams require a replica set or sharded cluster.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from cqrs_ddd_core.ports.background_worker import IBackgroundWorker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .outbox import MongoOutboxStorage
+
+logger = logging.getLogger("cqrs_ddd.outbox")
+
+
+class MongoOutboxChangeStreamWatcher(IBackgroundWorker):
+    """
+    Calls ``on_change`` whenever a message is inserted into the outbox.
+
+    Only ``insert`` events are watched, with ``full_document`` left off so
+    each event is small.  The stream is reopened after ``reconnect_delay``
+    seconds if it fails, and ``on_change`` is also called after every
+    (re)open so inserts made while the stream was down are not missed.
+
+    Usage::
+
+        outbox = BufferedOutbox(storage=mongo_outbox, broker=broker)
+        watcher = MongoOutboxChangeStreamWatcher(mongo_outbox, outbox.trigger)
+        await outbox.start()
+        await watcher.start()
+    """
+
+    def __init__(
+        self,
+        storage: MongoOutboxStorage,
+        on_change: Callable[[], None],
+        *,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._storage = storage
+        self._on_change = on_change
+        self.reconnect_delay = reconnect_delay
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start watching in a background task."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("MongoOutboxChangeStreamWatcher started")
+
+    async def stop(self) -> None:
+        """Stop watching and close the change stream."""
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("MongoOutboxChangeStreamWatcher stopped")
+
+    async def _run_loop(self) -> None:
+        while self._running:
+            try:
+                await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Outbox change stream failed: %s (reopening in %.1fs)",
+                    exc,
+                    self.reconnect_delay,
+                )
+            if self._running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _watch(self) -> None:
+        coll = self._storage._collection()
+        pipeline = [{"$match": {"operationType": "insert"}}]
+        async with coll.watch(pipeline) as stream:
+            # Catch up on anything inserted while we were not watching
+            self._on_change()
+            async for _change in stream:
+                self._on_change()
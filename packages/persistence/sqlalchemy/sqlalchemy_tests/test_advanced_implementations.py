@@ -308,3 +308,31 @@ async def test_snapshot_store(session_factory):
 
         snap_after = await store.get_latest_snapshot(agg_type, agg_id)
         assert snap_after is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not HAS_ADVANCED_CORE, reason="cqrs-ddd-advanced-core not installed"
+)
+async def test_snapshot_store_get_latest_snapshots(session_factory):
+    """Batch lookup returns the latest snapshot per aggregate."""
+
+    async with session_factory() as session:
+
+        def uow_factory():
+            return SQLAlchemyUnitOfWork(session=session)
+
+        store = SQLAlchemySnapshotStore(uow_factory)
+        await store.save_snapshot("Order", "o1", {"total": 100}, 1)
+        await store.save_snapshot("Order", "o1", {"total": 150}, 4)
+        await store.save_snapshot("Order", "o2", {"total": 200}, 2)
+        await store.save_snapshot("Invoice", "o3", {"total": 300}, 1)
+        await session.commit()
+
+        snapshots = await store.get_latest_snapshots("Order", ["o1", "o2", "o3"])
+
+        assert set(snapshots) == {"o1", "o2"}
+        assert snapshots["o1"]["version"] == 4
+        assert snapshots["o1"]["snapshot_data"] == {"total": 150}
+        assert snapshots["o2"]["version"] == 2
+        assert await store.get_latest_snapshots("Order", []) == {}
@@ -0,0 +1,140 @@
+"""PostgreSQL integration tests for SQLAlchemyEventStore appends.
+
+Cover the sequence ``INSERT ... RETURNING`` path and the asyncpg ``COPY``
+path, neither of which runs on SQLite.  Require asyncpg and testcontainers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("testcontainers")
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+from cqrs_ddd_core.ports.event_store import StoredEvent
+from cqrs_ddd_core.primitives.exceptions import OptimisticConcurrencyError
+from cqrs_ddd_persistence_sqlalchemy import (
+    Base,
+    SQLAlchemyEventStore,
+    StoredEventModel,
+)
+
+# Naive on purpose: ``occurred_at`` is a timezone-less DateTime column
+_OCCURRED_AT = datetime(2024, 1, 10, 12, 0)  # noqa: DTZ001
+
+
+@pytest.fixture(scope="module")
+def postgres_url() -> Iterator[str]:
+    with PostgresContainer("postgres:16-alpine", driver="asyncpg") as postgres:
+        yield postgres.get_connection_url()
+
+
+@pytest.fixture
+async def session_factory(
+    postgres_url: str,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(postgres_url)
+    tables = [StoredEventModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=tables)
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _stored(aggregate_id: str, version: int) -> StoredEvent:
+    return StoredEvent(
+        event_id=f"{aggregate_id}-{version}",
+        event_type="Updated",
+        aggregate_id=aggregate_id,
+        aggregate_type="Agg",
+        version=version,
+        payload={"v": version, "tags": ["a", "b"]},
+        metadata={"m": 1},
+        occurred_at=_OCCURRED_AT,
+        correlation_id="corr-1",
+    )
+
+
+def _record_statements(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(session.get_bind(), "before_cursor_execute", _record)
+    return statements
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_append_batch_uses_sequence_insert_returning(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        store = SQLAlchemyEventStore(session)
+        statements = _record_statements(session)
+
+        positions = await store.append_batch([_stored("agg-1", v) for v in (1, 2, 3)])
+        await store.append(_stored("agg-1", 4))
+        await session.commit()
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO event_store")]
+        assert len(inserts) == 2
+        assert all("RETURNING" in s for s in inserts)
+        assert positions == list(range(positions[0], positions[0] + 3))
+        events = await store.get_events("agg-1")
+        assert [e.position for e in events[:3]] == positions
+        assert events[3].position > positions[-1]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_append_batch_copies_large_batches(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        store = SQLAlchemyEventStore(session, copy_threshold=3)
+        statements = _record_statements(session)
+
+        positions = await store.append_batch([_stored("agg-1", v) for v in range(1, 6)])
+        await session.commit()
+
+        # Rows went through COPY; only the sequence reservation ran as SQL
+        assert not [s for s in statements if s.startswith("INSERT")]
+        assert any("generate_series" in s for s in statements)
+        assert positions == sorted(positions)
+        assert len(set(positions)) == 5
+
+        events = await store.get_events("agg-1")
+        assert [e.position for e in events] == positions
+        assert events[0].payload == {"v": 1, "tags": ["a", "b"]}
+        assert events[0].metadata == {"m": 1}
+        assert events[0].occurred_at == _OCCURRED_AT
+        assert events[0].correlation_id == "corr-1"
+        assert await store.get_latest_position() == positions[-1]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_copy_duplicate_version_conflicts(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        store = SQLAlchemyEventStore(session, copy_threshold=1)
+        await store.append_batch([_stored("agg-1", 1)])
+        await session.commit()
+
+        with pytest.raises(OptimisticConcurrencyError):
+            await store.append_batch([_stored("agg-1", 2), _stored("agg-1", 1)])
+        await session.rollback()
+
+        assert [e.version for e in await store.get_events("agg-1")] == [1]
@@ -0,0 +1,129 @@
+"""Tests for PostgreSQL LISTEN/NOTIFY outbox wake-ups (fake asyncpg driver)."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cqrs_ddd_core.ports.outbox import OutboxMessage
+from cqrs_ddd_persistence_sqlalchemy import (
+    DEFAULT_OUTBOX_CHANNEL,
+    PostgresOutboxNotifier,
+    SQLAlchemyOutboxStorage,
+    SQLAlchemyPersistenceError,
+)
+
+
+class FakeDriver:
+    """Subset of ``asyncpg.Connection`` used by the notifier."""
+
+    def __init__(self) -> None:
+        self.listeners: dict[str, Any] = {}
+        self.termination_listeners: list[Any] = []
+
+    async def add_listener(self, channel: str, callback: Any) -> None:
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel: str, callback: Any) -> None:
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback: Any) -> None:
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback: Any) -> None:
+        self.termination_listeners.remove(callback)
+
+    def notify(self, channel: str) -> None:
+        self.listeners[channel](self, 4242, channel, "")
+
+    def terminate(self) -> None:
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+class FakeEngine:
+    def __init__(self, driver: str = "asyncpg") -> None:
+        self.dialect = SimpleNamespace(name="postgresql", driver=driver)
+        self.drivers: list[FakeDriver] = []
+
+    @contextlib.asynccontextmanager
+    async def connect(self) -> Any:
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        raw = SimpleNamespace(driver_connection=driver)
+        yield SimpleNamespace(get_raw_connection=AsyncMock(return_value=raw))
+
+
+async def _until(predicate: Any) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_notifier_triggers_on_notify_and_reconnects() -> None:
+    engine = FakeEngine()
+    calls = 0
+
+    def _trigger() -> None:
+        nonlocal calls
+        calls += 1
+
+    notifier = PostgresOutboxNotifier(engine, _trigger, reconnect_delay=0)  # type: ignore[arg-type]
+    await notifier.start()
+    try:
+        await _until(lambda: engine.drivers and engine.drivers[0].listeners)
+        assert calls == 1  # catch-up after connecting
+
+        engine.drivers[0].notify(DEFAULT_OUTBOX_CHANNEL)
+        assert calls == 2
+
+        engine.drivers[0].terminate()
+        await _until(lambda: len(engine.drivers) == 2 and engine.drivers[1].listeners)
+        assert calls == 3
+        assert engine.drivers[0].listeners == {}
+    finally:
+        await notifier.stop()
+    assert engine.drivers[1].listeners == {}
+
+
+def test_notifier_requires_asyncpg() -> None:
+    with pytest.raises(SQLAlchemyPersistenceError, match="asyncpg"):
+        PostgresOutboxNotifier(FakeEngine(driver="psycopg"), lambda: None)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_storage_emits_pg_notify_on_postgresql() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.get_bind.return_value = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql")
+    )
+    storage = SQLAlchemyOutboxStorage(session, notify_channel="outbox_ch")
+
+    await storage.save_messages([OutboxMessage(message_id="m-1")])
+
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.call_args.args[0])
+    assert "pg_notify" in sql
+
+
+@pytest.mark.asyncio
+async def test_storage_skips_notify_on_other_dialects() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.get_bind.return_value = SimpleNamespace(
+        dialect=SimpleNamespace(name="sqlite")
+    )
+    storage = SQLAlchemyOutboxStorage(session, notify_channel="outbox_ch")
+
+    await storage.save_messages([OutboxMessage(message_id="m-1")])
+
+    session.execute.assert_not_called()
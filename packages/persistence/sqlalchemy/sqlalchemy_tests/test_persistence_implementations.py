@@ -1,11 +1,12 @@
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from unittest.mock import AsyncMock
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, event, select, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from cqrs_ddd_core.ports.event_store import StoredEvent
+from cqrs_ddd_core.ports.event_store import EventCursor, StoredEvent
 from cqrs_ddd_core.ports.outbox import OutboxMessage
 from cqrs_ddd_persistence_sqlalchemy import (
     Base,
@@ -13,6 +14,7 @@ from cqrs_ddd_persistence_sqlalchemy import (
     SQLAlchemyEventStore,
     SQLAlchemyOutboxStorage,
     SQLAlchemyUnitOfWork,
+    StoredEventModel,
 )
 from cqrs_ddd_persistence_sqlalchemy import (
     OutboxMessage as OutboxMessageModel,
@@ -151,6 +153,159 @@ async def test_outbox_storage(
         assert model.retry_count == 1
 
 
+@pytest.mark.asyncio
+async def test_outbox_claim_pending_gives_disjoint_batches(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        storage = SQLAlchemyOutboxStorage(session)
+        await storage.save_messages(
+            [OutboxMessage(message_id=f"claim-{i}", event_type="E") for i in range(5)]
+        )
+        await session.commit()
+
+        first = await storage.claim_pending(limit=3, worker_id="w1")
+        await session.commit()
+        second = await storage.claim_pending(limit=3, worker_id="w2")
+        await session.commit()
+
+        assert [m.message_id for m in first] == ["claim-0", "claim-1", "claim-2"]
+        assert [m.message_id for m in second] == ["claim-3", "claim-4"]
+        assert await storage.claim_pending(limit=3, worker_id="w3") == []
+
+        # Releasing only affects the caller's own claims
+        await storage.release_claims(["claim-0", "claim-3"], worker_id="w1")
+        await storage.mark_published(["claim-1"])
+        await session.commit()
+
+        third = await storage.claim_pending(limit=10, worker_id="w3")
+        assert [m.message_id for m in third] == ["claim-0"]
+
+
+@pytest.mark.asyncio
+async def test_outbox_claim_pending_max_retries_claims_only_retryable(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        storage = SQLAlchemyOutboxStorage(session)
+        await storage.save_messages(
+            [
+                OutboxMessage(message_id="fresh", event_type="E"),
+                OutboxMessage(
+                    message_id="exhausted", event_type="E", error="x", retry_count=3
+                ),
+                OutboxMessage(
+                    message_id="retryable", event_type="E", error="x", retry_count=1
+                ),
+            ]
+        )
+        await session.commit()
+
+        claimed = await storage.claim_pending(limit=1, worker_id="w1", max_retries=3)
+        await session.commit()
+
+        assert [m.message_id for m in claimed] == ["retryable"]
+        rest = await storage.claim_pending(limit=10, worker_id="w2")
+        assert [m.message_id for m in rest] == ["fresh", "exhausted"]
+
+
+@pytest.mark.asyncio
+async def test_outbox_mark_failed_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        storage = SQLAlchemyOutboxStorage(session)
+        await storage.save_messages(
+            [OutboxMessage(message_id=f"fail-{i}") for i in range(3)]
+        )
+        await session.commit()
+
+        await storage.mark_failed_batch({"fail-0": "timeout", "fail-2": "refused"})
+        await session.commit()
+
+        result = await session.execute(
+            select(OutboxMessageModel).order_by(OutboxMessageModel.event_id)
+        )
+        rows = {m.event_id: m for m in result.scalars()}
+        assert rows["fail-0"].error == "timeout"
+        assert rows["fail-2"].error == "refused"
+        assert rows["fail-0"].retry_count == rows["fail-2"].retry_count == 1
+        assert rows["fail-1"].status == OutboxStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_outbox_claim_pending_reclaims_expired_leases(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_factory() as session:
+        storage = SQLAlchemyOutboxStorage(session)
+        await storage.save_messages([OutboxMessage(message_id="lease-1")])
+        await session.commit()
+
+        claimed = await storage.claim_pending(worker_id="w1", lease_seconds=-1)
+        await session.commit()
+        assert len(claimed) == 1
+
+        reclaimed = await storage.claim_pending(worker_id="w2")
+        await session.commit()
+        assert [m.message_id for m in reclaimed] == ["lease-1"]
+
+        result = await session.execute(
+            select(OutboxMessageModel).where(OutboxMessageModel.event_id == "lease-1")
+        )
+        assert result.scalar_one().claimed_by == "w2"
+
+
+@pytest.mark.asyncio
+async def test_outbox_purge_published_and_stats(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    # Naive on purpose: SQLite DateTime columns round-trip without tzinfo
+    jan = datetime(2024, 1, 10)  # noqa: DTZ001
+    feb = datetime(2024, 2, 10)  # noqa: DTZ001
+    async with session_factory() as session:
+        storage = SQLAlchemyOutboxStorage(session)
+        await storage.save_messages(
+            [
+                OutboxMessage(message_id="jan-1", created_at=jan),
+                OutboxMessage(message_id="jan-2", created_at=jan),
+                OutboxMessage(message_id="feb-1", created_at=feb),
+                OutboxMessage(message_id="pending", created_at=jan),
+            ]
+        )
+        await storage.mark_published(["jan-1", "jan-2", "feb-1"])
+        await session.commit()
+
+        stats = await storage.get_stats()
+        assert (stats.pending, stats.published, stats.failed) == (1, 3, 0)
+        assert stats.oldest_pending_at == jan
+
+        cutoff = datetime(2024, 3, 1)  # noqa: DTZ001
+        with pytest.raises(ValueError, match="UnitOfWork"):
+            await storage.purge_published(cutoff, limit=2)
+
+        chunks = []
+        for _ in range(3):
+            async with SQLAlchemyUnitOfWork(session_factory=session_factory) as uow:
+                chunks.append(
+                    await storage.purge_published(cutoff, 2, uow, archive=True)
+                )
+        assert chunks == [2, 1, 0]
+
+    # Every chunk was committed by its own unit of work
+    async with session_factory() as session:
+        stats = await SQLAlchemyOutboxStorage(session).get_stats()
+        assert (stats.pending, stats.published) == (1, 0)
+        jan_rows = await session.execute(
+            text("SELECT event_id FROM outbox_archive_2024_01")
+        )
+        feb_rows = await session.execute(
+            text("SELECT event_id FROM outbox_archive_2024_02")
+        )
+        assert sorted(r.event_id for r in jan_rows) == ["jan-1", "jan-2"]
+        assert [r.event_id for r in feb_rows] == ["feb-1"]
+
+
 @pytest.mark.asyncio
 async def test_event_store(
     session_factory: async_sessionmaker[AsyncSession],
@@ -219,3 +374,163 @@ async def test_event_store(
         async for evt in store.get_events_from_position(0, limit=5):
             collected.append(evt)
         assert len(collected) >= 0
+
+
+def _stored(aggregate_id: str, version: int) -> StoredEvent:
+    return StoredEvent(
+        event_id=f"{aggregate_id}-{version}",
+        event_type="Updated",
+        aggregate_id=aggregate_id,
+        aggregate_type="Agg",
+        version=version,
+        payload={"v": version},
+        metadata={"m": 1},
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_store_append_batch_returns_positions(
+    session: AsyncSession,
+) -> None:
+    store = SQLAlchemyEventStore(session, copy_threshold=1)
+
+    await store.append(_stored("agg-1", 1))
+    positions = await store.append_batch([_stored("agg-1", v) for v in (2, 3, 4)])
+    assert await store.append_batch([]) == []
+    await session.commit()
+
+    assert positions == [2, 3, 4]
+    # Core inserts: nothing tracked by the ORM session
+    assert len(session.identity_map) == 0
+    events = await store.get_events("agg-1")
+    assert [e.position for e in events] == [1, 2, 3, 4]
+    assert events[1].payload == {"v": 2}
+    assert events[1].metadata == {"m": 1}
+    assert await store.get_latest_position() == 4
+
+
+@pytest.mark.asyncio
+async def test_event_store_duplicate_version_conflicts(
+    session: AsyncSession,
+) -> None:
+    from cqrs_ddd_core.primitives.exceptions import OptimisticConcurrencyError
+
+    store = SQLAlchemyEventStore(session)
+    await store.append_batch([_stored("agg-1", 1), _stored("agg-2", 1)])
+    await session.commit()
+
+    duplicate = StoredEvent(
+        event_type="Updated", aggregate_id="agg-1", aggregate_type="Agg", version=1
+    )
+    with pytest.raises(OptimisticConcurrencyError):
+        await store.append_batch([_stored("agg-1", 2), duplicate])
+    await session.rollback()
+
+    assert [e.version for e in await store.get_events("agg-1")] == [1]
+
+
+@pytest.mark.asyncio
+async def test_event_store_position_collision_is_not_a_version_conflict(
+    session: AsyncSession,
+) -> None:
+    from cqrs_ddd_core.primitives.exceptions import (
+        ConcurrencyError,
+        EventStoreError,
+    )
+
+    store = SQLAlchemyEventStore(session)
+    await store.append_batch([_stored("agg-1", 1)])
+    await session.commit()
+
+    # A concurrent writer that read the same max position
+    store._next_free_position = AsyncMock(return_value=1)  # type: ignore[method-assign]
+    with pytest.raises(EventStoreError, match="collided") as exc_info:
+        await store.append_batch([_stored("agg-2", 1)])
+    assert not isinstance(exc_info.value, ConcurrencyError)
+    await session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_event_store_streams_with_one_query(
+    session: AsyncSession,
+) -> None:
+    store = SQLAlchemyEventStore(session)
+    await store.append_batch([_stored("agg-1", v) for v in range(1, 6)])
+    await session.commit()
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        batches = [b async for b in store.get_all_streaming(batch_size=2)]
+        tail = [e async for e in store.get_events_from_position(2, limit=2)]
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert [[e.position for e in b] for b in batches] == [[1, 2], [3, 4], [5]]
+    assert batches[0][0].payload == {"v": 1}
+    assert [e.position for e in tail] == [3, 4, 5]
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_event_store_stream_batches_resumes_across_gaps(
+    session: AsyncSession,
+) -> None:
+    store = SQLAlchemyEventStore(session)
+    await store.append_batch([_stored("agg-1", v) for v in range(1, 7)])
+    # Rolled-back appends leave holes in the position sequence
+    await session.execute(
+        delete(StoredEventModel).where(StoredEventModel.position.in_([2, 3, 5]))
+    )
+    await session.commit()
+
+    batches = [b async for b in store.stream_batches(batch_size=2)]
+    assert [[e.position for e in b.events] for b in batches] == [[1, 4], [6]]
+    assert batches[0].cursor == EventCursor(4, "agg-1-4")
+
+    resumed = [b async for b in store.stream_batches(batches[0].cursor)]
+    assert [e.position for e in resumed[0].events] == [6]
+    checkpoint = [b async for b in store.stream_batches(EventCursor(4))]
+    assert [e.position for e in checkpoint[0].events] == [6]
+    assert [b async for b in store.stream_batches(batches[-1].cursor)] == []
+
+
+@pytest.mark.asyncio
+async def test_event_store_get_events_for_aggregates_uses_one_query(
+    session: AsyncSession,
+) -> None:
+    store = SQLAlchemyEventStore(session)
+    await store.append_batch(
+        [
+            _stored(aggregate_id, v)
+            for aggregate_id in ("a", "b", "c")
+            for v in (1, 2, 3)
+        ]
+    )
+    await session.commit()
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        events = await store.get_events_for_aggregates(
+            ["a", "b", "c", "missing"], {"b": 2, "c": 1}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert [e.version for e in events["a"]] == [1, 2, 3]
+    assert [e.version for e in events["b"]] == [3]
+    assert [e.version for e in events["c"]] == [2, 3]
+    assert events["missing"] == []
+    assert len(statements) == 1
+    assert await store.get_events_for_aggregates([]) == {}
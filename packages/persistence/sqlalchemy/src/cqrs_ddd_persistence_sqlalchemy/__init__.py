@@ -14,6 +14,7 @@ from .core.models import (
     StoredEventModel,
 )
 from .core.outbox import SQLAlchemyOutboxStorage
+from .core.outbox_notifier import DEFAULT_OUTBOX_CHANNEL, PostgresOutboxNotifier
 from .core.repository import SQLAlchemyRepository
 from .core.uow import SQLAlchemyUnitOfWork
 from .exceptions import (
@@ -57,6 +58,8 @@ __all__ = [
     "SQLAlchemyUnitOfWork",
     "SQLAlchemyEventStore",
     "SQLAlchemyOutboxStorage",
+    "PostgresOutboxNotifier",
+    "DEFAULT_OUTBOX_CHANNEL",
     "Base",
     "OutboxMessage",
     "StoredEventModel",
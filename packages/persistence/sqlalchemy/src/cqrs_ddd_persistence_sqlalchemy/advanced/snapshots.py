@@ -6,13 +6,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 
 from ..compat import require_advanced
 from ..specifications.compiler import build_sqla_filter
 from .models import SnapshotModel
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from cqrs_ddd_core.domain.specification import ISpecification
@@ -109,6 +111,45 @@ class SQLAlchemySnapshotStore:
         if not model:
             return None
 
+        return self._to_dict(model)
+
+    async def get_latest_snapshots(
+        self,
+        aggregate_type: str,
+        aggregate_ids: Sequence[Any],
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve the most recent snapshot of each aggregate in one query."""
+        ids = list(dict.fromkeys(str(aggregate_id) for aggregate_id in aggregate_ids))
+        if not ids:
+            return {}
+        latest = self._apply_spec(
+            select(
+                SnapshotModel.aggregate_id,
+                func.max(SnapshotModel.version).label("version"),
+            )
+            .where(
+                SnapshotModel.aggregate_id.in_(ids),
+                SnapshotModel.aggregate_type == aggregate_type,
+            )
+            .group_by(SnapshotModel.aggregate_id),
+            specification,
+        ).subquery()
+        stmt = select(SnapshotModel).join(
+            latest,
+            (SnapshotModel.aggregate_id == latest.c.aggregate_id)
+            & (SnapshotModel.version == latest.c.version),
+        )
+        stmt = self._apply_spec(
+            stmt.where(SnapshotModel.aggregate_type == aggregate_type), specification
+        )
+        session = await self._get_session()
+        result = await session.execute(stmt)
+        return {model.aggregate_id: self._to_dict(model) for model in result.scalars()}
+
+    @staticmethod
+    def _to_dict(model: SnapshotModel) -> dict[str, Any]:
         return {
             "snapshot_data": model.snapshot_data,
             "version": model.version,
@@ -3,6 +3,15 @@ SQLAlchemy implementation of the Event Store.
 
 Uses SQLAlchemy Sequence for auto-incremented ``position`` field,
 ensuring atomicity and preventing race conditions without any migration logic.
+On databases without sequences (SQLite) the store assigns positions itself.
+
+Appends bypass the ORM unit of work: rows are written with Core ``INSERT``
+statements (executemany / ``insertmanyvalues`` with ``RETURNING``), or with
+``COPY`` on PostgreSQL + asyncpg for large batches.
+
+Reads select plain columns into ``StoredEvent`` without building ORM
+entities; the streaming reads use one server-side cursor (``yield_per``)
+so replays run in constant memory.
 
 All read methods accept an optional ``specification`` parameter.  When
 provided the specification is compiled to a SQLAlchemy WHERE clause via
@@ -11,30 +20,84 @@ provided the specification is compiled to a SQLAlchemy WHERE clause via
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import json
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, insert, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
 
-from cqrs_ddd_core.ports.event_store import IEventStore, StoredEvent
+from cqrs_ddd_core.ports.event_store import (
+    EventBatch,
+    EventCursor,
+    IEventStore,
+    StoredEvent,
+)
+from cqrs_ddd_core.primitives.exceptions import (
+    EventStoreError,
+    OptimisticConcurrencyError,
+)
 
 from ..specifications.compiler import build_sqla_filter
 from .models import StoredEventModel
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
 
+    from sqlalchemy import Select, Table
+    from sqlalchemy.engine import Dialect
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from cqrs_ddd_core.domain.specification import ISpecification
 
+# Insert columns in COPY order; ``position`` is appended when assigned here
+_APPEND_COLUMNS = (
+    "event_id",
+    "event_type",
+    "aggregate_id",
+    "aggregate_type",
+    "version",
+    "schema_version",
+    "payload",
+    "metadata",
+    "occurred_at",
+    "correlation_id",
+    "causation_id",
+    "tenant_id",
+)
+_UNIQUE_VIOLATION = "23505"
+
 
 class SQLAlchemyEventStore(IEventStore):
     """
     Event Store implementation using SQLAlchemy.
+
+    ``append`` / ``append_batch`` write with Core statements instead of ORM
+    models, so no per-row identity-map or flush bookkeeping is paid.  A
+    duplicate ``(aggregate_id, version)`` (or event id) raises
+    :class:`OptimisticConcurrencyError`.
+
+    On databases without sequences (SQLite) positions are numbered from the
+    current maximum, so appends from concurrent transactions can pick the
+    same positions.  That collision is not a version conflict and raises
+    :class:`EventStoreError`; serialise writers (SQLite allows only one at
+    a time anyway) or retry the append.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        copy_threshold: int | None = None,
+    ) -> None:
+        """
+        Args:
+            session: The session whose transaction appends join.
+            copy_threshold: On PostgreSQL with asyncpg, batches of at least
+                this many events are written with ``COPY``.  ``None``
+                (default) always uses ``INSERT``.
+        """
         self.session = session
+        self.copy_threshold = copy_threshold
 
     # -- specification helper ------------------------------------------------
 
@@ -59,48 +122,164 @@ class SQLAlchemyEventStore(IEventStore):
         Position is auto-incremented by database Sequence, ensuring
         atomicity and no race conditions.
         """
-        model = StoredEventModel(
-            event_id=stored_event.event_id,
-            event_type=stored_event.event_type,
-            aggregate_id=stored_event.aggregate_id,
-            aggregate_type=stored_event.aggregate_type,
-            version=stored_event.version,
-            schema_version=stored_event.schema_version,
-            payload=stored_event.payload,
-            metadata_=stored_event.metadata,
-            occurred_at=stored_event.occurred_at,
-            correlation_id=stored_event.correlation_id,
-            causation_id=stored_event.causation_id,
-            tenant_id=stored_event.tenant_id,
-            # Position handled by Sequence - don't set manually
-        )
-        self.session.add(model)
+        await self._insert([stored_event])
 
-    async def append_batch(self, events: list[StoredEvent]) -> None:
+    async def append_batch(self, events: list[StoredEvent]) -> list[int]:
         """
         Append multiple stored events atomically.
 
         Positions are auto-incremented by database Sequence for each event.
+
+        Returns:
+            The positions assigned to *events*, in order.
+
+        Raises:
+            OptimisticConcurrencyError: If an event conflicts with a stored
+                one (same ``aggregate_id`` and ``version``, or same id).
+            EventStoreError: If store-assigned positions collided with a
+                concurrent append (databases without sequences only).
         """
-        models = [
-            StoredEventModel(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                aggregate_id=event.aggregate_id,
-                aggregate_type=event.aggregate_type,
-                version=event.version,
-                schema_version=event.schema_version,
-                payload=event.payload,
-                metadata_=event.metadata,
-                occurred_at=event.occurred_at,
-                correlation_id=event.correlation_id,
-                causation_id=event.causation_id,
-                tenant_id=event.tenant_id,
-                # Position handled by Sequence - don't set manually
+        if not events:
+            return []
+        return await self._insert(events)
+
+    # -- append internals ----------------------------------------------------
+
+    async def _insert(self, events: list[StoredEvent]) -> list[int]:
+        table = cast("Table", StoredEventModel.__table__)
+        rows = [self._to_row(event) for event in events]
+        dialect = self.session.get_bind().dialect
+        try:
+            if self._use_copy(dialect, len(rows)):
+                return await self._copy(table, rows)
+            if dialect.supports_sequences:
+                stmt = insert(table).returning(
+                    table.c.position, sort_by_parameter_order=True
+                )
+                result = await self.session.execute(stmt, rows)
+                return [int(p) for p in result.scalars()]
+            # No sequences (SQLite): number the block after the current max
+            first = await self._next_free_position(table)
+            for i, row in enumerate(rows):
+                row["position"] = first + i
+            await self.session.execute(insert(table), rows)
+            return [row["position"] for row in rows]
+        except IntegrityError as exc:
+            if f"{table.name}.position" in str(exc.orig):
+                raise EventStoreError(
+                    "Event positions collided with a concurrent append; "
+                    f"retry the append: {exc.orig}"
+                ) from exc
+            raise OptimisticConcurrencyError(
+                f"Event append conflicts with a stored event: {exc.orig}"
+            ) from exc
+
+    def _use_copy(self, dialect: Dialect, count: int) -> bool:
+        return (
+            self.copy_threshold is not None
+            and count >= self.copy_threshold
+            and dialect.name == "postgresql"
+            and dialect.driver == "asyncpg"
+        )
+
+    async def _copy(self, table: Table, rows: list[dict[str, Any]]) -> list[int]:
+        """Reserve positions from the sequence, then ``COPY`` the rows in."""
+        seq = table.c.position.default
+        reserved = await self.session.execute(
+            select(seq.next_value()).select_from(  # type: ignore[union-attr]
+                func.generate_series(1, len(rows))
+            )
+        )
+        positions = sorted(int(p) for p in reserved.scalars())
+        columns = [*_APPEND_COLUMNS, "position"]
+        records = []
+        for row, position in zip(rows, positions, strict=True):
+            row["position"] = position
+            row["payload"] = json.dumps(row["payload"])
+            row["metadata"] = json.dumps(row["metadata"])
+            records.append(tuple(row[c] for c in columns))
+
+        conn = await self.session.connection()
+        raw = await conn.get_raw_connection()
+        driver: Any = raw.driver_connection
+        try:
+            await driver.copy_records_to_table(
+                table.name, schema_name=table.schema, records=records, columns=columns
             )
-            for event in events
-        ]
-        self.session.add_all(models)
+        except Exception as exc:
+            # COPY goes straight to asyncpg, so errors are not wrapped
+            if getattr(exc, "sqlstate", None) == _UNIQUE_VIOLATION:
+                raise OptimisticConcurrencyError(
+                    f"Event append conflicts with a stored event: {exc}"
+                ) from exc
+            raise
+        return positions
+
+    async def _next_free_position(self, table: Table) -> int:
+        result = await self.session.execute(
+            select(func.coalesce(func.max(table.c.position), 0))
+        )
+        return int(result.scalar_one()) + 1
+
+    @staticmethod
+    def _to_row(event: StoredEvent) -> dict[str, Any]:
+        return {
+            "event_id": event.event_id,
+            "event_type": event.event_type,
+            "aggregate_id": event.aggregate_id,
+            "aggregate_type": event.aggregate_type,
+            "version": event.version,
+            "schema_version": event.schema_version,
+            "payload": event.payload,
+            "metadata": event.metadata,
+            "occurred_at": event.occurred_at,
+            "correlation_id": event.correlation_id,
+            "causation_id": event.causation_id,
+            "tenant_id": event.tenant_id,
+        }
+
+    # -- reads -------------------------------------------------------------
+
+    @staticmethod
+    def _select_events() -> Select[Any]:
+        """Column select (no ORM entities) in ``_to_stored_event`` order."""
+        m = StoredEventModel
+        return select(
+            m.event_id,
+            m.event_type,
+            m.aggregate_id,
+            m.aggregate_type,
+            m.version,
+            m.schema_version,
+            m.payload,
+            m.metadata_,
+            m.occurred_at,
+            m.correlation_id,
+            m.causation_id,
+            m.position,
+            m.tenant_id,
+        )
+
+    async def _fetch(self, stmt: Select[Any]) -> list[StoredEvent]:
+        result = await self.session.execute(stmt)
+        return [self._to_stored_event(row) for row in result]
+
+    async def _stream(
+        self, stmt: Select[Any], batch_size: int
+    ) -> AsyncIterator[list[StoredEvent]]:
+        """
+        Run *stmt* on a server-side cursor, ``batch_size`` rows at a time.
+
+        One query serves the whole iteration and at most one batch is held
+        in memory.  The cursor lives on the session's connection, so do not
+        commit or close that session until iteration ends.
+        """
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        try:
+            async for rows in result.partitions():
+                yield [self._to_stored_event(row) for row in rows]
+        finally:
+            await result.close()
 
     async def get_events(
         self,
@@ -113,17 +292,50 @@ class SQLAlchemyEventStore(IEventStore):
         Return events for an aggregate after *after_version*.
         """
         stmt = (
-            select(StoredEventModel)
+            self._select_events()
             .where(
                 StoredEventModel.aggregate_id == aggregate_id,
                 StoredEventModel.version > after_version,
             )
             .order_by(StoredEventModel.version)
         )
-        stmt = self._apply_spec(stmt, specification)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_dataclass(m) for m in models]
+        return await self._fetch(self._apply_spec(stmt, specification))
+
+    async def get_events_for_aggregates(
+        self,
+        aggregate_ids: Sequence[str],
+        after_versions: Mapping[str, int] | None = None,
+        *,
+        specification: ISpecification[Any] | None = None,
+    ) -> dict[str, list[StoredEvent]]:
+        """
+        Return events for several aggregates with a single query.
+
+        Ids sharing an ``after_version`` (``0``, or a common snapshot
+        version) share one ``aggregate_id IN (...)`` term.
+        """
+        results: dict[str, list[StoredEvent]] = {aid: [] for aid in aggregate_ids}
+        if not results:
+            return results
+        by_version: dict[int, list[str]] = {}
+        for aid in results:
+            by_version.setdefault((after_versions or {}).get(aid, 0), []).append(aid)
+        m = StoredEventModel
+        stmt = (
+            self._select_events()
+            .where(
+                or_(
+                    *(
+                        and_(m.aggregate_id.in_(ids), m.version > version)
+                        for version, ids in by_version.items()
+                    )
+                )
+            )
+            .order_by(m.aggregate_id, m.version)
+        )
+        for event in await self._fetch(self._apply_spec(stmt, specification)):
+            results[event.aggregate_id].append(event)
+        return results
 
     async def get_by_aggregate(
         self,
@@ -135,17 +347,13 @@ class SQLAlchemyEventStore(IEventStore):
         """
         Return all events for an aggregate, optionally filtered by type.
         """
-        stmt = select(StoredEventModel).where(
+        stmt = self._select_events().where(
             StoredEventModel.aggregate_id == aggregate_id
         )
         if aggregate_type:
             stmt = stmt.where(StoredEventModel.aggregate_type == aggregate_type)
         stmt = stmt.order_by(StoredEventModel.version)
-        stmt = self._apply_spec(stmt, specification)
-
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_dataclass(m) for m in models]
+        return await self._fetch(self._apply_spec(stmt, specification))
 
     async def get_all(
         self,
@@ -155,14 +363,11 @@ class SQLAlchemyEventStore(IEventStore):
         """
         Return every stored event (for projections / catch-up).
 
-        For better performance with large event histories, use
-        :meth:`get_events_after` or :meth:`get_all_streaming`.
+        Loads the whole table; for large event histories use
+        :meth:`get_all_streaming` or :meth:`get_events_from_position`.
         """
-        stmt = select(StoredEventModel).order_by(StoredEventModel.occurred_at)
-        stmt = self._apply_spec(stmt, specification)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_dataclass(m) for m in models]
+        stmt = self._select_events().order_by(StoredEventModel.occurred_at)
+        return await self._fetch(self._apply_spec(stmt, specification))
 
     async def get_events_after(
         self,
@@ -178,15 +383,12 @@ class SQLAlchemyEventStore(IEventStore):
         all events into memory.
         """
         stmt = (
-            select(StoredEventModel)
+            self._select_events()
             .where(StoredEventModel.position > position)
             .order_by(StoredEventModel.position)
             .limit(limit)
         )
-        stmt = self._apply_spec(stmt, specification)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_dataclass(m) for m in models]
+        return await self._fetch(self._apply_spec(stmt, specification))
 
     async def get_events_from_position(
         self,
@@ -198,22 +400,18 @@ class SQLAlchemyEventStore(IEventStore):
         """
         Stream events starting from a given position (exclusive).
 
-        Used by ProjectionWorker to resume after crash.
+        Used by ProjectionWorker to resume after crash.  A single
+        server-side cursor query; *limit* is the fetch size (default 1000).
         """
-        batch_size = limit if limit is not None else 1000
-        current = position
-        while True:
-            batch = await self.get_events_after(
-                current, batch_size, specification=specification
-            )
-            for e in batch:
-                yield e
-            if len(batch) < batch_size:
-                break
-            last = batch[-1]
-            current = (
-                last.position if last.position is not None else current + len(batch)
-            )
+        stmt = (
+            self._select_events()
+            .where(StoredEventModel.position > position)
+            .order_by(StoredEventModel.position)
+        )
+        stmt = self._apply_spec(stmt, specification)
+        async for batch in self._stream(stmt, limit or 1000):
+            for event in batch:
+                yield event
 
     async def get_latest_position(
         self,
@@ -225,8 +423,6 @@ class SQLAlchemyEventStore(IEventStore):
 
         Used for catch-up subscription mode.
         """
-        from sqlalchemy import func
-
         stmt = select(func.max(StoredEventModel.position))
         stmt = self._apply_spec(stmt, specification)
         result = await self.session.execute(stmt)
@@ -242,38 +438,72 @@ class SQLAlchemyEventStore(IEventStore):
         """
         Stream all events in batches for memory-efficient processing.
 
-        Yields batches until all events are consumed. Uses the position
-        field from StoredEvent for cursor-based iteration.
+        Events come in position order from one server-side cursor query,
+        ``batch_size`` rows per batch.
         """
-        offset = 0
-        while True:
-            batch = await self.get_events_after(
-                offset, batch_size, specification=specification
-            )
-            if not batch:
-                break
-            yield batch
-            offset += len(batch)
+        async for batch in self.stream_batches(
+            batch_size=batch_size, specification=specification
+        ):
+            yield batch.events
 
-    def _to_dataclass(self, model: StoredEventModel) -> StoredEvent:
+    async def stream_batches(
+        self,
+        after: EventCursor | None = None,
+        *,
+        batch_size: int = 1000,
+        specification: ISpecification[Any] | None = None,
+    ) -> AsyncGenerator[EventBatch, None]:
         """
-        Convert SQLAlchemy model to StoredEvent dataclass.
+        Stream events after *after* in ``(position, event_id)`` order.
 
-        Position is auto-generated by database Sequence, ensuring
-        atomicity and no race conditions.
+        A keyset query (``WHERE (position, event_id) > (:p, :id)``) on one
+        server-side cursor; each batch carries the cursor to resume from.
         """
+        m = StoredEventModel
+        stmt = self._select_events().where(m.position.is_not(None))
+        if after is not None and after.position is not None:
+            if after.event_id is None:
+                stmt = stmt.where(m.position > after.position)
+            else:
+                stmt = stmt.where(
+                    tuple_(m.position, m.event_id)
+                    > tuple_(after.position, after.event_id)
+                )
+        stmt = stmt.order_by(m.position, m.event_id)
+        stmt = self._apply_spec(stmt, specification)
+        async for events in self._stream(stmt, batch_size):
+            yield EventBatch(events, EventCursor.after(events[-1]))
+
+    @staticmethod
+    def _to_stored_event(row: Any) -> StoredEvent:
+        """Convert a ``_select_events`` row to a StoredEvent."""
+        (
+            event_id,
+            event_type,
+            aggregate_id,
+            aggregate_type,
+            version,
+            schema_version,
+            payload,
+            metadata,
+            occurred_at,
+            correlation_id,
+            causation_id,
+            position,
+            tenant_id,
+        ) = row
         return StoredEvent(
-            event_id=model.event_id,
-            event_type=model.event_type,
-            aggregate_id=model.aggregate_id,
-            aggregate_type=model.aggregate_type,
-            version=model.version,
-            schema_version=getattr(model, "schema_version", 1),
-            payload=model.payload,
-            metadata=model.metadata_,
-            occurred_at=model.occurred_at,
-            correlation_id=model.correlation_id,
-            causation_id=model.causation_id,
-            position=model.position,
-            tenant_id=model.tenant_id,
+            event_id=event_id,
+            event_type=event_type,
+            aggregate_id=aggregate_id,
+            aggregate_type=aggregate_type,
+            version=version,
+            schema_version=schema_version if schema_version is not None else 1,
+            payload=payload,
+            metadata=metadata,
+            occurred_at=occurred_at,
+            correlation_id=correlation_id,
+            causation_id=causation_id,
+            position=position,
+            tenant_id=tenant_id,
         )
@@ -8,7 +8,9 @@ from sqlalchemy import (
     Enum,
     Index,
     Integer,
+    Sequence,
     String,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -62,9 +64,19 @@ class OutboxMessage(Base):
     correlation_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     causation_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     tenant_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    # Lease held by a worker in claim mode (see SQLAlchemyOutboxStorage)
+    claimed_by: Mapped[str | None] = mapped_column(String, nullable=True)
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     __table_args__ = (
         Index("ix_outbox_pending_id", "status", "id"),
+        # Partial: stays small however many published rows are retained
+        Index(
+            "ix_outbox_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
         Index("ix_outbox_tracing", "correlation_id", "causation_id"),
         Index("ix_outbox_tenant_status", "tenant_id", "status"),
     )
@@ -76,7 +88,12 @@ class StoredEventModel(Base):
     Persists domain events for event sourcing and audit logs.
 
     The ``position`` column enables cursor-based pagination for efficient
-    projection processing without loading all events into memory.
+    projection processing without loading all events into memory.  It is
+    filled from ``event_store_position_seq`` on databases with sequences
+    (PostgreSQL) and by ``SQLAlchemyEventStore`` elsewhere.
+
+    ``(aggregate_id, version)`` is unique: two writers appending the same
+    aggregate version conflict instead of forking the stream.
 
     The ``tenant_id`` column enables multitenant isolation with database-level
     filtering, supporting B-tree indexes, Row-Level Security, and partitioning.
@@ -98,11 +115,15 @@ class StoredEventModel(Base):
     )
     causation_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     position: Mapped[int] = mapped_column(
-        Integer, autoincrement=True, unique=True, index=True, nullable=True
+        Integer,
+        Sequence("event_store_position_seq"),
+        unique=True,
+        index=True,
+        nullable=True,
     )
     tenant_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
 
     __table_args__ = (
-        Index("ix_event_store_aggregate", "aggregate_id", "version"),
+        Index("ix_event_store_aggregate", "aggregate_id", "version", unique=True),
         Index("ix_event_store_tenant_position", "tenant_id", "position"),
     )
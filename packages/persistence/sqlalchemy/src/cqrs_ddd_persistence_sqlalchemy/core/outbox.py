@@ -4,11 +4,28 @@ SQLAlchemy implementation of the transactional outbox storage.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
 
-from cqrs_ddd_core.ports.outbox import IOutboxStorage, OutboxMessage
+from cqrs_ddd_core.ports.outbox import (
+    IClaimingOutboxStorage,
+    IOutboxRetentionStorage,
+    OutboxMessage,
+    OutboxStats,
+)
 
 from ..specifications.compiler import build_sqla_filter
 from .models import OutboxMessage as OutboxMessageModel
@@ -21,13 +38,47 @@ if TYPE_CHECKING:
     from cqrs_ddd_core.ports.unit_of_work import UnitOfWork
 
 
-class SQLAlchemyOutboxStorage(IOutboxStorage):
+class SQLAlchemyOutboxStorage(IClaimingOutboxStorage, IOutboxRetentionStorage):
     """
     Transactional outbox storage implementation using SQLAlchemy.
+
+    ``claim_pending`` leases a batch to one worker with a single
+    ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING``
+    statement, so concurrent workers receive disjoint batches.  Requires a
+    backend with ``UPDATE ... RETURNING`` (PostgreSQL, SQLite >= 3.35).
+    Like the other methods it does not commit; commit the session to make
+    the claim visible to other workers.
+
+    ``purge_published`` deletes old published rows in bounded chunks,
+    optionally copying them first into time-partitioned archive tables
+    (``outbox_archive_YYYY_MM`` by default) that are created on demand.
+    ``purge_published`` requires a unit of work and runs on its session,
+    so give ``OutboxPurgeWorker`` a ``uow_factory`` and every chunk is
+    committed in its own transaction; ``get_stats`` uses ``uow.session``
+    when one is passed.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        notify_channel: str | None = None,
+        archive_table_format: str = "outbox_archive_{:%Y_%m}",
+    ) -> None:
+        """
+        Args:
+            session: Session whose transaction the outbox rows join.
+            notify_channel: On PostgreSQL, ``pg_notify`` this channel whenever
+                messages are saved so ``PostgresOutboxNotifier`` listeners in
+                other processes wake up on commit.  Ignored on other dialects.
+            archive_table_format: Format string applied to a message's
+                ``created_at`` to name its archive table.
+        """
         self.session = session
+        self.notify_channel = notify_channel
+        self.archive_table_format = archive_table_format
+        self._archive_metadata = MetaData()
+        self._archive_tables_ready: set[str] = set()
 
     async def save_messages(
         self,
@@ -54,6 +105,10 @@ class SQLAlchemyOutboxStorage(IOutboxStorage):
             )
             self.session.add(model)
 
+        if messages and self.notify_channel and self._is_postgresql():
+            # Delivered by PostgreSQL only when the transaction commits
+            await self.session.execute(select(func.pg_notify(self.notify_channel, "")))
+
     async def get_pending(
         self,
         limit: int = 100,
@@ -76,24 +131,80 @@ class SQLAlchemyOutboxStorage(IOutboxStorage):
                 where_clause = build_sqla_filter(OutboxMessageModel, spec_data)
                 stmt = stmt.where(where_clause)
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
-
-        return [
-            OutboxMessage(
-                message_id=m.event_id,
-                event_type=m.event_type,
-                payload=m.payload,
-                metadata=m.event_metadata or {},
-                created_at=m.created_at,
-                published_at=None,
-                error=m.error,
-                retry_count=m.retry_count,
-                correlation_id=m.correlation_id,
-                causation_id=m.causation_id,
-                tenant_id=m.tenant_id,
+        return [self._to_message(m) for m in result.scalars().all()]
+
+    async def claim_pending(
+        self,
+        limit: int = 100,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+        *,
+        worker_id: str,
+        lease_seconds: float = 30.0,
+        specification: ISpecification[Any] | None = None,
+        max_retries: int | None = None,
+    ) -> list[OutboxMessage]:
+        """
+        Claim up to *limit* unclaimed pending messages for *worker_id*.
+        """
+        now = datetime.now(timezone.utc)
+        candidates = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.status == OutboxStatus.PENDING,
+                or_(
+                    OutboxMessageModel.claimed_until.is_(None),
+                    OutboxMessageModel.claimed_until < now,
+                ),
+            )
+            .order_by(OutboxMessageModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if specification is not None:
+            spec_data = specification.to_dict()
+            if spec_data:
+                where_clause = build_sqla_filter(OutboxMessageModel, spec_data)
+                candidates = candidates.where(where_clause)
+        if max_retries is not None:
+            candidates = candidates.where(
+                OutboxMessageModel.error.is_not(None),
+                OutboxMessageModel.retry_count < max_retries,
             )
-            for m in models
-        ]
+
+        stmt = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(candidates.scalar_subquery()))
+            .values(
+                claimed_by=worker_id,
+                claimed_until=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(OutboxMessageModel)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        # RETURNING order is unspecified; restore creation order.
+        models = sorted(result.scalars().all(), key=lambda m: (m.created_at, m.id))
+        return [self._to_message(m) for m in models]
+
+    async def release_claims(
+        self,
+        message_ids: list[str],
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+        *,
+        worker_id: str,
+    ) -> None:
+        """
+        Give back claims held by *worker_id* without changing message status.
+        """
+        stmt = (
+            update(OutboxMessageModel)
+            .where(
+                OutboxMessageModel.event_id.in_(message_ids),
+                OutboxMessageModel.claimed_by == worker_id,
+            )
+            .values(claimed_by=None, claimed_until=None)
+        )
+        await self.session.execute(stmt)
 
     async def mark_published(
         self,
@@ -106,7 +217,7 @@ class SQLAlchemyOutboxStorage(IOutboxStorage):
         stmt = (
             update(OutboxMessageModel)
             .where(OutboxMessageModel.event_id.in_(message_ids))
-            .values(status=OutboxStatus.PUBLISHED)
+            .values(status=OutboxStatus.PUBLISHED, claimed_by=None, claimed_until=None)
         )
         await self.session.execute(stmt)
 
@@ -126,6 +237,162 @@ class SQLAlchemyOutboxStorage(IOutboxStorage):
                 status=OutboxStatus.FAILED,
                 error=error,
                 retry_count=OutboxMessageModel.retry_count + 1,
+                claimed_by=None,
+                claimed_until=None,
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def mark_failed_batch(
+        self,
+        failures: dict[str, str],
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Record several publication failures in one UPDATE statement.
+        """
+        if not failures:
+            return
+        stmt = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.event_id.in_(list(failures)))
+            .values(
+                status=OutboxStatus.FAILED,
+                error=case(failures, value=OutboxMessageModel.event_id),
+                retry_count=OutboxMessageModel.retry_count + 1,
+                claimed_by=None,
+                claimed_until=None,
             )
         )
         await self.session.execute(stmt)
+
+    async def purge_published(
+        self,
+        older_than: datetime,
+        limit: int = 1000,
+        uow: UnitOfWork | None = None,
+        *,
+        archive: bool = False,
+    ) -> int:
+        """
+        Delete up to *limit* published rows created before *older_than*.
+
+        The chunk runs on ``uow.session``; the caller commits it.  The
+        storage's own session is never used, so a purge cannot commit or
+        roll back unrelated work pending on it.
+
+        Raises:
+            ValueError: If no unit of work is given.
+        """
+        if uow is None:
+            raise ValueError(
+                "purge_published requires a UnitOfWork; "
+                "pass uow_factory to OutboxPurgeWorker."
+            )
+        session = self._session_for(uow)
+        model = OutboxMessageModel
+        result = await session.execute(
+            select(model.id, model.created_at)
+            .where(
+                model.status == OutboxStatus.PUBLISHED, model.created_at < older_than
+            )
+            .order_by(model.id)
+            .limit(limit)
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        if archive:
+            partitions: dict[str, list[int]] = {}
+            for row_id, created_at in rows:
+                name = self.archive_table_format.format(created_at)
+                partitions.setdefault(name, []).append(row_id)
+            columns = list(model.__table__.columns)
+            for name, ids in partitions.items():
+                table = await self._archive_table(session, name)
+                await session.execute(
+                    insert(table).from_select(
+                        [c.name for c in columns],
+                        select(*columns).where(model.id.in_(ids)),
+                    )
+                )
+
+        await session.execute(
+            delete(model)
+            .where(model.id.in_([row_id for row_id, _ in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        return len(rows)
+
+    async def get_stats(self, uow: UnitOfWork | None = None) -> OutboxStats:
+        """
+        Return row counts per status and the oldest pending row.
+        """
+        session = self._session_for(uow)
+        model = OutboxMessageModel
+        result = await session.execute(
+            select(model.status, func.count()).group_by(model.status)
+        )
+        counts: dict[OutboxStatus, int] = dict(result.all())
+        oldest = await session.scalar(
+            select(func.min(model.created_at)).where(
+                model.status == OutboxStatus.PENDING
+            )
+        )
+        return OutboxStats(
+            pending=counts.get(OutboxStatus.PENDING, 0),
+            failed=counts.get(OutboxStatus.FAILED, 0),
+            published=counts.get(OutboxStatus.PUBLISHED, 0),
+            oldest_pending_at=oldest,
+        )
+
+    async def _archive_table(self, session: AsyncSession, name: str) -> Table:
+        table = self._archive_metadata.tables.get(name)
+        if table is None:
+            # Same columns as the outbox, without its indexes and constraints
+            table = Table(
+                name,
+                self._archive_metadata,
+                *(
+                    Column(
+                        c.name,
+                        c.type,
+                        primary_key=c.primary_key,
+                        autoincrement=False,
+                        nullable=c.nullable,
+                    )
+                    for c in OutboxMessageModel.__table__.columns
+                ),
+            )
+        if name not in self._archive_tables_ready:
+            await session.run_sync(
+                lambda sync_session: table.create(
+                    sync_session.connection(), checkfirst=True
+                )
+            )
+            self._archive_tables_ready.add(name)
+        return table
+
+    def _session_for(self, uow: UnitOfWork | None) -> AsyncSession:
+        session = getattr(uow, "session", None)
+        return cast("AsyncSession", session) if session is not None else self.session
+
+    def _is_postgresql(self) -> bool:
+        return bool(self.session.get_bind().dialect.name == "postgresql")
+
+    @staticmethod
+    def _to_message(m: OutboxMessageModel) -> OutboxMessage:
+        return OutboxMessage(
+            message_id=m.event_id,
+            event_type=m.event_type,
+            payload=m.payload,
+            metadata=m.event_metadata or {},
+            created_at=m.created_at,
+            published_at=None,
+            error=m.error,
+            retry_count=m.retry_count,
+            correlation_id=m.correlation_id,
+            causation_id=m.causation_id,
+            tenant_id=m.tenant_id,
+        )
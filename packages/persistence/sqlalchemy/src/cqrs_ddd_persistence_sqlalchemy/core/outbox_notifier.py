@@ -0,0 +1,125 @@
+"""
+PostgreSQL LISTEN/NOTIFY wake-ups for the transactional outbox.
+
+``SQLAlchemyOutboxStorage(session, notify_channel=...)`` issues
+``pg_notify`` in the writing transaction; PostgreSQL delivers it on commit.
+``PostgresOutboxNotifier`` listens on the same channel from every worker
+process and calls ``on_notify`` (typically ``BufferedOutbox.trigger``), so
+messages written by any pod are published without waiting for the polling
+fallback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any
+
+from cqrs_ddd_core.ports.background_worker import IBackgroundWorker
+
+from ..exceptions import SQLAlchemyPersistenceError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("cqrs_ddd.outbox")
+
+DEFAULT_OUTBOX_CHANNEL = "cqrs_ddd_outbox"
+
+
+class PostgresOutboxNotifier(IBackgroundWorker):
+    """
+    Listens for outbox NOTIFY events and calls ``on_notify`` for each one.
+
+    Holds one dedicated connection from *engine* (asyncpg driver required)
+    for the lifetime of the listener.  If the connection drops it reconnects
+    after ``reconnect_delay`` seconds, and ``on_notify`` is also called after
+    every (re)connect so writes made while disconnected are not missed.
+
+    Usage::
+
+        outbox = BufferedOutbox(storage=storage, broker=broker)
+        notifier = PostgresOutboxNotifier(engine, outbox.trigger)
+        await outbox.start()
+        await notifier.start()
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        on_notify: Callable[[], None],
+        *,
+        channel: str = DEFAULT_OUTBOX_CHANNEL,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        if engine.dialect.driver != "asyncpg":
+            raise SQLAlchemyPersistenceError(
+                "PostgresOutboxNotifier requires the postgresql+asyncpg driver, "
+                f"got {engine.dialect.name}+{engine.dialect.driver}."
+            )
+        self._engine = engine
+        self._on_notify = on_notify
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start listening in a background task."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("PostgresOutboxNotifier listening on %r", self.channel)
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("PostgresOutboxNotifier stopped")
+
+    async def _run_loop(self) -> None:
+        while self._running:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Outbox LISTEN connection lost: %s (reconnecting in %.1fs)",
+                    exc,
+                    self.reconnect_delay,
+                )
+            if self._running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen(self) -> None:
+        async with self._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver: Any = raw.driver_connection
+            closed = asyncio.Event()
+
+            def _on_message(*_args: Any) -> None:
+                self._on_notify()
+
+            def _on_terminated(*_args: Any) -> None:
+                closed.set()
+
+            await driver.add_listener(self.channel, _on_message)
+            driver.add_termination_listener(_on_terminated)
+            try:
+                # Catch up on anything written while we were not listening
+                self._on_notify()
+                await closed.wait()
+            finally:
+                driver.remove_termination_listener(_on_terminated)
+                with contextlib.suppress(Exception):
+                    await driver.remove_listener(self.channel, _on_message)
+        raise SQLAlchemyPersistenceError("LISTEN connection terminated")